@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, post_delete
 
 
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dashboard'
+
+    def ready(self):
+        from main.models import Cluster, KubeConfig
+        from .src.clusters_DB import invalidate_cluster_cache
+        # Drop cached cluster rows whenever a cluster or its kubeconfig changes
+        for model in (Cluster, KubeConfig):
+            post_save.connect(invalidate_cluster_cache, sender=model, dispatch_uid=f"invalidate_cluster_cache_save_{model.__name__}")
+            post_delete.connect(invalidate_cluster_cache, sender=model, dispatch_uid=f"invalidate_cluster_cache_delete_{model.__name__}")
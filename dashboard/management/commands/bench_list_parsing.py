@@ -0,0 +1,105 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from django.core.management.base import BaseCommand
+from kubernetes import client
+from dashboard.src.list_engine import project
+from dashboard.src.utils import list_raw
+from dashboard.src.workloads.k8s_pods import POD_COLUMNS, RAW_POD_COLUMNS
+
+
+class FakeResponse:
+    # Stands in for the urllib3 response the API returns with _preload_content=False
+    def __init__(self, data):
+        self.data = data
+
+    def release_conn(self):
+        pass
+
+
+def synthetic_pod_list(count):
+    created = (datetime.now(timezone.utc) - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    pods = []
+    for i in range(count):
+        name = f"web-{i:05d}"
+        pods.append({
+            "metadata": {
+                "name": name,
+                "namespace": f"team-{i % 50}",
+                "uid": f"00000000-0000-0000-0000-{i:012d}",
+                "resourceVersion": str(100000 + i),
+                "creationTimestamp": created,
+                "labels": {"app": "web", "pod-template-hash": "7d9c6b8f5"},
+                "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "web-7d9c6b8f5",
+                                     "uid": "11111111-1111-1111-1111-111111111111", "controller": True}],
+            },
+            "spec": {
+                "nodeName": f"node-{i % 200}",
+                "containers": [{
+                    "name": "app",
+                    "image": "nginx:1.25",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"memory": "256Mi"}},
+                    "env": [{"name": "MODE", "value": "production"}],
+                    "volumeMounts": [{"name": "config", "mountPath": "/etc/app"}],
+                }],
+                "volumes": [{"name": "config", "configMap": {"name": "web-config"}}],
+                "tolerations": [{"key": "node.kubernetes.io/not-ready", "operator": "Exists", "effect": "NoExecute"}],
+            },
+            "status": {
+                "phase": "Running",
+                "podIP": f"10.0.{i // 250}.{i % 250}",
+                "hostIP": f"192.168.0.{i % 200}",
+                "startTime": created,
+                "qosClass": "Burstable",
+                "conditions": [{"type": condition, "status": "True", "lastTransitionTime": created}
+                               for condition in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+                "containerStatuses": [{
+                    "name": "app",
+                    "ready": True,
+                    "restartCount": i % 3,
+                    "image": "nginx:1.25",
+                    "imageID": "docker.io/library/nginx@sha256:" + "0" * 64,
+                    "state": {"running": {"startedAt": created}},
+                }],
+            },
+        })
+    return json.dumps({"apiVersion": "v1", "kind": "PodList", "metadata": {"resourceVersion": "1"},
+                       "items": pods}).encode()
+
+
+class Command(BaseCommand):
+    help = "Compare OpenAPI model deserialization with the raw JSON fast path on a synthetic pod list"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pods", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        body = synthetic_pod_list(options["pods"])
+        api_client = client.ApiClient()
+        now = datetime.now(timezone.utc)
+        self.stdout.write(f"{options['pods']} pods, {len(body) / 1e6:.1f} MB of JSON")
+
+        def model_path():
+            pod_list = api_client.deserialize(FakeResponse(body), "V1PodList")
+            return project(pod_list.items, POD_COLUMNS, now)
+
+        def raw_path():
+            return project(list_raw(lambda **kwargs: FakeResponse(body)), RAW_POD_COLUMNS, now)
+
+        if model_path() != raw_path():
+            self.stderr.write("Model and raw paths produced different rows")
+            return
+
+        results = {}
+        for label, func in (("model", model_path), ("raw", raw_path)):
+            timings = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            results[label] = min(timings)
+            self.stdout.write(f"{label:>5}: {results[label] * 1000:.0f} ms (best of {options['repeat']})")
+
+        self.stdout.write(f"speedup: {results['model'] / results['raw']:.1f}x")
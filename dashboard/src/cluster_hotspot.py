@@ -5,11 +5,11 @@ from datetime import datetime, timezone
 def get_cluster_hotspot(path, context):
     try:
         # Load kube config
-        configure_k8s(path, context)
+        api_client = configure_k8s(path, context)
 
-        core_v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
-        batch_v1 = client.BatchV1Api()
+        core_v1 = client.CoreV1Api(api_client)
+        apps_v1 = client.AppsV1Api(api_client)
+        batch_v1 = client.BatchV1Api(api_client)
 
         empty_namespaces = []
         latest_tag_pods = []
@@ -1,40 +1,43 @@
 from kubernetes import client, config
 from kubebuddy.appLogs import logger
 import yaml
-from ..utils import filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+LIMIT_RANGE_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("created_at", lambda lr, now: lr.metadata.creation_timestamp.strftime("%Y-%m-%d %H:%M:%S")),
+))
 
 def get_limit_ranges(path, context):
     # Load Kubernetes configuration
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    
-    # Get all namespaces
-    namespaces = [ns.metadata.name for ns in v1.list_namespace().items]
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     
     limit_ranges = []
     
-    # Iterate over all namespaces and get limit ranges
-    for ns in namespaces:
-        try:
-            lr_list = client.CoreV1Api().list_namespaced_limit_range(ns).items
-            for lr in lr_list:
-                limit_ranges.append({
-                    "namespace": ns,
-                    "name": lr.metadata.name,
-                    "created_at": lr.metadata.creation_timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                })
-        except Exception as e:
-            logger.error(f"Error fetching LimitRange for namespace {ns}: {e}")
+    # Get the limit ranges of all namespaces in one paginated call
+    try:
+        limit_ranges = project(list_items(v1.list_limit_range_for_all_namespaces), LIMIT_RANGE_COLUMNS)
+    except Exception as e:
+        logger.error(f"Error fetching LimitRanges: {e}")
     
     return limit_ranges, len(limit_ranges)
 
 
 
-def get_limit_range_description(path=None, context=None, namespace=None, limit_range_name=None):
+def read_limit_range(path, context, namespace, limit_range_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_limit_range(name=limit_range_name, namespace=namespace)
+
+def get_limit_range_description(path=None, context=None, namespace=None, limit_range_name=None, limit_range=None):
     try:
-        configure_k8s(path, context)
-        v1 = client.CoreV1Api()
-        limit_range = v1.read_namespaced_limit_range(name=limit_range_name, namespace=namespace)
+        api_client = configure_k8s(path, context)
+        v1 = client.CoreV1Api(api_client)
+        if limit_range is None:
+            limit_range = v1.read_namespaced_limit_range(name=limit_range_name, namespace=namespace)
         
         limit_range_info = {
             "name": limit_range.metadata.name,
@@ -68,24 +71,20 @@ def get_limit_range_description(path=None, context=None, namespace=None, limit_r
 
 
 def get_limitrange_events(path, context, namespace, limitrange_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    limitrange_events = [
-        event for event in events if event.involved_object.name == limitrange_name and event.involved_object.kind == "LimitRange"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in limitrange_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, limitrange_name, "LimitRange", namespace=namespace))
 
-def get_limitrange_yaml(path, context, namespace, limitrange_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    limit_ranges = v1.read_namespaced_limit_range(limitrange_name, namespace=namespace)
+def get_limitrange_yaml(path, context, namespace, limitrange_name, managed_fields, limit_range=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if limit_range is None:
+        limit_range = v1.read_namespaced_limit_range(limitrange_name, namespace=namespace)
     # Filtering Annotations
-    if limit_ranges.metadata:
-        limit_ranges.metadata.annotations = filter_annotations(limit_ranges.metadata.annotations or {})
+    if limit_range.metadata:
+        limit_range.metadata.annotations = filter_annotations(limit_range.metadata.annotations or {})
 
-    api_client = client.ApiClient()
-    lr_dict = api_client.sanitize_for_serialization(limit_ranges)
+    lr_dict = api_client.sanitize_for_serialization(limit_range)
 
     # Clean up metadata
     if "metadata" in lr_dict and not managed_fields:
@@ -1,17 +1,27 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 from django.shortcuts import render
 from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
 import yaml
 
+NAMESPACE_COLUMNS = compile_columns((
+    ("name", "metadata.name"),
+    ("status", "status.phase"),
+    ("age", lambda ns, now: calculateAge(now - ns.metadata.creation_timestamp)),
+    ("labels", "metadata.labels"),
+))
+
 def get_namespace(path, context):
     try:
-        configure_k8s(path, context)
-        v1 = client.CoreV1Api()
+        api_client = configure_k8s(path, context)
+        v1 = client.CoreV1Api(api_client)
         list_ns = []
-        namespaces = v1.list_namespace()
-        for ns in namespaces.items:
+        namespaces = cached_items(path, context, "namespaces")
+        if namespaces is None:
+            namespaces = list_items(v1.list_namespace)
+        for ns in namespaces:
             list_ns.append(ns.metadata.name)
         return list_ns
     except client.exceptions.ApiException as e:
@@ -20,34 +30,26 @@ def get_namespace(path, context):
 
 def namespaces_data(path, context):
     # Load Kubernetes config
-    configure_k8s(path, context)
-
-    v1 = client.CoreV1Api()
-    namespaces = v1.list_namespace().items
+    api_client = configure_k8s(path, context)
 
-    namespace_data = []
-    for ns in namespaces:
-        name = ns.metadata.name
-        status = ns.status.phase
-        age = calculateAge(datetime.now(timezone.utc) - ns.metadata.creation_timestamp)
-        labels = ns.metadata.labels
+    v1 = client.CoreV1Api(api_client)
+    namespaces = cached_items(path, context, "namespaces")
+    if namespaces is None:
+        namespaces = list_items(v1.list_namespace)
 
-        namespace_data.append({
-            "name": name,
-            "status": status,
-            "age": age,
-            "labels": labels
-        })
+    return project(namespaces, NAMESPACE_COLUMNS)
 
-    return namespace_data
+def read_namespace(path, context, namespace_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespace(name=namespace_name)
 
-def get_namespace_description(path=None, context=None, namespace=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def get_namespace_description(path=None, context=None, namespace=None, ns=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
 
     try:
         # Fetch namespace details
-        namespace = v1.read_namespace(name=namespace)
+        namespace = ns if ns is not None else v1.read_namespace(name=namespace)
 
         namespace_info = {
             "name": namespace.metadata.name,
@@ -63,15 +65,14 @@ def get_namespace_description(path=None, context=None, namespace=None):
     except client.exceptions.ApiException as e:
         return {"error": f"Failed to fetch namespace details: {e.reason}"}
     
-def get_namespace_yaml(path, context, namespace_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    namespace = v1.read_namespace(name=namespace_name)
+def get_namespace_yaml(path, context, namespace_name, managed_fields, ns=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    namespace = ns if ns is not None else v1.read_namespace(name=namespace_name)
     # Filtering Annotations
     if namespace.metadata:
         namespace.metadata.annotations = filter_annotations(namespace.metadata.annotations or {})
 
-    api_client = client.ApiClient()
     ns_dict = api_client.sanitize_for_serialization(namespace)
 
     # Clean up metadata
@@ -83,13 +84,9 @@ def get_namespace_yaml(path, context, namespace_name, managed_fields):
 
     return yaml.safe_dump(ns_dict, sort_keys=False)
 
-def get_namespace_details():
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    v1 = client.CoreV1Api()
+def get_namespace_details(path, context):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     namespaces = v1.list_namespace()
 
     def get_age(creation_timestamp):
@@ -1,23 +1,30 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 from datetime import datetime, timezone
-from ..utils import calculateAge
+from ..informers import cached_items
+from ..utils import calculateAge, list_items
 from ..utils import configure_k8s
 import yaml
 
 def getnodes(path, cluster_name):
-    configure_k8s(path, cluster_name)
-    v1 = client.CoreV1Api() #Create an API client for the CoreV1Api
-    nodes = v1.list_node() #total number of nodes
+    api_client = configure_k8s(path, cluster_name)
+    v1 = client.CoreV1Api(api_client) #Create an API client for the CoreV1Api
+    nodes = cached_items(path, cluster_name, "nodes") #total number of nodes
+    if nodes is None:
+        nodes = list_items(v1.list_node)
     node_list = []
-    for node in nodes.items:
+    for node in nodes:
         node_list.append(node.metadata.name)
     return node_list, len(node_list)
 
 def get_nodes_status(path, context):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    node_list = v1.list_node().items
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    node_list = cached_items(path, context, "nodes")
+    if node_list is None:
+        node_list = list_items(v1.list_node)
+    return count_nodes_status(node_list)
+
+def count_nodes_status(node_list):
     ready_nodes = 0
     not_ready_nodes = 0
     for node in node_list:
@@ -39,10 +46,12 @@ NODE_ROLE_PREFIX = "node-role.kubernetes.io/"
 
 def get_nodes_info(path: str, context: str):
     # Load the kube config with the specified path and context
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
     
-    v1 = client.CoreV1Api()
-    nodes = v1.list_node().items
+    v1 = client.CoreV1Api(api_client)
+    nodes = cached_items(path, context, "nodes")
+    if nodes is None:
+        nodes = list_items(v1.list_node)
     
     node_data = []
     
@@ -92,14 +101,19 @@ def get_nodes_info(path: str, context: str):
     
     return node_data
 
-def get_node_description(path=None, context=None, node_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    coordination_v1 = client.CoordinationV1Api()
+def read_node(path, context, node_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_node(name=node_name)
+
+def get_node_description(path=None, context=None, node_name=None, node=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    coordination_v1 = client.CoordinationV1Api(api_client)
 
     try:
         # Fetch node details
-        node = v1.read_node(name=node_name)
+        if node is None:
+            node = v1.read_node(name=node_name)
         roles = [key.replace(NODE_ROLE_PREFIX, "") for key in node.metadata.labels if key.startswith(NODE_ROLE_PREFIX)]
         
         # Prepare node information
@@ -187,12 +201,12 @@ def get_node_description(path=None, context=None, node_name=None):
         return {"error": f"Failed to fetch node details: {e.reason}"}
 
 
-def get_node_yaml(path, context, node_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    node = v1.read_node(name=node_name)
+def get_node_yaml(path, context, node_name, managed_fields, node=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if node is None:
+        node = v1.read_node(name=node_name)
 
-    api_client = client.ApiClient()
     node_dict = api_client.sanitize_for_serialization(node)
 
     # Clean up metadata
@@ -204,13 +218,9 @@ def get_node_yaml(path, context, node_name, managed_fields):
 
     return yaml.safe_dump(node_dict, sort_keys=False)
 
-def get_node_details():
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    v1 = client.CoreV1Api()
+def get_node_details(path, context):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     nodes = v1.list_node()
 
     def get_age(creation_timestamp):
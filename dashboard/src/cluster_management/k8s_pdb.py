@@ -1,25 +1,26 @@
 from kubernetes import client, config
 import yaml
-from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+PDB_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("min", lambda pdb, now: pdb.spec.min_available or "N/A"),
+    ("max", lambda pdb, now: pdb.spec.max_unavailable or "N/A"),
+    ("disruptions", "status.disruptions_allowed"),
+    ("age", lambda pdb, now: calculateAge(now - pdb.metadata.creation_timestamp)),
+))
 
 def get_pdb(path, context):
+    pdb_list = []
     # Load Kubernetes configuration
     try:
-        configure_k8s(path, context)
-        v1 = client.PolicyV1Api()
-        pdbs = v1.list_pod_disruption_budget_for_all_namespaces()
-        pdb_list = []
-        for pdb in pdbs.items:
-           pdb_list.append({
-              "namespace": pdb.metadata.namespace,
-              "name": pdb.metadata.name,
-              "min": pdb.spec.min_available or "N/A",
-              "max": pdb.spec.max_unavailable or "N/A",
-              "disruptions": pdb.status.disruptions_allowed,
-              "age": calculateAge(datetime.now(timezone.utc) - pdb.metadata.creation_timestamp)
-           })
+        api_client = configure_k8s(path, context)
+        v1 = client.PolicyV1Api(api_client)
+        pdb_list = project(list_items(v1.list_pod_disruption_budget_for_all_namespaces), PDB_COLUMNS)
         
     except Exception as e:
         logger.error(f"Error fetching PDB: {e}")
@@ -27,11 +28,16 @@ def get_pdb(path, context):
     return pdb_list, len(pdb_list)
         
 
-def get_pdb_description(path=None, context=None, namespace=None, pdb_name=None):
-    configure_k8s(path, context)
-    v1 = client.PolicyV1Api()
+def read_pdb(path, context, namespace, pdb_name):
+    api_client = configure_k8s(path, context)
+    return client.PolicyV1Api(api_client).read_namespaced_pod_disruption_budget(name=pdb_name, namespace=namespace)
+
+def get_pdb_description(path=None, context=None, namespace=None, pdb_name=None, pdb=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.PolicyV1Api(api_client)
     try:
-        pdb = v1.read_namespaced_pod_disruption_budget(name=pdb_name, namespace=namespace)
+        if pdb is None:
+            pdb = v1.read_namespaced_pod_disruption_budget(name=pdb_name, namespace=namespace)
         pdb_info = {
             "name": pdb.metadata.name,
             "namespace": pdb.metadata.namespace,
@@ -53,23 +59,19 @@ def get_pdb_description(path=None, context=None, namespace=None, pdb_name=None):
 
 
 def get_pdb_events(path, context, namespace, pdb_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    pdb_events = [
-        event for event in events if event.involved_object.name == pdb_name and event.involved_object.kind == "PodDisruptionBudget"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in pdb_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, pdb_name, "PodDisruptionBudget", namespace=namespace))
 
-def get_pdb_yaml(path, context, namespace, pdb_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.PolicyV1Api()
-    pdb = v1.read_namespaced_pod_disruption_budget(pdb_name, namespace=namespace)
+def get_pdb_yaml(path, context, namespace, pdb_name, managed_fields, pdb=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.PolicyV1Api(api_client)
+    if pdb is None:
+        pdb = v1.read_namespaced_pod_disruption_budget(pdb_name, namespace=namespace)
     # Filtering Annotations
     if pdb.metadata:
         pdb.metadata.annotations = filter_annotations(pdb.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     pdb_dict = api_client.sanitize_for_serialization(pdb)
 
     # Clean up metadata
@@ -3,10 +3,11 @@ from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
 import yaml
 from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..events.k8s_events import get_object_events, format_object_events
 
 def get_resource_quotas(path, context, namespace="all"):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     
     try:
         quotas = v1.list_resource_quota_for_all_namespaces() if namespace == "all" else v1.list_namespaced_resource_quota(namespace=namespace)
@@ -47,22 +48,23 @@ def get_resource_quotas(path, context, namespace="all"):
         return {"error": f"Failed to fetch ResourceQuotas: {e.reason}"}, 0
     
 
-def get_resourcequota_description(path=None, context=None, namespace=None, resourcequota_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    try:
-        resource_quotas = v1.list_namespaced_resource_quota(namespace=namespace).items
+def read_resource_quota(path, context, namespace, resourcequota_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_resource_quota(name=resourcequota_name, namespace=namespace)
 
-        target_resource_quota = next((rq for rq in resource_quotas if rq.metadata.name == resourcequota_name), None)
-        if target_resource_quota is None:
-            return {"error": f"ResourceQuota {resourcequota_name} not found in namespace {namespace}"}
+def get_resourcequota_description(path=None, context=None, namespace=None, resourcequota_name=None, resource_quota=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    try:
+        if resource_quota is None:
+            resource_quota = v1.read_namespaced_resource_quota(name=resourcequota_name, namespace=namespace)
         
-        hard_limits = target_resource_quota.spec.hard if target_resource_quota.spec.hard else {}
-        used_resources = target_resource_quota.status.used if target_resource_quota.status.used else {}
+        hard_limits = resource_quota.spec.hard if resource_quota.spec.hard else {}
+        used_resources = resource_quota.status.used if resource_quota.status.used else {}
 
         resourcequota_info = {
-            "name": target_resource_quota.metadata.name,
-            "namespace": target_resource_quota.metadata.namespace,
+            "name": resource_quota.metadata.name,
+            "namespace": resource_quota.metadata.namespace,
             "resources": []
         }
 
@@ -78,24 +80,20 @@ def get_resourcequota_description(path=None, context=None, namespace=None, resou
         return {"error": f"Failed to fetch ResourceQuota details: {e.reason}"}
 
 def get_resourcequota_events(path, context, namespace, resourcequota_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    resourcequota_events = [
-        event for event in events if event.involved_object.name == resourcequota_name and event.involved_object.kind == "ResourceQuota"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in resourcequota_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, resourcequota_name, "ResourceQuota", namespace=namespace))
 
-def get_resourcequota_yaml(path, context, namespace, resourcequota_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    resource_quotas = v1.read_namespaced_resource_quota(resourcequota_name, namespace=namespace)
+def get_resourcequota_yaml(path, context, namespace, resourcequota_name, managed_fields, resource_quota=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if resource_quota is None:
+        resource_quota = v1.read_namespaced_resource_quota(resourcequota_name, namespace=namespace)
     # Filtering Annotations
-    if resource_quotas.metadata:
-        resource_quotas.metadata.annotations = filter_annotations(resource_quotas.metadata.annotations or {})
+    if resource_quota.metadata:
+        resource_quota.metadata.annotations = filter_annotations(resource_quota.metadata.annotations or {})
 
-    api_client = client.ApiClient()
-    rs_dict = api_client.sanitize_for_serialization(resource_quotas)
+    rs_dict = api_client.sanitize_for_serialization(resource_quota)
 
     # Clean up metadata
     if "metadata" in rs_dict and not managed_fields:
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from kubernetes import client
+from kubebuddy.appLogs import logger
+from .informers import cached_items
+from .utils import configure_k8s, list_items
+
+# kind -> (API class, all-namespaces list method, namespaced list method or None if cluster-scoped)
+SNAPSHOT_KINDS = {
+    "nodes": (client.CoreV1Api, "list_node", None),
+    "pods": (client.CoreV1Api, "list_pod_for_all_namespaces", "list_namespaced_pod"),
+    "deployments": (client.AppsV1Api, "list_deployment_for_all_namespaces", "list_namespaced_deployment"),
+    "daemonsets": (client.AppsV1Api, "list_daemon_set_for_all_namespaces", "list_namespaced_daemon_set"),
+    "replicasets": (client.AppsV1Api, "list_replica_set_for_all_namespaces", "list_namespaced_replica_set"),
+    "statefulsets": (client.AppsV1Api, "list_stateful_set_for_all_namespaces", "list_namespaced_stateful_set"),
+    "jobs": (client.BatchV1Api, "list_job_for_all_namespaces", "list_namespaced_job"),
+    "cronjobs": (client.BatchV1Api, "list_cron_job_for_all_namespaces", "list_namespaced_cron_job"),
+}
+
+
+class ClusterSnapshot:
+    """
+    The objects behind the dashboard widgets, each kind listed exactly once.
+
+    fetch() lists every kind in SNAPSHOT_KINDS concurrently, reading from
+    the informer cache when it is enabled.
+    Widgets derive their counts from the snapshot instead of listing the
+    same kind again. A failed kind is logged and recorded in errors.
+    """
+
+    def __init__(self, path, context, namespace="all"):
+        self.path = path
+        self.context = context
+        self.namespace = namespace
+        self.items = {}
+        self.errors = {}
+
+    def fetch(self):
+        api_client = configure_k8s(self.path, self.context)
+        with ThreadPoolExecutor() as executor:
+            futures = {kind: executor.submit(self._list_kind, api_client, kind) for kind in SNAPSHOT_KINDS}
+
+            for kind, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to list {kind} for the cluster snapshot: {e}")
+                    self.errors[kind] = e
+                    result = None
+                self.items[kind] = result if result is not None else []
+        return self
+
+    def get(self, kind):
+        """Return the listed objects of a kind, re-raising the error if listing it failed."""
+        if kind in self.errors:
+            raise self.errors[kind]
+        return self.items[kind]
+
+    def _list_kind(self, api_client, kind):
+        # Nodes are cluster-scoped and always listed in full
+        namespace = self.namespace if SNAPSHOT_KINDS[kind][2] else "all"
+        objects = cached_items(self.path, self.context, kind, namespace)
+        if objects is not None:
+            return objects
+        api_class, list_all, list_namespaced = SNAPSHOT_KINDS[kind]
+        api = api_class(api_client)
+        if namespace == "all":
+            return list(list_items(getattr(api, list_all)))
+        return list(list_items(getattr(api, list_namespaced), namespace=namespace))
@@ -1,17 +1,13 @@
-from main.models import Cluster
-from kubernetes import config, client
+from main.models import Cluster, KubeConfig
+from django.core.cache import cache
+from kubernetes import client
 from kubebuddy.appLogs import logger
 from django.http import JsonResponse
 import json
 from django.views.decorators.csrf import csrf_exempt
 import os
 from dotenv import load_dotenv
-from google.auth import default
-from google.cloud.container_v1 import ClusterManagerClient
-import base64
-import tempfile
-import boto3
-import subprocess
+from .utils import configure_k8s
 
 @csrf_exempt
 def get_cluster_status(request):
@@ -27,84 +23,10 @@ def get_cluster_status(request):
     failed_dns_pods = []
 
     try:
-        if cluster.get('context_name', '').startswith('gke_'):
-            # Handle GKE
-            SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
-            credentials, _ = default(scopes=SCOPES)
-            cluster_manager_client = ClusterManagerClient(credentials=credentials)
+        # GKE/EKS endpoints and tokens come from the shared credential cache
+        api_client = configure_k8s(cluster["kube_config__path"], cluster["context_name"])
 
-            # Extract GKE details from context_name: gke_{project}_{zone}_{cluster_name}
-        
-            _, project_id, zone, cluster_id = cluster['context_name'].split('_', 3) # Have removed the try block assuming context is always in this format
-    
-            gke_cluster = cluster_manager_client.get_cluster(
-                project_id=project_id,
-                zone=zone,
-                cluster_id=cluster_id
-            )
-
-            cert = base64.b64decode(gke_cluster.master_auth.cluster_ca_certificate)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".crt") as cert_file:
-                cert_file.write(cert)
-                cert_path = cert_file.name
-
-            configuration = client.Configuration()
-            configuration.host = f"https://{gke_cluster.endpoint}:443"
-            configuration.ssl_ca_cert = cert_path
-            configuration.verify_ssl = True
-            configuration.api_key = {"authorization": "Bearer " + credentials.token}
-            client.Configuration.set_default(configuration)
-
-        elif cluster.get('context_name', '').startswith('arn:aws:eks:'):
-            # currently using context for cluster name and user as well, if need be we can read the file and get the relevant data
-            # Get token
-            region = cluster['context_name'].split(':')[3]
-            name = cluster['context_name'].split(':')[5].split('/')[1]
-            eks = boto3.client('eks', region_name=region)
-            cluster_info = eks.describe_cluster(name=name)
-            cluster_cert = cluster_info['cluster']['certificateAuthority']['data']
-            cluster_endpoint = cluster_info['cluster']['endpoint']
-
-            # Generate token
-            token = boto3.client('sts').get_caller_identity()
-            auth_token = subprocess.check_output(
-                ['aws', 'eks', 'get-token', '--cluster-name', name, '--region', region, '--output', 'json']
-            )
-            token_data = json.loads(auth_token)
-            bearer_token = token_data['status']['token']
-            # Build config manually
-
-            config_dict = {
-                'apiVersion': 'v1',
-                'clusters': [{
-                    'cluster': {
-                        'server': cluster_endpoint,
-                        'certificate-authority-data': cluster_cert
-                    },
-                    'name': cluster['cluster_name']
-                }],
-                'contexts': [{
-                    'context': {
-                        'cluster': cluster['cluster_name'],
-                        'user': cluster['context_name']
-                    },
-                    'name': cluster['context_name']
-                }],
-                'current-context': cluster['context_name'],
-                'kind': 'Config',
-                'users': [{
-                    'name': cluster['context_name'],
-                    'user': {
-                        'token': bearer_token
-                    }
-                }]
-            }
-
-            config.load_kube_config_from_dict(config_dict)
-        else:
-            config.load_kube_config(config_file=cluster["kube_config__path"], context=cluster["context_name"])
-
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(api_client)
         nodes = v1.list_node().items
         cluster['number_of_nodes'] = len(nodes)
         cluster['control_plane_status'] = "Running"
@@ -143,6 +65,34 @@ def get_registered_clusters():
     clusters = Cluster.objects.all().values("id", "cluster_name", "context_name", "kube_config__path")
     return list(clusters)
 
+# Cluster rows are cached until a Cluster/KubeConfig signal invalidates them. The timeout only
+# bounds staleness for other processes when the cache backend is not shared (locmem).
+CLUSTER_CACHE_TIMEOUT = 300
+CLUSTER_NAMES_CACHE_KEY = "clusters:names"
+
+def _cluster_cache_key(cluster_id):
+    return f"clusters:{cluster_id}"
+
+def get_cluster(cluster_id):
+    key = _cluster_cache_key(cluster_id)
+    cluster = cache.get(key)
+    if cluster is None:
+        cluster = Cluster.objects.select_related("kube_config").get(id=cluster_id)
+        cache.set(key, cluster, CLUSTER_CACHE_TIMEOUT)
+    return cluster
+
 def get_cluster_names():
-    clusters = Cluster.objects.all()
-    return [{"cluster_name": cluster.cluster_name, "id": cluster.id} for cluster in clusters]
\ No newline at end of file
+    cluster_names = cache.get(CLUSTER_NAMES_CACHE_KEY)
+    if cluster_names is None:
+        clusters = Cluster.objects.all()
+        cluster_names = [{"cluster_name": cluster.cluster_name, "id": cluster.id} for cluster in clusters]
+        cache.set(CLUSTER_NAMES_CACHE_KEY, cluster_names, CLUSTER_CACHE_TIMEOUT)
+    return cluster_names
+
+def invalidate_cluster_cache(sender, instance, **kwargs):
+    # Connected to post_save/post_delete of Cluster and KubeConfig in DashboardConfig.ready
+    if sender is KubeConfig:
+        cluster_ids = list(Cluster.objects.filter(kube_config=instance).values_list("id", flat=True))
+    else:
+        cluster_ids = [instance.id]
+    cache.delete_many([CLUSTER_NAMES_CACHE_KEY] + [_cluster_cache_key(cluster_id) for cluster_id in cluster_ids])
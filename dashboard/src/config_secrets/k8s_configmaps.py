@@ -1,58 +1,47 @@
 from kubernetes import client, config
-from datetime import datetime, timezone
 import yaml
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+CONFIGMAP_COLUMNS = compile_columns((
+    ("name", "metadata.name"),
+    ("namespace", "metadata.namespace"),
+    # Number of data keys only, not the values
+    ("data", lambda cm, now: len(cm.data.keys()) if cm.data else 0),
+    ("age", lambda cm, now: calculateAge(now - cm.metadata.creation_timestamp)),
+))
 
 def get_configmaps(path, context):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
 
     # Fetch all ConfigMaps in all namespaces
-    configmaps = v1.list_config_map_for_all_namespaces().items
+    configmaps = cached_items(path, context, "configmaps")
+    if configmaps is None:
+        configmaps = list_items(v1.list_config_map_for_all_namespaces)
 
-    configmap_list = []
-    total_count = len(configmaps)
-    for cm in configmaps:
-        name = cm.metadata.name
-        namespace = cm.metadata.namespace
-        creation_time = cm.metadata.creation_timestamp
+    configmap_list = project(configmaps, CONFIGMAP_COLUMNS)
+    return configmap_list, len(configmap_list)
 
-        # Calculate age in days
-        age = calculateAge(datetime.now(timezone.utc) - creation_time)
 
-        # Get data keys only (not full values)
-        data_keys = cm.data.keys() if cm.data else []
 
-        configmap_list.append({
-        "name": name,
-        "namespace": namespace,
-        "data": len(data_keys),
-        "age": age,
-        })
+def read_configmap(path, context, namespace, configmap_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_config_map(name=configmap_name, namespace=namespace)
 
-    return configmap_list, total_count
-
-
-
-def get_configmap_description(path=None, context=None, namespace=None, configmap_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def get_configmap_description(path=None, context=None, namespace=None, configmap_name=None, configmap=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     try:
-        configmaps = v1.list_namespaced_config_map(namespace=namespace).items
-
-        target_configmap = None
-        for cm in configmaps:
-            if cm.metadata.name == configmap_name:
-                target_configmap = cm
-                break
-
-        if target_configmap is None:
-            return {"error": f"ConfigMap {configmap_name} not found in namespace {namespace}"}
+        if configmap is None:
+            configmap = v1.read_namespaced_config_map(name=configmap_name, namespace=namespace)
 
         configmap_info = {
-            "name": target_configmap.metadata.name,
-            "namespace": target_configmap.metadata.namespace,
-            "data": dict(target_configmap.data) if target_configmap.data else {}, # Handle missing data
+            "name": configmap.metadata.name,
+            "namespace": configmap.metadata.namespace,
+            "data": dict(configmap.data) if configmap.data else {}, # Handle missing data
         }
         return configmap_info
 
@@ -60,25 +49,21 @@ def get_configmap_description(path=None, context=None, namespace=None, configmap
         return {"error": f"Failed to fetch ConfigMap details: {e.reason}"}
 
 def get_configmap_events(path, context, namespace, configmap_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    configmap_events = [
-        event for event in events if event.involved_object.name == configmap_name and event.involved_object.kind == "ConfigMap"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in configmap_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, configmap_name, "ConfigMap", namespace=namespace))
 
 
-def get_configmap_yaml(path, context, namespace, configmap_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    configmaps = v1.read_namespaced_config_map(configmap_name, namespace=namespace)
+def get_configmap_yaml(path, context, namespace, configmap_name, managed_fields, configmap=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if configmap is None:
+        configmap = v1.read_namespaced_config_map(configmap_name, namespace=namespace)
     # Filtering Annotations
-    if configmaps.metadata:
-        configmaps.metadata.annotations = filter_annotations(configmaps.metadata.annotations or {})
+    if configmap.metadata:
+        configmap.metadata.annotations = filter_annotations(configmap.metadata.annotations or {})
     
-    api_client = client.ApiClient()
-    configmap_dict = api_client.sanitize_for_serialization(configmaps)
+    configmap_dict = api_client.sanitize_for_serialization(configmap)
 
     # Clean up metadata
     if "metadata" in configmap_dict and not managed_fields:
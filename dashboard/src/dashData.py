@@ -3,87 +3,82 @@ from concurrent.futures import ThreadPoolExecutor
 from . import k8s_cluster_metric
 from .workloads import k8s_cronjobs, k8s_daemonset, k8s_deployments, k8s_jobs, k8s_pods, k8s_replicaset, k8s_statefulset
 from .cluster_management import k8s_nodes
+from .metrics import k8s_node_metrics
 from .events import k8s_events
+from .cluster_snapshot import ClusterSnapshot
+from .view_cache import cached_result
 
-def fetch_nodes_status(path, context_name):
-    return k8s_nodes.get_nodes_status(path, context_name)
-
-def fetch_nodes(path, context_name):
-    return k8s_nodes.getnodes(path, context_name)
-
-def fetch_pods_status(path, context_name, namespace):
-    return k8s_pods.getPodsStatus(path, context_name, namespace)
-
-def fetch_pods(path, context_name, namespace):
-    return k8s_pods.getpods(path, context_name, namespace)
-
-def fetch_deployments(path, context_name, namespace):
-    return k8s_deployments.getDeploymentsStatus(path, context_name, namespace)
-
-def fetch_daemonsets(path, context_name, namespace):
-    return k8s_daemonset.getDaemonsetStatus(path, context_name, namespace)
+def fetch_events(path, context_name, namespace):
+    return k8s_events.get_events(path, context_name, True, namespace)
 
-def fetch_replicasets(path, context_name, namespace):
-    return k8s_replicaset.getReplicasetStatus(path, context_name, namespace)
+def fetch_event_trends(path, context_name, namespace):
+    # Read from the event index; the widgets are left out while it is unavailable
+    index = k8s_events.get_event_index(path, context_name)
+    if index is None:
+        return None, None
+    history = index.histogram("Warning", namespace=namespace)
+    return ({"labels": [start.strftime("%H:%M") for start, _ in history], "counts": [count for _, count in history]},
+            index.top("Warning", namespace=namespace))
 
-def fetch_statefulsets(path, context_name, namespace):
-    return k8s_statefulset.getStatefulsetStatus(path, context_name, namespace)
+def fetch_status(snapshot, kind, count_status):
+    # The per-kind status helpers return [] when listing fails; keep that for the widgets
+    if kind in snapshot.errors:
+        return []
+    return count_status(snapshot.items[kind])
 
-def fetch_jobs(path, context_name, namespace):
-    return k8s_jobs.getJobsStatus(path, context_name, namespace)
+def fetch_metrics(node_metrics):
+    node_rows, _, metrics_available = node_metrics
+    if not metrics_available:
+        return {"error": f"Failed to fetch endpoint details: {node_rows['error']}"}
+    return k8s_cluster_metric.summarize_usage(node_rows)
 
-def fetch_cronjobs(path, context_name, namespace):
-    return k8s_cronjobs.getCronJobsStatus(path, context_name, namespace)
+def fetch_cluster_widgets(path, context_name, namespace):
+    # One list call per kind: every widget is derived from the same snapshot
+    with ThreadPoolExecutor() as executor:
+        snapshot_future = executor.submit(ClusterSnapshot(path, context_name, namespace).fetch)
+        events_future = executor.submit(fetch_events, path, context_name, namespace)
+        trends_future = executor.submit(fetch_event_trends, path, context_name, namespace)
+        snapshot = snapshot_future.result()
+        events = events_future.result()
+        warning_history, top_warnings = trends_future.result()
 
-def fetch_metrics(path, context_name):
-    return k8s_cluster_metric.get_metrics(path, context_name)
+    nodes = snapshot.get("nodes")
+    pods = snapshot.get("pods")
+    ready_nodes, not_ready_nodes, node_count = k8s_nodes.count_nodes_status(nodes)
+    node_names = [node.metadata.name for node in nodes]
 
-def fetch_events(path, context_name, namespace):
-    return k8s_events.get_events(path, context_name, True, namespace)
+    return {
+        'ready_nodes': ready_nodes,
+        'not_ready_nodes': not_ready_nodes,
+        'node_count': node_count,
+        'status_count': k8s_pods.count_pods_status(pods),
+        'pod_count': len(pods),
+        'node_list': (node_names, len(node_names)),
+        'deployments_status': fetch_status(snapshot, "deployments", k8s_deployments.count_deployments_status),
+        'daemonset_status': fetch_status(snapshot, "daemonsets", k8s_daemonset.count_daemonsets_status),
+        'replicaset_status': fetch_status(snapshot, "replicasets", k8s_replicaset.count_replicasets_status),
+        'statefulset_status': fetch_status(snapshot, "statefulsets", k8s_statefulset.count_statefulsets_status),
+        'jobs_status': fetch_status(snapshot, "jobs", k8s_jobs.count_jobs_status),
+        'cronjob_status': fetch_status(snapshot, "cronjobs", k8s_cronjobs.count_cronjobs_status),
+        'events': events,
+        'warning_history': warning_history,
+        'top_warnings': top_warnings,
+    }
 
 def fetch_dashboard_data(path, context_name, namespace, current_cluster, namespaces, namespaces_count, cluster_id, registered_clusters, warning_message):
-    with ThreadPoolExecutor() as executor:
-        futures = {
-            "nodes_status": executor.submit(fetch_nodes_status, path, context_name),
-            "nodes": executor.submit(fetch_nodes, path, context_name),
-            "pods_status": executor.submit(fetch_pods_status, path, context_name, namespace),
-            "pods": executor.submit(fetch_pods, path, context_name, namespace),
-            "deployments_status": executor.submit(fetch_deployments, path, context_name, namespace),
-            "daemonsets_status": executor.submit(fetch_daemonsets, path, context_name, namespace),
-            "replicasets_status": executor.submit(fetch_replicasets, path, context_name, namespace),
-            "statefulsets_status": executor.submit(fetch_statefulsets, path, context_name, namespace),
-            "jobs_status": executor.submit(fetch_jobs, path, context_name, namespace),
-            "cronjobs_status": executor.submit(fetch_cronjobs, path, context_name, namespace),
-            "metrics": executor.submit(fetch_metrics, path, context_name),
-            "events": executor.submit(fetch_events, path, context_name, namespace),
-        }
-
-        results = {key: future.result() for key, future in futures.items()}
-    
     # Prepare the context for the template
     context = {
         'warning': warning_message,
-        'ready_nodes': results["nodes_status"][0],
-        'not_ready_nodes': results["nodes_status"][1],
-        'node_count': results["nodes_status"][2],
-        'status_count': results["pods_status"],
-        'pod_count': results["pods"][1],
         'current_cluster': current_cluster,
-        'node_list': results["nodes"],
-        'deployments_status': results["deployments_status"],
-        'daemonset_status': results["daemonsets_status"],
-        'replicaset_status': results["replicasets_status"],
-        'statefulset_status': results["statefulsets_status"],
-        'jobs_status': results["jobs_status"],
-        'cronjob_status': results["cronjobs_status"],
         'namespaces': namespaces,
         'selected_namespace': namespace,
         'namespaces_count': namespaces_count,
         'cluster_id': cluster_id,
-        'metrics': results["metrics"],
         'registered_clusters': registered_clusters,
-        'events': results["events"],
         'context_name': context_name
     }
-    
+    context.update(cached_result(cluster_id, namespace, fetch_cluster_widgets, path, context_name, namespace))
+    # Same cache entry as the node metrics page, so the gauge and the page share one metrics fetch
+    context['metrics'] = fetch_metrics(cached_result(cluster_id, "all", k8s_node_metrics.get_node_metrics, path, context_name))
+
     return context
@@ -0,0 +1,80 @@
+from functools import partial
+from .workloads import k8s_cronjobs, k8s_daemonset, k8s_deployments, k8s_jobs, k8s_pods, k8s_replicaset, k8s_statefulset
+from .cluster_management import k8s_limit_range, k8s_namespaces, k8s_nodes, k8s_pdb, k8s_resource_quota
+from .config_secrets import k8s_configmaps, k8s_secrets
+from .services import k8s_endpoints, k8s_services
+from .persistent_volume import k8s_pv, k8s_pvc, k8s_storage_class
+from .networking import k8s_ingress, k8s_np
+from .rbac import k8s_cluster_role_bindings, k8s_cluster_roles, k8s_role, k8s_rolebindings, k8s_service_accounts
+from .workload_logs import get_workload_logs
+
+# resource -> (YAML renderer, other lazily loaded tabs); cluster-scoped kinds take no namespace
+DETAIL_TABS = {
+    "pods": (k8s_pods.get_pod_yaml, {"logs": k8s_pods.get_pod_logs, "events": k8s_pods.get_pod_events}),
+    "deployments": (k8s_deployments.get_yaml_deploy, {
+        "logs": partial(get_workload_logs, resource="deployments"), "events": k8s_deployments.get_deploy_events}),
+    "replicasets": (k8s_replicaset.get_yaml_rs, {
+        "logs": partial(get_workload_logs, resource="replicasets"), "events": k8s_replicaset.get_replicaset_events}),
+    "statefulsets": (k8s_statefulset.get_yaml_sts, {
+        "logs": partial(get_workload_logs, resource="statefulsets"), "events": k8s_statefulset.get_sts_events}),
+    "daemonsets": (k8s_daemonset.get_daemonset_yaml, {
+        "logs": partial(get_workload_logs, resource="daemonsets"), "events": k8s_daemonset.get_daemonset_events}),
+    "jobs": (k8s_jobs.get_yaml_job, {
+        "logs": partial(get_workload_logs, resource="jobs"), "events": k8s_jobs.get_job_events}),
+    "cronjobs": (k8s_cronjobs.get_yaml_cronjob, {"events": k8s_cronjobs.get_cronjob_events}),
+    "nodes": (k8s_nodes.get_node_yaml, {}),
+    "namespaces": (k8s_namespaces.get_namespace_yaml, {}),
+    "limitranges": (k8s_limit_range.get_limitrange_yaml, {"events": k8s_limit_range.get_limitrange_events}),
+    "resourcequotas": (k8s_resource_quota.get_resourcequota_yaml, {"events": k8s_resource_quota.get_resourcequota_events}),
+    "poddisruptionbudgets": (k8s_pdb.get_pdb_yaml, {"events": k8s_pdb.get_pdb_events}),
+    "configmaps": (k8s_configmaps.get_configmap_yaml, {"events": k8s_configmaps.get_configmap_events}),
+    "secrets": (k8s_secrets.get_secret_yaml, {"events": k8s_secrets.get_secret_events}),
+    "services": (k8s_services.get_service_yaml, {"events": k8s_services.get_service_events}),
+    "endpoints": (k8s_endpoints.get_endpoint_yaml, {"events": k8s_endpoints.get_endpoint_events}),
+    "persistentvolumes": (k8s_pv.get_pv_yaml, {}),
+    "persistentvolumeclaims": (k8s_pvc.get_pvc_yaml, {"events": k8s_pvc.get_pvc_events}),
+    "storageclasses": (k8s_storage_class.get_sc_yaml, {"events": k8s_storage_class.get_storage_class_events}),
+    "networkpolicies": (k8s_np.get_np_yaml, {"events": k8s_np.get_np_events}),
+    "ingresses": (k8s_ingress.get_ingress_yaml, {"events": k8s_ingress.get_ingress_events}),
+    "roles": (k8s_role.get_role_yaml, {"events": k8s_role.get_role_events}),
+    "rolebindings": (k8s_rolebindings.get_role_binding_yaml, {"events": k8s_rolebindings.get_role_binding_events}),
+    "clusterroles": (k8s_cluster_roles.get_cluster_role_yaml, {"events": k8s_cluster_roles.get_cluster_role_events}),
+    "clusterrolebindings": (k8s_cluster_role_bindings.get_cluster_role_binding_yaml, {
+        "events": k8s_cluster_role_bindings.get_cluster_role_binding_events}),
+    "serviceaccounts": (k8s_service_accounts.get_sa_yaml, {"events": k8s_service_accounts.get_sa_events}),
+}
+
+
+def render_yamls(render_yaml, obj):
+    """Return the (yaml, edit) renderings of one object: with and without managed fields."""
+    return render_yaml(True, obj), render_yaml(False, obj)
+
+def fetch_detail(read, describe, render_yaml=None):
+    """
+    Build a detail page's data from a single read of the object.
+
+    read() returns the object and describe(obj) its describe dict. The
+    other tabs are loaded on demand through fetch_tab(); pass
+    render_yaml(managed_fields, obj) when the YAML is needed up front,
+    e.g. to diff an edit, and both renderings are derived from the same read.
+    """
+    obj = read()
+    # Describe first: the YAML renderers filter the object's annotations in place
+    detail = {"describe": describe(obj)}
+    if render_yaml is not None:
+        detail["yaml"], detail["edit"] = render_yamls(render_yaml, obj)
+    return detail
+
+def tab_names(resource):
+    """Return the tabs of a resource's detail page that fetch_tab() can serve (empty if unknown)."""
+    if resource not in DETAIL_TABS:
+        return set()
+    return {"yaml", "edit", *DETAIL_TABS[resource][1]}
+
+def fetch_tab(path, context, resource, namespace, name, tab):
+    """Return the text of one detail-page tab: yaml, edit or a kind-specific tab such as logs."""
+    render_yaml, tabs = DETAIL_TABS[resource]
+    args = (path, context, namespace, name) if namespace else (path, context, name)
+    if tab in ("yaml", "edit"):
+        return render_yaml(*args, tab == "yaml")
+    return tabs[tab](*args)
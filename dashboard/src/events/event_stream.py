@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from datetime import datetime
+import json
+import queue
+import threading
+import time
+from dateutil.tz import tzutc
+from kubernetes import client, watch
+from django.conf import settings
+from kubebuddy.appLogs import logger
+from ..utils import configure_k8s
+from .k8s_events import event_row, events_field_selector
+
+# Server-side timeout of one watch request; also bounds how long a watcher outlives its viewer
+WATCH_TIMEOUT_SECONDS = 60
+# Events held for one viewer between flushes; older ones are dropped during an event storm
+MAX_PENDING_EVENTS = 1000
+# Seconds between comments sent on an idle stream, so proxies keep it open and a gone viewer is noticed
+HEARTBEAT_SECONDS = 15
+# Seconds a blocked watcher waits between checks that the viewer is still connected
+PUT_TIMEOUT = 0.5
+
+_ERROR = "ERROR"
+
+
+class EventCoalescer:
+    """
+    Holds the watched events not sent yet, keeping only the newest version of each.
+
+    A repeating event is a single Event object whose count the API server
+    bumps, so changes are keyed by uid: any number of bumps between two
+    flushes go out as one row. At most max_pending events are held; when
+    more arrive the oldest is dropped and counted.
+    """
+
+    def __init__(self, max_pending=MAX_PENDING_EVENTS):
+        self.max_pending = max_pending
+        self.pending = OrderedDict()
+        self.dropped = 0
+
+    def add(self, change, event):
+        uid = event.metadata.uid
+        # A newer version moves to the back, behind the events that changed before it
+        self.pending.pop(uid, None)
+        self.pending[uid] = (change, event)
+        if len(self.pending) > self.max_pending:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+
+    def take(self, limit):
+        """Remove and return up to limit (change, event) pairs, oldest first, and the count dropped since the last take."""
+        taken = []
+        while self.pending and len(taken) < limit:
+            taken.append(self.pending.popitem(last=False)[1])
+        dropped, self.dropped = self.dropped, 0
+        return taken, dropped
+
+
+def current_resource_version(list_func, **kwargs):
+    # One item is enough: the list metadata carries the collection's resourceVersion
+    return list_func(limit=1, **kwargs).metadata.resource_version
+
+def _put(changes, item, stopped):
+    while not stopped.is_set():
+        try:
+            changes.put(item, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _watch_events(list_func, kwargs, resource_version, changes, stopped):
+    try:
+        while not stopped.is_set():
+            stream = watch.Watch()
+            try:
+                for event in stream.stream(list_func, resource_version=resource_version, allow_watch_bookmarks=True,
+                                           timeout_seconds=WATCH_TIMEOUT_SECONDS, **kwargs):
+                    if stopped.is_set():
+                        return
+                    if event["type"] == "BOOKMARK":
+                        resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                        continue
+                    if event["type"] == _ERROR:
+                        logger.error(f"Event watch failed: {event['raw_object']}")
+                        _put(changes, (_ERROR, "Event watch failed"), stopped)
+                        return
+                    resource_version = event["object"].metadata.resource_version
+                    if not _put(changes, (event["type"], event["object"]), stopped):
+                        return
+            except client.exceptions.ApiException as e:
+                if e.status != 410:
+                    raise
+                # The watch fell behind the API server's history; carry on from now
+                resource_version = current_resource_version(list_func, **kwargs)
+            finally:
+                stream.stop()
+    except Exception as e:
+        logger.error(f"Event watch failed: {e}")
+        _put(changes, (_ERROR, "Event watch interrupted"), stopped)
+
+def sse_frame(taken, dropped):
+    now = datetime.now(tzutc())
+    rows = [dict(event_row(event, now), change=change) for change, event in taken]
+    return f"event: events\ndata: {json.dumps({'rows': rows, 'dropped': dropped})}\n\n"
+
+def live_events(list_func, kwargs, resource_version, interval=None, max_rows=None):
+    """
+    Watch events from resource_version and yield batches of changed rows as server-sent events.
+
+    The watch runs on its own thread; this generator flushes what it
+    collected at most once per interval (K8S_EVENT_STREAM_INTERVAL
+    seconds), at most max_rows (K8S_EVENT_STREAM_MAX_ROWS) rows at a time,
+    so a viewer is never sent more than max_rows / interval rows a second
+    however fast events change. Closing the generator stops the watch.
+    """
+    interval = settings.K8S_EVENT_STREAM_INTERVAL if interval is None else interval
+    max_rows = settings.K8S_EVENT_STREAM_MAX_ROWS if max_rows is None else max_rows
+    changes = queue.Queue(MAX_PENDING_EVENTS)
+    stopped = threading.Event()
+    threading.Thread(target=_watch_events, name="event-stream", daemon=True,
+                     args=(list_func, kwargs, resource_version, changes, stopped)).start()
+    coalescer = EventCoalescer()
+    last_flush = last_write = time.monotonic()
+    try:
+        while True:
+            now = time.monotonic()
+            if coalescer.pending:
+                timeout = max(last_flush + interval - now, 0)
+            else:
+                timeout = max(last_write + HEARTBEAT_SECONDS - now, 0)
+            failure = None
+            try:
+                item = changes.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            # Take everything already waiting, so bumps to one event coalesce
+            while item is not None:
+                change, event = item
+                if change == _ERROR:
+                    failure = event
+                    break
+                coalescer.add(change, event)
+                try:
+                    item = changes.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            now = time.monotonic()
+            if coalescer.pending and (failure or now - last_flush >= interval):
+                yield sse_frame(*coalescer.take(max_rows))
+                last_flush = last_write = now
+            elif now - last_write >= HEARTBEAT_SECONDS:
+                yield ": keepalive\n\n"
+                last_write = now
+            if failure:
+                yield f"event: error\ndata: {failure}\n\n"
+                return
+    finally:
+        stopped.set()
+
+def stream_events(config_file, context, namespace="all", event_type=None, kind=None):
+    """
+    Return a server-sent event stream of the events that change from now on.
+
+    Takes the events page's filters. The current resourceVersion is read
+    before returning, so an ApiException (e.g. no access to events) is
+    raised here rather than mid-stream.
+    """
+    v1 = client.CoreV1Api(configure_k8s(config_file, context))
+    kwargs = {}
+    field_selector = events_field_selector(event_type, kind)
+    if field_selector:
+        kwargs["field_selector"] = field_selector
+    if namespace == "all":
+        list_func = v1.list_event_for_all_namespaces
+    else:
+        list_func = v1.list_namespaced_event
+        kwargs["namespace"] = namespace
+    resource_version = current_resource_version(list_func, **kwargs)
+    return live_events(list_func, kwargs, resource_version)
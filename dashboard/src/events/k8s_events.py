@@ -1,79 +1,336 @@
 from kubernetes import client
+from array import array
 from datetime import datetime
+import heapq
+import math
+import threading
+import time
 from dateutil.tz import tzutc
+from django.conf import settings
 from kubebuddy.appLogs import logger
 from dateutil.relativedelta import relativedelta
-from ..utils import configure_k8s
+from ..utils import configure_k8s, list_items
+from .. import informers
+
+# Event types the events page can filter on
+EVENT_TYPES = ("Normal", "Warning")
+# Registry name of the index's informer, apart from a plain "events" informer of the same cluster
+EVENT_INDEX_INFORMER = "event-index"
+
+def format_last_seen(now, timestamp):
+    temp = relativedelta(now, timestamp)
+    if temp.years > 0:
+        return f"{temp.years}y"
+    elif temp.months > 0:
+        return f"{temp.months}mo"
+    elif temp.days > 0:
+        return f"{temp.days}d"
+    elif temp.hours > 0:
+        return f"{temp.hours}h"
+    elif temp.minutes > 0:
+        return f"{temp.minutes}m"
+    return f"{temp.seconds}s"
+
+def event_row(event, now):
+    """Format one event as a row of the events table."""
+    event_data = {}
+    event_data["uid"] = event.metadata.uid
+    event_data["namespace"] = event.metadata.namespace
+    event_data["message"] = event.message
+    kind = event.involved_object.kind or ""
+    name = event.involved_object.name or ""
+    event_data["object"] = f"{kind}/{name}" if kind or name else ""
+
+    # Handle the 'source' field safely
+    component = event.source.component
+    host = event.source.host
+
+    if component:
+        event_data["source"] = component
+        if host:
+            event_data["source"] += f", {host}"
+    else:
+        reporting_component = event.reporting_component or ""
+        reporting_instance = event.reporting_instance or ""
+        parts = [p for p in [reporting_component, reporting_instance] if p]
+        event_data["source"] = ", ".join(parts) if parts else "unknown"
+
+    event_data["count"] = event.count
+    # Events recorded through events.k8s.io may only carry event_time
+    timestamp = event.last_timestamp or event.event_time
+    event_data["last_seen"] = format_last_seen(now, timestamp) if timestamp else ""
+    event_data["type"] = event.type
+    return event_data
 
 def get_events(config_file, context, limit, namespace = "all"):
     try:
-        configure_k8s(config_file, context)
+        api_client = configure_k8s(config_file, context)
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(api_client)
 
         if limit:
-            data = v1.list_event_for_all_namespaces(limit=30) if namespace == "all" else v1.list_namespaced_event(namespace=namespace, limit = 30)
+            data = (v1.list_event_for_all_namespaces(limit=30) if namespace == "all" else v1.list_namespaced_event(namespace=namespace, limit = 30)).items
         else:
-            data = v1.list_event_for_all_namespaces() if namespace == "all" else v1.list_namespaced_event(namespace=namespace)
-        events = []
-
-        for event in data.items:
-            event_data = {}
-            event_data["namespace"] = event.metadata.namespace
-            event_data["message"] = event.message
-            kind = event.involved_object.kind or ""
-            name = event.involved_object.name or ""
-            event_data["object"] = f"{kind}/{name}" if kind or name else ""
-
-            # Handle the 'source' field safely
-            component = event.source.component
-            host = event.source.host
-
-            if component:
-                event_data["source"] = component
-                if host:
-                    event_data["source"] += f", {host}"
-            else:
-                reporting_component = event.reporting_component or ""
-                reporting_instance = event.reporting_instance or ""
-                parts = [p for p in [reporting_component, reporting_instance] if p]
-                event_data["source"] = ", ".join(parts) if parts else "unknown"
-
-            event_data["count"] = event.count
-            current_time = datetime.now(tzutc())
-            
-            temp = relativedelta(current_time,event.last_timestamp)
-            years = temp.years
-            months = temp.months
-            days = temp.days
-            hours = temp.hours
-            minutes = temp.minutes
-            seconds = temp.seconds
-
-            if years > 0:
-                temp = f"{years}y"
-            elif months > 0:
-                temp = f"{months}mo"
-            elif days > 0:
-                temp = f"{days}d"
-            elif hours > 0:
-                temp = f"{hours}h"
-            elif minutes > 0:
-                temp = f"{minutes}m"
-            else:
-                temp = f"{seconds}s"
-
-            event_data["last_seen"] = temp
-
-            event_data["type"] = event.type
-
-            events.append(event_data)
-
-        return events
+            data = list_items(v1.list_event_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_event, namespace=namespace)
+
+        current_time = datetime.now(tzutc())
+        return [event_row(event, current_time) for event in data]
 
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")
         return []
     except Exception as e:
         logger.error(f"An error occurred: {e}")
-        return []
\ No newline at end of file
+        return []
+
+def events_field_selector(event_type=None, kind=None):
+    selectors = {"type": event_type, "involvedObject.kind": kind}
+    return ",".join(f"{field}={value}" for field, value in selectors.items() if value)
+
+def get_events_page(config_file, context, namespace="all", event_type=None, kind=None, limit=50, continue_token=None):
+    """
+    Return one page of event rows and the continue token of the next page.
+
+    The page is cut by the API server (limit and _continue) and filtered
+    there by type and involved kind, so only the rows shown are fetched
+    and formatted. The token is None on the last page. An ApiException
+    with status 410 means continue_token has expired.
+    """
+    api_client = configure_k8s(config_file, context)
+    v1 = client.CoreV1Api(api_client)
+    kwargs = {"limit": limit}
+    if continue_token:
+        kwargs["_continue"] = continue_token
+    field_selector = events_field_selector(event_type, kind)
+    if field_selector:
+        kwargs["field_selector"] = field_selector
+    if namespace == "all":
+        page = v1.list_event_for_all_namespaces(**kwargs)
+    else:
+        page = v1.list_namespaced_event(namespace=namespace, **kwargs)
+
+    current_time = datetime.now(tzutc())
+    rows = [event_row(event, current_time) for event in page.items]
+    next_token = page.metadata._continue
+    # V1ListMeta._continue is an empty string or None on the last page
+    return rows, (next_token if isinstance(next_token, str) and next_token else None)
+
+def event_timestamp(event):
+    # Newer events only carry event_time; fall back so every event has a sortable time
+    timestamp = event.last_timestamp or event.event_time or event.first_timestamp
+    return timestamp if isinstance(timestamp, datetime) else datetime.min.replace(tzinfo=tzutc())
+
+def get_object_events(v1, name, kind=None, namespace=None, uid=None, limit=None):
+    """
+    Return the events of one object, oldest first.
+
+    The involvedObject name, kind and uid are sent as a field selector so
+    the API server only returns this object's events instead of the whole
+    namespace. namespace=None looks the events up across all namespaces
+    (for cluster-scoped objects). Only the newest limit events are kept,
+    K8S_OBJECT_EVENTS_LIMIT by default; 0 keeps them all.
+    """
+    selectors = {"involvedObject.name": name, "involvedObject.kind": kind, "involvedObject.uid": uid}
+    field_selector = ",".join(f"{field}={value}" for field, value in selectors.items() if value)
+    if namespace is None:
+        events = list_items(v1.list_event_for_all_namespaces, field_selector=field_selector)
+    else:
+        events = list_items(v1.list_namespaced_event, namespace=namespace, field_selector=field_selector)
+
+    events = sorted((event for event in events if event.involved_object.name == name
+                     and (kind is None or event.involved_object.kind == kind)), key=event_timestamp)
+    limit = settings.K8S_OBJECT_EVENTS_LIMIT if limit is None else limit
+    return events[-limit:] if limit else events
+
+def format_object_events(events):
+    return "\n".join(f"{e.reason}: {e.message}" for e in events)
+
+
+class BucketRing:
+    """
+    Event counts of one key in a fixed number of fixed-width time buckets.
+
+    Bucket b lives in slot b % size. Each slot remembers which bucket it
+    holds, so a slot left over from an older pass round the ring reads as
+    zero and is reset when written again: the window slides without any
+    sweep and the ring never grows.
+    """
+
+    __slots__ = ("counts", "buckets")
+
+    def __init__(self, size):
+        self.counts = array("q", [0]) * size
+        self.buckets = array("q", [-1]) * size
+
+    def add(self, bucket, amount):
+        slot = bucket % len(self.counts)
+        if self.buckets[slot] > bucket:
+            # The slot already moved on to a newer bucket
+            return
+        if self.buckets[slot] != bucket:
+            self.buckets[slot] = bucket
+            self.counts[slot] = 0
+        self.counts[slot] += amount
+
+    def count(self, bucket):
+        slot = bucket % len(self.counts)
+        return self.counts[slot] if self.buckets[slot] == bucket else 0
+
+    def total(self, first, last):
+        return sum(self.count(bucket) for bucket in range(first, last + 1))
+
+    def newest(self):
+        return max(self.buckets)
+
+
+class EventIndex:
+    """
+    Event counts by type, namespace, involved object and reason over a sliding window.
+
+    The window is K8S_EVENT_INDEX_BUCKETS buckets of
+    K8S_EVENT_INDEX_BUCKET_SECONDS each. Every key has a BucketRing, and
+    every (type, namespace) a total ring for the histogram, so queries read
+    counters instead of rescanning events. The count last seen per event
+    uid is kept, so a repeated event only adds its new occurrences, at its
+    last timestamp, and a relist adds nothing twice.
+    """
+
+    def __init__(self, bucket_seconds=None, buckets=None):
+        self.bucket_seconds = bucket_seconds or settings.K8S_EVENT_INDEX_BUCKET_SECONDS
+        self.buckets = buckets or settings.K8S_EVENT_INDEX_BUCKETS
+        # (type, namespace, object, reason) -> BucketRing
+        self._rings = {}
+        # (type, namespace) -> BucketRing
+        self._totals = {}
+        # event uid -> count already added
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, timestamp):
+        return int(timestamp // self.bucket_seconds)
+
+    def window(self, seconds=None, now=None):
+        """Return the first and last bucket covering the last seconds, at most the whole ring."""
+        last = self.bucket(time.time() if now is None else now)
+        size = self.buckets if seconds is None else min(max(math.ceil(seconds / self.bucket_seconds), 1), self.buckets)
+        return last - size + 1, last
+
+    def _add(self, event, previous):
+        count = event.count or 1
+        self._seen[event.metadata.uid] = count
+        amount = count - (previous or 0)
+        timestamp = event_timestamp(event)
+        if amount <= 0 or timestamp.year == datetime.min.year:
+            return
+        bucket = self.bucket(timestamp.timestamp())
+        if bucket < self.window()[0]:
+            return
+        kind = event.involved_object.kind or ""
+        name = event.involved_object.name or ""
+        namespace = event.metadata.namespace or ""
+        key = (event.type, namespace, f"{kind}/{name}" if kind or name else "", event.reason or "")
+        for rings, ring_key in ((self._rings, key), (self._totals, key[:2])):
+            ring = rings.get(ring_key)
+            if ring is None:
+                ring = rings[ring_key] = BucketRing(self.buckets)
+            ring.add(bucket, amount)
+
+    def add(self, event):
+        """Count the occurrences of an added or updated event not counted yet."""
+        with self._lock:
+            self._add(event, self._seen.get(event.metadata.uid))
+
+    def forget(self, event):
+        # A deleted event's occurrences stay counted; only its uid is dropped
+        with self._lock:
+            self._seen.pop(event.metadata.uid, None)
+
+    def replace(self, pages):
+        """
+        Count a full listing of events, e.g. after a relist, forgetting the uids it no longer has.
+
+        pages yields lists of events; each page is counted as it arrives,
+        so queries only wait for one page and the listing is never held
+        in memory. A listing that fails part way keeps the uids counted
+        before it, so a retry adds nothing twice.
+        """
+        with self._lock:
+            previous, self._seen = self._seen, {}
+        try:
+            for events in pages:
+                with self._lock:
+                    for event in events:
+                        self._add(event, previous.get(event.metadata.uid))
+        except Exception:
+            with self._lock:
+                self._seen = {**previous, **self._seen}
+            raise
+
+    def top(self, event_type="Warning", seconds=3600, limit=20, namespace="all", now=None):
+        """Return the limit (namespace, object, reason) keys with the most events of a type in the last seconds."""
+        first, last = self.window(seconds, now)
+        oldest = self.window(None, now)[0]
+        rows = []
+        with self._lock:
+            for key, ring in list(self._rings.items()):
+                if ring.newest() < oldest:
+                    # Nothing left in the window
+                    del self._rings[key]
+                    continue
+                if key[0] != event_type or (namespace != "all" and key[1] != namespace):
+                    continue
+                count = ring.total(first, last)
+                if count:
+                    rows.append({"namespace": key[1], "object": key[2], "reason": key[3], "count": count})
+        return heapq.nlargest(limit, rows, key=lambda row: row["count"])
+
+    def histogram(self, event_type="Warning", seconds=None, namespace="all", now=None):
+        """Return (bucket start, count) pairs for the events of a type in the last seconds, oldest first."""
+        first, last = self.window(seconds, now)
+        counts = [0] * (last - first + 1)
+        with self._lock:
+            rings = [ring for (ring_type, ring_namespace), ring in self._totals.items()
+                     if ring_type == event_type and (namespace == "all" or ring_namespace == namespace)]
+            for ring in rings:
+                for offset, bucket in enumerate(range(first, last + 1)):
+                    counts[offset] += ring.count(bucket)
+        return [(datetime.fromtimestamp((first + offset) * self.bucket_seconds, tzutc()), count)
+                for offset, count in enumerate(counts)]
+
+
+class EventIndexInformer(informers.Informer):
+    """Feeds an EventIndex from a list and watch of all events, instead of storing the events."""
+
+    def __init__(self, api_client, kind="events"):
+        super().__init__(api_client, kind)
+        self.index = EventIndex()
+
+    def _replace(self, pages):
+        self.index.replace(pages)
+
+    def _apply(self, event_type, obj):
+        if event_type == "DELETED":
+            self.index.forget(obj)
+        else:
+            self.index.add(obj)
+
+def get_event_index(config_file, context):
+    """
+    Return the cluster's event index, kept current by a background watch.
+
+    The first call starts listing all events in the background and does
+    not wait for it. Returns None when the index is disabled
+    (K8S_EVENT_INDEX_ENABLED), cannot be started or is still listing, so
+    the widgets that read it are left out until it is ready.
+    """
+    if not settings.K8S_EVENT_INDEX_ENABLED:
+        return None
+    try:
+        informer = informers.get_informer(config_file, context, "events", factory=EventIndexInformer,
+                                          name=EVENT_INDEX_INFORMER)
+    except Exception as e:
+        logger.error(f"Event index unavailable for {context}: {e}")
+        return None
+    if not informer.wait_for_sync(0):
+        return None
+    return informer.index
@@ -0,0 +1,207 @@
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+from kubebuddy.appLogs import logger
+from django.conf import settings
+import threading
+from .utils import configure_k8s, list_pages
+
+# kind -> (API class, all-namespaces list method)
+INFORMER_KINDS = {
+    "pods": (client.CoreV1Api, "list_pod_for_all_namespaces"),
+    "services": (client.CoreV1Api, "list_service_for_all_namespaces"),
+    "configmaps": (client.CoreV1Api, "list_config_map_for_all_namespaces"),
+    "secrets": (client.CoreV1Api, "list_secret_for_all_namespaces"),
+    "nodes": (client.CoreV1Api, "list_node"),
+    "namespaces": (client.CoreV1Api, "list_namespace"),
+    "deployments": (client.AppsV1Api, "list_deployment_for_all_namespaces"),
+    "replicasets": (client.AppsV1Api, "list_replica_set_for_all_namespaces"),
+    "statefulsets": (client.AppsV1Api, "list_stateful_set_for_all_namespaces"),
+    "daemonsets": (client.AppsV1Api, "list_daemon_set_for_all_namespaces"),
+    "jobs": (client.BatchV1Api, "list_job_for_all_namespaces"),
+    "cronjobs": (client.BatchV1Api, "list_cron_job_for_all_namespaces"),
+    "events": (client.CoreV1Api, "list_event_for_all_namespaces"),
+}
+
+# Annotation in which kubectl apply keeps a copy of the object, a Secret's data included
+LAST_APPLIED_ANNOTATION = "kubectl.kubernetes.io/last-applied-configuration"
+
+# Server-side timeout of one watch request; the informer re-watches from its last resourceVersion
+WATCH_TIMEOUT_SECONDS = 300
+# Seconds to wait before retrying after an unexpected list/watch failure
+RETRY_BACKOFF_SECONDS = 5
+
+
+class Informer:
+    """
+    Keeps an in-memory copy of one resource kind for one cluster.
+
+    The informer lists the kind once and then follows a long-running watch
+    from the list's resourceVersion. BOOKMARK events only advance the
+    resourceVersion. A 410 Gone (expired resourceVersion) triggers a relist.
+    Objects are indexed by namespace for namespace-scoped reads. Secrets
+    are stored without their values: the keys of data are kept, so lists
+    can count them, and detail pages read the Secret itself.
+    """
+
+    def __init__(self, api_client, kind):
+        api_class, list_method = INFORMER_KINDS[kind]
+        self.api_client = api_client
+        self.kind = kind
+        self._list_func = getattr(api_class(api_client), list_method)
+        self._by_namespace = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        # Set once the first list attempt has finished, whether or not it succeeded
+        self._listed_once = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._thread = None
+        self._list_version = None
+        self.resource_version = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def wait_for_sync(self, timeout=None):
+        # Returns early with False when the initial list failed (e.g. cluster unreachable)
+        self._listed_once.wait(timeout)
+        return self._synced.is_set()
+
+    def list(self, namespace="all"):
+        with self._lock:
+            if namespace == "all":
+                return [obj for objects in self._by_namespace.values() for obj in objects.values()]
+            return list(self._by_namespace.get(namespace, {}).values())
+
+    def get(self, name, namespace=None):
+        with self._lock:
+            return self._by_namespace.get(namespace, {}).get(name)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch_once()
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info(f"Informer {self.kind}: resourceVersion expired, relisting")
+                    self.resource_version = None
+                    continue
+                logger.error(f"Informer {self.kind} failed: {e}")
+                self._listed_once.set()
+                self._stopped.wait(RETRY_BACKOFF_SECONDS)
+            except Exception as e:
+                logger.error(f"Informer {self.kind} failed: {e}")
+                self._listed_once.set()
+                self._stopped.wait(RETRY_BACKOFF_SECONDS)
+
+    def _pages(self):
+        # Yields the items of each page of a full listing as it arrives
+        for page in list_pages(self._list_func):
+            # Every page of one listing carries the same snapshot resourceVersion
+            self._list_version = page.metadata.resource_version
+            yield page.items
+
+    def _relist(self):
+        self._list_version = None
+        self._replace(self._pages())
+        self.resource_version = self._list_version
+        self._synced.set()
+        self._listed_once.set()
+
+    def _stored(self, obj):
+        if self.kind == "secrets":
+            if obj.data:
+                obj.data = dict.fromkeys(obj.data, "")
+            if obj.metadata.annotations:
+                obj.metadata.annotations.pop(LAST_APPLIED_ANNOTATION, None)
+        return obj
+
+    def _replace(self, pages):
+        # Pages are consumed one at a time, so no list of the whole listing is built next to the store
+        by_namespace = {}
+        for objects in pages:
+            for obj in objects:
+                by_namespace.setdefault(obj.metadata.namespace, {})[obj.metadata.name] = self._stored(obj)
+        with self._lock:
+            self._by_namespace = by_namespace
+
+    def _watch_once(self):
+        self._watch = watch.Watch()
+        for event in self._watch.stream(self._list_func, resource_version=self.resource_version,
+                                        allow_watch_bookmarks=True, timeout_seconds=WATCH_TIMEOUT_SECONDS):
+            if self._stopped.is_set():
+                break
+            if event["type"] == "BOOKMARK":
+                self.resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                continue
+            self._apply(event["type"], event["object"])
+            self.resource_version = event["object"].metadata.resource_version
+
+    def _apply(self, event_type, obj):
+        namespace, name = obj.metadata.namespace, obj.metadata.name
+        with self._lock:
+            if event_type == "DELETED":
+                objects = self._by_namespace.get(namespace, {})
+                objects.pop(name, None)
+                if not objects:
+                    self._by_namespace.pop(namespace, None)
+            else:
+                self._by_namespace.setdefault(namespace, {})[name] = self._stored(obj)
+
+
+# Running informers keyed by (kubeconfig path, context, kind)
+_informers = {}
+_informers_lock = threading.Lock()
+
+def get_informer(path, context, kind, factory=Informer, name=None):
+    # factory builds the informer when none runs yet, e.g. a subclass that indexes instead of storing;
+    # such an informer is registered under its own name, so it never stands in for the plain one of kind
+    api_client = configure_k8s(path, context)
+    key = (path, context, name or kind)
+    with _informers_lock:
+        informer = _informers.get(key)
+        # A new ApiClient means the kubeconfig changed, so the old watch is stale
+        if informer is not None and informer.api_client is not api_client:
+            informer.stop()
+            informer = None
+        if informer is None:
+            informer = factory(api_client, kind)
+            informer.start()
+            _informers[key] = informer
+    return informer
+
+def cached_items(path, context, kind, namespace="all"):
+    """
+    Return the objects of a kind from the cluster's informer.
+
+    Returns None when informers are disabled for the kind, the informer
+    cannot be started or it has no initial list yet, so callers can fall
+    back to a live list. The namespaces informer is small and runs unless
+    K8S_NAMESPACE_INFORMER_ENABLED is off, even without K8S_INFORMERS_ENABLED.
+    """
+    enabled = getattr(settings, "K8S_INFORMERS_ENABLED", False) or (
+        kind == "namespaces" and getattr(settings, "K8S_NAMESPACE_INFORMER_ENABLED", False))
+    if not enabled:
+        return None
+    try:
+        informer = get_informer(path, context, kind)
+    except Exception as e:
+        logger.error(f"Informer {kind} unavailable for {context}: {e}")
+        return None
+    if not informer.wait_for_sync(getattr(settings, "K8S_INFORMER_SYNC_TIMEOUT", 10)):
+        return None
+    return informer.list(namespace)
+
+def stop_informers():
+    with _informers_lock:
+        for informer in _informers.values():
+            informer.stop()
+        _informers.clear()
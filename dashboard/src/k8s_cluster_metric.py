@@ -1,46 +1,45 @@
 from kubernetes import client, config
 from .utils import configure_k8s
+from .metrics.k8s_node_metrics import node_usage
+import numpy as np
+
+def summarize_usage(node_metrics):
+    # Cluster CPU/memory usage from the per-node rows of k8s_node_metrics; nodes without metrics are left out
+    rows = [row for row in node_metrics if "error" not in row]
+    columns = np.array([[row["cpu_usage_nano"], row["memory_usage_bytes"], row["cpu_cores"], row["memory_capacity_bytes"]]
+                        for row in rows], dtype=np.float64).reshape(-1, 4)
+    cpu_usage_nano, memory_usage_bytes, cpu_cores, memory_capacity_bytes = columns.sum(axis=0)
+    # CPU in cores, memory in Gi
+    total_cpu_usage = cpu_usage_nano / 1e9
+    total_memory_usage = memory_usage_bytes / (1024 ** 3)
+    total_cpu_capacity = int(cpu_cores) if float(cpu_cores).is_integer() else round(float(cpu_cores), 3)
+    total_memory_capacity = round(float(memory_capacity_bytes) / (1024 ** 3), 2)
+
+    # Calculate percentage usage
+    cpu_percent = (total_cpu_usage / total_cpu_capacity) * 100 if total_cpu_capacity else 0
+    memory_percent = (total_memory_usage / total_memory_capacity) * 100 if total_memory_capacity else 0
+
+    cpu_percent = round(float(cpu_percent),2)
+    memory_percent = round(float(memory_percent), 2)
+
+    return {'cpu_usage': cpu_percent, 'memory_usage': memory_percent, 'cpu_total': total_cpu_capacity, 'memory_total': total_memory_capacity }
+
+def summarize_metrics(metrics, nodes):
+    # Cluster CPU/memory usage from a metrics.k8s.io node list and the matching V1Nodes
+    return summarize_usage(node_usage(metrics, nodes))
+
 def get_metrics(path, context):
     try:
-        configure_k8s(path, context)
+        api_client = configure_k8s(path, context)
 
-        api = client.CustomObjectsApi()
-        core_api = client.CoreV1Api()
+        api = client.CustomObjectsApi(api_client)
+        core_api = client.CoreV1Api(api_client)
 
         metrics = api.list_cluster_custom_object("metrics.k8s.io", "v1beta1", "nodes")
 
         node_list = core_api.list_node()
 
-        total_cpu_usage = 0
-        total_memory_usage = 0
-        total_cpu_capacity = 0
-        total_memory_capacity = 0
-
-        for node in metrics["items"]:
-            node_name = node["metadata"]["name"]
-            
-            # CPU Usage (convert from nanocores to cores)
-            usage_cpu = int(node["usage"]["cpu"][:-1]) / 1e9
-            total_cpu_usage += usage_cpu
-
-            # Memory Usage (convert from Ki to Gi)
-            usage_memory = int(node["usage"]["memory"][:-2]) / (1024 * 1024)
-            total_memory_usage += usage_memory
-
-            # Get total capacity of each node
-            for n in node_list.items:
-                if n.metadata.name == node_name:
-                    total_cpu_capacity += int(n.status.capacity["cpu"])  # Cores
-                    total_memory_capacity += int(n.status.capacity["memory"][:-2]) / (1024 * 1024)  # Convert Ki to Gi
-                    total_memory_capacity = round(total_memory_capacity, 2)
-        # Calculate percentage usage
-        cpu_percent = (total_cpu_usage / total_cpu_capacity) * 100 if total_cpu_capacity else 0
-        memory_percent = (total_memory_usage / total_memory_capacity) * 100 if total_memory_capacity else 0
-
-        cpu_percent = round(cpu_percent,2)
-        memory_percent = round(memory_percent, 2)
-
-        return {'cpu_usage': cpu_percent, 'memory_usage': memory_percent, 'cpu_total': total_cpu_capacity, 'memory_total': total_memory_capacity }
-    
+        return summarize_metrics(metrics, node_list.items)
+
     except client.exceptions.ApiException as e:
-        return {"error": f"Failed to fetch endpoint details: {e.reason}"}
\ No newline at end of file
+        return {"error": f"Failed to fetch endpoint details: {e.reason}"}
@@ -9,7 +9,7 @@ import os
 
 def run_kube_bench_job(job_file,path, context, namespace="default"):
 
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
 
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     two_levels_up = os.path.dirname(os.path.dirname(BASE_DIR))
@@ -22,7 +22,7 @@ def run_kube_bench_job(job_file,path, context, namespace="default"):
     except FileNotFoundError:
         print(f"❌ Job file {job_file} not found")
         return False
-    batch_v1 = client.BatchV1Api()
+    batch_v1 = client.BatchV1Api(api_client)
     job_name = job_yaml["metadata"]["name"]
     try:
         try:
@@ -43,9 +43,9 @@ def run_kube_bench_job(job_file,path, context, namespace="default"):
         print(f"❌ Failed to create job: {e}")
         return False
 
-def get_kube_bench_logs(job_name="kube-bench", namespace="default", timeout_seconds=300):
-    core_v1 = client.CoreV1Api()
-    batch_v1 = client.BatchV1Api()
+def get_kube_bench_logs(api_client, job_name="kube-bench", namespace="default", timeout_seconds=300):
+    core_v1 = client.CoreV1Api(api_client)
+    batch_v1 = client.BatchV1Api(api_client)
     start_time = time.time()
     pods = []
     while not pods:
@@ -266,8 +266,8 @@ def render_test(pdf, test):
     pdf.set_font('Dejavu_Sans', '', 10)
     pdf.multi_cell(0, 5, clean_details)
 
-def cleanup_kube_bench_job(job_name="kube-bench", namespace="default"):
-    batch_v1 = client.BatchV1Api()
+def cleanup_kube_bench_job(api_client, job_name="kube-bench", namespace="default"):
+    batch_v1 = client.BatchV1Api(api_client)
     try:
         try:
             batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
@@ -330,10 +330,10 @@ def kube_bench_report_generate(path, context):
             job_file = 'job.yaml'
 
         job_name = run_kube_bench_job(job_file=job_file, path=path, context=context)
-        logs = get_kube_bench_logs(job_name=job_name, timeout_seconds=300)
+        logs = get_kube_bench_logs(configure_k8s(path, context), job_name=job_name, timeout_seconds=300)
         generate_kube_bench_pdf(logs, filename="kube_bench_report.pdf", context=context, path=path)
     except Exception as e:
         print(f"❌ An error occurred: {e}")
     finally:
         if job_name != None:
-            cleanup_kube_bench_job(job_name=job_name)
+            cleanup_kube_bench_job(configure_k8s(path, context), job_name=job_name)
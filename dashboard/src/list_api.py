@@ -0,0 +1,182 @@
+from collections import OrderedDict
+import threading
+import time
+from django.conf import settings
+from .informers import INFORMER_KINDS
+from .utils import configure_k8s, list_raw
+from .view_cache import cache_key, cached_entry
+from .workloads import k8s_cronjobs, k8s_daemonset, k8s_deployments, k8s_jobs, k8s_pods, k8s_replicaset, k8s_statefulset
+from .config_secrets import k8s_configmaps, k8s_secrets
+from .services import k8s_services
+from .cluster_management import k8s_namespaces, k8s_nodes
+
+# resource -> function returning the list page's rows (or a (rows, count) tuple)
+LIST_RESOURCES = {
+    "pods": k8s_pods.get_pod_info,
+    "deployments": k8s_deployments.getDeploymentsInfo,
+    "replicasets": k8s_replicaset.getReplicaSetsInfo,
+    "statefulsets": k8s_statefulset.getStatefulsetList,
+    "daemonsets": k8s_daemonset.getDaemonsetList,
+    "jobs": k8s_jobs.getJobsList,
+    "cronjobs": k8s_cronjobs.getCronJobsList,
+    "configmaps": k8s_configmaps.get_configmaps,
+    "secrets": k8s_secrets.list_secrets,
+    "services": k8s_services.list_kubernetes_services,
+    "nodes": k8s_nodes.get_nodes_info,
+    "namespaces": k8s_namespaces.namespaces_data,
+}
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Seconds per calculateAge() unit, so "45m" sorts before "2h"
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Filtered and sorted orderings kept per RowIndex, so paging through one query does not redo it
+QUERY_CACHE_SIZE = 32
+# Seconds a RowIndex is reused when the view cache is off, so paging through a list does not refetch it
+INDEX_TTL = 15
+
+
+def result_rows(result):
+    # Several list functions return (rows, count)
+    return result[0] if isinstance(result, tuple) else result
+
+def age_seconds(age):
+    try:
+        return int(age[:-1]) * AGE_UNITS[age[-1]]
+    except (TypeError, ValueError, KeyError, IndexError):
+        return None
+
+def sort_key(row, field):
+    value = row.get(field)
+    if field == "age":
+        value = age_seconds(value)
+    # Numbers before strings so mixed columns still compare; missing values are marked with 2
+    if value is None:
+        return (2, 0)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value).casefold())
+
+def label_selected_keys(path, context, resource, label_selector):
+    """
+    Return the (namespace, name) of every object of a resource matching a label selector.
+
+    List rows do not carry labels, so the selector is evaluated by the API
+    server. Only metadata is read, from the raw response.
+    """
+    api_class, list_method = INFORMER_KINDS[resource]
+    api = api_class(configure_k8s(path, context))
+    return {(item["metadata"].get("namespace"), item["metadata"]["name"])
+            for item in list_raw(getattr(api, list_method), label_selector=label_selector)}
+
+
+class RowIndex:
+    """
+    The rows of one list page indexed for server-side filtering and sorting.
+
+    Rows are bucketed by namespace and status and their lowercased names are
+    kept alongside, so a filter only scans the buckets it selects. Sort keys
+    are computed once per field, and the last QUERY_CACHE_SIZE orderings
+    returned by query() are kept.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.by_namespace = {}
+        self.by_status = {}
+        self.names = []
+        for position, row in enumerate(rows):
+            self.by_namespace.setdefault(row.get("namespace"), []).append(position)
+            self.by_status.setdefault(row.get("status"), []).append(position)
+            self.names.append(str(row.get("name", "")).casefold())
+        self._sort_keys = {}
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def select(self, namespace=None, status=None, name=None, keys=None):
+        """
+        Return the positions of the rows matching every given filter, in row order.
+
+        namespace is one namespace or a list of them.
+        """
+        positions = range(len(self.rows))
+        if isinstance(namespace, (list, tuple)) and len(namespace) == 1:
+            namespace = namespace[0]
+        if isinstance(namespace, (list, tuple)):
+            positions = sorted(position for value in set(namespace) for position in self.by_namespace.get(value, []))
+        elif namespace:
+            positions = self.by_namespace.get(namespace, [])
+        if status:
+            matching = self.by_status.get(status, [])
+            positions = matching if not namespace else sorted(set(positions).intersection(matching))
+        if name:
+            name = name.casefold()
+            positions = [position for position in positions if name in self.names[position]]
+        if keys is not None:
+            positions = [position for position in positions
+                         if (self.rows[position].get("namespace"), self.rows[position].get("name")) in keys]
+        return list(positions)
+
+    def sort(self, positions, field, descending=False):
+        if field not in self._sort_keys:
+            self._sort_keys[field] = [sort_key(row, field) for row in self.rows]
+        keys = self._sort_keys[field]
+        # Keep rows without the field last in both directions
+        present = [position for position in positions if keys[position][0] != 2]
+        missing = [position for position in positions if keys[position][0] == 2]
+        return sorted(present, key=keys.__getitem__, reverse=descending) + missing
+
+    def query(self, namespace=None, status=None, name=None, sort=None):
+        """
+        Return the positions selected by the filters, ordered by sort (a field, "-" prefix for descending).
+
+        Results are remembered per filter and sort, so the next pages of a
+        query are slices of the same list. Callers must not modify it.
+        """
+        query = (tuple(namespace) if isinstance(namespace, list) else namespace, status, name, sort)
+        with self._lock:
+            if query in self._queries:
+                self._queries.move_to_end(query)
+                return self._queries[query]
+        positions = self.select(namespace=namespace, status=status, name=name)
+        if sort:
+            positions = self.sort(positions, sort.lstrip("-"), descending=sort.startswith("-"))
+        with self._lock:
+            self._queries[query] = positions
+            if len(self._queries) > QUERY_CACHE_SIZE:
+                self._queries.popitem(last=False)
+        return positions
+
+    def page(self, positions):
+        return [self.rows[position] for position in positions]
+
+
+# RowIndex of each list result, keyed like the view cache with the version it was built from and its expiry
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def row_index(cluster_id, resource, path, context):
+    """
+    Return the RowIndex of a resource's list rows, from the same cached fetch as the HTML list page.
+
+    The index is kept until the view cache rebuilds the rows, so its sort
+    keys and query results serve every page request in between. With the
+    view cache disabled the index keeps its own rows for INDEX_TTL seconds.
+    """
+    fetch = LIST_RESOURCES[resource]
+    key = cache_key(cluster_id, "all", fetch, path, context)
+    if settings.K8S_VIEW_CACHE_TTL:
+        version, result = cached_entry(cluster_id, "all", fetch, path, context)
+    else:
+        with _indexes_lock:
+            entry = _indexes.get(key)
+        if entry is not None and entry[0] is None and time.monotonic() < entry[1]:
+            return entry[2]
+        version, result = None, fetch(path, context)
+    with _indexes_lock:
+        entry = _indexes.get(key)
+        if version is None or entry is None or entry[0] != version:
+            entry = (version, time.monotonic() + INDEX_TTL, RowIndex(result_rows(result)))
+            _indexes[key] = entry
+    return entry[2]
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from operator import attrgetter
+
+
+def compile_columns(columns):
+    """
+    Turn a column spec into (name, getter) pairs called as getter(obj, now).
+
+    A spec is a sequence of (name, source) pairs where source is either a
+    dotted attribute path such as "metadata.name" or a callable taking the
+    object and the time of the listing. Compile a module's spec once, at
+    import time, and pass the result to project().
+    """
+    compiled = []
+    for name, source in columns:
+        if isinstance(source, str):
+            source = (lambda get: lambda obj, now: get(obj))(attrgetter(source))
+        compiled.append((name, source))
+    return tuple(compiled)
+
+def project(objects, columns, now=None):
+    """
+    Build one row dict per object in a single pass over compiled columns.
+
+    Every row shares the same now, so ages are consistent across the page
+    and the clock is read once per listing instead of once per row.
+    """
+    now = now or datetime.now(timezone.utc)
+    return [{name: get(obj, now) for name, get in columns} for obj in objects]
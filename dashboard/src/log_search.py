@@ -0,0 +1,118 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import re
+import time
+from kubernetes import client
+from django.conf import settings
+from kubebuddy.appLogs import logger
+from .utils import configure_k8s, list_items
+from .pod_logs import stream_pod_log
+
+DEFAULT_CONTEXT_LINES = 2
+MAX_CONTEXT_LINES = 10
+DEFAULT_MAX_MATCHES = 50
+MAX_MATCHES = 500
+MAX_PATTERN_LENGTH = 256
+
+
+def compile_pattern(pattern, regex=False, ignore_case=False):
+    """
+    Compile a search pattern and return it with whether it is matched literally.
+
+    The pattern is matched literally unless regex is set; a regex that does
+    not compile is matched literally too. Patterns longer than
+    MAX_PATTERN_LENGTH raise a ValueError.
+    """
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise ValueError(f"pattern is longer than {MAX_PATTERN_LENGTH} characters")
+    flags = re.IGNORECASE if ignore_case else 0
+    if regex:
+        try:
+            return re.compile(pattern, flags), False
+        except re.error:
+            pass
+    return re.compile(re.escape(pattern), flags), True
+
+def grep_lines(lines, regex, context=0, max_matches=None, deadline=None):
+    """
+    Yield a dict per line matching regex, with up to context lines before and after it.
+
+    Only the last context lines are held. Once max_matches matches have
+    their trailing context, the generator returns without reading further.
+    It also stops at deadline, a time.monotonic() value, with the matches
+    found so far.
+    """
+    before = deque(maxlen=context)
+    # Matches still collecting their trailing context, oldest first
+    pending = []
+    found = 0
+    for number, line in enumerate(lines, 1):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        for match in pending:
+            match["after"].append(line)
+        while pending and len(pending[0]["after"]) == context:
+            yield pending.pop(0)
+        if max_matches is not None and found >= max_matches:
+            if not pending:
+                return
+        elif regex.search(line):
+            found += 1
+            match = {"line_number": number, "line": line, "before": list(before), "after": []}
+            if context:
+                pending.append(match)
+            else:
+                yield match
+                if found == max_matches:
+                    return
+        before.append(line)
+    yield from pending
+
+def namespace_pods(path, context, namespace, label_selector=None):
+    """Return the names of a namespace's pods that have started, optionally filtered by labels."""
+    v1 = client.CoreV1Api(configure_k8s(path, context))
+    kwargs = {"label_selector": label_selector} if label_selector else {}
+    pods = list_items(v1.list_namespaced_pod, namespace=namespace, **kwargs)
+    # Pending pods have no log yet
+    return sorted(pod.metadata.name for pod in pods if pod.status.phase != "Pending")
+
+def search_pod(path, context, namespace, pod_name, regex, since_seconds, context_lines, max_matches, **options):
+    """
+    Search one pod's log within the last since_seconds, reading it as a stream.
+
+    The search stops after K8S_LOG_SEARCH_TIMEOUT seconds; the result is
+    then truncated like one that reached max_matches.
+    """
+    deadline = time.monotonic() + settings.K8S_LOG_SEARCH_TIMEOUT if settings.K8S_LOG_SEARCH_TIMEOUT else None
+    try:
+        lines = stream_pod_log(path, context, namespace, pod_name, bounded=False, since_seconds=since_seconds,
+                               limit_bytes=settings.K8S_LOG_SEARCH_LIMIT_BYTES, **options)
+    except client.exceptions.ApiException as e:
+        return {"pod": pod_name, "error": e.reason}
+    try:
+        matches = list(grep_lines(lines, regex, context_lines, max_matches, deadline))
+    except Exception as e:
+        logger.error(f"Searching logs of pod {pod_name} failed: {e}")
+        return {"pod": pod_name, "error": "Log stream interrupted"}
+    finally:
+        # Stops the download once enough matches were found
+        lines.close()
+    timed_out = deadline is not None and time.monotonic() >= deadline
+    return {"pod": pod_name, "matches": matches, "truncated": len(matches) >= max_matches or timed_out}
+
+def search_logs(path, context, namespace, pod_names, regex, since_seconds,
+                context_lines=DEFAULT_CONTEXT_LINES, max_matches=DEFAULT_MAX_MATCHES, **options):
+    """
+    Search the logs of several pods concurrently and return the pods with matches or errors.
+
+    Pods are searched by at most K8S_LOG_SEARCH_WORKERS threads. Each pod's
+    result holds at most max_matches matches with their context, so the
+    result size is bounded however large the logs are.
+    """
+    pod_names = pod_names[:settings.K8S_LOG_AGGREGATION_MAX_PODS]
+    if not pod_names:
+        return []
+    with ThreadPoolExecutor(max_workers=min(settings.K8S_LOG_SEARCH_WORKERS, len(pod_names))) as executor:
+        results = executor.map(lambda pod_name: search_pod(path, context, namespace, pod_name, regex, since_seconds,
+                                                           context_lines, max_matches, **options), pod_names)
+        return [result for result in results if result.get("matches") or result.get("error")]
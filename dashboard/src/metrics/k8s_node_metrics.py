@@ -2,66 +2,81 @@ from kubernetes import config, client
 from kubebuddy.appLogs import logger
 from kubernetes.client.rest import ApiException
 from ..utils import configure_k8s
+from ..quantity import parse_quantities
+import numpy as np
+
+METRICS_GROUP = "metrics.k8s.io"
+METRICS_VERSION = "v1beta1"
+
+
+def node_usage(metrics, nodes):
+    """
+    Join a metrics.k8s.io node list with V1Nodes by name, one row per node.
+
+    The metrics are indexed by node name once, so the join is linear in the
+    number of nodes. Usage and capacity are parsed as columns with the
+    shared quantity parser, so any unit (e.g. millicore capacity) works.
+    Rows keep the raw usage and capacity next to the display values, for
+    callers that sum them. Nodes the metrics API has no entry for get a row
+    with an error.
+    """
+    usage_by_name = {item["metadata"]["name"]: item["usage"] for item in (metrics or {}).get("items") or []}
+    measured = [(node, usage_by_name[node.metadata.name]) for node in nodes if node.metadata.name in usage_by_name]
+    cpu_usage_nano = parse_quantities([usage["cpu"] for _, usage in measured], unit="n")
+    memory_usage_bytes = parse_quantities([usage["memory"] for _, usage in measured])
+    cpu_capacity_cores = parse_quantities([node.status.capacity["cpu"] for node, _ in measured])
+    memory_capacity_bytes = parse_quantities([node.status.capacity["memory"] for node, _ in measured])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cpu_usage_percentage = np.round(cpu_usage_nano / (cpu_capacity_cores * 1e9) * 100, 2)
+        memory_usage_percentage = np.round(memory_usage_bytes / memory_capacity_bytes * 100, 2)
+
+    rows = {}
+    for index, (node, _) in enumerate(measured):
+        cores = float(cpu_capacity_cores[index])
+        rows[node.metadata.name] = {
+            "name": node.metadata.name,
+            "cpu_cores": int(cores) if cores.is_integer() else cores,
+            "cpu_usage_percentage": float(cpu_usage_percentage[index]),
+            # Convert memory bytes to Mi
+            "memory_mi": round(float(memory_capacity_bytes[index]) / (1024 * 1024), 2),
+            "memory_usage_percentage": float(memory_usage_percentage[index]),
+            "cpu_usage_nano": float(cpu_usage_nano[index]),
+            "memory_usage_bytes": float(memory_usage_bytes[index]),
+            "memory_capacity_bytes": float(memory_capacity_bytes[index]),
+        }
+    return [rows.get(node.metadata.name) or {"name": node.metadata.name, "error": "No metrics reported for this node"}
+            for node in nodes]
 
 def get_node_metrics(path=None, context=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    metrics_api = client.CustomObjectsApi()
+    """
+    Return (rows, node count, metrics available) for every node.
+
+    Usage comes from one list call to the metrics API, joined with the node
+    list by node_usage. The dashboard gauge sums the same rows, so the
+    node metrics page and the dashboard share one cached fetch.
+    """
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    metrics_api = client.CustomObjectsApi(api_client)
 
     try:
         nodes = v1.list_node().items
-        node_metrics = []
-        total_nodes = len(nodes)
-        metrics_available = True
-        
+
         # Check if metrics API is available
         try:
             # Try to access metrics API
-            metrics_api.get_api_resources(group="metrics.k8s.io", version="v1beta1")
+            metrics_api.get_api_resources(group=METRICS_GROUP, version=METRICS_VERSION)
         except ApiException:
             # Metrics API not available
             return {"error": "Metrics API not available"}, 0, False
-            
-        for node in nodes:
-            node_name = node.metadata.name
-            try:
-                metrics = metrics_api.get_cluster_custom_object(
-                    group="metrics.k8s.io",
-                    version="v1beta1",
-                    name=node_name,
-                    plural="nodes",
-                )
-
-                cpu_usage_nano = int(metrics['usage']['cpu'].replace('n', ''))
-                memory_usage_bytes = int(metrics['usage']['memory'].replace('Ki', '')) * 1024  # convert Ki to bytes
-
-                # Get node capacity for CPU and memory to calculate percentages
-                node_capacity = node.status.capacity
-                cpu_capacity_cores = int(node_capacity['cpu'])
-                memory_capacity_bytes = int(node_capacity['memory'].replace('Ki', '')) * 1024
 
-                cpu_usage_percentage = (cpu_usage_nano / (cpu_capacity_cores * 1e9)) * 100
-                memory_usage_percentage = (memory_usage_bytes / memory_capacity_bytes) * 100
-
-                # Convert memory bytes to Mi
-                memory_capacity_mi = memory_capacity_bytes / (1024 * 1024)
-                node_metrics.append({
-                    "name": node_name,
-                    "cpu_cores": cpu_capacity_cores,
-                    "cpu_usage_percentage": round(cpu_usage_percentage, 2),
-                    "memory_mi": round(memory_capacity_mi,2),
-                    "memory_usage_percentage": round(memory_usage_percentage, 2)
-                })
-
-            except ApiException as e:
-                logger.error(f"Error fetching metrics for node {node_name}: {e}")
-                node_metrics.append({
-                    "name": node_name,
-                    "error": f"Failed to fetch metrics: {e.reason}"
-                })
-                metrics_available = False
+        try:
+            metrics = metrics_api.list_cluster_custom_object(group=METRICS_GROUP, version=METRICS_VERSION, plural="nodes")
+        except ApiException as e:
+            logger.error(f"Error fetching node metrics: {e}")
+            return {"error": f"Failed to fetch node metrics: {e.reason}"}, 0, False
 
-        return node_metrics, total_nodes, metrics_available
+        return node_usage(metrics, nodes), len(nodes), True
 
     except ApiException as e:
-        return {"error": f"Failed to fetch node list: {e.reason}"}, 0, False
\ No newline at end of file
+        return {"error": f"Failed to fetch node list: {e.reason}"}, 0, False
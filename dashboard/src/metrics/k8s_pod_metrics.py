@@ -1,92 +1,97 @@
 from kubernetes import config, client
 from kubebuddy.appLogs import logger
 from kubernetes.client.rest import ApiException
-from ..utils import configure_k8s
+from ..utils import configure_k8s, list_raw
+from ..quantity import sum_by
 
-def get_pod_metrics(path=None, context=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    metrics_api = client.CustomObjectsApi()
+METRICS_GROUP = "metrics.k8s.io"
+METRICS_VERSION = "v1beta1"
 
-    try:
-        # Check if metrics API is available
-        try:
-            # Try to access metrics API
-            metrics_api.get_api_resources(group="metrics.k8s.io", version="v1beta1")
-        except ApiException:
-            # Metrics API not available
-            return {"error": "Metrics API not available"}, 0, False
-        
-        all_namespaces = v1.list_namespace().items
-        all_pod_metrics = []
-        metrics_available = True
 
-        for namespace_obj in all_namespaces:
-            namespace = namespace_obj.metadata.name
-            try:
-                pods = v1.list_namespaced_pod(namespace=namespace).items
-                for pod in pods:
-                    pod_name = pod.metadata.name
-                    try:
-                        metrics = metrics_api.get_namespaced_custom_object(
-                            group="metrics.k8s.io",
-                            version="v1beta1",
-                            name=pod_name,
-                            plural="pods",
-                            namespace=namespace,
-                        )
+def pod_usage(items):
+    """
+    Return the CPU (millicores) and memory (Mi) used by each PodMetrics item, as arrays in item order.
 
-                        total_cpu_usage_nano = 0
-                        total_memory_usage_bytes = 0
+    The usage of every container of every pod is parsed as one column and
+    summed per pod in a single vectorized pass.
+    """
+    owners, cpu, memory = [], [], []
+    for position, item in enumerate(items):
+        for container in item.get("containers") or []:
+            owners.append(position)
+            cpu.append(container["usage"]["cpu"])
+            memory.append(container["usage"]["memory"])
+    return sum_by(owners, cpu, len(items), unit="m"), sum_by(owners, memory, len(items), unit="Mi")
 
-                        for container in metrics['containers']:
-                            cpu_str = container['usage']['cpu']
-                            memory_str = container['usage']['memory']
+def list_pod_usage(metrics_api, namespace="all"):
+    """Return {(namespace, name): PodMetrics item} from one list call to the metrics API."""
+    if namespace == "all":
+        metrics = metrics_api.list_cluster_custom_object(group=METRICS_GROUP, version=METRICS_VERSION, plural="pods")
+    else:
+        metrics = metrics_api.list_namespaced_custom_object(group=METRICS_GROUP, version=METRICS_VERSION,
+                                                            namespace=namespace, plural="pods")
+    return {(item["metadata"]["namespace"], item["metadata"]["name"]): item for item in metrics.get("items") or []}
 
-                            if cpu_str.endswith('n'):
-                                total_cpu_usage_nano += int(cpu_str.replace('n', ''))
-                            elif cpu_str.endswith('m'):
-                                total_cpu_usage_nano += int(cpu_str.replace('m', '')) * 1000000
+def list_pod_keys(v1, namespace="all"):
+    # Only the names are needed for the join, so the pods are read as raw dicts
+    if namespace == "all":
+        pods = list_raw(v1.list_pod_for_all_namespaces)
+    else:
+        pods = list_raw(v1.list_namespaced_pod, namespace=namespace)
+    return {(pod["metadata"]["namespace"], pod["metadata"]["name"]) for pod in pods}
 
-                            if memory_str.endswith('Ki'):
-                                total_memory_usage_bytes += int(memory_str.replace('Ki', '')) * 1024
-                            elif memory_str.endswith('Mi'):
-                                total_memory_usage_bytes += int(memory_str.replace('Mi', '')) * 1024 * 1024
-                            elif memory_str.endswith('Gi'):
-                                total_memory_usage_bytes += int(memory_str.replace('Gi','')) * 1024 * 1024 * 1024
-                            elif memory_str.endswith('Ti'):
-                                total_memory_usage_bytes += int(memory_str.replace('Ti','')) * 1024 * 1024 * 1024 * 1024
-                            elif memory_str.endswith('Pi'):
-                                total_memory_usage_bytes += int(memory_str.replace('Pi','')) * 1024 * 1024 * 1024 * 1024 * 1024
-                            elif memory_str.endswith('Ei'):
-                                total_memory_usage_bytes += int(memory_str.replace('Ei','')) * 1024 * 1024 * 1024 * 1024 * 1024 * 1024
-                            elif memory_str.endswith('B'):
-                                total_memory_usage_bytes += int(memory_str.replace('B',''))
+def get_pod_metrics(path=None, context=None, namespace="all"):
+    """
+    Return (rows, row count, metrics available) for the pods of a namespace or of all namespaces.
 
-                        cpu_usage_milli = int(total_cpu_usage_nano / 1000000)
-                        memory_usage_mi = round(total_memory_usage_bytes / (1024 * 1024), 2)
+    The usage of every pod comes from a single list call to the metrics API,
+    joined in memory with the pod list. Pods the metrics API has no entry
+    for (e.g. just started or completed) get a row with an error instead of
+    a request each.
+    """
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    metrics_api = client.CustomObjectsApi(api_client)
 
-                        all_pod_metrics.append({
-                            "name": pod_name,
-                            "namespace": namespace,
-                            "cpu_usage_milli": cpu_usage_milli,
-                            "memory_usage_mi": memory_usage_mi,
-                            'error': '-'
-                        })
+    try:
+        # Try to access metrics API
+        metrics_api.get_api_resources(group=METRICS_GROUP, version=METRICS_VERSION)
+    except ApiException:
+        # Metrics API not available
+        return {"error": "Metrics API not available"}, 0, False
 
-                    except ApiException as e:
-                        logger.error(f"Error fetching metrics for pod {pod_name} in namespace {namespace}: {e}")
-                        all_pod_metrics.append({
-                            "name": pod_name,
-                            "namespace": namespace,
-                            "error": f"Failed to fetch metrics: {e.reason}"
-                        })
-                        # metrics_available = False
+    try:
+        usage = list_pod_usage(metrics_api, namespace)
+    except ApiException as e:
+        logger.error(f"Error fetching pod metrics: {e}")
+        return {"error": f"Failed to fetch pod metrics: {e.reason}"}, 0, False
+    try:
+        pod_keys = list_pod_keys(v1, namespace)
+    except ApiException as e:
+        logger.error(f"Error fetching pods: {e}")
+        return {"error": f"Failed to fetch pod list: {e.reason}"}, 0, False
 
-            except ApiException as e:
-                logger.error(f"Error fetching pods in namespace {namespace}: {e}")
+    keys = list(usage)
+    cpu_milli, memory_mi = pod_usage([usage[key] for key in keys])
+    position = {key: index for index, key in enumerate(keys)}
 
-        return all_pod_metrics, len(all_pod_metrics), metrics_available
+    all_pod_metrics = []
+    # Pods created after the pod list was read still have their metrics shown
+    for pod_namespace, pod_name in sorted(pod_keys | usage.keys()):
+        index = position.get((pod_namespace, pod_name))
+        if index is None:
+            all_pod_metrics.append({
+                "name": pod_name,
+                "namespace": pod_namespace,
+                "error": "No metrics reported for this pod"
+            })
+            continue
+        all_pod_metrics.append({
+            "name": pod_name,
+            "namespace": pod_namespace,
+            "cpu_usage_milli": int(cpu_milli[index]),
+            "memory_usage_mi": round(float(memory_mi[index]), 2),
+            'error': '-'
+        })
 
-    except ApiException as e:
-        return {"error": f"Failed to fetch namespace list: {e.reason}"}, 0, False
\ No newline at end of file
+    return all_pod_metrics, len(all_pod_metrics), True
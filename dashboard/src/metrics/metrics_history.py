@@ -0,0 +1,214 @@
+from kubebuddy.appLogs import logger
+from django.conf import settings
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+import numpy as np
+from .metrics_sampler import INITIAL_ROWS, COARSE_STEP, MetricRing, SeriesStore
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on Windows; only one process may then sample a cluster
+    fcntl = None
+
+HOURLY_STEP = 3600
+SERIES_FILE = "series.json"
+LOCK_FILE = ".lock"
+# Column file extensions; files of a tier whose step or retention changed are removed on open
+COLUMN_SUFFIXES = (".sums.f32", ".counts.u16", ".buckets.i64", ".last_seen.f64", ".first_seen.f64")
+
+
+def open_column(path, dtype, shape):
+    """Memory-map a column file of shape, creating it or resizing it to fit; returns (array, created)."""
+    created = not os.path.exists(path)
+    with open(path, "ab") as f:
+        f.truncate(math.prod(shape) * np.dtype(dtype).itemsize)
+    return np.memmap(path, dtype=dtype, mode="r+", shape=shape), created
+
+
+class DiskRing(MetricRing):
+    """
+    A MetricRing whose arrays are memory-mapped files, so it survives restarts.
+
+    The files are series-major like the arrays, so the window of a series
+    is one contiguous read and pages are read from disk only when touched.
+    New rows are appended to the files: growing never rewrites the rows
+    already stored, and mappings taken before still read right. A crash
+    while the files grow leaves some of them longer than the others; they
+    are all lengthened to the longest on open.
+    """
+
+    def __init__(self, directory, name, step, slots, rows):
+        self.step = step
+        self.slots = slots
+        self.prefix = os.path.join(directory, f"{name}-{step}s-{slots}")
+        self.slot_buckets, created = open_column(self.prefix + ".buckets.i64", np.int64, (slots,))
+        if created:
+            self.slot_buckets[:] = -1
+        self.sums = self._open(".sums.f32", np.float32, (2,), rows)
+        self.counts = self._open(".counts.u16", np.uint16, (), rows)
+        self.grow(self.rows)
+
+    @property
+    def rows(self):
+        return max(self.sums.shape[0], self.counts.shape[0])
+
+    def _open(self, suffix, dtype, shape, rows):
+        """Map a column of at least rows series, keeping every row already in the file."""
+        path = self.prefix + suffix
+        row_bytes = self.slots * math.prod(shape) * np.dtype(dtype).itemsize
+        stored = os.path.getsize(path) // row_bytes if os.path.exists(path) else 0
+        return open_column(path, dtype, (max(stored, rows), self.slots) + shape)[0]
+
+    def grow(self, rows):
+        self.flush()
+        self.sums = self._open(".sums.f32", np.float32, (2,), rows)
+        self.counts = self._open(".counts.u16", np.uint16, (), rows)
+
+    def flush(self):
+        self.sums.flush()
+        self.counts.flush()
+        self.slot_buckets.flush()
+
+
+class HistoryStore(SeriesStore):
+    """
+    A SeriesStore kept in memory-mapped column files under directory.
+
+    Three tiers are kept: raw samples for K8S_METRICS_RAW_RETENTION seconds,
+    and five-minute and hourly means for K8S_METRICS_5M_RETENTION and
+    K8S_METRICS_1H_RETENTION. Each sample is added to all three, so the
+    coarse tiers are downsampled as they are written. A series unseen for
+    K8S_METRICS_SERIES_RETENTION seconds gives up its row, and a full store
+    reuses the row of the series seen longest ago. The series keys are
+    saved to series.json when they change. The columns are shared mappings,
+    so the process may exit or crash without losing samples; they are
+    flushed to disk every K8S_METRICS_FLUSH_INTERVAL seconds, off the
+    request path, so a machine crash loses at most that many seconds.
+    """
+
+    def __init__(self, directory, interval, max_series):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        keys = self._load_keys()
+        tiers = [DiskRing(directory, name, step, max(math.ceil(retention / step), 1), max(len(keys), INITIAL_ROWS))
+                 for name, step, retention in (("raw", interval, settings.K8S_METRICS_RAW_RETENTION),
+                                               ("5m", COARSE_STEP, settings.K8S_METRICS_5M_RETENTION),
+                                               ("1h", HOURLY_STEP, settings.K8S_METRICS_1H_RETENTION))]
+        # A crash while the columns grew may leave some of them longer than series.json
+        rows = max(tier.rows for tier in tiers)
+        for tier in tiers:
+            tier.grow(rows)
+        keys.extend([None] * (rows - len(keys)))
+        super().__init__(interval, max_series, tiers=tiers, retention=settings.K8S_METRICS_SERIES_RETENTION)
+        self._remove_stale_columns()
+
+        self.keys = keys
+        self.rows = {key: row for row, key in enumerate(keys) if key is not None}
+        self._next_row = max(self.rows.values(), default=-1) + 1
+        self._free = [row for row in range(self._next_row) if keys[row] is None]
+        self.last_seen, _ = open_column(os.path.join(directory, "series.last_seen.f64"), np.float64, (rows,))
+        self.first_seen, _ = open_column(os.path.join(directory, "series.first_seen.f64"), np.float64, (rows,))
+        self._saved_keys = list(keys)
+        self._flushed = time.monotonic()
+        # A crash between writing a sample and saving series.json leaves samples in rows of no series;
+        # the rows are free, and their samples hidden by first_seen once reused
+        self.last_seen[[row for row, key in enumerate(keys) if key is None]] = 0
+
+    def _load_keys(self):
+        try:
+            with open(os.path.join(self.directory, SERIES_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except ValueError as e:
+            logger.error(f"Metrics history series in {self.directory} are unreadable, starting over: {e}")
+            return []
+
+    def _remove_stale_columns(self):
+        current = tuple(os.path.basename(tier.prefix) + "." for tier in self.tiers)
+        for name in os.listdir(self.directory):
+            if name.endswith(COLUMN_SUFFIXES) and not name.startswith(current) and not name.startswith("series."):
+                os.remove(os.path.join(self.directory, name))
+
+    def _grow(self, size):
+        for tier in self.tiers:
+            tier.grow(size)
+        self.keys.extend([None] * (size - len(self.keys)))
+        self.last_seen.flush()
+        self.first_seen.flush()
+        self.last_seen, _ = open_column(os.path.join(self.directory, "series.last_seen.f64"), np.float64, (size,))
+        self.first_seen, _ = open_column(os.path.join(self.directory, "series.first_seen.f64"), np.float64, (size,))
+
+    def _save_keys(self):
+        path = os.path.join(self.directory, SERIES_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.keys, f)
+        os.replace(path + ".tmp", path)
+        self._saved_keys = list(self.keys)
+
+    def flush(self):
+        with self._lock:
+            for tier in self.tiers:
+                tier.flush()
+            self.last_seen.flush()
+            self.first_seen.flush()
+            self._flushed = time.monotonic()
+
+    def record(self, timestamp, keys, values):
+        super().record(timestamp, keys, values)
+        with self._lock:
+            if self.keys != self._saved_keys:
+                self._save_keys()
+        # Called from the sampler's thread, so the flush never holds up a page
+        if time.monotonic() - self._flushed >= settings.K8S_METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+
+def history_directory(path, context):
+    # One directory per kubeconfig and context; the context name is kept readable
+    digest = hashlib.sha1(f"{path}\0{context}".encode()).hexdigest()[:12]
+    return os.path.join(settings.K8S_METRICS_HISTORY_DIR, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', context or 'default')}-{digest}")
+
+
+# Histories open in this process keyed by directory, with their lock file
+_histories = {}
+_histories_lock = threading.Lock()
+
+def open_history(directory, interval=None, max_series=None):
+    """
+    Return the on-disk {"nodes": HistoryStore, "pods": HistoryStore} of a cluster directory.
+
+    The stores are opened once per process and shared by the samplers of
+    the cluster, e.g. when its kubeconfig is reloaded. Another process
+    holding the directory's lock raises an OSError.
+    """
+    with _histories_lock:
+        if directory in _histories:
+            return _histories[directory][1]
+        os.makedirs(directory, exist_ok=True)
+        lock_file = open(os.path.join(directory, LOCK_FILE), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise OSError(f"{directory} is in use by another process")
+        interval = interval or settings.K8S_METRICS_SAMPLE_INTERVAL
+        max_series = max_series or settings.K8S_METRICS_MAX_SERIES
+        stores = {kind: HistoryStore(os.path.join(directory, kind), interval, max_series) for kind in ("nodes", "pods")}
+        _histories[directory] = (lock_file, stores)
+        return stores
+
+def close_histories():
+    with _histories_lock:
+        for lock_file, stores in _histories.values():
+            for store in stores.values():
+                store.flush()
+            lock_file.close()
+        _histories.clear()
@@ -0,0 +1,334 @@
+from kubernetes import client
+from kubebuddy.appLogs import logger
+from django.conf import settings
+import math
+import threading
+import time
+import numpy as np
+from ..utils import configure_k8s
+from ..quantity import parse_quantities
+from .k8s_pod_metrics import METRICS_GROUP, METRICS_VERSION, list_pod_usage, pod_usage
+
+# Seconds covered by each tier: samples as taken over the last hour, and five-minute means over the last day
+FINE_SPAN = 3600
+COARSE_STEP = 300
+COARSE_SPAN = 24 * 3600
+# Series rows allocated at first; the arrays grow by a quarter as needed, up to K8S_METRICS_MAX_SERIES,
+# so at most a quarter of the rows are spare
+INITIAL_ROWS = 64
+# Values stored per sample: CPU (millicores) and memory (Mi)
+CPU, MEMORY = 0, 1
+
+
+class MetricRing:
+    """
+    One resolution of the history: a (series, slot) array of samples in fixed-width time slots.
+
+    Slot s holds the bucket timestamp // step with bucket % slots == s, and
+    remembers which bucket it holds, so a slot left over from an older pass
+    reads as empty and the ring never grows over time. A slot keeps the sum
+    and count of the samples in its bucket, so a coarse tier stores means.
+    The arrays are series-major: the window of a series is one contiguous
+    read, and new rows are appended without moving the others.
+    """
+
+    def __init__(self, step, slots, rows=INITIAL_ROWS):
+        self.step = step
+        self.slots = slots
+        self.sums = np.zeros((rows, slots, 2), dtype=np.float32)
+        self.counts = np.zeros((rows, slots), dtype=np.uint16)
+        self.slot_buckets = np.full(slots, -1, dtype=np.int64)
+
+    @property
+    def span(self):
+        return self.step * self.slots
+
+    def nbytes(self):
+        return self.sums.nbytes + self.counts.nbytes + self.slot_buckets.nbytes
+
+    def grow(self, rows):
+        extra = rows - self.sums.shape[0]
+        self.sums = np.concatenate([self.sums, np.zeros((extra, self.slots, 2), dtype=np.float32)])
+        self.counts = np.concatenate([self.counts, np.zeros((extra, self.slots), dtype=np.uint16)])
+
+    def reset(self, rows, timestamp):
+        # Rows given to new series keep their old samples, hidden by window()'s since; only the slot
+        # being filled is cleared, so reusing a row never rewrites the whole column
+        bucket = int(timestamp // self.step)
+        slot = bucket % self.slots
+        if self.slot_buckets[slot] == bucket:
+            self.sums[rows, slot] = 0
+            self.counts[rows, slot] = 0
+
+    def flush(self):
+        pass
+
+    def add(self, timestamp, rows, values):
+        """Add one sample per row; rows are distinct series, values an (n, 2) array."""
+        bucket = int(timestamp // self.step)
+        slot = bucket % self.slots
+        if self.slot_buckets[slot] > bucket:
+            return
+        if self.slot_buckets[slot] != bucket:
+            self.slot_buckets[slot] = bucket
+            self.sums[:, slot] = 0
+            self.counts[:, slot] = 0
+        self.sums[rows, slot] += values
+        self.counts[rows, slot] += 1
+
+    def window(self, row, seconds, now, since=0):
+        """
+        Return the first bucket of the last seconds and the (buckets, 2) means of a row.
+
+        Means are NaN where no sample was taken, and before since, the first
+        sample of the series now in the row.
+        """
+        last = int(now // self.step)
+        buckets = np.arange(last - min(math.ceil(seconds / self.step), self.slots) + 1, last + 1)
+        slots = buckets % self.slots
+        valid = (self.slot_buckets[slots] == buckets) & (buckets >= int(since // self.step))
+        counts = np.where(valid, self.counts[row, slots], 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = self.sums[row, slots] / counts[:, None]
+        means[counts == 0] = np.nan
+        return int(buckets[0]), means
+
+
+class SeriesStore:
+    """
+    The CPU and memory history of every pod or node of a cluster, one array row per series.
+
+    Keys (a node name, or namespace/name for a pod) map to rows. Rows of
+    series unseen for retention seconds (by default the span of the longest
+    tier) are freed and reused, and at most max_series rows are allocated,
+    so memory stays bounded by the number of series and the tier sizes,
+    never by uptime. Once all rows are taken, a new series takes the row
+    of the series seen longest ago, so pod churn never locks new pods out.
+    tiers are MetricRings from finest to coarsest; by default the last hour
+    at the sampling interval and five-minute means over the last day.
+    """
+
+    def __init__(self, interval, max_series, tiers=None, retention=None):
+        self.max_series = max_series
+        self.tiers = tiers or [MetricRing(interval, math.ceil(FINE_SPAN / interval)),
+                               MetricRing(COARSE_STEP, COARSE_SPAN // COARSE_STEP)]
+        self.retention = retention or max(tier.span for tier in self.tiers)
+        self.rows = {}
+        self.keys = [None] * INITIAL_ROWS
+        self.last_seen = np.zeros(INITIAL_ROWS)
+        self.first_seen = np.zeros(INITIAL_ROWS)
+        self._free = []
+        self._next_row = 0
+        self._full_logged = False
+        self._overflow_logged = False
+        # _lock guards the rows and is shared with history(); _record_lock keeps
+        # samples one at a time so the arrays can grow without holding _lock
+        self._lock = threading.Lock()
+        self._record_lock = threading.Lock()
+
+    def nbytes(self):
+        return sum(tier.nbytes() for tier in self.tiers) + self.last_seen.nbytes + self.first_seen.nbytes
+
+    def _row(self, key, timestamp):
+        row = self.rows.get(key)
+        if row is None:
+            row = self._new_row(key, timestamp)
+        if row >= 0:
+            # Marked at once, so the rows of this sample are never the least recently seen
+            self.last_seen[row] = timestamp
+        return row
+
+    def _new_row(self, key, timestamp):
+        if self._free:
+            row = self._free.pop()
+        elif self._next_row < self.max_series:
+            row = self._next_row
+            self._next_row += 1
+        else:
+            oldest = int(np.argmin(self.last_seen[:self._next_row]))
+            if self.last_seen[oldest] >= timestamp:
+                # Every row holds a series of this very sample
+                if not self._overflow_logged:
+                    logger.error(f"Metrics sample has more than {self.max_series} series; the rest are not recorded")
+                    self._overflow_logged = True
+                return -1
+            if not self._full_logged:
+                logger.info(f"Metrics history is full ({self.max_series} series); the series seen longest ago make room")
+                self._full_logged = True
+            self._release(np.array([oldest]))
+            row = self._free.pop()
+        self.rows[key] = row
+        self.keys[row] = key
+        self.first_seen[row] = timestamp
+        for tier in self.tiers:
+            tier.reset(row, timestamp)
+        return row
+
+    def _grow(self, size):
+        for tier in self.tiers:
+            tier.grow(size)
+        self.keys.extend([None] * (size - len(self.keys)))
+        self.last_seen = np.concatenate([self.last_seen, np.zeros(size - len(self.last_seen))])
+        self.first_seen = np.concatenate([self.first_seen, np.zeros(size - len(self.first_seen))])
+
+    def _release(self, rows):
+        # The samples stay in the columns until overwritten; first_seen hides them from the next series
+        self.last_seen[rows] = 0
+        for row in rows.tolist():
+            del self.rows[self.keys[row]]
+            self.keys[row] = None
+            self._free.append(row)
+
+    def _evict(self, now):
+        stale = np.nonzero((self.last_seen > 0) & (self.last_seen < now - self.retention))[0]
+        if len(stale):
+            self._release(stale)
+
+    def record(self, timestamp, keys, values):
+        """Store one sample of every series in keys; values is an (n, 2) array of CPU millicores and memory Mi."""
+        with self._record_lock:
+            with self._lock:
+                self._evict(timestamp)
+                unseen = sum(1 for key in keys if key not in self.rows)
+                needed = min(self._next_row + max(unseen - len(self._free), 0), self.max_series)
+            size = len(self.keys)
+            while size < needed:
+                size = min(size + max(size // 4, INITIAL_ROWS), self.max_series)
+            if size > len(self.keys):
+                # Rows are only added after the existing ones, so history() keeps reading
+                # the arrays it holds while the new ones are built
+                self._grow(size)
+            with self._lock:
+                rows = np.fromiter((self._row(key, timestamp) for key in keys), dtype=np.intp, count=len(keys))
+                kept = rows >= 0
+                rows, values = rows[kept], np.asarray(values, dtype=np.float32).reshape(-1, 2)[kept]
+                for tier in self.tiers:
+                    tier.add(timestamp, rows, values)
+
+    def history(self, keys, seconds, now=None):
+        """
+        Return the samples of some series over the last seconds, from the finest tier that covers them.
+
+        The result is {"start", "step", "series": {key: {"cpu": [...], "memory": [...]}}},
+        with None where no sample was taken; unknown keys are left out.
+        """
+        now = time.time() if now is None else now
+        tier = next((tier for tier in self.tiers if tier.span >= seconds), self.tiers[-1])
+        start, series = None, {}
+        with self._lock:
+            for key in keys:
+                row = self.rows.get(key)
+                if row is None:
+                    continue
+                first, means = tier.window(row, seconds, now, since=self.first_seen[row])
+                start = first * tier.step
+                series[key] = {name: [None if math.isnan(value) else round(float(value), 2) for value in means[:, column]]
+                               for name, column in (("cpu", CPU), ("memory", MEMORY))}
+        return {"start": start, "step": tier.step, "series": series}
+
+
+class MetricsSampler:
+    """
+    Polls the node and pod metrics of one cluster every K8S_METRICS_SAMPLE_INTERVAL seconds into SeriesStores.
+
+    Each poll is one list call for nodes and one for pods, the same calls
+    the metrics pages make, and runs on a daemon thread.
+    """
+
+    def __init__(self, api_client, interval=None, max_series=None, stores=None):
+        self.api_client = api_client
+        self.interval = interval or settings.K8S_METRICS_SAMPLE_INTERVAL
+        max_series = max_series or settings.K8S_METRICS_MAX_SERIES
+        self.stores = stores or {"nodes": SeriesStore(self.interval, max_series), "pods": SeriesStore(self.interval, max_series)}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            self.sample()
+            self._stopped.wait(max(self.interval - (time.monotonic() - started), 0))
+
+    def sample(self, now=None):
+        now = time.time() if now is None else now
+        metrics_api = client.CustomObjectsApi(self.api_client)
+        try:
+            items = metrics_api.list_cluster_custom_object(group=METRICS_GROUP, version=METRICS_VERSION,
+                                                           plural="nodes").get("items") or []
+            values = np.column_stack([parse_quantities([item["usage"]["cpu"] for item in items], unit="m"),
+                                      parse_quantities([item["usage"]["memory"] for item in items], unit="Mi")])
+            self.stores["nodes"].record(now, [item["metadata"]["name"] for item in items], values)
+        except Exception as e:
+            logger.error(f"Sampling node metrics failed: {e}")
+        try:
+            usage = list_pod_usage(metrics_api)
+            keys = list(usage)
+            cpu_milli, memory_mi = pod_usage([usage[key] for key in keys])
+            self.stores["pods"].record(now, [f"{namespace}/{name}" for namespace, name in keys],
+                                       np.column_stack([cpu_milli, memory_mi]))
+        except Exception as e:
+            logger.error(f"Sampling pod metrics failed: {e}")
+
+    def history(self, kind, keys, seconds):
+        return self.stores[kind].history(keys, seconds)
+
+
+# Running samplers keyed by (kubeconfig path, context)
+_samplers = {}
+_samplers_lock = threading.Lock()
+
+def get_sampler(path, context):
+    """
+    Return the cluster's metrics sampler, starting it on first use.
+
+    Returns None when sampling is disabled (K8S_METRICS_SAMPLER_ENABLED) or
+    the cluster's kubeconfig cannot be loaded. The history is kept on disk
+    under K8S_METRICS_HISTORY_DIR when set, so it outlives restarts, and in
+    memory otherwise, starting with the first call.
+    """
+    # metrics_history builds its on-disk stores on the classes of this module
+    from .metrics_history import open_history, history_directory
+    if not settings.K8S_METRICS_SAMPLER_ENABLED:
+        return None
+    try:
+        api_client = configure_k8s(path, context)
+    except Exception as e:
+        logger.error(f"Metrics sampler unavailable for {context}: {e}")
+        return None
+    key = (path, context)
+    with _samplers_lock:
+        sampler = _samplers.get(key)
+        # A new ApiClient means the kubeconfig changed
+        if sampler is not None and sampler.api_client is not api_client:
+            sampler.stop()
+            sampler = None
+        if sampler is None:
+            stores = None
+            if settings.K8S_METRICS_HISTORY_DIR:
+                try:
+                    stores = open_history(history_directory(path, context))
+                except OSError as e:
+                    logger.error(f"Metrics history of {context} is kept in memory only: {e}")
+            sampler = MetricsSampler(api_client, stores=stores)
+            sampler.start()
+            _samplers[key] = sampler
+    return sampler
+
+def history_span():
+    # Longest window the metrics history can answer
+    if settings.K8S_METRICS_HISTORY_DIR:
+        return max(settings.K8S_METRICS_RAW_RETENTION, settings.K8S_METRICS_5M_RETENTION, settings.K8S_METRICS_1H_RETENTION)
+    return COARSE_SPAN
+
+def stop_samplers():
+    with _samplers_lock:
+        for sampler in _samplers.values():
+            sampler.stop()
+        _samplers.clear()
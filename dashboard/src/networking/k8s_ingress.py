@@ -1,17 +1,17 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 import yaml
 from kubebuddy.appLogs import logger
 from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 
 def get_ingress(path, context):
     try:
-        configure_k8s(path, context)
-        v1 = client.NetworkingV1Api()
-        ingresses = v1.list_ingress_for_all_namespaces()
+        api_client = configure_k8s(path, context)
+        v1 = client.NetworkingV1Api(api_client)
+        ingresses = list_items(v1.list_ingress_for_all_namespaces)
         ingress_list = []
-        for ingress in ingresses.items:
+        for ingress in ingresses:
             namespace = ingress.metadata.namespace
             name = ingress.metadata.name
             ingress_class = ingress.spec.ingress_class_name
@@ -35,12 +35,17 @@ def get_ingress(path, context):
 
 DEFAULT_NONE_VALUE = "<none>"
 
-def get_ingress_description(path=None, context=None, namespace=None, ingress_name=None):
-    configure_k8s(path, context)
-    v1 = client.NetworkingV1Api()
+def read_ingress(path, context, namespace, ingress_name):
+    api_client = configure_k8s(path, context)
+    return client.NetworkingV1Api(api_client).read_namespaced_ingress(name=ingress_name, namespace=namespace)
+
+def get_ingress_description(path=None, context=None, namespace=None, ingress_name=None, ingress=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.NetworkingV1Api(api_client)
 
     try:
-        ingress = v1.read_namespaced_ingress(name=ingress_name, namespace=namespace)
+        if ingress is None:
+            ingress = v1.read_namespaced_ingress(name=ingress_name, namespace=namespace)
 
         rules = []
         for rule in ingress.spec.rules or []:
@@ -51,7 +56,7 @@ def get_ingress_description(path=None, context=None, namespace=None, ingress_nam
                 backend_port = path.backend.service.port.name or path.backend.service.port.number
 
                 try:
-                    _ = client.CoreV1Api().read_namespaced_service(name=backend_service, namespace=namespace)
+                    _ = client.CoreV1Api(api_client).read_namespaced_service(name=backend_service, namespace=namespace)
                     backend_status = f"{backend_service}:{backend_port}"
                 except client.exceptions.ApiException:
                     backend_status = f"{backend_service}:{backend_port} (<error: service '{backend_service}' not found>)"
@@ -80,24 +85,19 @@ def get_ingress_description(path=None, context=None, namespace=None, ingress_nam
 
 
 def get_ingress_events(path, context, namespace, ingress_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    ingress_events = [
-        event for event in events 
-        if event.involved_object.name == ingress_name and event.involved_object.kind == "Ingress"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in ingress_events])
-
-def get_ingress_yaml(path, context, namespace, ingress_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.NetworkingV1Api()
-    ingress = v1.read_namespaced_ingress(name=ingress_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, ingress_name, "Ingress", namespace=namespace))
+
+def get_ingress_yaml(path, context, namespace, ingress_name, managed_fields, ingress=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.NetworkingV1Api(api_client)
+    if ingress is None:
+        ingress = v1.read_namespaced_ingress(name=ingress_name, namespace=namespace)
     # Filtering Annotations
     if ingress.metadata:
         ingress.metadata.annotations = filter_annotations(ingress.metadata.annotations or {})
 
-    api_client = client.ApiClient()
     ingress_dict = api_client.sanitize_for_serialization(ingress)
 
     # Clean up metadata
@@ -109,13 +109,9 @@ def get_ingress_yaml(path, context, namespace, ingress_name, managed_fields):
 
     return yaml.safe_dump(ingress_dict, sort_keys=False)
 
-def get_ingress_details():
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    networking_v1 = client.NetworkingV1Api()
+def get_ingress_details(path, context):
+    api_client = configure_k8s(path, context)
+    networking_v1 = client.NetworkingV1Api(api_client)
     ingresses = networking_v1.list_ingress_for_all_namespaces()
 
     def get_age(creation_timestamp):
@@ -1,34 +1,40 @@
 from kubernetes import client, config
 import yaml
-from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+NP_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("pod_selector", lambda np, now: ", ".join(f"{k}={v}" for k, v in np.spec.pod_selector.match_labels.items())
+        if np.spec.pod_selector.match_labels else "None"),
+    ("age", lambda np, now: calculateAge(now - np.metadata.creation_timestamp)),
+))
 
 def get_np(path, context):
+    np_list = []
     try:
-        configure_k8s(path, context)
-        v1 = client.NetworkingV1Api()
-        nps = v1.list_network_policy_for_all_namespaces()
-        np_list = []
-        # np.spec.pod_selector.match_labels
-        for np in nps.items:
-           np_list.append({
-              "namespace": np.metadata.namespace,
-              "name": np.metadata.name,
-              "pod_selector": ", ".join(f"{k}={v}" for k, v in np.spec.pod_selector.match_labels.items()) if np.spec.pod_selector.match_labels else "None",
-              "age": calculateAge(datetime.now(timezone.utc) - np.metadata.creation_timestamp)
-           })
+        api_client = configure_k8s(path, context)
+        v1 = client.NetworkingV1Api(api_client)
+        np_list = project(list_items(v1.list_network_policy_for_all_namespaces), NP_COLUMNS)
         
     except Exception as e:
         logger.error(f"Error fetching np: {e}")
     
     return np_list, len(np_list)
 
-def get_np_description(path=None, context=None, namespace=None, np_name=None):
-    configure_k8s(path, context)
-    v1 = client.NetworkingV1Api()
+def read_np(path, context, namespace, np_name):
+    api_client = configure_k8s(path, context)
+    return client.NetworkingV1Api(api_client).read_namespaced_network_policy(name=np_name, namespace=namespace)
+
+def get_np_description(path=None, context=None, namespace=None, np_name=None, np=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.NetworkingV1Api(api_client)
     try:
-        np = v1.read_namespaced_network_policy(name=np_name, namespace=namespace)
+        if np is None:
+            np = v1.read_namespaced_network_policy(name=np_name, namespace=namespace)
 
         np_info = {
             "name": np.metadata.name,
@@ -50,23 +56,19 @@ def get_np_description(path=None, context=None, namespace=None, np_name=None):
 
 
 def get_np_events(path, context, namespace, np_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    pdb_events = [
-        event for event in events if event.involved_object.name == np_name and event.involved_object.kind == "NetworkPolicy"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in pdb_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, np_name, "NetworkPolicy", namespace=namespace))
 
-def get_np_yaml(path, context, namespace, np_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.NetworkingV1Api()
-    np = v1.read_namespaced_network_policy(np_name, namespace=namespace)
+def get_np_yaml(path, context, namespace, np_name, managed_fields, np=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.NetworkingV1Api(api_client)
+    if np is None:
+        np = v1.read_namespaced_network_policy(np_name, namespace=namespace)
     # Filtering Annotations
     if np.metadata:
         np.metadata.annotations = filter_annotations(np.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     np_dict = api_client.sanitize_for_serialization(np)
 
     # Clean up metadata
@@ -5,9 +5,9 @@ import yaml
 
 def list_persistent_volumes(path: str, context: str):
     # Load Kubernetes configuration
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
     
-    v1 = client.CoreV1Api()
+    v1 = client.CoreV1Api(api_client)
     pv_list = v1.list_persistent_volume().items
     
     # Collect PV details
@@ -37,10 +37,15 @@ def list_persistent_volumes(path: str, context: str):
 
     return pv_details, len(pv_details)
 
-def get_pv_description(path=None, context=None, pv_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pv = v1.read_persistent_volume(name=pv_name)
+def read_pv(path, context, pv_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_persistent_volume(name=pv_name)
+
+def get_pv_description(path=None, context=None, pv_name=None, pv=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if pv is None:
+        pv = v1.read_persistent_volume(name=pv_name)
 
     pv_info = {
         "Name": pv.metadata.name,
@@ -72,15 +77,15 @@ def get_pv_description(path=None, context=None, pv_name=None):
     return pv_info
 
 
-def get_pv_yaml(path, context, pv_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pv = v1.read_persistent_volume(name=pv_name)
+def get_pv_yaml(path, context, pv_name, managed_fields, pv=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if pv is None:
+        pv = v1.read_persistent_volume(name=pv_name)
     # Filtering Annotations
     if pv.metadata:
         pv.metadata.annotations = filter_annotations(pv.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     pv_dict = api_client.sanitize_for_serialization(pv)
 
     # Clean up metadata
@@ -1,14 +1,15 @@
 from kubernetes import client, config
 from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 import yaml
 
 def list_pvc(path: str, context: str):
     # Load Kubernetes configuration
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
     
-    v1 = client.CoreV1Api()
-    pvcs = v1.list_persistent_volume_claim_for_all_namespaces().items
+    v1 = client.CoreV1Api(api_client)
+    pvcs = list_items(v1.list_persistent_volume_claim_for_all_namespaces)
     
     pvc_list = []
     for pvc in pvcs:
@@ -41,10 +42,15 @@ def list_pvc(path: str, context: str):
     
     return pvc_list, len(pvc_list)
 
-def get_pvc_description(path=None, context=None, namespace=None, pvc_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pvc = v1.read_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
+def read_pvc(path, context, namespace, pvc_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
+
+def get_pvc_description(path=None, context=None, namespace=None, pvc_name=None, pvc=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if pvc is None:
+        pvc = v1.read_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
 
     pvc_info = {
         "Name": pvc.metadata.name,
@@ -72,23 +78,19 @@ def get_pvc_description(path=None, context=None, namespace=None, pvc_name=None):
     return pvc_info
 
 def get_pvc_events(path, context, namespace, pvc_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    pvc_events = [
-        event for event in events if event.involved_object.name == pvc_name and event.involved_object.kind == "PersistentVolumeClaim"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in pvc_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, pvc_name, "PersistentVolumeClaim", namespace=namespace))
 
-def get_pvc_yaml(path, context, namespace, pvc_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pvc = v1.read_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
+def get_pvc_yaml(path, context, namespace, pvc_name, managed_fields, pvc=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if pvc is None:
+        pvc = v1.read_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
     # Filtering Annotations
     if pvc.metadata:
         pvc.metadata.annotations = filter_annotations(pvc.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     pvc_dict = api_client.sanitize_for_serialization(pvc)
 
     # Clean up metadata
@@ -1,13 +1,14 @@
 from kubernetes import client, config
 from datetime import datetime, timezone
 from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..events.k8s_events import get_object_events, format_object_events
 import yaml
 
 def list_storage_classes(path: str, context: str):
     # Load Kubernetes config
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
     
-    v1 = client.StorageV1Api()
+    v1 = client.StorageV1Api(api_client)
     storage_classes = v1.list_storage_class().items
     
     storage_data = []
@@ -29,12 +30,17 @@ def list_storage_classes(path: str, context: str):
     
     return storage_data, len(storage_data)
 
-def get_storage_class_description(path=None, context=None, sc_name=None):
-    configure_k8s(path, context)
-    v1 = client.StorageV1Api()
+def read_storage_class(path, context, sc_name):
+    api_client = configure_k8s(path, context)
+    return client.StorageV1Api(api_client).read_storage_class(name=sc_name)
+
+def get_storage_class_description(path=None, context=None, sc_name=None, sc=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.StorageV1Api(api_client)
 
     try:
-        sc = v1.read_storage_class(name=sc_name)
+        if sc is None:
+            sc = v1.read_storage_class(name=sc_name)
         
         if sc.metadata.annotations.get("storageclass.kubernetes.io/is-default-class") and sc.metadata.annotations.get("storageclass.kubernetes.io/is-default-class") == "true":
             is_default = "Yes"
@@ -57,25 +63,20 @@ def get_storage_class_description(path=None, context=None, sc_name=None):
         return {"error": f"Failed to fetch Storage Class details: {e.reason}"}
     
 def get_storage_class_events(path, context, sc_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_event_for_all_namespaces().items
-    sc_events = [
-        event for event in events if event.involved_object.name == sc_name and event.involved_object.kind == "StorageClass"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in sc_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, sc_name, "StorageClass"))
 
-def get_sc_yaml(path, context, sc_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.StorageV1Api()
+def get_sc_yaml(path, context, sc_name, managed_fields, sc=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.StorageV1Api(api_client)
     try:
-        sc = v1.read_storage_class(name=sc_name)
+        if sc is None:
+            sc = v1.read_storage_class(name=sc_name)
         # Filtering Annotations
         if sc.metadata:
             sc.metadata.annotations = filter_annotations(sc.metadata.annotations or {})
         
-        api_client = client.ApiClient()
         sc_dict = api_client.sanitize_for_serialization(sc)
 
         # Clean up metadata
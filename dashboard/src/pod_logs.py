@@ -0,0 +1,215 @@
+import math
+import time
+from kubernetes import client
+from urllib3.exceptions import HTTPError, ReadTimeoutError
+from django.conf import settings
+from kubebuddy.appLogs import logger
+from .utils import configure_k8s
+
+# Bytes requested from the API server per read of a log stream
+CHUNK_SIZE = 64 * 1024
+# Longer lines are emitted in pieces so a runaway line cannot grow the buffer
+MAX_LINE_BYTES = 64 * 1024
+# Annotation naming the container kubectl logs reads when none is given
+DEFAULT_CONTAINER_ANNOTATION = "kubectl.kubernetes.io/default-container"
+# Seconds a followed log may stay quiet before its read times out and the viewer is sent a keepalive
+KEEPALIVE_SECONDS = 15
+# Yielded by followed logs in place of a line while they are quiet
+KEEPALIVE = object()
+
+
+def parse_bool(value):
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"expected a positive number, got {value}")
+    return number
+
+# Query parameter -> converter for the read_namespaced_pod_log options a viewer may set
+LOG_OPTIONS = {
+    "container": str,
+    "tail_lines": positive_int,
+    "since_seconds": positive_int,
+    "limit_bytes": positive_int,
+    "previous": parse_bool,
+    "timestamps": parse_bool,
+}
+
+
+def log_options(params):
+    """Read log options from request parameters. Raises ValueError for a bad window or limit."""
+    options = {}
+    for key, convert in LOG_OPTIONS.items():
+        value = params.get(key)
+        if value not in (None, ""):
+            try:
+                options[key] = convert(value)
+            except ValueError as e:
+                raise ValueError(f"Invalid {key}: {value}") from e
+    return options
+
+def bounded_log_options(options, follow=False):
+    """
+    Apply the configured log bounds to a set of options.
+
+    Without a tail or since window only the last K8S_POD_LOG_TAIL_LINES lines
+    are read. Reads that end are capped at K8S_POD_LOG_LIMIT_BYTES; a follow
+    stream is not, since it is never held in memory.
+    """
+    options = dict(options)
+    tail_lines = settings.K8S_POD_LOG_TAIL_LINES
+    if tail_lines and "tail_lines" not in options and "since_seconds" not in options:
+        options["tail_lines"] = tail_lines
+    limit_bytes = settings.K8S_POD_LOG_LIMIT_BYTES
+    if limit_bytes and not follow:
+        options["limit_bytes"] = min(options.get("limit_bytes", limit_bytes), limit_bytes)
+    return options
+
+def default_container(pod):
+    """Return the container kubectl would pick for a multi-container pod, or None for a single one."""
+    containers = pod.spec.containers or []
+    if len(containers) < 2:
+        return None
+    annotations = pod.metadata.annotations or {}
+    return annotations.get(DEFAULT_CONTAINER_ANNOTATION) or containers[0].name
+
+def read_pod_log(v1, namespace, pod_name, **kwargs):
+    """
+    Call read_namespaced_pod_log, picking a default container when the pod needs one.
+
+    The API answers 400 when a multi-container pod is read without a
+    container; the pod is only read in that case.
+    """
+    try:
+        return v1.read_namespaced_pod_log(name=pod_name, namespace=namespace, **kwargs)
+    except client.exceptions.ApiException as e:
+        if e.status != 400 or kwargs.get("container"):
+            raise
+        container = default_container(v1.read_namespaced_pod(name=pod_name, namespace=namespace))
+        if container is None:
+            raise
+        return v1.read_namespaced_pod_log(name=pod_name, namespace=namespace, container=container, **kwargs)
+
+def iter_lines(chunks):
+    """Split byte chunks into decoded lines, holding at most one partial line."""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", "replace")
+        while len(pending) > MAX_LINE_BYTES:
+            yield pending[:MAX_LINE_BYTES].decode("utf-8", "replace")
+            pending = pending[MAX_LINE_BYTES:]
+    if pending:
+        yield pending.decode("utf-8", "replace")
+
+def timestamp_key(timestamp):
+    # RFC3339Nano drops trailing zeros, so pad the fraction before comparing strings
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return f"{seconds}.{fraction.ljust(9, '0')}"
+
+def split_timestamp(line):
+    """Split a line read with timestamps=True into (timestamp, message)."""
+    timestamp, _, message = line.partition(" ")
+    return timestamp, message
+
+def read_lines(response):
+    # Closing the generator (e.g. the viewer disconnected) closes the connection to the API server
+    try:
+        yield from iter_lines(response.stream(CHUNK_SIZE))
+    finally:
+        response.close()
+        response.release_conn()
+
+def stream_pod_log(path, context, namespace, pod_name, follow=False, bounded=True, read_timeout=KEEPALIVE_SECONDS,
+                   **options):
+    """
+    Open a pod's log and return a generator over its lines.
+
+    The log is read in chunks with _preload_content=False, so memory per
+    viewer stays constant however large the log is. The request is made
+    before returning, so an ApiException (unknown pod or container, no
+    previous container) is raised here rather than mid-stream. Callers that
+    only scan the log may pass bounded=False to skip the viewer's bounds.
+    A followed log is read through follow_log, with read_timeout.
+    """
+    v1 = client.CoreV1Api(configure_k8s(path, context))
+    if bounded:
+        options = bounded_log_options(options, follow)
+    if follow:
+        return follow_log(v1, namespace, pod_name, read_timeout, **options)
+    response = read_pod_log(v1, namespace, pod_name, follow=False, _preload_content=False, **options)
+    return read_lines(response)
+
+def follow_log(v1, namespace, pod_name, read_timeout=KEEPALIVE_SECONDS, timestamps=False, **options):
+    """
+    Follow a pod's log and return a generator over its lines and keepalives.
+
+    Every read times out after read_timeout seconds of quiet; a KEEPALIVE
+    is then yielded and the log reopened, so the caller gets control back
+    (e.g. to write to a viewer that may have gone) however long the pod
+    stays quiet. read_namespaced_pod_log takes no since_time, so the log
+    is reopened with since_seconds from just before the last line read,
+    and the lines already emitted are skipped by their timestamp. The first
+    request is made before returning, like stream_pod_log.
+    """
+    def open_log(options):
+        return read_pod_log(v1, namespace, pod_name, follow=True, timestamps=True, _preload_content=False,
+                            _request_timeout=(read_timeout, read_timeout), **options)
+    return _followed_lines(open_log, open_log(options), options, timestamps)
+
+def _followed_lines(open_log, response, options, timestamps):
+    # Timestamp of the last line emitted, how many lines carried it, and when it was read
+    last_key, repeats, last_read = None, 0, None
+    replaying = False
+    while True:
+        lines = read_lines(response)
+        try:
+            for line in lines:
+                timestamp, message = split_timestamp(line)
+                key = timestamp_key(timestamp)
+                if replaying:
+                    if key < last_key:
+                        continue
+                    if key == last_key and skip:
+                        skip -= 1
+                        continue
+                    replaying = False
+                repeats = repeats + 1 if key == last_key else 1
+                last_key, last_read = key, time.monotonic()
+                yield line if timestamps else message
+            return
+        except ReadTimeoutError:
+            pass
+        finally:
+            lines.close()
+        yield KEEPALIVE
+        # A reopened log starts with lines already emitted
+        if last_read is not None:
+            options = {key: value for key, value in options.items() if key not in ("tail_lines", "since_seconds")}
+            options["since_seconds"] = math.ceil(time.monotonic() - last_read) + 1
+            replaying, skip = True, repeats
+        response = open_log(options)
+
+def sse_events(lines):
+    """
+    Frame log lines as server-sent events, ending with an "end" or "error" event once the log closes.
+
+    A KEEPALIVE becomes a comment: writing it fails once the viewer has
+    gone, which closes the stream while the log itself is quiet.
+    """
+    try:
+        for line in lines:
+            if line is KEEPALIVE:
+                yield ": keepalive\n\n"
+                continue
+            line = line.rstrip("\r")
+            yield f"data: {line}\n\n"
+    except (HTTPError, client.exceptions.ApiException) as e:
+        logger.error(f"Pod log stream failed: {e}")
+        yield "event: error\ndata: Log stream interrupted\n\n"
+        return
+    yield "event: end\ndata: \n\n"
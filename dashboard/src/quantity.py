@@ -0,0 +1,56 @@
+from decimal import Decimal
+import re
+import numpy as np
+
+# Multiplier of each Kubernetes quantity suffix (k8s.io/apimachinery resource.Quantity)
+SUFFIXES = {
+    "n": Decimal("1e-9"), "u": Decimal("1e-6"), "m": Decimal("1e-3"), "": Decimal(1),
+    "k": Decimal("1e3"), "M": Decimal("1e6"), "G": Decimal("1e9"), "T": Decimal("1e12"),
+    "P": Decimal("1e15"), "E": Decimal("1e18"),
+    "Ki": Decimal(2) ** 10, "Mi": Decimal(2) ** 20, "Gi": Decimal(2) ** 30,
+    "Ti": Decimal(2) ** 40, "Pi": Decimal(2) ** 50, "Ei": Decimal(2) ** 60,
+}
+
+# A number with either a decimal exponent (1e3, 2E-2) or a suffix; "1E" is one exa, not an exponent
+QUANTITY = re.compile(r"([+-]?(?:\d+\.?\d*|\.\d+))(?:([eE][+-]?\d+)|(Ki|Mi|Gi|Ti|Pi|Ei|[numkMGTPE]))?")
+
+
+def _parse(value, unit):
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(value) / SUFFIXES[unit]
+    match = QUANTITY.fullmatch(str(value).strip())
+    if not match:
+        raise ValueError(f"Invalid quantity: {value!r}")
+    number, exponent, suffix = match.groups()
+    if exponent:
+        return Decimal(number + exponent) / SUFFIXES[unit]
+    return Decimal(number) * SUFFIXES[suffix or ""] / SUFFIXES[unit]
+
+def parse_quantity(value, unit=""):
+    """
+    Parse a Kubernetes quantity (e.g. "250m", "1.5Gi", "12e6", "100000n") into a float of unit.
+
+    unit is any quantity suffix: parse_quantity("1Gi", "Mi") is 1024.0 and
+    parse_quantity("250m") is 0.25 cores. The scaling is done in Decimal,
+    so values of a whole unit come out exact. Raises ValueError for a
+    malformed quantity and KeyError for an unknown unit.
+    """
+    return float(_parse(value, unit))
+
+def parse_quantities(values, unit=""):
+    """
+    Parse a column of quantities into a float64 NumPy array of unit.
+
+    Usage and capacity columns repeat few distinct strings, so each distinct
+    value is parsed once and the column is rebuilt from the inverse index
+    of np.unique; sums over the result are then a single vectorized call.
+    """
+    if len(values) == 0:
+        return np.zeros(0)
+    distinct, inverse = np.unique(np.asarray([str(value) for value in values]), return_inverse=True)
+    parsed = np.array([parse_quantity(value, unit) for value in distinct])
+    return parsed[inverse.reshape(-1)]
+
+def sum_by(owners, values, size, unit=""):
+    """Sum a column of quantities per owner index (0 <= owner < size), e.g. the containers of each pod."""
+    return np.bincount(np.asarray(owners, dtype=np.intp), weights=parse_quantities(values, unit), minlength=size)
@@ -1,11 +1,12 @@
 from kubernetes import client, config
 from datetime import datetime, timedelta, timezone
 from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..events.k8s_events import get_object_events, format_object_events
 import yaml
 
 def get_cluster_role_bindings(path, context):
-    configure_k8s(path, context)
-    rbac_api = client.RbacAuthorizationV1Api()
+    api_client = configure_k8s(path, context)
+    rbac_api = client.RbacAuthorizationV1Api(api_client)
     clusterrolebindings = rbac_api.list_cluster_role_binding()
 
     bindings_data = []
@@ -36,13 +37,17 @@ def get_cluster_role_bindings(path, context):
 
     return bindings_data, len(bindings_data)
 
-def get_cluster_role_binding_description(path=None, context=None, cluster_role_binding=None):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def read_cluster_role_binding(path, context, cluster_role_binding_name):
+    api_client = configure_k8s(path, context)
+    return client.RbacAuthorizationV1Api(api_client).read_cluster_role_binding(name=cluster_role_binding_name)
+
+def get_cluster_role_binding_description(path=None, context=None, cluster_role_binding=None, binding=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
 
     
     try:
-        cluster_role_binding = v1.read_cluster_role_binding(name=cluster_role_binding)
+        cluster_role_binding = binding if binding is not None else v1.read_cluster_role_binding(name=cluster_role_binding)
 
         subjects = [{
                 'kind': r.kind,
@@ -65,25 +70,19 @@ def get_cluster_role_binding_description(path=None, context=None, cluster_role_b
         return {"error": f"Failed to fetch role_binding details: {e.reason}"}
     
 def get_cluster_role_binding_events(path, context, cluster_role_binding):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_event_for_all_namespaces().items
-    cluster_role_binding_events = [
-        event for event in events if event.involved_object.name == cluster_role_binding and event.involved_object.kind == "ClusterRoleBinding"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in cluster_role_binding_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, cluster_role_binding, "ClusterRoleBinding"))
 
-def get_cluster_role_binding_yaml(path, context, cluster_role_binding, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def get_cluster_role_binding_yaml(path, context, cluster_role_binding, managed_fields, binding=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
     try:
-        cluster_role_binding = v1.read_cluster_role_binding(name=cluster_role_binding)
+        cluster_role_binding = binding if binding is not None else v1.read_cluster_role_binding(name=cluster_role_binding)
         # Filtering Annotations
         if cluster_role_binding.metadata:
             cluster_role_binding.metadata.annotations = filter_annotations(cluster_role_binding.metadata.annotations or {})
         
-        api_client = client.ApiClient()
         cluster_role_binding_dict = api_client.sanitize_for_serialization(cluster_role_binding)
 
         # Clean up metadata
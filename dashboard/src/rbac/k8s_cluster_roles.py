@@ -1,10 +1,11 @@
 from kubernetes import client, config
 import yaml
 from ..utils import filter_annotations, configure_k8s
+from ..events.k8s_events import get_object_events, format_object_events
 
 def get_cluster_role(path, context):
-    configure_k8s(path, context)
-    rbac_api = client.RbacAuthorizationV1Api()
+    api_client = configure_k8s(path, context)
+    rbac_api = client.RbacAuthorizationV1Api(api_client)
 
     clusterroles = []
     response = rbac_api.list_cluster_role()
@@ -23,12 +24,17 @@ def get_cluster_role(path, context):
     })
     return clusterroles, len(clusterroles)
 
-def get_cluster_role_description(path=None, context=None, cluster_role_name=None):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def read_cluster_role(path, context, cluster_role_name):
+    api_client = configure_k8s(path, context)
+    return client.RbacAuthorizationV1Api(api_client).read_cluster_role(name=cluster_role_name)
+
+def get_cluster_role_description(path=None, context=None, cluster_role_name=None, cluster_role=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
 
     try:
-        cluster_role = v1.read_cluster_role(name=cluster_role_name)
+        if cluster_role is None:
+            cluster_role = v1.read_cluster_role(name=cluster_role_name)
 
         policy_rule = [{
                 'resources': r.resources,
@@ -48,25 +54,20 @@ def get_cluster_role_description(path=None, context=None, cluster_role_name=None
         return {"error": f"Failed to fetch Role details: {e.reason}"}
     
 def get_cluster_role_events(path, context, cluster_role_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_event_for_all_namespaces().items
-    cluster_role_events = [
-        event for event in events if event.involved_object.name == cluster_role_name and event.involved_object.kind == "ClusterRole"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in cluster_role_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, cluster_role_name, "ClusterRole"))
 
-def get_cluster_role_yaml(path, context, cluster_role_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def get_cluster_role_yaml(path, context, cluster_role_name, managed_fields, cluster_role=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
     try:
-        cluster_role = v1.read_cluster_role(name=cluster_role_name)
+        if cluster_role is None:
+            cluster_role = v1.read_cluster_role(name=cluster_role_name)
         # Filtering Annotations
         if cluster_role.metadata:
             cluster_role.metadata.annotations = filter_annotations(cluster_role.metadata.annotations or {})
         
-        api_client = client.ApiClient()
         cluster_role_dict = api_client.sanitize_for_serialization(cluster_role)
 
         # Clean up metadata
@@ -1,39 +1,39 @@
 from kubernetes import client, config
 from datetime import datetime
 import yaml
-from ..utils import filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+ROLE_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("created_at", lambda role, now: role.metadata.creation_timestamp.strftime("%Y-%m-%d %H:%M:%S")),
+))
 
 def list_roles(path, context):
     # Load kubeconfig using the provided path and context
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
 
     # Initialize the Kubernetes API client for roles
-    rbac_v1 = client.RbacAuthorizationV1Api()
-
-    # List all namespaces
-    namespaces = client.CoreV1Api().list_namespace()
-
-    # Collect roles across all namespaces
-    roles_data = []
+    rbac_v1 = client.RbacAuthorizationV1Api(api_client)
 
-    for namespace in namespaces.items:
-        namespace_name = namespace.metadata.name
-        roles = rbac_v1.list_namespaced_role(namespace_name)
-        for role in roles.items:
-            roles_data.append({
-                "namespace": namespace_name,
-                "name": role.metadata.name,
-                "created_at": role.metadata.creation_timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            })
+    # Collect roles across all namespaces in one paginated call
+    roles_data = project(list_items(rbac_v1.list_role_for_all_namespaces), ROLE_COLUMNS)
 
     return roles_data, len(roles_data)
 
-def get_role_description(path=None, context=None, namespace=None, role_name=None):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def read_role(path, context, namespace, role_name):
+    api_client = configure_k8s(path, context)
+    return client.RbacAuthorizationV1Api(api_client).read_namespaced_role(name=role_name, namespace=namespace)
+
+def get_role_description(path=None, context=None, namespace=None, role_name=None, role=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
 
     try:
-        role = v1.read_namespaced_role(name=role_name, namespace=namespace)
+        if role is None:
+            role = v1.read_namespaced_role(name=role_name, namespace=namespace)
       
         policy_rule = [{
                 'resources': r.resources,
@@ -53,25 +53,20 @@ def get_role_description(path=None, context=None, namespace=None, role_name=None
         return {"error": f"Failed to fetch Role details: {e.reason}"}
     
 def get_role_events(path, context, namespace, role_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    role_events = [
-        event for event in events if event.involved_object.name == role_name and event.involved_object.kind == "Role"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in role_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, role_name, "Role", namespace=namespace))
 
-def get_role_yaml(path, context, namespace, role_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def get_role_yaml(path, context, namespace, role_name, managed_fields, role=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
     try:
-        role = v1.read_namespaced_role(name=role_name, namespace=namespace)
+        if role is None:
+            role = v1.read_namespaced_role(name=role_name, namespace=namespace)
         # Filtering Annotations
         if role.metadata:
             role.metadata.annotations = filter_annotations(role.metadata.annotations or {})
         
-        api_client = client.ApiClient()
         role_dict = api_client.sanitize_for_serialization(role)
 
         # Clean up metadata
@@ -1,64 +1,52 @@
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 from kubebuddy.appLogs import logger
-from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 import yaml
 
+def subject_names(rb, kind):
+    return ', '.join(subject.name for subject in rb.subjects if subject.kind == kind)
+
+ROLEBINDING_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('role', 'role_ref.name'),
+    ('users', lambda rb, now: subject_names(rb, 'User')),
+    ('groups', lambda rb, now: subject_names(rb, 'Group')),
+    ('service_accounts', lambda rb, now: subject_names(rb, 'ServiceAccount')),
+    ('age', lambda rb, now: calculateAge(now - rb.metadata.creation_timestamp)),
+))
+
 def list_rolebindings(path, context):
     # Load kube config with the provided path and context
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
     
-    v1 = client.RbacAuthorizationV1Api()
+    v1 = client.RbacAuthorizationV1Api(api_client)
 
     rolebindings_data = []
 
     try:
         # List rolebindings across all namespaces
-        rolebindings = v1.list_role_binding_for_all_namespaces()
-
-        for rb in rolebindings.items:
-            namespace = rb.metadata.namespace
-            name = rb.metadata.name
-            role_ref = rb.role_ref.name
-            users = []
-            groups = []
-            service_accounts = []
-
-            # Extract subjects (users, groups, service accounts) from rolebinding
-            for subject in rb.subjects:
-                if subject.kind == 'User':
-                    users.append(subject.name)
-                elif subject.kind == 'Group':
-                    groups.append(subject.name)
-                elif subject.kind == 'ServiceAccount':
-                    service_accounts.append(subject.name)
-
-            # Calculate the age of the rolebinding
-            creation_time = rb.metadata.creation_timestamp
-            age = calculateAge(datetime.now(timezone.utc) - creation_time)
-
-            rolebindings_data.append({
-                'namespace': namespace,
-                'name': name,
-                'role': role_ref,
-                'users': ', '.join(users),
-                'groups': ', '.join(groups),
-                'service_accounts': ', '.join(service_accounts),
-                'age': age
-            })
+        rolebindings_data = project(list_items(v1.list_role_binding_for_all_namespaces), ROLEBINDING_COLUMNS)
 
     except ApiException as e:
         logger.error(f"Error listing role bindings: {e}")
     
     return rolebindings_data, len(rolebindings_data)
 
-def get_role_binding_description(path=None, context=None, namespace=None, role_binding_name=None):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def read_role_binding(path, context, namespace, role_binding_name):
+    api_client = configure_k8s(path, context)
+    return client.RbacAuthorizationV1Api(api_client).read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
+
+def get_role_binding_description(path=None, context=None, namespace=None, role_binding_name=None, role_binding=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
 
     try:
-        role_binding = v1.read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
+        if role_binding is None:
+            role_binding = v1.read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
         
         subjects = [{
                 'kind': r.kind,
@@ -81,25 +69,20 @@ def get_role_binding_description(path=None, context=None, namespace=None, role_b
         return {"error": f"Failed to fetch role_binding details: {e.reason}"}
     
 def get_role_binding_events(path, context, namespace, role_binding_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    role_binding_events = [
-        event for event in events if event.involved_object.name == role_binding_name and event.involved_object.kind == "RoleBinding"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in role_binding_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, role_binding_name, "RoleBinding", namespace=namespace))
 
-def get_role_binding_yaml(path, context, namespace, role_binding_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.RbacAuthorizationV1Api()
+def get_role_binding_yaml(path, context, namespace, role_binding_name, managed_fields, role_binding=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.RbacAuthorizationV1Api(api_client)
     try:
-        role_binding = v1.read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
+        if role_binding is None:
+            role_binding = v1.read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
         # Filtering Annotations
         if role_binding.metadata:
             role_binding.metadata.annotations = filter_annotations(role_binding.metadata.annotations or {})
         
-        api_client = client.ApiClient()
         role_binding_dict = api_client.sanitize_for_serialization(role_binding)
 
         # Clean up metadata
@@ -1,38 +1,36 @@
 from kubernetes import client, config
 from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 from kubebuddy.appLogs import logger
 import yaml
 
-def get_service_accounts(path, context):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    namespaces = v1.list_namespace()
-    all_service_accounts = []
-
-    for namespace in namespaces.items:
-        namespace_name = namespace.metadata.name
-        service_accounts = v1.list_namespaced_service_account(namespace=namespace_name)
-        for sa in service_accounts.items:
-            secrets = len([secret.name for secret in sa.secrets]) if sa.secrets else 0
-
-            age = calculateAge(datetime.now(timezone.utc) - sa.metadata.creation_timestamp)
+SERVICE_ACCOUNT_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("secrets", lambda sa, now: len(sa.secrets) if sa.secrets else 0),
+    ("age", lambda sa, now: calculateAge(now - sa.metadata.creation_timestamp)),
+))
 
-            all_service_accounts.append({
-                "namespace": namespace_name,
-                "name": sa.metadata.name,
-                "secrets": secrets,
-                "age": age 
-            })
+def get_service_accounts(path, context):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    all_service_accounts = project(list_items(v1.list_service_account_for_all_namespaces), SERVICE_ACCOUNT_COLUMNS)
 
     return all_service_accounts, len(all_service_accounts)
 
-def get_sa_description(path=None, context=None, namespace=None, sa_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def read_service_account(path, context, namespace, sa_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_service_account(name=sa_name, namespace=namespace)
+
+def get_sa_description(path=None, context=None, namespace=None, sa_name=None, sa=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
 
     try:
-        sa = v1.read_namespaced_service_account(name=sa_name, namespace=namespace)
+        if sa is None:
+            sa = v1.read_namespaced_service_account(name=sa_name, namespace=namespace)
       
         return {
             'name': sa.metadata.name,
@@ -52,24 +50,19 @@ def get_sa_description(path=None, context=None, namespace=None, sa_name=None):
         return {"error": f"Failed to fetch Service Account details: {e.reason}"}
     
 def get_sa_events(path, context, namespace, sa_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    sa_events = [
-        event for event in events if event.involved_object.name == sa_name and event.involved_object.kind == "ServiceAccount"
-    ]
-
-    return "\n".join([f"{e.reason}: {e.message}" for e in sa_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, sa_name, "ServiceAccount", namespace=namespace))
 
-def get_sa_yaml(path, context, namespace, sa_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def get_sa_yaml(path, context, namespace, sa_name, managed_fields, sa=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     try:
-        sa = v1.read_namespaced_service_account(name=sa_name, namespace=namespace)
+        if sa is None:
+            sa = v1.read_namespaced_service_account(name=sa_name, namespace=namespace)
         # Filtering Annotations
         if sa.metadata:
             sa.metadata.annotations = filter_annotations(sa.metadata.annotations or {})
-        api_client = client.ApiClient()
         sa_dict = api_client.sanitize_for_serialization(sa)
 
         # Clean up metadata
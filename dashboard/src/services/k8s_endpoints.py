@@ -1,77 +1,60 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 from datetime import datetime, timezone
 import yaml
 from kubebuddy.appLogs import logger
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+def endpoint_addresses(ep):
+    # ip:port for each address and port, or the bare ip when the subset has no ports
+    ip_port_pairs = []
+    for subset in ep.subsets or []:
+        for addr in subset.addresses or []:
+            if subset.ports:
+                ip_port_pairs.extend(f"{addr.ip}:{port.port}" for port in subset.ports)
+            else:
+                ip_port_pairs.append(addr.ip)
+    return ip_port_pairs or ['None']
+
+ENDPOINT_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('endpoints', lambda ep, now: endpoint_addresses(ep)),
+    ('age', lambda ep, now: calculateAge(now - ep.metadata.creation_timestamp) if ep.metadata.creation_timestamp else 'N/A'),
+))
 
 def get_endpoints(path, context):
     try:
         # Load kube config with specific path and context
-        configure_k8s(path, context)
+        api_client = configure_k8s(path, context)
         
         # Initialize the Kubernetes API client
-        v1 = client.CoreV1Api()
-        
-        # Get all namespaces
-        try:
-            namespaces = v1.list_namespace()
-        except Exception as e:
-            logger.error(f"Error fetching namespaces: {e}")
-            return []
+        v1 = client.CoreV1Api(api_client)
         
-        endpoint_data = []
-        
-        for ns in namespaces.items:
-            namespace = ns.metadata.name
-            
-            # Get all endpoints in the namespace
-            try:
-                endpoints = v1.list_namespaced_endpoints(namespace)
-            except Exception as e:
-                logger.error(f"Error fetching endpoints for namespace '{namespace}': {e}")
-                continue  # Skip to the next namespace
-            
-            for ep in endpoints.items:
-                try:
-                    # Extract IP addresses with associated ports
-                    ip_port_pairs = []
-                    for subset in ep.subsets or []:
-                        if subset.addresses:
-                            for addr in subset.addresses:
-                                if subset.ports:
-                                    for port in subset.ports:
-                                        ip_port_pairs.append(f"{addr.ip}:{port.port}")
-                                else:
-                                    ip_port_pairs.append(addr.ip)
-
-                    endpoint_info = {
-                        'namespace': namespace,
-                        'name': ep.metadata.name,
-                        'endpoints': ip_port_pairs if ip_port_pairs else ['None'],
-                        'age': calculateAge(datetime.now(timezone.utc) - ep.metadata.creation_timestamp) if ep.metadata.creation_timestamp else 'N/A'
-                    }
-                    endpoint_data.append(endpoint_info)
-                except Exception as e:
-                    logger.error(f"Error processing endpoint '{ep.metadata.name}' in namespace '{namespace}': {e}")
-        
-        return endpoint_data
+        # Get the endpoints of all namespaces in one paginated call
+        return project(list_items(v1.list_endpoints_for_all_namespaces), ENDPOINT_COLUMNS)
     
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error(f"Error fetching endpoints: {e}")
         return []
 
 
-def get_endpoint_description(path=None, context=None, namespace=None, endpoint_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def read_endpoint(path, context, namespace, endpoint_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_endpoints(name=endpoint_name, namespace=namespace)
+
+def get_endpoint_description(path=None, context=None, namespace=None, endpoint_name=None, endpoint=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     try:
-        target_endpoint = v1.read_namespaced_endpoints(endpoint_name, namespace=namespace)
+        if endpoint is None:
+            endpoint = v1.read_namespaced_endpoints(endpoint_name, namespace=namespace)
         endpoint_info = {
-            "name": target_endpoint.metadata.name,
-            "namespace": target_endpoint.metadata.namespace,
-            "labels": target_endpoint.metadata.labels,
-            "annotations": filter_annotations(target_endpoint.metadata.annotations or {}),
+            "name": endpoint.metadata.name,
+            "namespace": endpoint.metadata.namespace,
+            "labels": endpoint.metadata.labels,
+            "annotations": filter_annotations(endpoint.metadata.annotations or {}),
             "subsets": [
                 {
                     "addresses": [
@@ -87,7 +70,7 @@ def get_endpoint_description(path=None, context=None, namespace=None, endpoint_n
                         for address in subset.not_ready_addresses or []
                     ]
                 }
-                for subset in (target_endpoint.subsets if target_endpoint.subsets else [])
+                for subset in (endpoint.subsets if endpoint.subsets else [])
             ],
         }
         return endpoint_info
@@ -95,25 +78,21 @@ def get_endpoint_description(path=None, context=None, namespace=None, endpoint_n
         return {"error": f"Failed to fetch endpoint details: {e.reason}"}
 
 def get_endpoint_events(path, context, namespace, endpoint_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    endpoint_events = [
-        event for event in events if event.involved_object.name == endpoint_name and event.involved_object.kind == "Endpoints"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in endpoint_events])
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, endpoint_name, "Endpoints", namespace=namespace))
 
 
-def get_endpoint_yaml(path, context, namespace, endpoint_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    endpoints = v1.read_namespaced_endpoints(endpoint_name, namespace=namespace)
+def get_endpoint_yaml(path, context, namespace, endpoint_name, managed_fields, endpoint=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if endpoint is None:
+        endpoint = v1.read_namespaced_endpoints(endpoint_name, namespace=namespace)
     # Filtering Annotations
-    if endpoints.metadata:
-        endpoints.metadata.annotations = filter_annotations(endpoints.metadata.annotations or {})
+    if endpoint.metadata:
+        endpoint.metadata.annotations = filter_annotations(endpoint.metadata.annotations or {})
     
-    api_client = client.ApiClient()
-    endpoint_dict = api_client.sanitize_for_serialization(endpoints)
+    endpoint_dict = api_client.sanitize_for_serialization(endpoint)
 
     # Clean up metadata
     if "metadata" in endpoint_dict and not managed_fields:
@@ -124,13 +103,9 @@ def get_endpoint_yaml(path, context, namespace, endpoint_name, managed_fields):
 
     return yaml.safe_dump(endpoint_dict, sort_keys=False)
 
-def get_endpoint_details():
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    v1 = client.CoreV1Api()
+def get_endpoint_details(path, context):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     endpoints = v1.list_endpoints_for_all_namespaces()
 
     def get_age(creation_timestamp):
@@ -1,52 +1,51 @@
-from kubernetes import client, config
+from kubernetes import client
 from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 from kubebuddy.appLogs import logger
 import yaml
 
+SERVICE_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("type", "spec.type"),
+    ("cluster_ip", "spec.cluster_ip"),
+    # Read-only: services may be shared informer objects
+    ("external_ip", lambda svc, now: ", ".join(ingress.ip for ingress in (svc.status.load_balancer.ingress or [])
+                                              if ingress.ip) or "-"),
+    ("ports", lambda svc, now: ", ".join(f"{p.port}/{p.protocol}" for p in svc.spec.ports)),
+    ("age", lambda svc, now: calculateAge(now - svc.metadata.creation_timestamp)),
+    ("selector", "spec.selector"),
+))
+
 
 def list_kubernetes_services(path, context):
     # Load the kubeconfig with the specified context
-    configure_k8s(path, context)
+    api_client = configure_k8s(path, context)
 
     # Create Kubernetes API client
-    v1 = client.CoreV1Api()
+    v1 = client.CoreV1Api(api_client)
 
     # Fetch all services in all namespaces
-    services = v1.list_service_for_all_namespaces(watch=False)
+    services = cached_items(path, context, "services")
+    if services is None:
+        services = list_items(v1.list_service_for_all_namespaces)
 
     # Prepare data for Jinja template
-    service_data = []
-    for svc in services.items:
-        name = svc.metadata.name
-        namespace = svc.metadata.namespace
-        svc_type = svc.spec.type
-        cluster_ip = svc.spec.cluster_ip
-        external_ip = ", ".join(svc.status.load_balancer.ingress[0].ip 
-                                for svc.status.load_balancer.ingress in (svc.status.load_balancer.ingress or []) 
-                                if svc.status.load_balancer.ingress) or "-"
-        ports = ", ".join(f"{p.port}/{p.protocol}" for p in svc.spec.ports)
-        age = calculateAge(datetime.now(timezone.utc) - svc.metadata.creation_timestamp)
-        selector = svc.spec.selector
-
-        service_data.append({
-            "namespace": namespace,
-            "name": name,
-            "type": svc_type,
-            "cluster_ip": cluster_ip,
-            "external_ip": external_ip,
-            "ports": ports,
-            "age": age,
-            "selector": selector
-        })
+    return project(services, SERVICE_COLUMNS)
 
-    return service_data
 
+def read_service(path, context, namespace, service_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_service(name=service_name, namespace=namespace)
 
-def get_service_description(path=None, context=None, namespace=None, service_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    service = v1.read_namespaced_service(name=service_name, namespace=namespace)
+def get_service_description(path=None, context=None, namespace=None, service_name=None, service=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if service is None:
+        service = v1.read_namespaced_service(name=service_name, namespace=namespace)
     
     # Get Endpoints related to this service
     endpoints = None
@@ -104,23 +103,19 @@ def get_service_description(path=None, context=None, namespace=None, service_nam
     return service_info
 
 def get_service_events(path, context, namespace, service_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    service_events = [
-        event for event in events if event.involved_object.name == service_name and event.involved_object.kind == "Service"
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in service_events])
-
-def get_service_yaml(path, context, namespace, service_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    service = v1.read_namespaced_service(name=service_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, service_name, "Service", namespace=namespace))
+
+def get_service_yaml(path, context, namespace, service_name, managed_fields, service=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if service is None:
+        service = v1.read_namespaced_service(name=service_name, namespace=namespace)
     # Filtering Annotations
     if service.metadata:
         service.metadata.annotations = filter_annotations(service.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     service_dict = api_client.sanitize_for_serialization(service)
 
     # Clean up metadata
@@ -132,13 +127,9 @@ def get_service_yaml(path, context, namespace, service_name, managed_fields):
 
     return yaml.safe_dump(service_dict, sort_keys=False)
 
-def get_service_details(namespace=None):
-    try:
-        config.load_incluster_config()
-    except config.ConfigException:
-        config.load_kube_config()
-
-    v1 = client.CoreV1Api()
+def get_service_details(path, context, namespace=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     services = v1.list_namespaced_service(namespace) if namespace else v1.list_service_for_all_namespaces()
 
     def get_age(created_at):
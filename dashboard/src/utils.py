@@ -1,5 +1,6 @@
 from kubernetes import client, config
 from google.auth import default
+from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.cloud.container_v1 import ClusterManagerClient
 import tempfile
 import base64
@@ -8,8 +9,12 @@ import yaml
 from kubebuddy.appLogs import logger
 from deepdiff import DeepDiff
 import json
+import orjson
 import boto3
 import subprocess
+import threading
+import time
+from datetime import datetime, timezone
 
 # Age calculation
 def calculateAge(timedelta_obj):
@@ -25,89 +30,212 @@ def calculateAge(timedelta_obj):
         return str(timedelta_obj.days) + "d"
     
 
+# Parse an RFC 3339 timestamp from a raw API response (e.g. metadata.creationTimestamp)
+def parse_k8s_timestamp(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 def filter_annotations(annotations):
     if not annotations:
         return None
     filtered_annotations = {k: v for k, v in annotations.items() if k != "kubectl.kubernetes.io/last-applied-configuration"} 
     return filtered_annotations if filtered_annotations else None
 
-def configure_k8s(path: str, context: str):
-    if context.startswith('gke_'):
-        # Handle GKE
-        SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
-        credentials, project = default(scopes=SCOPES)
-        cluster_manager_client = ClusterManagerClient(credentials=credentials)
+# Cached API clients keyed by (kubeconfig path, context, kubeconfig mtime)
+_api_clients = {}
+_api_clients_lock = threading.Lock()
 
-        # Extract GKE details from context_name: gke_{project}_{zone}_{cluster_name}
-    
-        _, project_id, zone, cluster_id = context.split('_', 3) # Have removed the try block assuming context is always in this format
+# GKE/EKS endpoint, CA file and bearer token keyed by context name
+_cloud_credentials = {}
+_cloud_credentials_lock = threading.Lock()
 
-        gke_cluster = cluster_manager_client.get_cluster(
-            project_id=project_id,
-            zone=zone,
-            cluster_id=cluster_id
-        )
+# Refresh a cloud bearer token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 120
+
+def _kubeconfig_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+def _write_ca_cert(ca_data):
+    cert = base64.b64decode(ca_data)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".crt") as cert_file:
+        cert_file.write(cert)
+        return cert_file.name
+
+def _fetch_gke_endpoint(context):
+    SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
+    credentials, project = default(scopes=SCOPES)
+    cluster_manager_client = ClusterManagerClient(credentials=credentials)
+
+    # Extract GKE details from context_name: gke_{project}_{zone}_{cluster_name}
+    _, project_id, zone, cluster_id = context.split('_', 3) # Have removed the try block assuming context is always in this format
+
+    gke_cluster = cluster_manager_client.get_cluster(
+        project_id=project_id,
+        zone=zone,
+        cluster_id=cluster_id
+    )
+
+    return {
+        "host": f"https://{gke_cluster.endpoint}:443",
+        "ca_cert": _write_ca_cert(gke_cluster.master_auth.cluster_ca_certificate),
+        "google_credentials": credentials,
+        "token": None,
+        "expiry": 0,
+    }
+
+def _fetch_gke_token(credentials):
+    if not credentials.valid:
+        credentials.refresh(GoogleAuthRequest())
+    # google-auth reports expiry as a naive UTC datetime
+    expiry = credentials.expiry.replace(tzinfo=timezone.utc).timestamp() if credentials.expiry else time.time() + 3600
+    return credentials.token, expiry
+
+def _fetch_eks_endpoint(context):
+    # currently using context for cluster name and user as well, if need be we can read the file and get the relevant data
+    region = context.split(':')[3]
+    name = context.split(':')[5].split('/')[1]
+    eks = boto3.client('eks', region_name=region)
+    cluster_info = eks.describe_cluster(name=name)
+
+    return {
+        "host": cluster_info['cluster']['endpoint'],
+        "ca_cert": _write_ca_cert(cluster_info['cluster']['certificateAuthority']['data']),
+        "token": None,
+        "expiry": 0,
+    }
+
+def _fetch_eks_token(context):
+    region = context.split(':')[3]
+    name = context.split(':')[5].split('/')[1]
+    auth_token = subprocess.check_output(
+        ['aws', 'eks', 'get-token', '--cluster-name', name, '--region', region, '--output', 'json']
+    )
+    token_data = json.loads(auth_token)
+    expiry = parse_k8s_timestamp(token_data['status']['expirationTimestamp']).timestamp()
+    return token_data['status']['token'], expiry
+
+def _token_needs_refresh(credentials):
+    return credentials["token"] is None or credentials["expiry"] - TOKEN_REFRESH_MARGIN <= time.time()
+
+def get_cloud_credentials(context):
+    """
+    Return the endpoint, CA file and a valid bearer token for a GKE or EKS context.
+
+    The endpoint and CA are looked up once per context. The token is reused
+    until it is within TOKEN_REFRESH_MARGIN seconds of expiring.
+    """
+    credentials = _cloud_credentials.get(context)
+    if credentials is not None and not _token_needs_refresh(credentials):
+        return credentials
+
+    # Only one thread per process fetches; the others wait and reuse its result
+    with _cloud_credentials_lock:
+        credentials = _cloud_credentials.get(context)
+        if credentials is None:
+            credentials = _fetch_gke_endpoint(context) if context.startswith('gke_') else _fetch_eks_endpoint(context)
+            _cloud_credentials[context] = credentials
 
-        cert = base64.b64decode(gke_cluster.master_auth.cluster_ca_certificate)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".crt") as cert_file:
-            cert_file.write(cert)
-            cert_path = cert_file.name
+        if _token_needs_refresh(credentials):
+            if context.startswith('gke_'):
+                token, expiry = _fetch_gke_token(credentials["google_credentials"])
+            else:
+                token, expiry = _fetch_eks_token(context)
+            credentials["token"] = token
+            credentials["expiry"] = expiry
+
+    return credentials
+
+def _build_api_client(path, context):
+    if context.startswith('gke_') or context.startswith('arn:aws:eks:'):
+        credentials = get_cloud_credentials(context)
 
         configuration = client.Configuration()
-        configuration.host = f"https://{gke_cluster.endpoint}:443"
-        configuration.ssl_ca_cert = cert_path
+        configuration.host = credentials["host"]
+        configuration.ssl_ca_cert = credentials["ca_cert"]
         configuration.verify_ssl = True
-        configuration.api_key = {"authorization": "Bearer " + credentials.token}
-        client.Configuration.set_default(configuration)
-
-    elif context.startswith('arn:aws:eks:'):
-        # currently using context for cluster name and user as well, if need be we can read the file and get the relevant data
-        # Get token
-        region = context.split(':')[3]
-        name = context.split(':')[5].split('/')[1]
-        eks = boto3.client('eks', region_name=region)
-        cluster_info = eks.describe_cluster(name=name)
-        cluster_cert = cluster_info['cluster']['certificateAuthority']['data']
-        cluster_endpoint = cluster_info['cluster']['endpoint']
-
-        # Generate token
-        token = boto3.client('sts').get_caller_identity()
-        auth_token = subprocess.check_output(
-            ['aws', 'eks', 'get-token', '--cluster-name', name, '--region', region, '--output', 'json']
+        configuration.api_key = {"authorization": "Bearer " + credentials["token"]}
+        # Called before every request so a long-lived client picks up refreshed tokens
+        configuration.refresh_api_key_hook = lambda conf: conf.api_key.update(
+            authorization="Bearer " + get_cloud_credentials(context)["token"]
         )
-        token_data = json.loads(auth_token)
-        bearer_token = token_data['status']['token']
-        # Build config manually
-
-        config_dict = {
-            'apiVersion': 'v1',
-            'clusters': [{
-                'cluster': {
-                    'server': cluster_endpoint,
-                    'certificate-authority-data': cluster_cert
-                },
-                'name': context
-            }],
-            'contexts': [{
-                'context': {
-                    'cluster': context,
-                    'user': context
-                },
-                'name': context
-            }],
-            'current-context': context,
-            'kind': 'Config',
-            'users': [{
-                'name': context,
-                'user': {
-                    'token': bearer_token
-                }
-            }]
-        }
-
-        config.load_kube_config_from_dict(config_dict)
+        return client.ApiClient(configuration)
     else:
-        config.load_kube_config(config_file=path, context=context)
+        return config.new_client_from_config(config_file=path, context=context)
+
+def configure_k8s(path: str, context: str):
+    """
+    Return a cached ApiClient for the given kubeconfig/context.
+
+    Clients are built once per kubeconfig mtime so the urllib3 connection
+    pool stays warm between calls. GKE and EKS clients refresh their bearer
+    token through get_cloud_credentials before it expires.
+    The process-wide default Configuration is never touched, so callers must
+    pass the returned client to every API object they create. This keeps
+    concurrent requests for different clusters isolated from each other.
+    """
+    key = (path, context, _kubeconfig_mtime(path))
+    api_client = _api_clients.get(key)
+    if api_client is not None:
+        return api_client
+
+    with _api_clients_lock:
+        api_client = _api_clients.get(key)
+        if api_client is None:
+            # Drop clients built from an older version of this kubeconfig
+            for stale in [k for k in _api_clients if k[:2] == (path, context)]:
+                _api_clients.pop(stale).close()
+            api_client = _build_api_client(path, context)
+            _api_clients[key] = api_client
+
+    return api_client
+
+
+# Objects requested per page by list_pages
+LIST_PAGE_SIZE = 500
+
+def list_pages(list_func, page_size=LIST_PAGE_SIZE, **kwargs):
+    """
+    Yield the responses of a Kubernetes list call one page at a time.
+
+    Each request asks for at most page_size objects and passes the previous
+    page's continue token, so large lists never sit in memory as a single
+    response. A 410 Gone (continue token expired mid-listing) is raised to
+    the caller like any other ApiException.
+    """
+    _continue = None
+    while True:
+        page = list_func(limit=page_size, _continue=_continue, **kwargs)
+        yield page
+        _continue = page.metadata._continue
+        # V1ListMeta._continue is an empty string or None on the last page
+        if not isinstance(_continue, str) or not _continue:
+            return
+
+def list_items(list_func, page_size=LIST_PAGE_SIZE, **kwargs):
+    """Yield every object of a paginated list call (see list_pages)."""
+    for page in list_pages(list_func, page_size, **kwargs):
+        yield from page.items
+
+def list_raw(list_func, page_size=LIST_PAGE_SIZE, **kwargs):
+    """
+    Yield every object of a paginated list call as a plain dict.
+
+    The call is made with _preload_content=False and each page is decoded
+    with orjson, skipping the client's OpenAPI model deserialization. Use it
+    where a view only projects a few fields out of a large list. Keys keep
+    the API's camelCase names (e.g. metadata.creationTimestamp).
+    """
+    _continue = None
+    while True:
+        response = list_func(limit=page_size, _continue=_continue, _preload_content=False, **kwargs)
+        page = orjson.loads(response.data)
+        response.release_conn()
+        yield from page.get("items") or []
+        _continue = page.get("metadata", {}).get("continue")
+        if not _continue:
+            return
 
 
 # Map resource kinds to API client and patch methods
@@ -245,8 +373,7 @@ K8S_RESOURCE_MAP = {
 }
 
 def validate_and_patch_resource(path, context, name, namespace=None, old_yaml=None, new_yaml=None):
-    configure_k8s(path, context)
-    k8s_client = client.ApiClient()
+    k8s_client = configure_k8s(path, context)
     try:
         resource_dict = yaml.safe_load(new_yaml)
         kind = resource_dict.get("kind")
@@ -278,7 +405,7 @@ def validate_and_patch_resource(path, context, name, namespace=None, old_yaml=No
             ret = patch_method(name=name, body=resource_dict)
 
         # converting new obj to yaml
-        sanitized = client.ApiClient().sanitize_for_serialization(ret)
+        sanitized = k8s_client.sanitize_for_serialization(ret)
     
         # Dump YAML
         edited_yaml = yaml.safe_dump(sanitized, sort_keys=False)
@@ -287,7 +414,9 @@ def validate_and_patch_resource(path, context, name, namespace=None, old_yaml=No
         return {
             "success": True,
             "message": f"{kind} patched successfully.",
-            "changes": changes
+            "changes": changes,
+            # The patched object, so callers can re-render it without reading it again
+            "object": ret
         }
     
     except Exception as ex:
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+from kubebuddy.appLogs import logger
+import hashlib
+import time
+
+# Seconds a refresh lock is held before another request may retry a stuck refresh
+REFRESH_LOCK_SECONDS = 60
+
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="view-cache")
+
+def cache_key(cluster_id, namespace, fetch, *args):
+    # The arguments are hashed, since they include kubeconfig paths and keys must stay short
+    digest = hashlib.sha1(repr(args).encode()).hexdigest()
+    return f"view:{cluster_id}:{namespace}:{fetch.__module__}.{fetch.__qualname__}:{digest}"
+
+def _store(key, fetch, args):
+    ttl = settings.K8S_VIEW_CACHE_TTL
+    entry = (time.time() + ttl, fetch(*args))
+    cache.set(key, entry, ttl + settings.K8S_VIEW_CACHE_STALE_TTL)
+    return entry
+
+def _refresh(key, fetch, args):
+    try:
+        _store(key, fetch, args)
+    except Exception as e:
+        logger.error(f"Background refresh of {key} failed: {e}")
+    finally:
+        cache.delete(f"{key}:refreshing")
+
+def cached_result(cluster_id, namespace, fetch, *args):
+    """
+    Return fetch(*args) through a per-(cluster, namespace, view, arguments) cache.
+
+    Entries younger than K8S_VIEW_CACHE_TTL are returned as they are. Older
+    entries are still returned immediately, and one background refresh per
+    key replaces them. Misses are fetched in the request. Concurrent viewers
+    of the same page therefore cost one set of API calls per TTL.
+    A TTL of 0 disables the cache.
+    """
+    return cached_entry(cluster_id, namespace, fetch, *args)[1]
+
+def cached_entry(cluster_id, namespace, fetch, *args):
+    """
+    Like cached_result, but return (version, value).
+
+    version changes whenever the cached value is rebuilt, so callers can
+    keep data derived from the value (e.g. an index of its rows) until then.
+    It is None when the cache is disabled and the value is fetched every time.
+    """
+    if not settings.K8S_VIEW_CACHE_TTL:
+        return None, fetch(*args)
+
+    key = cache_key(cluster_id, namespace, fetch, *args)
+    entry = cache.get(key)
+    if entry is None:
+        return _store(key, fetch, args)
+
+    fresh_until, value = entry
+    # cache.add only succeeds for the first request that sees the entry go stale
+    if fresh_until <= time.time() and cache.add(f"{key}:refreshing", True, REFRESH_LOCK_SECONDS):
+        _refresh_executor.submit(_refresh, key, fetch, args)
+    return entry
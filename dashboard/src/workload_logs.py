@@ -0,0 +1,185 @@
+from collections import deque
+import heapq
+import queue
+import threading
+import time
+from kubernetes import client
+from django.conf import settings
+from kubebuddy.appLogs import logger
+from .utils import configure_k8s, list_items
+from .pod_logs import KEEPALIVE, KEEPALIVE_SECONDS, split_timestamp, stream_pod_log, timestamp_key
+
+# resource -> (API class, read method) of the workloads whose pods can be aggregated
+WORKLOAD_KINDS = {
+    "deployments": (client.AppsV1Api, "read_namespaced_deployment"),
+    "replicasets": (client.AppsV1Api, "read_namespaced_replica_set"),
+    "statefulsets": (client.AppsV1Api, "read_namespaced_stateful_set"),
+    "daemonsets": (client.AppsV1Api, "read_namespaced_daemon_set"),
+    "jobs": (client.BatchV1Api, "read_namespaced_job"),
+}
+
+# Lines buffered per pod before its reader waits for the merge to catch up
+POD_BUFFER_LINES = 256
+# Seconds a blocked reader waits between checks that the merge is still running
+PUT_TIMEOUT = 0.5
+# Seconds a followed pod may stay quiet before its reader checks that the merge is still running
+FOLLOW_READ_TIMEOUT = 5
+# Seconds a merge waits, for all its pods together, for free readers before reporting the rest as skipped
+READER_WAIT = 5
+# Sorts before every real timestamp, e.g. for a pod whose log could not be opened
+NO_TIMESTAMP = ""
+
+_DONE = object()
+# Log readers running in this process, across all merged log views
+_readers = threading.BoundedSemaphore(settings.K8S_LOG_READERS_MAX)
+
+
+def selector_string(label_selector):
+    """Render a V1LabelSelector as a label_selector query string."""
+    terms = [f"{key}={value}" for key, value in (label_selector.match_labels or {}).items()]
+    for expression in label_selector.match_expressions or []:
+        if expression.operator == "In":
+            terms.append(f"{expression.key} in ({','.join(expression.values)})")
+        elif expression.operator == "NotIn":
+            terms.append(f"{expression.key} notin ({','.join(expression.values)})")
+        elif expression.operator == "Exists":
+            terms.append(expression.key)
+        elif expression.operator == "DoesNotExist":
+            terms.append(f"!{expression.key}")
+    return ",".join(terms)
+
+def workload_pods(path, context, resource, namespace, name):
+    """Return the names of a workload's pods, found through the workload's own selector."""
+    api_class, read_method = WORKLOAD_KINDS[resource]
+    api_client = configure_k8s(path, context)
+    workload = getattr(api_class(api_client), read_method)(name=name, namespace=namespace)
+    v1 = client.CoreV1Api(api_client)
+    pods = list_items(v1.list_namespaced_pod, namespace=namespace,
+                      label_selector=selector_string(workload.spec.selector))
+    return sorted(pod.metadata.name for pod in pods)
+
+def _put(buffer, item, stopped):
+    # Block while the buffer is full, but give up once the merge has stopped
+    while not stopped.is_set():
+        try:
+            buffer.put(item, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _pod_lines(path, context, namespace, pod_name, follow, options, stopped):
+    """
+    Yield the (timestamp, message) lines of a pod's log.
+
+    A followed log is read with a FOLLOW_READ_TIMEOUT read timeout, so the
+    reader of a quiet pod wakes up to check that the merge still runs.
+    """
+    lines = stream_pod_log(path, context, namespace, pod_name, follow=follow, timestamps=True,
+                           read_timeout=FOLLOW_READ_TIMEOUT, **options)
+    try:
+        for line in lines:
+            if line is KEEPALIVE:
+                if stopped.is_set():
+                    return
+                continue
+            yield split_timestamp(line)
+    finally:
+        lines.close()
+
+def _read_pod(path, context, namespace, pod_name, follow, options, buffer, stopped):
+    lines = _pod_lines(path, context, namespace, pod_name, follow, options, stopped)
+    try:
+        for timestamp, message in lines:
+            if not _put(buffer, (timestamp, pod_name, message), stopped):
+                break
+    except client.exceptions.ApiException as e:
+        _put(buffer, (NO_TIMESTAMP, pod_name, f"[log unavailable: {e.reason}]"), stopped)
+    except Exception as e:
+        logger.error(f"Reading logs of pod {pod_name} failed: {e}")
+        _put(buffer, (NO_TIMESTAMP, pod_name, "[log stream interrupted]"), stopped)
+    finally:
+        lines.close()
+        # Always signal the end, or the merge would wait for this pod forever
+        _put(buffer, (NO_TIMESTAMP, pod_name, _DONE), stopped)
+        _readers.release()
+
+def merge_pod_logs(path, context, namespace, pod_names, follow=False, **options):
+    """
+    Stream the logs of several pods as (timestamp, pod, message) tuples.
+
+    Each pod is read by its own thread, at most K8S_LOG_AGGREGATION_MAX_PODS
+    of them, into a bounded buffer: a reader that gets ahead of the merge
+    waits, so memory stays bounded however much the pods log. At most
+    K8S_LOG_READERS_MAX readers run in the process; the pods that find none
+    free within READER_WAIT seconds, counted once for the whole merge, are
+    reported as skipped. Finite logs are merged by timestamp. Followed logs
+    are emitted as they arrive, since a strict merge would stall on any pod
+    that stays quiet, and a KEEPALIVE is yielded whenever all the pods stay
+    quiet for KEEPALIVE_SECONDS, so a viewer that has gone is noticed.
+    Closing the generator stops the readers, within FOLLOW_READ_TIMEOUT
+    seconds for one waiting on a quiet pod.
+    """
+    pod_names = pod_names[:settings.K8S_LOG_AGGREGATION_MAX_PODS]
+    # Lines are always read with timestamps, to merge on them
+    options = {key: value for key, value in options.items() if key != "timestamps"}
+    stopped = threading.Event()
+    if follow:
+        shared = queue.Queue(POD_BUFFER_LINES * max(len(pod_names), 1))
+        buffers = [shared] * len(pod_names)
+    else:
+        buffers = [queue.Queue(POD_BUFFER_LINES) for _ in pod_names]
+    deadline = time.monotonic() + READER_WAIT
+    for pod_name, buffer in zip(pod_names, buffers):
+        if not _readers.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            buffer.put((NO_TIMESTAMP, pod_name, "[log skipped: too many logs are being read]"))
+            buffer.put((NO_TIMESTAMP, pod_name, _DONE))
+            continue
+        threading.Thread(target=_read_pod, name=f"pod-log-{pod_name}", daemon=True,
+                         args=(path, context, namespace, pod_name, follow, options, buffer, stopped)).start()
+    try:
+        if follow:
+            remaining = len(pod_names)
+            while remaining:
+                try:
+                    item = shared.get(timeout=KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield KEEPALIVE
+                    continue
+                if item[2] is _DONE:
+                    remaining -= 1
+                else:
+                    yield item
+            return
+        # k-way merge on the oldest buffered line of every pod
+        heads = []
+        for index, buffer in enumerate(buffers):
+            item = buffer.get()
+            if item[2] is not _DONE:
+                heads.append((timestamp_key(item[0]), index, item))
+        heapq.heapify(heads)
+        while heads:
+            _, index, item = heapq.heappop(heads)
+            yield item
+            item = buffers[index].get()
+            if item[2] is not _DONE:
+                heapq.heappush(heads, (timestamp_key(item[0]), index, item))
+    finally:
+        stopped.set()
+
+def format_line(timestamp, pod_name, message, timestamps=False):
+    return f"[{pod_name}] {timestamp} {message}" if timestamps and timestamp else f"[{pod_name}] {message}"
+
+def format_lines(items, timestamps=False):
+    """Format merged (timestamp, pod, message) tuples, passing a KEEPALIVE through."""
+    for item in items:
+        yield item if item is KEEPALIVE else format_line(*item, timestamps)
+
+def get_workload_logs(path, context, namespace, name, resource):
+    """Return the newest K8S_POD_LOG_TAIL_LINES lines of a workload's pods, merged by timestamp."""
+    pod_names = workload_pods(path, context, resource, namespace, name)
+    # Only the merged tail is kept, however many pods contribute to it
+    lines = deque(maxlen=settings.K8S_POD_LOG_TAIL_LINES or None)
+    for timestamp, pod_name, message in merge_pod_logs(path, context, namespace, pod_names):
+        lines.append(format_line(timestamp, pod_name, message))
+    return "\n".join(lines)
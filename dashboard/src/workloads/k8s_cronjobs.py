@@ -1,38 +1,56 @@
-from kubernetes import client, config
-from ..utils import calculateAge, filter_annotations, configure_k8s
-from datetime import datetime, timezone
+from kubernetes import client
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 from kubebuddy.appLogs import logger
 import yaml
 
-def getCronJobCount():
-    config.load_kube_config()
-    v1 = client.BatchV1Api()
+CRONJOB_COLUMNS = compile_columns((
+    ('name', 'metadata.name'),
+    ('namespace', 'metadata.namespace'),
+    ('schedule', 'spec.schedule'),
+    ('time_zone', 'spec.time_zone'),
+    ('suspend', 'spec.suspend'),
+    ('active', lambda job, now: len(job.status.active) if job.status.active else 0),
+    ('last_schedule', lambda job, now: calculateAge(now - job.status.last_schedule_time)),
+    ('age', lambda job, now: calculateAge(now - job.metadata.creation_timestamp)),
+))
+
+def getCronJobCount(path, context):
+    api_client = configure_k8s(path, context)
+    v1 = client.BatchV1Api(api_client)
     cronjobs = v1.list_cron_job_for_all_namespaces().items
 
     return len(cronjobs)
 
+def count_cronjobs_status(cronjobs):
+    cronjobs_status = {
+        "Running": 0,
+        "Completed": 0,
+        "Count": 0
+    }
+
+    for cronjob in cronjobs:
+        if cronjob.status.active == None:
+            cronjobs_status["Completed"] += 1
+        else:
+            cronjobs_status["Running"] += 1
+
+        cronjobs_status["Count"] += 1
+
+    return cronjobs_status
+
 def getCronJobsStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.BatchV1Api()
-        cronjobs = v1.list_cron_job_for_all_namespaces() if namespace == "all" else v1.list_namespaced_cron_job(namespace=namespace)
-
-        cronjobs_status = {
-            "Running": 0,
-            "Completed": 0,
-            "Count": 0
-        }
-
-        for cronjob in cronjobs.items:
-            if cronjob.status.active == None:
-                cronjobs_status["Completed"] += 1
-            else:
-                cronjobs_status["Running"] += 1
+        api_client = configure_k8s(path, context)
+        v1 = client.BatchV1Api(api_client)
+        cronjobs = cached_items(path, context, "cronjobs", namespace)
+        if cronjobs is None:
+            cronjobs = list_items(v1.list_cron_job_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_cron_job, namespace=namespace)
 
-            cronjobs_status["Count"] += 1
+        return count_cronjobs_status(cronjobs)
 
-        return cronjobs_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")
         return []
@@ -42,34 +60,13 @@ def getCronJobsStatus(path, context, namespace="all"):
 
 def getCronJobsList(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.BatchV1Api()
-        cronjobs = v1.list_cron_job_for_all_namespaces() if namespace == "all" else v1.list_namespaced_cron_job(namespace=namespace)
-
-        cronjobs_list = []
-        for job in cronjobs.items:
-            namespace = job.metadata.namespace
-            name = job.metadata.name
-            schedule = job.spec.schedule
-            time_zone = job.spec.time_zone
-            suspend = job.spec.suspend
-            active = len(job.status.active) if job.status.active else 0
-            difference1 = datetime.now(timezone.utc) - job.status.last_schedule_time
-            last_schedule = calculateAge(difference1)
-            difference2 = datetime.now(timezone.utc) - job.metadata.creation_timestamp
-            age = calculateAge(difference2)
-
-            cronjobs_list.append({
-                'name': name,
-                'namespace': namespace,
-                'schedule': schedule,
-                'time_zone': time_zone,
-                'suspend': suspend,
-                'active': active,
-                'last_schedule': last_schedule,
-                'age': age
-            })
-        return cronjobs_list
+        api_client = configure_k8s(path, context)
+        v1 = client.BatchV1Api(api_client)
+        cronjobs = cached_items(path, context, "cronjobs", namespace)
+        if cronjobs is None:
+            cronjobs = list_items(v1.list_cron_job_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_cron_job, namespace=namespace)
+
+        return project(cronjobs, CRONJOB_COLUMNS)
 
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")
@@ -78,13 +75,18 @@ def getCronJobsList(path, context, namespace="all"):
         logger.error(f"An error occurred: {e}")
         return []
 
-def get_cronjob_description(path=None, context=None, namespace=None, cronjob_name=None):
-    configure_k8s(path, context)
-    v1 = client.BatchV1Api()
+def read_cronjob(path, context, namespace, cronjob_name):
+    api_client = configure_k8s(path, context)
+    return client.BatchV1Api(api_client).read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
+
+def get_cronjob_description(path=None, context=None, namespace=None, cronjob_name=None, cronjob=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.BatchV1Api(api_client)
 
     try:
         # Fetch CronJob details
-        cronjob = v1.read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
+        if cronjob is None:
+            cronjob = v1.read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
         
         # Prepare CronJob information
         cronjob_info = {
@@ -134,21 +136,19 @@ def get_cronjob_description(path=None, context=None, namespace=None, cronjob_nam
         return {"error": f"Failed to fetch CronJob details: {e.reason}"}
 
 def get_cronjob_events(path, context, namespace, cronjob_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    cronjob_events = [event for event in events if event.involved_object.name == cronjob_name and event.involved_object.kind == "CronJob"]
-    return "\n".join([f"{e.reason}: {e.message}" for e in cronjob_events])
-
-def get_yaml_cronjob(path, context, namespace, cronjob_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.BatchV1Api()
-    cronjob = v1.read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, cronjob_name, "CronJob", namespace=namespace))
+
+def get_yaml_cronjob(path, context, namespace, cronjob_name, managed_fields, cronjob=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.BatchV1Api(api_client)
+    if cronjob is None:
+        cronjob = v1.read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
     # Filtering Annotations
     if cronjob.metadata:
         cronjob.metadata.annotations = filter_annotations(cronjob.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     cronjob_dict = api_client.sanitize_for_serialization(cronjob)
 
     # Clean up metadata
@@ -1,31 +1,47 @@
 from kubernetes import client, config
-from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
 import yaml
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+DAEMONSET_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('desired', 'status.desired_number_scheduled'),
+    ('current', 'status.current_number_scheduled'),
+    ('ready', 'status.number_ready'),
+    ('age', lambda ds, now: calculateAge(now - ds.metadata.creation_timestamp)),
+))
+
+def count_daemonsets_status(daemonsets):
+    daemonset_status = {
+        "Running": 0,
+        "Pending": 0,
+        "Count": 0
+    }
+
+    for daemonset in daemonsets:
+        if daemonset.status.number_ready == daemonset.status.desired_number_scheduled == daemonset.status.current_number_scheduled != None: 
+            daemonset_status["Running"] += 1
+        else: 
+            daemonset_status["Pending"] += 1 
+        
+        daemonset_status["Count"] += 1
+
+    return daemonset_status
 
 def getDaemonsetStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        daemonsets = v1.list_daemon_set_for_all_namespaces() if namespace == "all" else v1.list_namespaced_daemon_set(namespace=namespace)
-
-        daemonset_status = {
-            "Running": 0,
-            "Pending": 0,
-            "Count": 0
-        }
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        daemonsets = cached_items(path, context, "daemonsets", namespace)
+        if daemonsets is None:
+            daemonsets = list_items(v1.list_daemon_set_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_daemon_set, namespace=namespace)
 
-        for daemonset in daemonsets.items:
-            if daemonset.status.number_ready == daemonset.status.desired_number_scheduled == daemonset.status.current_number_scheduled != None: 
-                daemonset_status["Running"] += 1
-            else: 
-                daemonset_status["Pending"] += 1 
-            
-            daemonset_status["Count"] += 1
+        return count_daemonsets_status(daemonsets)
 
-        return daemonset_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
         return []
@@ -35,30 +51,13 @@ def getDaemonsetStatus(path, context, namespace="all"):
     
 def getDaemonsetList(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        daemonsets = v1.list_daemon_set_for_all_namespaces() if namespace == "all" else v1.list_namespaced_daemon_set(namespace=namespace)
-
-        daemonset_info_list = []
-        for daemonset in daemonsets.items:
-            namespace = daemonset.metadata.namespace
-            name = daemonset.metadata.name
-            desired = daemonset.status.desired_number_scheduled
-            current = daemonset.status.current_number_scheduled
-            ready = daemonset.status.number_ready
-            difference = (datetime.now(timezone.utc) - daemonset.metadata.creation_timestamp)
-            age = calculateAge(difference)
-            
-            daemonset_info_list.append({
-                'namespace': namespace,
-                'name': name,
-                'desired': desired,
-                'current': current,
-                'ready': ready,
-                'age': age
-            })
-        
-        return daemonset_info_list
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        daemonsets = cached_items(path, context, "daemonsets", namespace)
+        if daemonsets is None:
+            daemonsets = list_items(v1.list_daemon_set_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_daemon_set, namespace=namespace)
+
+        return project(daemonsets, DAEMONSET_COLUMNS)
     
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
@@ -70,11 +69,16 @@ def getDaemonsetList(path, context, namespace="all"):
 
 
 
-def get_daemonset_description(path=None, context=None, namespace=None, daemonset_name=None):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()  # Use AppsV1Api for DaemonSets
+def read_daemonset(path, context, namespace, daemonset_name):
+    api_client = configure_k8s(path, context)
+    return client.AppsV1Api(api_client).read_namespaced_daemon_set(name=daemonset_name, namespace=namespace)
+
+def get_daemonset_description(path=None, context=None, namespace=None, daemonset_name=None, daemonset=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)  # Use AppsV1Api for DaemonSets
     try:
-        daemonset = v1.read_namespaced_daemon_set(name=daemonset_name, namespace=namespace)
+        if daemonset is None:
+            daemonset = v1.read_namespaced_daemon_set(name=daemonset_name, namespace=namespace)
         
         daemonset_info = {
             "name": daemonset.metadata.name,
@@ -141,23 +145,19 @@ def get_daemonset_description(path=None, context=None, namespace=None, daemonset
 
 
 def get_daemonset_events(path, context, namespace, daemonset_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    daemonset_events = [
-        event for event in events if event.involved_object.name == daemonset_name and event.involved_object.kind == "DaemonSet" # Filter by kind
-    ]
-    return "\n".join([f"{e.reason}: {e.message}" for e in daemonset_events])
-
-def get_daemonset_yaml(path, context, namespace, daemonset_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api() # Use AppsV1Api
-    daemonset = v1.read_namespaced_daemon_set(name=daemonset_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, daemonset_name, "DaemonSet", namespace=namespace))
+
+def get_daemonset_yaml(path, context, namespace, daemonset_name, managed_fields, daemonset=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client) # Use AppsV1Api
+    if daemonset is None:
+        daemonset = v1.read_namespaced_daemon_set(name=daemonset_name, namespace=namespace)
     # Filtering Annotations
     if daemonset.metadata:
         daemonset.metadata.annotations = filter_annotations(daemonset.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     ds_dict = api_client.sanitize_for_serialization(daemonset)
 
     # Clean up metadata
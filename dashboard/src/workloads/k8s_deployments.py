@@ -1,65 +1,69 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
 import yaml
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items, list_raw, parse_k8s_timestamp
+from ..events.k8s_events import get_object_events, format_object_events
+
+DEPLOYMENT_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('ready', lambda deployment, now: f"{deployment.status.ready_replicas or 0}/{deployment.spec.replicas}"),
+    ('age', lambda deployment, now: calculateAge(now - deployment.metadata.creation_timestamp)),
+    ('images', lambda deployment, now: [container.image for container in deployment.spec.template.spec.containers]),
+))
+
+# The same rows built from raw JSON deployments (see list_raw)
+RAW_DEPLOYMENT_COLUMNS = compile_columns((
+    ('namespace', lambda deployment, now: deployment["metadata"].get("namespace")),
+    ('name', lambda deployment, now: deployment["metadata"]["name"]),
+    ('ready', lambda deployment, now: "{}/{}".format(deployment.get("status", {}).get("readyReplicas", 0),
+                                                     deployment.get("spec", {}).get("replicas"))),
+    ('age', lambda deployment, now: calculateAge(now - parse_k8s_timestamp(deployment["metadata"]["creationTimestamp"]))),
+    ('images', lambda deployment, now: [container.get("image") for container in
+                                        deployment.get("spec", {}).get("template", {}).get("spec", {}).get("containers", [])]),
+))
 
 def getDeploymentsInfo(path, context, namespace="all"):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
-    deployments = v1.list_deployment_for_all_namespaces() if namespace == "all" else v1.list_namespaced_deployment(namespace=namespace)
-    deployment_info_list = []
-
-    current_time = datetime.now(timezone.utc)
-    
-    for deployment in deployments.items:
-        namespace = deployment.metadata.namespace
-        name = deployment.metadata.name
-        ready_replicas = deployment.status.ready_replicas if deployment.status.ready_replicas is not None else 0
-        replicas = deployment.spec.replicas
-        ready = str(ready_replicas) + "/" + str(replicas)
-        images = []
-
-        for container in deployment.spec.template.spec.containers:
-            images.append(container.image)
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
+    deployments = cached_items(path, context, "deployments", namespace)
+    if deployments is None:
+        # Only a few fields are shown, so skip building V1Deployment models
+        raw_deployments = list_raw(v1.list_deployment_for_all_namespaces) if namespace == "all" else list_raw(v1.list_namespaced_deployment, namespace=namespace)
+        return project(raw_deployments, RAW_DEPLOYMENT_COLUMNS)
+
+    return project(deployments, DEPLOYMENT_COLUMNS)
+
+def count_deployments_status(deployments):
+    deployment_status = {
+        "Running": 0,
+        "Pending": 0,
+        "Count": 0
+    }
+
+    for deployment in deployments:
+        if deployment.status.replicas == deployment.status.ready_replicas == deployment.status.available_replicas != None: 
+            deployment_status["Running"] += 1
+        else: 
+            deployment_status["Pending"] += 1 
         
-        # Remove timezone info from creation timestamp
-        creation_timestamp = deployment.metadata.creation_timestamp
-        age = calculateAge(current_time - creation_timestamp)
-        
-        deployment_info_list.append({
-            'namespace': namespace,
-            'name': name,
-            'ready': ready,
-            'age': age,
-            'images': images
-        })
+        deployment_status["Count"] += 1
 
-    return deployment_info_list
+    return deployment_status
 
 def getDeploymentsStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        deployments = v1.list_deployment_for_all_namespaces() if namespace == "all" else v1.list_namespaced_deployment(namespace=namespace)
-
-        deployment_status = {
-            "Running": 0,
-            "Pending": 0,
-            "Count": 0
-        }
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        deployments = cached_items(path, context, "deployments", namespace)
+        if deployments is None:
+            deployments = list_items(v1.list_deployment_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_deployment, namespace=namespace)
 
-        for deployment in deployments.items:
-            if deployment.status.replicas == deployment.status.ready_replicas == deployment.status.available_replicas != None: 
-                deployment_status["Running"] += 1
-            else: 
-                deployment_status["Pending"] += 1 
-            
-            deployment_status["Count"] += 1
+        return count_deployments_status(deployments)
 
-        return deployment_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
         return []
@@ -67,13 +71,17 @@ def getDeploymentsStatus(path, context, namespace="all"):
         logger(f"An error occurred: {e}")  # Print other errors to stderr
         return []
 
-def get_deployment_description(path=None, context=None, namespace=None, dep_name=None):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
+def read_deployment(path, context, namespace, deployment_name):
+    api_client = configure_k8s(path, context)
+    return client.AppsV1Api(api_client).read_namespaced_deployment(name=deployment_name, namespace=namespace)
+
+def get_deployment_description(path=None, context=None, namespace=None, dep_name=None, deployment=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
     
     try:
         # Fetch Deployment details
-        dep = v1.read_namespaced_deployment(name=dep_name, namespace=namespace)
+        dep = deployment if deployment is not None else v1.read_namespaced_deployment(name=dep_name, namespace=namespace)
 
         dep_info = {
             "name": dep.metadata.name,
@@ -137,21 +145,19 @@ def get_deployment_description(path=None, context=None, namespace=None, dep_name
 
 
 def get_deploy_events(path, context, namespace, deployment_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    deployment_events = [event for event in events if event.involved_object.name == deployment_name and event.involved_object.kind == "Deployment"]
-    return "\n".join([f"{e.reason}: {e.message}" for e in deployment_events])
-
-def get_yaml_deploy(path, context, namespace, deployment_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
-    deployment = v1.read_namespaced_deployment(name=deployment_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, deployment_name, "Deployment", namespace=namespace))
+
+def get_yaml_deploy(path, context, namespace, deployment_name, managed_fields, deployment=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
+    if deployment is None:
+        deployment = v1.read_namespaced_deployment(name=deployment_name, namespace=namespace)
     # Filtering Annotations
     if deployment.metadata:
         deployment.metadata.annotations = filter_annotations(deployment.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     deploy_dict = api_client.sanitize_for_serialization(deployment)
 
     # Clean up metadata
@@ -163,13 +169,9 @@ def get_yaml_deploy(path, context, namespace, deployment_name, managed_fields):
 
     return yaml.safe_dump(deploy_dict, sort_keys=False)
 
-def get_deployment_details(namespace=None):
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    v1 = client.AppsV1Api()
+def get_deployment_details(path, context, namespace=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
     deployments = v1.list_namespaced_deployment(namespace) if namespace else v1.list_deployment_for_all_namespaces()
 
     def get_age(creation_timestamp):
@@ -1,43 +1,70 @@
-from kubernetes import client, config
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client
 from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 import yaml
 
 
+def job_status(job):
+    if job.status.succeeded and job.status.succeeded >= job.spec.completions:
+        return "Completed"
+    if (job.status.failed and job.status.failed >= job.spec.backoff_limit) or job.status.failed:
+        return "Failed"
+    return "Running"
+
+def job_duration(job, now):
+    if job.status.completion_time is not None:
+        return calculateAge(job.status.completion_time - job.status.start_time)
+    return calculateAge(now - job.metadata.creation_timestamp)
+
+JOB_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('status', lambda job, now: job_status(job)),
+    ('completions', lambda job, now: f"{job.status.succeeded}/{job.spec.completions}"
+        if job.status.succeeded is not None else f"0/{job.spec.completions}"),
+    ('age', lambda job, now: calculateAge(now - job.metadata.creation_timestamp)),
+    ('duration', job_duration),
+))
+
 def getJobCount(path, context):
-    configure_k8s(path, context)
-    v1 = client.BatchV1Api()
-    jobs = v1.list_job_for_all_namespaces().items
+    api_client = configure_k8s(path, context)
+    v1 = client.BatchV1Api(api_client)
+    return sum(1 for _ in list_items(v1.list_job_for_all_namespaces))
+
+def count_jobs_status(jobs):
+    jobs_status = {
+        "Running": 0,
+        "Failed": 0,
+        "Completed": 0,
+        "Count": 0
+    }
+
+    for job in jobs:
+        if job.status.succeeded and job.status.succeeded >= job.spec.completions:
+            jobs_status["Completed"] += 1
+        elif (job.status.failed and job.status.failed >= job.spec.backoff_limit) or job.status.failed:
+            jobs_status["Failed"] += 1
+        else:
+            jobs_status["Running"] += 1
+        
+        jobs_status["Count"]+=1
 
-    return len(jobs)
+    return jobs_status
 
 def getJobsStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.BatchV1Api()
-        jobs = v1.list_job_for_all_namespaces() if namespace == "all" else v1.list_namespaced_job(namespace=namespace)
-
-        jobs_status = {
-            "Running": 0,
-            "Failed": 0,
-            "Completed": 0,
-            "Count": 0
-        }
+        api_client = configure_k8s(path, context)
+        v1 = client.BatchV1Api(api_client)
+        jobs = cached_items(path, context, "jobs", namespace)
+        if jobs is None:
+            jobs = list_items(v1.list_job_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_job, namespace=namespace)
+
+        return count_jobs_status(jobs)
 
-        for job in jobs.items:
-            if job.status.succeeded and job.status.succeeded >= job.spec.completions:
-                jobs_status["Completed"] += 1
-            elif (job.status.failed and job.status.failed >= job.spec.backoff_limit) or job.status.failed:
-                jobs_status["Failed"] += 1
-            else:
-                jobs_status["Running"] += 1
-            
-            jobs_status["Count"]+=1
-
-        return jobs_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
         return []
@@ -47,39 +74,12 @@ def getJobsStatus(path, context, namespace="all"):
     
 def getJobsList(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.BatchV1Api()
-        jobs = v1.list_job_for_all_namespaces() if namespace == "all" else v1.list_namespaced_job(namespace=namespace)
-        jobs_list = []
-
-        for job in jobs.items:
-            namespace = job.metadata.namespace
-            name = job.metadata.name
-            if job.status.succeeded and job.status.succeeded >= job.spec.completions:
-                status = "Completed"
-            elif (job.status.failed and job.status.failed >= job.spec.backoff_limit) or job.status.failed:
-                status = "Failed"
-            else:
-                status = "Running"
-            completions = str(job.status.succeeded) + "/" + str(job.spec.completions) if job.status.succeeded is not None else "0/" + str(job.spec.completions)
-            difference2 = (datetime.now(timezone.utc) - job.metadata.creation_timestamp)
-            age = calculateAge(difference2)
-            if job.status.completion_time is not None:
-                difference1 = job.status.completion_time - job.status.start_time
-                duration = calculateAge(difference1)
-            else:
-                duration = age
-
-            jobs_list.append({
-                'namespace': namespace,
-                'name': name,
-                'status': status,
-                'completions': completions,
-                'age': age,
-                'duration': duration,
-            })
-        
-        return jobs_list
+        api_client = configure_k8s(path, context)
+        v1 = client.BatchV1Api(api_client)
+        jobs = cached_items(path, context, "jobs", namespace)
+        if jobs is None:
+            jobs = list_items(v1.list_job_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_job, namespace=namespace)
+        return project(jobs, JOB_COLUMNS)
     
     except client.exceptions.ApiException as e:
         logger(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
@@ -89,13 +89,18 @@ def getJobsList(path, context, namespace="all"):
         return []
     
 
-def get_job_description(path=None, context=None, namespace=None, job_name=None):
-    configure_k8s(path, context)
-    batch_v1 = client.BatchV1Api()
+def read_job(path, context, namespace, job_name):
+    api_client = configure_k8s(path, context)
+    return client.BatchV1Api(api_client).read_namespaced_job(name=job_name, namespace=namespace)
+
+def get_job_description(path=None, context=None, namespace=None, job_name=None, job=None):
+    api_client = configure_k8s(path, context)
+    batch_v1 = client.BatchV1Api(api_client)
 
     try:
         # Fetch Job details
-        job = batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
+        if job is None:
+            job = batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
 
         # Prepare Job information
         job_info = {
@@ -147,21 +152,19 @@ def get_job_description(path=None, context=None, namespace=None, job_name=None):
         return {"error": f"Failed to fetch Job details: {e.reason}"}
 
 def get_job_events(path, context, namespace, job_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    job_events = [event for event in events if event.involved_object.name == job_name and event.involved_object.kind == "Job"]
-    return "\n".join([f"{e.reason}: {e.message}" for e in job_events])
-
-def get_yaml_job(path, context, namespace, job_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.BatchV1Api()
-    job = v1.read_namespaced_job(name=job_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, job_name, "Job", namespace=namespace))
+
+def get_yaml_job(path, context, namespace, job_name, managed_fields, job=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.BatchV1Api(api_client)
+    if job is None:
+        job = v1.read_namespaced_job(name=job_name, namespace=namespace)
     # Filtering Annotations
     if job.metadata:
         job.metadata.annotations = filter_annotations(job.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     job_dict = api_client.sanitize_for_serialization(job)
 
     # Clean up metadata
@@ -173,13 +176,9 @@ def get_yaml_job(path, context, namespace, job_name, managed_fields):
 
     return yaml.safe_dump(job_dict, sort_keys=False)
 
-def get_job_details(namespace=None):
-    try:
-        config.load_incluster_config()
-    except config.ConfigException:
-        config.load_kube_config()
-
-    batch_v1 = client.BatchV1Api()
+def get_job_details(path, context, namespace=None):
+    api_client = configure_k8s(path, context)
+    batch_v1 = client.BatchV1Api(api_client)
     jobs = batch_v1.list_namespaced_job(namespace) if namespace else batch_v1.list_job_for_all_namespaces()
 
     def get_age(creation_timestamp):
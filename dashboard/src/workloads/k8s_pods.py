@@ -1,25 +1,34 @@
-from kubernetes import client, config, utils
-from kubernetes.config.config_exception import ConfigException
+from kubernetes import client, utils
 from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
 import yaml
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items, list_raw, parse_k8s_timestamp
+from ..events.k8s_events import get_object_events, format_object_events
+from ..pod_logs import read_pod_log, bounded_log_options
 
 def getpods(path, context, namespace="all"):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pods = v1.list_pod_for_all_namespaces() if namespace == "all" else v1.list_namespaced_pod(namespace=namespace)
-    pod_names = [pod.metadata.name for pod in pods.items]
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    pods = cached_items(path, context, "pods", namespace)
+    if pods is None:
+        pods = list_items(v1.list_pod_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_pod, namespace=namespace)
+    pod_names = [pod.metadata.name for pod in pods]
     pod_list = []
     for name in pod_names:
         pod_list.append(name)
     return pod_list, len(pod_list)
 
 def getPodsStatus(path, context, namespace="all"):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pods = v1.list_pod_for_all_namespaces() if namespace == "all" else v1.list_namespaced_pod(namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    pods = cached_items(path, context, "pods", namespace)
+    if pods is None:
+        pods = list_items(v1.list_pod_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_pod, namespace=namespace)
+    return count_pods_status(pods)
 
+def count_pods_status(pods):
     status_counts = {
     "Pending": 0,
     "Running": 0,
@@ -28,7 +37,7 @@ def getPodsStatus(path, context, namespace="all"):
     }
 
     # Check each pod's status
-    for pod in pods.items:
+    for pod in pods:
         if pod.status.phase == "Succeeded":
             status_counts["Succeeded"]+=1
         elif pod.status.phase == "Pending":
@@ -66,37 +75,73 @@ def getPodStatus(pod):
             return "Running"
     return "Failed"
 
+def getRawPodStatus(pod):
+    # getPodStatus for a raw JSON pod (see list_raw)
+    status = pod.get("status", {})
+    phase = status.get("phase")
+    if phase in ("Succeeded", "Pending"):
+        return phase
+    elif phase == "Running":
+        for container_status in status.get("containerStatuses") or []:
+            if not container_status.get("state", {}).get("running"):
+                return "Failed"
+        return "Running"
+    return "Failed"
+
+def container_counts(statuses):
+    # "ready/total" for a pod's container statuses
+    return f"{sum(1 for status in statuses if status.ready)}/{len(statuses)}"
+
+def raw_container_statuses(pod):
+    return pod.get("status", {}).get("containerStatuses") or []
+
+# get_pod_info rows built from V1Pod models (informer cache)
+POD_COLUMNS = compile_columns((
+    ("namespace", "metadata.namespace"),
+    ("name", "metadata.name"),
+    ("containers", lambda pod, now: container_counts(pod.status.container_statuses or [])),
+    ("node", "spec.node_name"),
+    ("ip", lambda pod, now: pod.status.pod_ip or "N/A"),
+    ("restarts", lambda pod, now: sum(status.restart_count for status in pod.status.container_statuses or [])),
+    ("age", lambda pod, now: calculateAge(now - pod.metadata.creation_timestamp)),
+    ("status", lambda pod, now: getPodStatus(pod)),
+))
+
+# The same rows built from raw JSON pods (see list_raw)
+RAW_POD_COLUMNS = compile_columns((
+    ("namespace", lambda pod, now: pod["metadata"].get("namespace")),
+    ("name", lambda pod, now: pod["metadata"]["name"]),
+    ("containers", lambda pod, now: "{}/{}".format(sum(1 for status in raw_container_statuses(pod) if status.get("ready")),
+                                                   len(raw_container_statuses(pod)))),
+    ("node", lambda pod, now: pod.get("spec", {}).get("nodeName")),
+    ("ip", lambda pod, now: pod.get("status", {}).get("podIP") or "N/A"),
+    ("restarts", lambda pod, now: sum(status.get("restartCount", 0) for status in raw_container_statuses(pod))),
+    ("age", lambda pod, now: calculateAge(now - parse_k8s_timestamp(pod["metadata"]["creationTimestamp"]))),
+    ("status", lambda pod, now: getRawPodStatus(pod)),
+))
+
 def get_pod_info(config_path, cluster_name):
 
-    configure_k8s(config_path, cluster_name)
-    v1 = client.CoreV1Api()
-    pods = v1.list_pod_for_all_namespaces(watch=False)
+    api_client = configure_k8s(config_path, cluster_name)
+    v1 = client.CoreV1Api(api_client)
+    pods = cached_items(config_path, cluster_name, "pods")
+    if pods is None:
+        # Only a few fields are shown, so skip building V1Pod models for the whole cluster
+        return project(list_raw(v1.list_pod_for_all_namespaces), RAW_POD_COLUMNS)
 
-    pod_info_list = []
-    for pod in pods.items:
-        status = getPodStatus(pod)
-        container_statuses = pod.status.container_statuses or []
-        ready_count = sum(1 for status in container_statuses if status.ready)
-        total_count = len(container_statuses)
-        pod_info_list.append({
-            "namespace": pod.metadata.namespace,
-            "name": pod.metadata.name,
-            "containers": f"{ready_count}/{total_count}",
-            "node": pod.spec.node_name,
-            "ip": pod.status.pod_ip or "N/A",
-            "restarts": sum(container.restart_count for container in pod.status.container_statuses or []),
-            "age": calculateAge(datetime.now(timezone.utc) - pod.metadata.creation_timestamp),
-            "status": status,
-        })
-
-    return pod_info_list
-
-def get_pod_description(path=None, context=None, namespace=None, pod_name=None):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+    return project(pods, POD_COLUMNS)
+
+def read_pod(path, context, namespace, pod_name):
+    api_client = configure_k8s(path, context)
+    return client.CoreV1Api(api_client).read_namespaced_pod(name=pod_name, namespace=namespace)
+
+def get_pod_description(path=None, context=None, namespace=None, pod_name=None, pod=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     try:
         # Fetch pod details
-        pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+        if pod is None:
+            pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
         
         # Extract "Controlled By" from owner references
         controlled_by = None
@@ -178,33 +223,32 @@ def get_pod_description(path=None, context=None, namespace=None, pod_name=None):
     except client.exceptions.ApiException as e:
         return {"error": f"Failed to fetch pod details: {e.reason}"}
 
-def get_pod_logs(path, context, namespace, pod_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
+def get_pod_logs(path, context, namespace, pod_name, **options):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     try:
-        logs = v1.read_namespaced_pod_log(name=pod_name, namespace=namespace)
-    except Exception as e:
-        if e.status == 400:
-            logs = None
+        logs = read_pod_log(v1, namespace, pod_name, **bounded_log_options(options))
+    except client.exceptions.ApiException as e:
+        # e.g. the container has not started yet
+        if e.status != 400:
+            raise
+        logs = None
     return logs
 
 def get_pod_events(path, context, namespace, pod_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    pod_events = [event for event in events if event.involved_object.name == pod_name]
-    
-    return "\n".join([f"{e.reason}: {e.message}" for e in pod_events])
-
-def get_pod_yaml(path, context, namespace, pod_name, managed_fields=True):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, pod_name, "Pod", namespace=namespace))
+
+def get_pod_yaml(path, context, namespace, pod_name, managed_fields=True, pod=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    if pod is None:
+        pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
     # Filtering Annotations
     if pod.metadata:
         pod.metadata.annotations = filter_annotations(pod.metadata.annotations or {})
 
-    api_client = client.ApiClient()
     pod_dict = api_client.sanitize_for_serialization(pod)
 
     # Clean up metadata
@@ -216,13 +260,9 @@ def get_pod_yaml(path, context, namespace, pod_name, managed_fields=True):
 
     return yaml.safe_dump(pod_dict, sort_keys=False)
 
-def get_pod_details(namespace=None):
-    try:
-        config.load_incluster_config()
-    except ConfigException:
-        config.load_kube_config()
-
-    v1 = client.CoreV1Api()
+def get_pod_details(path, context, namespace=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
     pods = v1.list_namespaced_pod(namespace) if namespace else v1.list_pod_for_all_namespaces()
 
     def get_age(creation_timestamp):
@@ -1,69 +1,61 @@
 from kubernetes import client, config
-from datetime import datetime, timezone
 from kubebuddy.appLogs import logger
 import yaml
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
+
+REPLICASET_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('desired', 'spec.replicas'),
+    ('current', 'status.replicas'),
+    ('ready', lambda rs, now: rs.status.ready_replicas if rs.status.ready_replicas else 0),
+    ('age', lambda rs, now: calculateAge(now - rs.metadata.creation_timestamp)),
+    # List of image names for the ReplicaSet
+    ('images', lambda rs, now: [container.image for container in rs.spec.template.spec.containers or []]),
+))
 
 def getReplicaSetsInfo(path, context, namespace="all"):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
-    replicaset_info_list = []
-    
-    if namespace == "all":
-        replicasets = v1.list_replica_set_for_all_namespaces().items
-    else:
-        replicasets = v1.list_namespaced_replica_set(namespace=namespace).items
-
-    now = datetime.now(timezone.utc)
-    
-    for rs in replicasets:
-        # Remove timezone info from creation timestamp
-        creation_timestamp = rs.metadata.creation_timestamp
-        age = calculateAge(now - creation_timestamp)
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
+    replicasets = cached_items(path, context, "replicasets", namespace)
+    if replicasets is None:
+        if namespace == "all":
+            replicasets = list_items(v1.list_replica_set_for_all_namespaces)
+        else:
+            replicasets = list_items(v1.list_namespaced_replica_set, namespace=namespace)
+
+    return project(replicasets, REPLICASET_COLUMNS)
+
+def count_replicasets_status(replicasets):
+    replicaset_status = {
+        "Running": 0,
+        "Pending": 0,
+        "Count": 0
+    }
+
+    for replicaset in replicasets:
+        if replicaset.status.replicas == replicaset.status.ready_replicas == replicaset.status.available_replicas != None: 
+            replicaset_status["Running"] += 1
+        else: 
+            replicaset_status["Pending"] += 1 
         
-        # Extracting image names
-        image_names = []
-        if rs.spec.template.spec.containers:
-            for container in rs.spec.template.spec.containers:
-                image_names.append(container.image)
-
-        # Extracting selector information
-        _ = rs.spec.selector.match_labels if rs.spec.selector else {}
-
-        replicaset_info_list.append({
-            'namespace': rs.metadata.namespace,
-            'name': rs.metadata.name,
-            'desired': rs.spec.replicas,
-            'current': rs.status.replicas,
-            'ready': rs.status.ready_replicas if rs.status.ready_replicas else 0,
-            'age': age,
-            'images': image_names,   # List of image names for the ReplicaSet
-        })
-    
-    return replicaset_info_list
+        replicaset_status["Count"] += 1
+
+    return replicaset_status
 
 def getReplicasetStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        replicasets = v1.list_replica_set_for_all_namespaces() if namespace == "all" else v1.list_namespaced_replica_set(namespace=namespace)
-
-        replicaset_status = {
-            "Running": 0,
-            "Pending": 0,
-            "Count": 0
-        }
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        replicasets = cached_items(path, context, "replicasets", namespace)
+        if replicasets is None:
+            replicasets = list_items(v1.list_replica_set_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_replica_set, namespace=namespace)
 
-        for replicaset in replicasets.items:
-            if replicaset.status.replicas == replicaset.status.ready_replicas == replicaset.status.available_replicas != None: 
-                replicaset_status["Running"] += 1
-            else: 
-                replicaset_status["Pending"] += 1 
-            
-            replicaset_status["Count"] += 1
+        return count_replicasets_status(replicasets)
 
-        return replicaset_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
         return []
@@ -71,12 +63,17 @@ def getReplicasetStatus(path, context, namespace="all"):
         logger.error(f"An error occurred: {e}")  # Print other errors to stderr
         return []
 
-def get_replicaset_description(path=None, context=None, namespace=None, rs_name=None):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
+def read_replicaset(path, context, namespace, rs_name):
+    api_client = configure_k8s(path, context)
+    return client.AppsV1Api(api_client).read_namespaced_replica_set(name=rs_name, namespace=namespace)
+
+def get_replicaset_description(path=None, context=None, namespace=None, rs_name=None, rs=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
     try:
         # Fetch ReplicaSet details
-        rs = v1.read_namespaced_replica_set(name=rs_name, namespace=namespace)
+        if rs is None:
+            rs = v1.read_namespaced_replica_set(name=rs_name, namespace=namespace)
         # Prepare ReplicaSet information
         rs_info = {
             "name": rs.metadata.name,
@@ -126,21 +123,18 @@ def get_replicaset_description(path=None, context=None, namespace=None, rs_name=
 
 
 def get_replicaset_events(path, context, namespace, replicaset_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    rs_events = [event for event in events if event.involved_object.name == replicaset_name and event.involved_object.kind == "ReplicaSet"]
-    
-    return "\n".join([f"{e.reason}: {e.message}" for e in rs_events])    
-
-def get_yaml_rs(path, context, namespace, rs_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
-    rs = v1.read_namespaced_replica_set(name=rs_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, replicaset_name, "ReplicaSet", namespace=namespace))
+
+def get_yaml_rs(path, context, namespace, rs_name, managed_fields, rs=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
+    if rs is None:
+        rs = v1.read_namespaced_replica_set(name=rs_name, namespace=namespace)
     # Filtering Annotations
     if rs.metadata:
         rs.metadata.annotations = filter_annotations(rs.metadata.annotations or {})
-    api_client = client.ApiClient()
     rs_dict = api_client.sanitize_for_serialization(rs)
     # Clean up metadata
 
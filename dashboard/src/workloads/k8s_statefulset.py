@@ -1,37 +1,51 @@
 from kubernetes import client, config
-from datetime import datetime, timezone
-from ..utils import calculateAge, filter_annotations, configure_k8s
+from ..informers import cached_items
+from ..list_engine import compile_columns, project
+from ..utils import calculateAge, filter_annotations, configure_k8s, list_items
+from ..events.k8s_events import get_object_events, format_object_events
 from kubebuddy.appLogs import logger
 import yaml
 
+STATEFULSET_COLUMNS = compile_columns((
+    ('namespace', 'metadata.namespace'),
+    ('name', 'metadata.name'),
+    ('ready', lambda sts, now: f"{sts.status.available_replicas}/{sts.spec.replicas}"),
+    ('age', lambda sts, now: calculateAge(now - sts.metadata.creation_timestamp)),
+    ('images', lambda sts, now: [container.image for container in sts.spec.template.spec.containers]),
+))
+
 def getStatefulsetCount(path, context):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api() #Create an API client for the AppsV1Api
-    statefulsets = v1.list_stateful_set_for_all_namespaces().items
-    return len(statefulsets)
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client) #Create an API client for the AppsV1Api
+    return sum(1 for _ in list_items(v1.list_stateful_set_for_all_namespaces))
+
+def count_statefulsets_status(statefulsets):
+    statefulset_status = {
+        "Running": 0,
+        "Pending": 0,
+        "Count": 0
+    }
+
+    for statefulset in statefulsets:
+        if statefulset.status.replicas == statefulset.status.ready_replicas == statefulset.status.available_replicas != None: 
+            statefulset_status["Running"] += 1
+        else: 
+            statefulset_status["Pending"] += 1 
+        
+        statefulset_status["Count"] += 1
+
+    return statefulset_status
 
 def getStatefulsetStatus(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        statefulsets = v1.list_stateful_set_for_all_namespaces() if namespace == "all" else v1.list_namespaced_stateful_set(namespace=namespace)
-
-        statefulset_status = {
-            "Running": 0,
-            "Pending": 0,
-            "Count": 0
-        }
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        statefulsets = cached_items(path, context, "statefulsets", namespace)
+        if statefulsets is None:
+            statefulsets = list_items(v1.list_stateful_set_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_stateful_set, namespace=namespace)
 
-        for statefulset in statefulsets.items:
-            if statefulset.status.replicas == statefulset.status.ready_replicas == statefulset.status.available_replicas != None: 
-                statefulset_status["Running"] += 1
-            else: 
-                statefulset_status["Pending"] += 1 
-            
-            statefulset_status["Count"] += 1
+        return count_statefulsets_status(statefulsets)
 
-        return statefulset_status
-    
     except client.exceptions.ApiException as e:
         logger.error(f"Kubernetes API Exception: {e}")  # Print API errors to stderr
         return []
@@ -41,32 +55,13 @@ def getStatefulsetStatus(path, context, namespace="all"):
     
 def getStatefulsetList(path, context, namespace="all"):
     try:
-        configure_k8s(path, context)
-        v1 = client.AppsV1Api()
-        statefulsets = v1.list_stateful_set_for_all_namespaces() if namespace == "all" else v1.list_namespaced_stateful_set(namespace=namespace)
-
-        statefulset_info_list = []
-        for statefulset in statefulsets.items:
-            namespace = statefulset.metadata.namespace
-            name = statefulset.metadata.name
-            available_replicas = statefulset.status.available_replicas
-            replicas = statefulset.spec.replicas
-            ready = str(available_replicas) + "/" + str(replicas)
-            difference = (datetime.now(timezone.utc) - statefulset.metadata.creation_timestamp)
-            age = calculateAge(difference)
-            images = []
-            for containers in statefulset.spec.template.spec.containers:
-                images.append(containers.image)
-
-            statefulset_info_list.append({
-                'namespace': namespace,
-                'name': name,
-                'ready': ready,
-                'age': age,
-                'images': images
-            })
-        
-        return statefulset_info_list
+        api_client = configure_k8s(path, context)
+        v1 = client.AppsV1Api(api_client)
+        statefulsets = cached_items(path, context, "statefulsets", namespace)
+        if statefulsets is None:
+            statefulsets = list_items(v1.list_stateful_set_for_all_namespaces) if namespace == "all" else list_items(v1.list_namespaced_stateful_set, namespace=namespace)
+
+        return project(statefulsets, STATEFULSET_COLUMNS)
 
 
     except client.exceptions.ApiException as e:
@@ -77,13 +72,17 @@ def getStatefulsetList(path, context, namespace="all"):
         return []
     
 
-def get_statefulset_description(path=None, context=None, namespace=None, sts_name=None):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
+def read_statefulset(path, context, namespace, statefulset_name):
+    api_client = configure_k8s(path, context)
+    return client.AppsV1Api(api_client).read_namespaced_stateful_set(name=statefulset_name, namespace=namespace)
+
+def get_statefulset_description(path=None, context=None, namespace=None, sts_name=None, statefulset=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
 
     try:
         # Fetch StatefulSet details
-        sts = v1.read_namespaced_stateful_set(name=sts_name, namespace=namespace)
+        sts = statefulset if statefulset is not None else v1.read_namespaced_stateful_set(name=sts_name, namespace=namespace)
         
         sts_info = {
             "name": sts.metadata.name,
@@ -147,21 +146,19 @@ def get_statefulset_description(path=None, context=None, namespace=None, sts_nam
 
 
 def get_sts_events(path, context, namespace, statefulset_name):
-    configure_k8s(path, context)
-    v1 = client.CoreV1Api()
-    events = v1.list_namespaced_event(namespace=namespace).items
-    statefulset_events = [event for event in events if event.involved_object.name == statefulset_name and event.involved_object.kind == "StatefulSet"]
-    return "\n".join([f"{e.reason}: {e.message}" for e in statefulset_events])
-
-def get_yaml_sts(path, context, namespace, statefulset_name, managed_fields):
-    configure_k8s(path, context)
-    v1 = client.AppsV1Api()
-    statefulset = v1.read_namespaced_stateful_set(name=statefulset_name, namespace=namespace)
+    api_client = configure_k8s(path, context)
+    v1 = client.CoreV1Api(api_client)
+    return format_object_events(get_object_events(v1, statefulset_name, "StatefulSet", namespace=namespace))
+
+def get_yaml_sts(path, context, namespace, statefulset_name, managed_fields, statefulset=None):
+    api_client = configure_k8s(path, context)
+    v1 = client.AppsV1Api(api_client)
+    if statefulset is None:
+        statefulset = v1.read_namespaced_stateful_set(name=statefulset_name, namespace=namespace)
     # Filtering Annotations
     if statefulset.metadata:
         statefulset.metadata.annotations = filter_annotations(statefulset.metadata.annotations or {})
     
-    api_client = client.ApiClient()
     sts_dict = api_client.sanitize_for_serialization(statefulset)
 
     # Clean up metadata
@@ -1,11 +1,23 @@
 from django.test import TestCase, RequestFactory
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from main.models import KubeConfig, Cluster 
-from dashboard.views import get_utils_data, pods, pod_info, replicasets, rs_info, deployments, deploy_info, statefulsets, sts_info, daemonset, daemonset_info, jobs, jobs_info, cronjob_info, cronjobs, namespace, ns_info, nodes, node_info, limitrange, limitrange_info, resourcequota_info, resourcequotas,pdb,pdb_info, configmaps, configmap_info, secret_info, secrets, services, service_info, endpoints, endpoint_info, persistentvolume, pv_info, persistentvolumeclaim, pvc_info, storageclass, storageclass_info, np, np_info, ingress, ingress_info, role, role_info, role_binding_info, rolebinding, clusterrole, clusterrole_info, clusterrolebinding, cluster_role_binding_info, service_account, service_accountInfo, pod_metrics, node_metrics, events, execute_command
+from dashboard.views import get_utils_data, pods, pod_info, replicasets, rs_info, deployments, deploy_info, statefulsets, sts_info, daemonset, daemonset_info, jobs, jobs_info, cronjob_info, cronjobs, namespace, ns_info, nodes, node_info, limitrange, limitrange_info, resourcequota_info, resourcequotas,pdb,pdb_info, configmaps, configmap_info, secret_info, secrets, services, service_info, endpoints, endpoint_info, persistentvolume, pv_info, persistentvolumeclaim, pvc_info, storageclass, storageclass_info, np, np_info, ingress, ingress_info, role, role_info, role_binding_info, rolebinding, clusterrole, clusterrole_info, clusterrolebinding, cluster_role_binding_info, service_account, service_accountInfo, pod_metrics, node_metrics, events, execute_command, resource_list_api, detail_tab, pod_logs_stream, workload_logs_stream, pod_log_search, events_stream, metrics_history
+from django.contrib.auth.models import User
 from django.http import JsonResponse
 import os
 import json
+from kubernetes.client.rest import ApiException
+from django.test.utils import override_settings
+from dashboard.src import log_search
 
+# The views are tested against mocked list functions, so the view cache is opted out
+_no_view_cache = override_settings(K8S_VIEW_CACHE_TTL=0)
+
+def setUpModule():
+    _no_view_cache.enable()
+
+def tearDownModule():
+    _no_view_cache.disable()
 
 
 class GetUtilsDataFunctionTests(TestCase):
@@ -346,6 +358,16 @@ class PodsViewTests(TestCase):
         self.assertEqual(len(context["pods"]), 2) 
         self.assertEqual(len(context["pod_info_list"]), 1) 
 
+    def test_pods_view_renders_only_the_first_page(self):
+        self._setup_successful_mocks()
+        self.mock_k8s_pods.get_pod_info.return_value = [{"name": f"pod-{i}"} for i in range(120)]
+
+        pods(self.factory.get(f'/dashboard/pods/{self.cluster.id}/'), self.cluster.id)
+
+        context = self.mock_render.call_args[0][2]
+        self.assertEqual(len(context["pod_info_list"]), 50)
+        self.assertEqual((context["pod_rows"], context["page_size"]), (120, 50))
+
         self.mock_get_utils_data.assert_called_once()
         self.mock_k8s_pods.getpods.assert_called_once()
         self.mock_k8s_pods.get_pod_info.assert_called_once()
@@ -415,36 +437,31 @@ class PodInfoViewTests(TestCase):
 
         pod_info_dict = context["pod_info"]
         self.assertEqual(pod_info_dict["describe"], "Pod description")
-        self.assertEqual(pod_info_dict["logs"], "Pod logs")
-        self.assertEqual(pod_info_dict["events"], "Pod events")
-        self.assertEqual(pod_info_dict["yaml"], "Pod yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["pod_name"], "pod-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
 
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_pods.read_pod.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1")
         self.mock_k8s_pods.get_pod_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1"
-        )
-        self.mock_k8s_pods.get_pod_logs.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1"
-        )
-        self.mock_k8s_pods.get_pod_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1"
-        )
-        self.mock_k8s_pods.get_pod_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "pod-1", self.mock_k8s_pods.read_pod.return_value
         )
+        self.mock_k8s_pods.get_pod_logs.assert_not_called()
+        self.mock_k8s_pods.get_pod_events.assert_not_called()
+        self.mock_k8s_pods.get_pod_yaml.assert_not_called()
 
-    def test_pod_info_view_events_none(self):
+    def test_pod_info_view_loads_other_tabs_lazily(self):
         self._setup_successful_mocks()
-        self.mock_k8s_pods.get_pod_events.return_value = None
         request = self.factory.get(f'/dashboard/pod_info/{self.cluster.id}/default/pod-1/')
         response = pod_info(request, self.cluster.id, "default", "pod-1")
 
         context = self.mock_render.call_args[0][2]
-        self.assertEqual(context["pod_info"]["events"], "< None >")
+        self.assertEqual(context["pod_info"], {"describe": "Pod description"})
+        self.assertEqual(context["namespace"], "default")
+        self.mock_k8s_pods.get_pod_logs.assert_not_called()
+        self.mock_k8s_pods.get_pod_events.assert_not_called()
+        self.mock_k8s_pods.get_pod_yaml.assert_not_called()
 
     def test_pod_info_view_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -564,22 +581,17 @@ class ReplicasetViewsTests(TestCase):
         context = args[2]
         self.assertIn("rs_info", context)
         self.assertEqual(context["rs_info"]["describe"], "RS description")
-        self.assertEqual(context["rs_info"]["events"], "RS events")
-        self.assertEqual(context["rs_info"]["yaml"], "RS yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["rs_name"], "rs-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_replicaset.read_replicaset.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "rs-1")
         self.mock_k8s_replicaset.get_replicaset_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rs-1"
-        )
-        self.mock_k8s_replicaset.get_replicaset_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rs-1"
-        )
-        self.mock_k8s_replicaset.get_yaml_rs.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rs-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "rs-1", self.mock_k8s_replicaset.read_replicaset.return_value
         )
+        self.mock_k8s_replicaset.get_replicaset_events.assert_not_called()
+        self.mock_k8s_replicaset.get_yaml_rs.assert_not_called()
 
     def test_rs_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -699,22 +711,17 @@ class DeploymentsViewsTests(TestCase):
         context = args[2]
         self.assertIn("deploy_info", context)
         self.assertEqual(context["deploy_info"]["describe"], "Deploy description")
-        self.assertEqual(context["deploy_info"]["events"], "Deploy events")
-        self.assertEqual(context["deploy_info"]["yaml"], "Deploy yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["deploy_name"], "deploy-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_deployments.read_deployment.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "deploy-1")
         self.mock_k8s_deployments.get_deployment_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "deploy-1"
-        )
-        self.mock_k8s_deployments.get_deploy_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "deploy-1"
-        )
-        self.mock_k8s_deployments.get_yaml_deploy.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "deploy-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "deploy-1", self.mock_k8s_deployments.read_deployment.return_value
         )
+        self.mock_k8s_deployments.get_deploy_events.assert_not_called()
+        self.mock_k8s_deployments.get_yaml_deploy.assert_not_called()
 
     def test_deploy_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -834,22 +841,17 @@ class StatefulsetsViewsTests(TestCase):
         context = args[2]
         self.assertIn("sts_info", context)
         self.assertEqual(context["sts_info"]["describe"], "STS description")
-        self.assertEqual(context["sts_info"]["events"], "STS events")
-        self.assertEqual(context["sts_info"]["yaml"], "STS yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["sts_name"], "sts-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_statefulset.read_statefulset.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "sts-1")
         self.mock_k8s_statefulset.get_statefulset_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sts-1"
-        )
-        self.mock_k8s_statefulset.get_sts_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sts-1"
-        )
-        self.mock_k8s_statefulset.get_yaml_sts.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sts-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "sts-1", self.mock_k8s_statefulset.read_statefulset.return_value
         )
+        self.mock_k8s_statefulset.get_sts_events.assert_not_called()
+        self.mock_k8s_statefulset.get_yaml_sts.assert_not_called()
 
     def test_sts_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -969,22 +971,17 @@ class DaemonsetViewsTests(TestCase):
         context = args[2]
         self.assertIn("daemonset_info", context)
         self.assertEqual(context["daemonset_info"]["describe"], "DS description")
-        self.assertEqual(context["daemonset_info"]["events"], "DS events")
-        self.assertEqual(context["daemonset_info"]["yaml"], "DS yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["daemonset_name"], "ds-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_daemonset.read_daemonset.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "ds-1")
         self.mock_k8s_daemonset.get_daemonset_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ds-1"
-        )
-        self.mock_k8s_daemonset.get_daemonset_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ds-1"
-        )
-        self.mock_k8s_daemonset.get_daemonset_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ds-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "ds-1", self.mock_k8s_daemonset.read_daemonset.return_value
         )
+        self.mock_k8s_daemonset.get_daemonset_events.assert_not_called()
+        self.mock_k8s_daemonset.get_daemonset_yaml.assert_not_called()
 
     def test_daemonset_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -1402,18 +1399,16 @@ class NamespaceViewsTests(TestCase):
         context = args[2]
         self.assertIn("ns_info", context)
         self.assertEqual(context["ns_info"]["describe"], "Namespace description")
-        self.assertEqual(context["ns_info"]["yaml"], "Namespace yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["namespace"], "default")
         self.assertEqual(context["registered_clusters"], mock_utils_data[3])
         self.assertEqual(context["current_cluster"], mock_utils_data[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_namespaces.read_namespace.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default")
         self.mock_k8s_namespaces.get_namespace_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default"
-        )
-        self.mock_k8s_namespaces.get_namespace_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default"
+            self.kube_config_entry.path, self.cluster.context_name, "default", self.mock_k8s_namespaces.read_namespace.return_value
         )
+        self.mock_k8s_namespaces.get_namespace_yaml.assert_not_called()
 
     def test_ns_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -1538,18 +1533,16 @@ class NodesViewsTests(TestCase):
         context = args[2]
         self.assertIn("node_info", context)
         self.assertEqual(context["node_info"]["describe"], "Node description")
-        self.assertEqual(context["node_info"]["yaml"], "Node yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["node_name"], "node-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_nodes.read_node.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "node-1")
         self.mock_k8s_nodes.get_node_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "node-1"
-        )
-        self.mock_k8s_nodes.get_node_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "node-1"
+            self.kube_config_entry.path, self.cluster.context_name, "node-1", self.mock_k8s_nodes.read_node.return_value
         )
+        self.mock_k8s_nodes.get_node_yaml.assert_not_called()
 
     def test_node_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -1666,22 +1659,17 @@ class LimitRangeViewsTests(TestCase):
         context = args[2]
         self.assertIn("limitrange_info", context)
         self.assertEqual(context["limitrange_info"]["describe"], "LimitRange description")
-        self.assertEqual(context["limitrange_info"]["events"], "LimitRange events")
-        self.assertEqual(context["limitrange_info"]["yaml"], "LimitRange yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["limitrange_name"], "lr-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_limit_range.read_limit_range.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "lr-1")
         self.mock_k8s_limit_range.get_limit_range_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "lr-1"
-        )
-        self.mock_k8s_limit_range.get_limitrange_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "lr-1"
-        )
-        self.mock_k8s_limit_range.get_limitrange_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "lr-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "lr-1", self.mock_k8s_limit_range.read_limit_range.return_value
         )
+        self.mock_k8s_limit_range.get_limitrange_events.assert_not_called()
+        self.mock_k8s_limit_range.get_limitrange_yaml.assert_not_called()
 
     def test_limitrange_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -1800,22 +1788,17 @@ class ResourceQuotaViewsTests(TestCase):
         context = args[2]
         self.assertIn("resourcequota_info", context)
         self.assertEqual(context["resourcequota_info"]["describe"], "RQ description")
-        self.assertEqual(context["resourcequota_info"]["events"], "RQ events")
-        self.assertEqual(context["resourcequota_info"]["yaml"], "RQ yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["resourcequota_name"], "rq-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_resource_quota.read_resource_quota.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "rq-1")
         self.mock_k8s_resource_quota.get_resourcequota_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rq-1"
-        )
-        self.mock_k8s_resource_quota.get_resourcequota_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rq-1"
-        )
-        self.mock_k8s_resource_quota.get_resourcequota_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rq-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "rq-1", self.mock_k8s_resource_quota.read_resource_quota.return_value
         )
+        self.mock_k8s_resource_quota.get_resourcequota_events.assert_not_called()
+        self.mock_k8s_resource_quota.get_resourcequota_yaml.assert_not_called()
 
     def test_resourcequota_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -1935,21 +1918,16 @@ class PDBViewsTests(TestCase):
         context = args[2]
         self.assertIn("pdb_info", context)
         self.assertEqual(context["pdb_info"]["describe"], "PDB description")
-        self.assertEqual(context["pdb_info"]["events"], "PDB events")
-        self.assertEqual(context["pdb_info"]["yaml"], "PDB yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_pdb.read_pdb.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "pdb-1")
         self.mock_k8s_pdb.get_pdb_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pdb-1"
-        )
-        self.mock_k8s_pdb.get_pdb_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pdb-1"
-        )
-        self.mock_k8s_pdb.get_pdb_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pdb-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "pdb-1", self.mock_k8s_pdb.read_pdb.return_value
         )
+        self.mock_k8s_pdb.get_pdb_events.assert_not_called()
+        self.mock_k8s_pdb.get_pdb_yaml.assert_not_called()
 
     def test_pdb_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2069,22 +2047,17 @@ class ConfigmapsTests(TestCase):
         context = args[2]
         self.assertIn("configmap_info", context)
         self.assertEqual(context["configmap_info"]["describe"], "configmap description")
-        self.assertEqual(context["configmap_info"]["events"], "configmap events")
-        self.assertEqual(context["configmap_info"]["yaml"], "configmap yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["configmap_name"], "configmap-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_configmaps.read_configmap.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "configmap-1")
         self.mock_k8s_configmaps.get_configmap_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "configmap-1"
-        )
-        self.mock_k8s_configmaps.get_configmap_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "configmap-1"
-        )
-        self.mock_k8s_configmaps.get_configmap_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "configmap-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "configmap-1", self.mock_k8s_configmaps.read_configmap.return_value
         )
+        self.mock_k8s_configmaps.get_configmap_events.assert_not_called()
+        self.mock_k8s_configmaps.get_configmap_yaml.assert_not_called()
 
     def test_configmap_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2152,7 +2125,6 @@ class SecretsTests(TestCase):
 
     def test_secrets_successful_rendering(self):
         self._setup_utils_data()
-        self.mock_k8s_namespaces.get_namespace.return_value = ['default', 'kube-system']
         self.mock_k8s_secrets.list_secrets.return_value = (
             [
                 {"name": "secret-1", "namespace": "default"},
@@ -2171,12 +2143,10 @@ class SecretsTests(TestCase):
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["secrets"], self.mock_k8s_secrets.list_secrets.return_value[0])
         self.assertEqual(context["total_secrets"], 2)
-        self.assertEqual(context["namespaces"], self.mock_k8s_namespaces.get_namespace.return_value)
+        self.assertEqual(context["namespaces"], self.mock_get_utils_data.return_value[4])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
-        self.mock_k8s_namespaces.get_namespace.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name
-        )
+        self.mock_k8s_namespaces.get_namespace.assert_not_called()
         self.mock_k8s_secrets.list_secrets.assert_called_once_with(
             self.kube_config_entry.path, self.cluster.context_name
         )
@@ -2191,7 +2161,6 @@ class SecretsTests(TestCase):
 
     def test_secrets_k8s_api_failure(self):
         self._setup_utils_data()
-        self.mock_k8s_namespaces.get_namespace.return_value = ['default']
         self.mock_k8s_secrets.list_secrets.side_effect = Exception("K8s error")
         request = self.factory.get(f'/dashboard/secrets/{self.cluster.id}/')
         with self.assertRaises(Exception):
@@ -2213,22 +2182,17 @@ class SecretsTests(TestCase):
         context = args[2]
         self.assertIn("secret_info", context)
         self.assertEqual(context["secret_info"]["describe"], "secret description")
-        self.assertEqual(context["secret_info"]["events"], "secret events")
-        self.assertEqual(context["secret_info"]["yaml"], "secret yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["secret_name"], "secret-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_secrets.read_secret.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "secret-1")
         self.mock_k8s_secrets.get_secret_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "secret-1"
-        )
-        self.mock_k8s_secrets.get_secret_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "secret-1"
-        )
-        self.mock_k8s_secrets.get_secret_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "secret-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "secret-1", self.mock_k8s_secrets.read_secret.return_value
         )
+        self.mock_k8s_secrets.get_secret_events.assert_not_called()
+        self.mock_k8s_secrets.get_secret_yaml.assert_not_called()
 
     def test_secret_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2347,22 +2311,17 @@ class ServicesTests(TestCase):
         context = args[2]
         self.assertIn("service_info", context)
         self.assertEqual(context["service_info"]["describe"], "service description")
-        self.assertEqual(context["service_info"]["events"], "service events")
-        self.assertEqual(context["service_info"]["yaml"], "service yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["service_name"], "svc-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_services.read_service.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "svc-1")
         self.mock_k8s_services.get_service_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "svc-1"
-        )
-        self.mock_k8s_services.get_service_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "svc-1"
-        )
-        self.mock_k8s_services.get_service_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "svc-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "svc-1", self.mock_k8s_services.read_service.return_value
         )
+        self.mock_k8s_services.get_service_events.assert_not_called()
+        self.mock_k8s_services.get_service_yaml.assert_not_called()
 
     def test_service_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2481,22 +2440,17 @@ class EndpointsTests(TestCase):
         context = args[2]
         self.assertIn("endpoint_info", context)
         self.assertEqual(context["endpoint_info"]["describe"], "endpoint description")
-        self.assertEqual(context["endpoint_info"]["events"], "endpoint events")
-        self.assertEqual(context["endpoint_info"]["yaml"], "endpoint yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["endpoint_name"], "ep-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_endpoints.read_endpoint.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "ep-1")
         self.mock_k8s_endpoints.get_endpoint_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ep-1"
-        )
-        self.mock_k8s_endpoints.get_endpoint_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ep-1"
-        )
-        self.mock_k8s_endpoints.get_endpoint_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ep-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "ep-1", self.mock_k8s_endpoints.read_endpoint.return_value
         )
+        self.mock_k8s_endpoints.get_endpoint_events.assert_not_called()
+        self.mock_k8s_endpoints.get_endpoint_yaml.assert_not_called()
 
     def test_endpoint_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2613,18 +2567,16 @@ class PersistentVolumeTests(TestCase):
         context = args[2]
         self.assertIn("pv_info", context)
         self.assertEqual(context["pv_info"]["describe"], "PV description")
-        self.assertEqual(context["pv_info"]["yaml"], "PV yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["pv_name"], "pv-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_pv.read_pv.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "pv-1")
         self.mock_k8s_pv.get_pv_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "pv-1"
-        )
-        self.mock_k8s_pv.get_pv_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "pv-1"
+            self.kube_config_entry.path, self.cluster.context_name, "pv-1", self.mock_k8s_pv.read_pv.return_value
         )
+        self.mock_k8s_pv.get_pv_yaml.assert_not_called()
 
     def test_pv_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2740,18 +2692,16 @@ class PersistentVolumeTests(TestCase):
         context = args[2]
         self.assertIn("pv_info", context)
         self.assertEqual(context["pv_info"]["describe"], "PV description")
-        self.assertEqual(context["pv_info"]["yaml"], "PV yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["pv_name"], "pv-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_pv.read_pv.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "pv-1")
         self.mock_k8s_pv.get_pv_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "pv-1"
-        )
-        self.mock_k8s_pv.get_pv_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "pv-1"
+            self.kube_config_entry.path, self.cluster.context_name, "pv-1", self.mock_k8s_pv.read_pv.return_value
         )
+        self.mock_k8s_pv.get_pv_yaml.assert_not_called()
 
     def test_pv_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2829,22 +2779,17 @@ class PersistentVolumeTests(TestCase):
         context = args[2]
         self.assertIn("pvc_info", context)
         self.assertEqual(context["pvc_info"]["describe"], "PVC description")
-        self.assertEqual(context["pvc_info"]["events"], "PVC events")
-        self.assertEqual(context["pvc_info"]["yaml"], "PVC yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["pvc_name"], "pvc-1")
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_pvc.read_pvc.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "pvc-1")
         self.mock_k8s_pvc.get_pvc_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pvc-1"
-        )
-        self.mock_k8s_pvc.get_pvc_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pvc-1"
-        )
-        self.mock_k8s_pvc.get_pvc_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "pvc-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "pvc-1", self.mock_k8s_pvc.read_pvc.return_value
         )
+        self.mock_k8s_pvc.get_pvc_events.assert_not_called()
+        self.mock_k8s_pvc.get_pvc_yaml.assert_not_called()
 
     def test_pvc_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -2961,21 +2906,16 @@ class StorageClassViewsTests(TestCase):
         context = args[2]
         self.assertIn("sc_info", context)
         self.assertEqual(context["sc_info"]["describe"], "SC description")
-        self.assertEqual(context["sc_info"]["events"], "SC events")
-        self.assertEqual(context["sc_info"]["yaml"], "SC yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_storage_class.read_storage_class.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "sc-1")
         self.mock_k8s_storage_class.get_storage_class_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "sc-1"
-        )
-        self.mock_k8s_storage_class.get_storage_class_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "sc-1"
-        )
-        self.mock_k8s_storage_class.get_sc_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "sc-1"
+            self.kube_config_entry.path, self.cluster.context_name, "sc-1", self.mock_k8s_storage_class.read_storage_class.return_value
         )
+        self.mock_k8s_storage_class.get_storage_class_events.assert_not_called()
+        self.mock_k8s_storage_class.get_sc_yaml.assert_not_called()
 
     def test_storageclass_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3093,21 +3033,16 @@ class NetworkPolicyViewsTests(TestCase):
         context = args[2]
         self.assertIn("np_info", context)
         self.assertEqual(context["np_info"]["describe"], "NP description")
-        self.assertEqual(context["np_info"]["events"], "NP events")
-        self.assertEqual(context["np_info"]["yaml"], "NP yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_np.read_np.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "np-1")
         self.mock_k8s_np.get_np_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "np-1"
-        )
-        self.mock_k8s_np.get_np_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "np-1"
-        )
-        self.mock_k8s_np.get_np_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "np-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "np-1", self.mock_k8s_np.read_np.return_value
         )
+        self.mock_k8s_np.get_np_events.assert_not_called()
+        self.mock_k8s_np.get_np_yaml.assert_not_called()
 
     def test_np_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3225,21 +3160,16 @@ class IngressViewsTests(TestCase):
         context = args[2]
         self.assertIn("ingress_info", context)
         self.assertEqual(context["ingress_info"]["describe"], "Ingress description")
-        self.assertEqual(context["ingress_info"]["events"], "Ingress events")
-        self.assertEqual(context["ingress_info"]["yaml"], "Ingress yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_ingress.read_ingress.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "ingress-1")
         self.mock_k8s_ingress.get_ingress_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ingress-1"
-        )
-        self.mock_k8s_ingress.get_ingress_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ingress-1"
-        )
-        self.mock_k8s_ingress.get_ingress_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "ingress-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "ingress-1", self.mock_k8s_ingress.read_ingress.return_value
         )
+        self.mock_k8s_ingress.get_ingress_events.assert_not_called()
+        self.mock_k8s_ingress.get_ingress_yaml.assert_not_called()
 
     def test_ingress_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3357,21 +3287,16 @@ class RoleViewsTests(TestCase):
         context = args[2]
         self.assertIn("role_info", context)
         self.assertEqual(context["role_info"]["describe"], "Role description")
-        self.assertEqual(context["role_info"]["events"], "Role events")
-        self.assertEqual(context["role_info"]["yaml"], "Role yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_role.read_role.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "role-1")
         self.mock_k8s_role.get_role_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "role-1"
-        )
-        self.mock_k8s_role.get_role_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "role-1"
-        )
-        self.mock_k8s_role.get_role_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "role-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "role-1", self.mock_k8s_role.read_role.return_value
         )
+        self.mock_k8s_role.get_role_events.assert_not_called()
+        self.mock_k8s_role.get_role_yaml.assert_not_called()
 
     def test_role_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3489,21 +3414,16 @@ class RoleBindingViewsTests(TestCase):
         context = args[2]
         self.assertIn("role_binding_info", context)
         self.assertEqual(context["role_binding_info"]["describe"], "RoleBinding description")
-        self.assertEqual(context["role_binding_info"]["events"], "RoleBinding events")
-        self.assertEqual(context["role_binding_info"]["yaml"], "RoleBinding yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_rolebindings.read_role_binding.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1")
         self.mock_k8s_rolebindings.get_role_binding_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
-        )
-        self.mock_k8s_rolebindings.get_role_binding_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
-        )
-        self.mock_k8s_rolebindings.get_role_binding_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1", self.mock_k8s_rolebindings.read_role_binding.return_value
         )
+        self.mock_k8s_rolebindings.get_role_binding_events.assert_not_called()
+        self.mock_k8s_rolebindings.get_role_binding_yaml.assert_not_called()
 
     def test_role_binding_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3621,21 +3541,16 @@ class RoleBindingViewsTests(TestCase):
         context = args[2]
         self.assertIn("role_binding_info", context)
         self.assertEqual(context["role_binding_info"]["describe"], "RoleBinding description")
-        self.assertEqual(context["role_binding_info"]["events"], "RoleBinding events")
-        self.assertEqual(context["role_binding_info"]["yaml"], "RoleBinding yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_rolebindings.read_role_binding.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1")
         self.mock_k8s_rolebindings.get_role_binding_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
-        )
-        self.mock_k8s_rolebindings.get_role_binding_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
-        )
-        self.mock_k8s_rolebindings.get_role_binding_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "rb-1", self.mock_k8s_rolebindings.read_role_binding.return_value
         )
+        self.mock_k8s_rolebindings.get_role_binding_events.assert_not_called()
+        self.mock_k8s_rolebindings.get_role_binding_yaml.assert_not_called()
 
     def test_role_binding_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3752,21 +3667,16 @@ class ClusterRoleViewsTests(TestCase):
         context = args[2]
         self.assertIn("cluster_role_info", context)
         self.assertEqual(context["cluster_role_info"]["describe"], "ClusterRole description")
-        self.assertEqual(context["cluster_role_info"]["events"], "ClusterRole events")
-        self.assertEqual(context["cluster_role_info"]["yaml"], "ClusterRole yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_cluster_roles.read_cluster_role.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "cr-1")
         self.mock_k8s_cluster_roles.get_cluster_role_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "cr-1"
-        )
-        self.mock_k8s_cluster_roles.get_cluster_role_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "cr-1"
-        )
-        self.mock_k8s_cluster_roles.get_cluster_role_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "cr-1"
+            self.kube_config_entry.path, self.cluster.context_name, "cr-1", self.mock_k8s_cluster_roles.read_cluster_role.return_value
         )
+        self.mock_k8s_cluster_roles.get_cluster_role_events.assert_not_called()
+        self.mock_k8s_cluster_roles.get_cluster_role_yaml.assert_not_called()
 
     def test_clusterrole_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -3883,21 +3793,16 @@ class ClusterRoleBindingViewsTests(TestCase):
         context = args[2]
         self.assertIn("cluster_role_binding_info", context)
         self.assertEqual(context["cluster_role_binding_info"]["describe"], "ClusterRoleBinding description")
-        self.assertEqual(context["cluster_role_binding_info"]["events"], "ClusterRoleBinding events")
-        self.assertEqual(context["cluster_role_binding_info"]["yaml"], "ClusterRoleBinding yaml")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_cluster_role_bindings.read_cluster_role_binding.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "crb-1")
         self.mock_k8s_cluster_role_bindings.get_cluster_role_binding_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "crb-1"
-        )
-        self.mock_k8s_cluster_role_bindings.get_cluster_role_binding_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "crb-1"
-        )
-        self.mock_k8s_cluster_role_bindings.get_cluster_role_binding_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "crb-1"
+            self.kube_config_entry.path, self.cluster.context_name, "crb-1", self.mock_k8s_cluster_role_bindings.read_cluster_role_binding.return_value
         )
+        self.mock_k8s_cluster_role_bindings.get_cluster_role_binding_events.assert_not_called()
+        self.mock_k8s_cluster_role_bindings.get_cluster_role_binding_yaml.assert_not_called()
 
     def test_cluster_role_binding_info_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -4013,23 +3918,18 @@ class Service_accountViewsTests(TestCase):
         self.assertEqual(args[0], request)
         self.assertEqual(args[1], 'dashboard/RBAC/service_accountInfo.html')
         context = args[2]
-        self.assertIn("service_accountInfo", context)
-        self.assertEqual(context["service_accountInfo"]["describe"], "SA description")
-        self.assertEqual(context["service_accountInfo"]["events"], "SA events")
-        self.assertEqual(context["service_accountInfo"]["yaml"], "SA yaml")
+        self.assertIn("serviceAccountInfo", context)
+        self.assertEqual(context["serviceAccountInfo"]["describe"], "SA description")
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
+        self.mock_k8s_service_accounts.read_service_account.assert_called_once_with(self.kube_config_entry.path, self.cluster.context_name, "default", "sa-1")
         self.mock_k8s_service_accounts.get_sa_description.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sa-1"
-        )
-        self.mock_k8s_service_accounts.get_sa_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sa-1"
-        )
-        self.mock_k8s_service_accounts.get_sa_yaml.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, "default", "sa-1"
+            self.kube_config_entry.path, self.cluster.context_name, "default", "sa-1", self.mock_k8s_service_accounts.read_service_account.return_value
         )
+        self.mock_k8s_service_accounts.get_sa_events.assert_not_called()
+        self.mock_k8s_service_accounts.get_sa_yaml.assert_not_called()
 
     def test_service_accountInfo_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
@@ -4304,24 +4204,17 @@ class EventsViewTests(TestCase):
         )
         self.patcher_k8s_events = patch('dashboard.views.k8s_events')
         self.mock_k8s_events = self.patcher_k8s_events.start()
+        self.mock_k8s_events.EVENT_TYPES = ("Normal", "Warning")
         self.patcher_get_utils_data = patch('dashboard.views.get_utils_data')
         self.mock_get_utils_data = self.patcher_get_utils_data.start()
         self.patcher_render = patch('dashboard.views.render')
         self.mock_render = self.patcher_render.start()
-        self.patcher_paginator = patch('dashboard.views.Paginator')
-        self.mock_paginator = self.patcher_paginator.start()
-        self.patcher_page_not_an_integer = patch('dashboard.views.PageNotAnInteger', Exception)
-        self.mock_page_not_an_integer = self.patcher_page_not_an_integer.start()
-        self.patcher_empty_page = patch('dashboard.views.EmptyPage', Exception)
-        self.mock_empty_page = self.patcher_empty_page.start()
+        self.session = {}
 
     def tearDown(self):
         self.patcher_k8s_events.stop()
         self.patcher_get_utils_data.stop()
         self.patcher_render.stop()
-        self.patcher_paginator.stop()
-        self.patcher_page_not_an_integer.stop()
-        self.patcher_empty_page.stop()
 
     def _setup_utils_data(self):
         mock_current_cluster = MagicMock()
@@ -4335,60 +4228,163 @@ class EventsViewTests(TestCase):
             self.cluster.context_name
         )
 
+    def _get(self, **params):
+        request = self.factory.get(f'/dashboard/events/{self.cluster.id}/', params)
+        request.session = self.session
+        events(request, self.cluster.id)
+        return request, self.mock_render.call_args[0][2]
+
     def test_events_successful_rendering(self):
         self._setup_utils_data()
         mock_events = [{"type": "Normal", "message": "Pod started"} for _ in range(10)]
-        self.mock_k8s_events.get_events.return_value = mock_events
-        mock_page_obj = MagicMock()
-        self.mock_paginator.return_value.page.return_value = mock_page_obj
-        request = self.factory.get(f'/dashboard/events/{self.cluster.id}/', {'page': 1})
-        events(request, self.cluster.id)
+        self.mock_k8s_events.get_events_page.return_value = (mock_events, "token-2")
+        request, context = self._get()
         self.mock_render.assert_called_once()
-        args, kwargs = self.mock_render.call_args
-        context = args[2]
         self.assertEqual(context["cluster_id"], str(self.cluster.id))
-        self.assertEqual(context["events"], mock_page_obj)
+        self.assertEqual(context["events"], mock_events)
         self.assertEqual(context["registered_clusters"], self.mock_get_utils_data.return_value[3])
         self.assertEqual(context["namespaces"], self.mock_get_utils_data.return_value[4])
-        self.assertEqual(context["page_obj"], mock_page_obj)
+        self.assertEqual(context["page_obj"]["number"], 1)
+        self.assertTrue(context["page_obj"]["has_next"])
+        self.assertFalse(context["page_obj"]["has_previous"])
         self.assertEqual(context["current_cluster"], self.mock_get_utils_data.return_value[1])
         self.mock_get_utils_data.assert_called_once_with(request)
-        self.mock_k8s_events.get_events.assert_called_once_with(
-            self.kube_config_entry.path, self.cluster.context_name, False
+        self.mock_k8s_events.get_events_page.assert_called_once_with(
+            self.kube_config_entry.path, self.cluster.context_name, limit=50, continue_token=None,
+            namespace="all", event_type=None, kind=None
         )
-        self.mock_paginator.assert_called_once_with(mock_events, 50)
-        self.mock_paginator.return_value.page.assert_called_once_with('1')
 
-    def test_events_non_list_events(self):
+    def test_events_next_page_uses_the_session_token(self):
         self._setup_utils_data()
-        self.mock_k8s_events.get_events.return_value = None
-        mock_page_obj = MagicMock()
-        self.mock_paginator.return_value.page.return_value = mock_page_obj
-        request = self.factory.get(f'/dashboard/events/{self.cluster.id}/', {'page': 1})
-        events(request, self.cluster.id)
-        self.mock_paginator.assert_called_once_with([], 50)
-        self.mock_render.assert_called_once()
+        self.mock_k8s_events.get_events_page.side_effect = [([{}], "token-2"), ([{}], None), ([{}], "token-2")]
+        self._get(type="Warning")
+        _, context = self._get(type="Warning", page=2)
+        self.assertEqual(self.mock_k8s_events.get_events_page.call_args.kwargs["continue_token"], "token-2")
+        self.assertEqual(self.mock_k8s_events.get_events_page.call_args.kwargs["event_type"], "Warning")
+        self.assertFalse(context["page_obj"]["has_next"])
+        self.assertTrue(context["page_obj"]["has_previous"])
+        self.assertEqual(context["filter_query"], "type=Warning")
+        # Going back reuses the first page's (empty) token
+        self._get(type="Warning", page=1)
+        self.assertIsNone(self.mock_k8s_events.get_events_page.call_args.kwargs["continue_token"])
+
+    def test_events_unknown_page_falls_back_to_known_pages(self):
+        self._setup_utils_data()
+        self.mock_k8s_events.get_events_page.return_value = ([], None)
+        _, context = self._get(page='notanint')
+        self.assertEqual(context["page_obj"]["number"], 1)
+        _, context = self._get(page=7)
+        self.assertEqual(context["page_obj"]["number"], 1)
 
-    def test_events_page_not_an_integer(self):
+    def test_events_changed_filters_reset_tokens(self):
         self._setup_utils_data()
-        self.mock_k8s_events.get_events.return_value = [{"type": "Normal"}]
-        mock_page_obj = MagicMock()
-        paginator_instance = self.mock_paginator.return_value
-        paginator_instance.page.side_effect = [Exception, mock_page_obj]
-        request = self.factory.get(f'/dashboard/events/{self.cluster.id}/', {'page': 'notanint'})
-        events(request, self.cluster.id)
-        self.mock_render.assert_called_once()
-        self.assertEqual(self.mock_render.call_args[0][2]["events"], mock_page_obj)
+        self.mock_k8s_events.get_events_page.return_value = ([{}], "token-2")
+        self._get(namespace="default")
+        _, context = self._get(namespace="kube-system", page=2)
+        self.assertEqual(context["page_obj"]["number"], 1)
+        self.assertIsNone(self.mock_k8s_events.get_events_page.call_args.kwargs["continue_token"])
+
+    def test_events_expired_token_restarts_from_first_page(self):
+        self._setup_utils_data()
+        self.mock_k8s_events.get_events_page.side_effect = [([{}], "token-2"), ApiException(status=410), ([{}], "fresh")]
+        self._get()
+        _, context = self._get(page=2)
+        self.assertTrue(context["token_expired"])
+        self.assertEqual(context["page_obj"]["number"], 1)
+        self.assertEqual(self.session[f"event_pages_{self.cluster.id}"]["tokens"], [None, "fresh"])
+
+    def test_events_api_failure_renders_empty_page(self):
+        self._setup_utils_data()
+        self.mock_k8s_events.get_events_page.side_effect = ApiException(status=500)
+        _, context = self._get()
+        self.assertEqual(context["events"], [])
+        self.assertFalse(context["page_obj"]["has_next"])
 
     def test_events_get_utils_data_failure(self):
         self.mock_get_utils_data.side_effect = Cluster.DoesNotExist("Cluster not found")
         request = self.factory.get(f'/dashboard/events/{self.cluster.id}/')
         with self.assertRaises(Cluster.DoesNotExist):
             events(request, self.cluster.id)
-        self.mock_k8s_events.get_events.assert_not_called()
+        self.mock_k8s_events.get_events_page.assert_not_called()
         self.mock_render.assert_not_called()
 
 
+class ResourceListApiTests(TestCase):
+    ROWS = [
+        {"namespace": "default", "name": "web-1", "status": "Running", "age": "2h"},
+        {"namespace": "default", "name": "web-2", "status": "Pending", "age": "45m"},
+        {"namespace": "kube-system", "name": "coredns", "status": "Running", "age": "3d"},
+        {"namespace": "default", "name": "db-0", "status": "Running", "age": "10s"},
+    ]
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        self.fetch_pods = MagicMock(return_value=self.ROWS, __module__=__name__, __qualname__="fetch_pods")
+        patcher = patch.dict('dashboard.views.list_api.LIST_RESOURCES', {"pods": self.fetch_pods})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict('dashboard.views.list_api._indexes', clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, resource="pods", **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/api/{resource}/', params)
+        request.user = self.user
+        response = resource_list_api(request, self.cluster.id, resource)
+        return response, json.loads(response.content)
+
+    def test_filters_sorts_and_paginates(self):
+        response, body = self._get(namespace="default", status="Running", sort="-age", page_size=1, page=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body["total"], 4)
+        self.assertEqual(body["count"], 2)
+        self.assertEqual(body["num_pages"], 2)
+        self.assertEqual([row["name"] for row in body["rows"]], ["db-0"])
+        self.fetch_pods.assert_called_once_with('/test/kube/config/path', 'my-test-context')
+
+    def test_name_filter_is_case_insensitive_substring(self):
+        _, body = self._get(name="WEB", sort="age")
+
+        self.assertEqual([row["name"] for row in body["rows"]], ["web-2", "web-1"])
+
+    def test_several_namespaces_are_comma_separated(self):
+        _, body = self._get(namespace="kube-system,default", sort="name")
+
+        self.assertEqual([row["name"] for row in body["rows"]], ["coredns", "db-0", "web-1", "web-2"])
+
+    def test_tuple_results_are_unwrapped(self):
+        self.fetch_pods.return_value = (self.ROWS, len(self.ROWS))
+
+        _, body = self._get()
+
+        self.assertEqual(body["count"], 4)
+
+    @patch('dashboard.views.list_api.label_selected_keys')
+    def test_label_selector_is_evaluated_by_api_server(self, mock_keys):
+        mock_keys.return_value = {("kube-system", "coredns")}
+
+        _, body = self._get(label_selector="k8s-app=kube-dns")
+
+        self.assertEqual([row["name"] for row in body["rows"]], ["coredns"])
+        mock_keys.assert_called_once_with('/test/kube/config/path', 'my-test-context', "pods", "k8s-app=kube-dns")
+
+    def test_unknown_resource(self):
+        response, body = self._get(resource="widgets")
+
+        self.assertEqual(response.status_code, 404)
+        self.fetch_pods.assert_not_called()
+
+    def test_page_size_is_capped(self):
+        _, body = self._get(page_size=100000)
+
+        self.assertEqual(body["page_size"], 500)
+
+
 # Define current_working_directory at module level for patching in tests
 current_working_directory = None
 
@@ -4491,4 +4487,283 @@ class ExecuteCommandViewTests(TestCase):
         request = self.factory.get('/execute_command/')
         response = execute_command(request)
         self.assertIsNone(response)
-        # Should not execute anything, so response should be None
\ No newline at end of file
+        # Should not execute anything, so response should be None
+
+
+class DetailTabTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        self.render_yaml = MagicMock(return_value="kind: Pod")
+        self.get_events = MagicMock(return_value="Pulled: image")
+        patcher = patch.dict('dashboard.views.detail_page.DETAIL_TABS',
+                             {"pods": (self.render_yaml, {"events": self.get_events})})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, resource, tab, namespace="default"):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/tabs/{resource}/{namespace}/web/{tab}/')
+        request.user = self.user
+        response = detail_tab(request, self.cluster.id, resource, "web", tab, namespace=namespace)
+        return response, json.loads(response.content)
+
+    def test_side_tab_content(self):
+        response, body = self._get("pods", "events")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, {"content": "Pulled: image"})
+        self.get_events.assert_called_once_with('/test/kube/config/path', 'my-test-context', "default", "web")
+        self.render_yaml.assert_not_called()
+
+    def test_yaml_tab_keeps_managed_fields(self):
+        _, body = self._get("pods", "yaml")
+
+        self.assertEqual(body, {"content": "kind: Pod"})
+        self.render_yaml.assert_called_once_with('/test/kube/config/path', 'my-test-context', "default", "web", True)
+
+    def test_unknown_tab_returns_404(self):
+        response, _ = self._get("pods", "logs")
+
+        self.assertEqual(response.status_code, 404)
+        self.get_events.assert_not_called()
+
+    def test_api_error_is_reported(self):
+        self.get_events.side_effect = ApiException(status=403, reason="Forbidden")
+
+        response, body = self._get("pods", "events")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(body, {"error": "Forbidden"})
+
+
+class PodLogsStreamTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        patcher = patch('dashboard.views.pod_logs.stream_pod_log', return_value=iter(["line 1", "line 2"]))
+        self.mock_stream = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/pods/default/web/logs/', params)
+        request.user = self.user
+        return pod_logs_stream(request, self.cluster.id, "default", "web")
+
+    def test_plain_text_log(self):
+        response = self._get(container="app", tail_lines="100")
+
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertEqual(b"".join(response.streaming_content), b"line 1\nline 2\n")
+        self.mock_stream.assert_called_once_with('/test/kube/config/path', 'my-test-context', "default", "web",
+                                                 follow=False, container="app", tail_lines=100)
+
+    def test_follow_streams_server_sent_events(self):
+        response = self._get(follow="true")
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(b"".join(response.streaming_content),
+                         b"data: line 1\n\ndata: line 2\n\nevent: end\ndata: \n\n")
+        self.assertTrue(self.mock_stream.call_args.kwargs["follow"])
+
+    def test_invalid_option_returns_400(self):
+        response = self._get(tail_lines="many")
+
+        self.assertEqual(response.status_code, 400)
+        self.mock_stream.assert_not_called()
+
+    def test_api_error_is_reported(self):
+        self.mock_stream.side_effect = ApiException(status=404, reason="Not Found")
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.content), {"error": "Not Found"})
+
+
+class EventsStreamTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        patcher = patch('dashboard.views.event_stream.stream_events', return_value=iter(['event: events\ndata: {}\n\n']))
+        self.mock_stream = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/events/stream/', params)
+        request.user = self.user
+        return events_stream(request, self.cluster.id)
+
+    def test_streams_server_sent_events_with_page_filters(self):
+        response = self._get(namespace="dev", type="Warning", kind="Pod")
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        self.assertEqual(b"".join(response.streaming_content), b'event: events\ndata: {}\n\n')
+        self.mock_stream.assert_called_once_with('/test/kube/config/path', 'my-test-context',
+                                                 namespace="dev", event_type="Warning", kind="Pod")
+
+    def test_defaults_to_all_namespaces_and_ignores_unknown_type(self):
+        self._get(type="Bogus")
+
+        self.mock_stream.assert_called_once_with('/test/kube/config/path', 'my-test-context',
+                                                 namespace="all", event_type=None, kind=None)
+
+    def test_api_error_is_reported(self):
+        self.mock_stream.side_effect = ApiException(status=403, reason="Forbidden")
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(json.loads(response.content), {"error": "Forbidden"})
+
+
+class MetricsHistoryTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        patcher = patch('dashboard.views.metrics_sampler.get_sampler')
+        self.mock_get_sampler = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_get_sampler.return_value.history.return_value = {"start": 0, "step": 60, "series": {}}
+
+    def _get(self, kind, **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/metrics/history/{kind}/', params)
+        request.user = self.user
+        return metrics_history(request, self.cluster.id, kind)
+
+    def test_returns_history_of_requested_keys(self):
+        response = self._get('pods', keys='default/web,kube-system/dns', window='24h')
+
+        self.assertEqual(json.loads(response.content), {"start": 0, "step": 60, "series": {}})
+        self.mock_get_sampler.assert_called_once_with('/test/kube/config/path', 'my-test-context')
+        self.mock_get_sampler.return_value.history.assert_called_once_with('pods', ['default/web', 'kube-system/dns'], 86400)
+
+    def test_rejects_unknown_kind_or_window(self):
+        self.assertEqual(self._get('services').status_code, 400)
+        self.assertEqual(self._get('nodes', window='1y').status_code, 400)
+
+    def test_long_windows_read_the_coarse_tiers(self):
+        self._get('nodes', keys='node-1', window='30d')
+
+        self.mock_get_sampler.return_value.history.assert_called_once_with('nodes', ['node-1'], 30 * 24 * 3600)
+
+    def test_sampler_disabled(self):
+        self.mock_get_sampler.return_value = None
+
+        self.assertEqual(self._get('nodes', keys='node-1').status_code, 503)
+
+
+class WorkloadLogsStreamTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        patcher = patch('dashboard.views.workload_logs.workload_pods', return_value=["web-a", "web-b"])
+        self.mock_pods = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('dashboard.views.workload_logs.merge_pod_logs', return_value=iter([
+            ("2024-01-01T00:00:01Z", "web-a", "started"), ("2024-01-01T00:00:02Z", "web-b", "ready")]))
+        self.mock_merge = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, resource="deployments", **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/workloads/{resource}/default/web/logs/', params)
+        request.user = self.user
+        return workload_logs_stream(request, self.cluster.id, resource, "default", "web")
+
+    def test_merged_log_is_prefixed_with_pods(self):
+        response = self._get(tail_lines="10", timestamps="true")
+
+        self.assertEqual(b"".join(response.streaming_content),
+                         b"[web-a] 2024-01-01T00:00:01Z started\n[web-b] 2024-01-01T00:00:02Z ready\n")
+        self.mock_pods.assert_called_once_with('/test/kube/config/path', 'my-test-context', "deployments", "default", "web")
+        self.mock_merge.assert_called_once_with('/test/kube/config/path', 'my-test-context', "default",
+                                                ["web-a", "web-b"], follow=False, tail_lines=10)
+
+    def test_follow_streams_server_sent_events(self):
+        response = self._get(follow="true")
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn(b"data: [web-b] ready\n\n", b"".join(response.streaming_content))
+
+    def test_unknown_workload_returns_404(self):
+        response = self._get(resource="cronjobs")
+
+        self.assertEqual(response.status_code, 404)
+        self.mock_pods.assert_not_called()
+
+
+class PodLogSearchTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='viewer', password='secret')
+        self.kube_config_entry = KubeConfig.objects.create(path='/test/kube/config/path', path_type='file')
+        self.cluster = Cluster.objects.create(cluster_name='my-test-cluster', context_name='my-test-context',
+                                              kube_config=self.kube_config_entry, id=101)
+        patcher = patch('dashboard.views.log_search.search_logs', return_value=[{"pod": "web", "matches": [], "truncated": False}])
+        self.mock_search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, **params):
+        request = self.factory.get(f'/dashboard/{self.cluster.id}/logs/search/', params)
+        request.user = self.user
+        response = pod_log_search(request, self.cluster.id)
+        return response, json.loads(response.content)
+
+    @patch('dashboard.views.log_search.namespace_pods', return_value=["web", "db"])
+    def test_searches_a_namespace(self, mock_pods):
+        response, body = self._get(namespace="default", pattern="error", ignore_case="true", since_seconds="600",
+                                   context="3", max_matches="10000", label_selector="app=web")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body["pods_searched"], 2)
+        self.assertTrue(body["literal"])
+        self.assertEqual(body["results"], [{"pod": "web", "matches": [], "truncated": False}])
+        mock_pods.assert_called_once_with('/test/kube/config/path', 'my-test-context', "default", "app=web")
+        args = self.mock_search.call_args.args
+        self.assertEqual(args[3], ["web", "db"])
+        self.assertTrue(args[4].search("ERROR"))
+        self.assertEqual(args[5:], (600, 3, 500))
+
+    @patch('dashboard.views.workload_logs.workload_pods', return_value=["web-a"])
+    def test_searches_a_workload(self, mock_pods):
+        response, _ = self._get(namespace="default", pattern="error", resource="deployments", name="web")
+
+        self.assertEqual(response.status_code, 200)
+        mock_pods.assert_called_once_with('/test/kube/config/path', 'my-test-context', "deployments", "default", "web")
+
+    @patch('dashboard.views.log_search.namespace_pods', return_value=["web"])
+    def test_pattern_is_literal_unless_regex_is_set(self, mock_pods):
+        _, body = self._get(namespace="default", pattern="a.c")
+        self.assertTrue(body["literal"])
+        self.assertIsNone(self.mock_search.call_args.args[4].search("abc"))
+
+        _, body = self._get(namespace="default", pattern="a.c", regex="true")
+        self.assertFalse(body["literal"])
+        self.assertTrue(self.mock_search.call_args.args[4].search("abc"))
+
+    def test_overlong_pattern_returns_400(self):
+        response, body = self._get(namespace="default", pattern="a" * (log_search.MAX_PATTERN_LENGTH + 1))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid search", body["error"])
+        self.mock_search.assert_not_called()
+
+    def test_pattern_is_required(self):
+        response, _ = self._get(namespace="default")
+
+        self.assertEqual(response.status_code, 400)
@@ -1,14 +1,18 @@
-from django.test import TestCase
-from unittest.mock import patch, MagicMock
-from dashboard.src.metrics import k8s_pod_metrics
+from django.test import TestCase, override_settings
+from unittest.mock import patch, MagicMock, call
+from dashboard.src.metrics import k8s_pod_metrics, k8s_node_metrics, metrics_sampler, metrics_history
 from dashboard.src.cluster_management import k8s_limit_range, k8s_namespaces, k8s_nodes, k8s_pdb, k8s_resource_quota
 from dashboard.src.config_secrets import k8s_configmaps, k8s_secrets
-from dashboard.src.events import k8s_events
+from dashboard.src.events import k8s_events, event_stream
 from dashboard.src.networking import k8s_ingress, k8s_np
 from dashboard.src.persistent_volume import k8s_pv, k8s_pvc, k8s_storage_class
 from dashboard.src.rbac import k8s_cluster_role_bindings, k8s_cluster_roles, k8s_role, k8s_rolebindings, k8s_service_accounts
 from dashboard.src.services import k8s_endpoints, k8s_services
 from dashboard.src.workloads import k8s_cronjobs, k8s_daemonset, k8s_deployments, k8s_jobs, k8s_pods, k8s_replicaset, k8s_statefulset
+from dashboard.src import quantity, utils, informers, cluster_snapshot, view_cache, clusters_DB, list_api, list_engine, detail_page, pod_logs, workload_logs, log_search
+from main.models import Cluster, KubeConfig
+from django.core.cache import cache
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 from kubernetes.config.config_exception import ConfigException
 import yaml
@@ -16,6 +20,13 @@ import base64
 from datetime import datetime, timezone, timedelta
 from dateutil.tz import tzutc
 import os
+import tempfile
+import time
+import json
+import re
+import numpy as np
+import threading
+from urllib3.exceptions import ReadTimeoutError
 # This file is convering test cases for files present in dashboard.src
 
 # test cases for pod metrics
@@ -24,31 +35,23 @@ class GetPodMetricsTests(TestCase):
         self.mock_configure_k8s = patch('dashboard.src.metrics.k8s_pod_metrics.configure_k8s').start()
         self.mock_core_v1 = patch('dashboard.src.metrics.k8s_pod_metrics.client.CoreV1Api').start()
         self.mock_custom_api = patch('dashboard.src.metrics.k8s_pod_metrics.client.CustomObjectsApi').start()
+        self.mock_list_raw = patch('dashboard.src.metrics.k8s_pod_metrics.list_raw').start()
         self.addCleanup(patch.stopall)
 
         self.mock_v1_instance = self.mock_core_v1.return_value
         self.mock_metrics_api = self.mock_custom_api.return_value
+        self.mock_metrics_api.get_api_resources.return_value = True
 
-    def test_successful_metrics_collection(self):
-        # Mock namespace list
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "default"
-        self.mock_v1_instance.list_namespace.return_value.items = [mock_namespace]
+    def raw_pod(self, name, namespace="default"):
+        return {"metadata": {"name": name, "namespace": namespace}}
 
-        # Mock pod list
-        mock_pod = MagicMock()
-        mock_pod.metadata.name = "test-pod"
-        self.mock_v1_instance.list_namespaced_pod.return_value.items = [mock_pod]
+    def pod_usage(self, name, namespace="default", cpu="100000000n", memory="128Mi"):
+        return {"metadata": {"name": name, "namespace": namespace},
+                "containers": [{"name": "app", "usage": {"cpu": cpu, "memory": memory}}]}
 
-        # Mock metrics API availability
-        self.mock_metrics_api.get_api_resources.return_value = True
-
-        # Mock metrics return
-        self.mock_metrics_api.get_namespaced_custom_object.return_value = {
-            "containers": [
-                {"usage": {"cpu": "100000000n", "memory": "128Mi"}}
-            ]
-        }
+    def test_successful_metrics_collection(self):
+        self.mock_list_raw.return_value = [self.raw_pod("test-pod")]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {"items": [self.pod_usage("test-pod")]}
 
         result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
 
@@ -58,7 +61,35 @@ class GetPodMetricsTests(TestCase):
         self.assertEqual(result[0]['cpu_usage_milli'], 100)
         self.assertEqual(result[0]['memory_usage_mi'], 128.0)
         self.assertEqual(result[0]['error'], '-')
+        # One metrics call for every pod, no per-pod reads
+        self.mock_metrics_api.list_cluster_custom_object.assert_called_once_with(
+            group="metrics.k8s.io", version="v1beta1", plural="pods")
+        self.mock_metrics_api.get_namespaced_custom_object.assert_not_called()
+        self.mock_list_raw.assert_called_once_with(self.mock_v1_instance.list_pod_for_all_namespaces)
+
+    def test_container_usage_summed_across_units(self):
+        self.mock_list_raw.return_value = [self.raw_pod("web")]
+        item = self.pod_usage("web")
+        item["containers"] = [{"usage": {"cpu": "1500u", "memory": "1Gi"}},
+                              {"usage": {"cpu": "250m", "memory": "524288Ki"}},
+                              {"usage": {"cpu": "0", "memory": "134217728"}}]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {"items": [item]}
+
+        result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
+
+        self.assertEqual(result[0]["cpu_usage_milli"], 251)
+        self.assertEqual(result[0]["memory_usage_mi"], 1664.0)
+
+    def test_namespace_scoped_metrics(self):
+        self.mock_list_raw.return_value = [self.raw_pod("web", "dev")]
+        self.mock_metrics_api.list_namespaced_custom_object.return_value = {"items": [self.pod_usage("web", "dev", cpu="250m")]}
+
+        result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context", namespace="dev")
 
+        self.assertEqual(result[0]["cpu_usage_milli"], 250)
+        self.mock_metrics_api.list_namespaced_custom_object.assert_called_once_with(
+            group="metrics.k8s.io", version="v1beta1", namespace="dev", plural="pods")
+        self.mock_list_raw.assert_called_once_with(self.mock_v1_instance.list_namespaced_pod, namespace="dev")
 
     def test_metrics_api_not_available(self):
         self.mock_metrics_api.get_api_resources.side_effect = ApiException(status=404)
@@ -70,9 +101,9 @@ class GetPodMetricsTests(TestCase):
         self.assertIn("error", result)
         self.assertEqual(result["error"], "Metrics API not available")
 
-    def test_namespace_listing_failure(self):
-        self.mock_metrics_api.get_api_resources.return_value = True
-        self.mock_v1_instance.list_namespace.side_effect = ApiException(reason="Forbidden")
+    def test_pod_listing_failure(self):
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {"items": []}
+        self.mock_list_raw.side_effect = ApiException(reason="Forbidden")
 
         result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
 
@@ -81,40 +112,387 @@ class GetPodMetricsTests(TestCase):
         self.assertIn("error", result)
         self.assertIn("Forbidden", result["error"])
 
-    def test_pod_metrics_failure_for_single_pod(self):
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "default"
-        self.mock_v1_instance.list_namespace.return_value.items = [mock_namespace]
+    def test_metrics_listing_failure(self):
+        self.mock_metrics_api.list_cluster_custom_object.side_effect = ApiException(reason="ServiceUnavailable")
 
-        mock_pod = MagicMock()
-        mock_pod.metadata.name = "failing-pod"
-        self.mock_v1_instance.list_namespaced_pod.return_value.items = [mock_pod]
+        result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
 
-        self.mock_metrics_api.get_api_resources.return_value = True
-        self.mock_metrics_api.get_namespaced_custom_object.side_effect = ApiException(reason="NotFound")
+        self.assertEqual(count, 0)
+        self.assertFalse(available)
+        self.assertIn("ServiceUnavailable", result["error"])
+
+    def test_pods_missing_metrics_are_reported_from_the_join(self):
+        self.mock_list_raw.return_value = [self.raw_pod("b-pending"), self.raw_pod("a-running")]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {
+            "items": [self.pod_usage("a-running"), self.pod_usage("c-new", "other")]}
 
         result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
 
-        self.assertEqual(count, 1)
+        self.assertEqual(count, 3)
+        self.assertTrue(available)
+        self.assertEqual([(row["namespace"], row["name"]) for row in result],
+                         [("default", "a-running"), ("default", "b-pending"), ("other", "c-new")])
+        self.assertEqual(result[0]["error"], "-")
+        self.assertNotIn("cpu_usage_milli", result[1])
+        self.assertEqual(result[1]["error"], "No metrics reported for this pod")
+        self.assertEqual(result[2]["memory_usage_mi"], 128.0)
+
+# test cases for node metrics
+class GetNodeMetricsTests(TestCase):
+    def setUp(self):
+        self.mock_configure_k8s = patch('dashboard.src.metrics.k8s_node_metrics.configure_k8s').start()
+        self.mock_core_v1 = patch('dashboard.src.metrics.k8s_node_metrics.client.CoreV1Api').start()
+        self.mock_custom_api = patch('dashboard.src.metrics.k8s_node_metrics.client.CustomObjectsApi').start()
+        self.addCleanup(patch.stopall)
+
+        self.mock_v1_instance = self.mock_core_v1.return_value
+        self.mock_metrics_api = self.mock_custom_api.return_value
+
+    def make_node(self, name, cpu="4", memory="8388608Ki"):
+        node = MagicMock()
+        node.metadata.name = name
+        node.status.capacity = {"cpu": cpu, "memory": memory}
+        return node
+
+    def node_usage(self, name, cpu="1000000000n", memory="2097152Ki"):
+        return {"metadata": {"name": name}, "usage": {"cpu": cpu, "memory": memory}}
+
+    def test_metrics_joined_by_node_name(self):
+        self.mock_v1_instance.list_node.return_value.items = [self.make_node("node-a"), self.make_node("node-b")]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {
+            "items": [self.node_usage("node-b", cpu="2000000000n"), self.node_usage("node-a")]}
+
+        result, count, available = k8s_node_metrics.get_node_metrics("dummy/path", "dummy-context")
+
+        self.assertEqual((count, available), (2, True))
+        self.assertEqual([row["name"] for row in result], ["node-a", "node-b"])
+        self.assertEqual(result[0]["cpu_usage_percentage"], 25.0)
+        self.assertEqual(result[1]["cpu_usage_percentage"], 50.0)
+        self.assertEqual(result[0]["memory_usage_percentage"], 25.0)
+        self.assertEqual(result[0]["memory_mi"], 8192.0)
+        # One metrics call for every node
+        self.mock_metrics_api.list_cluster_custom_object.assert_called_once_with(
+            group="metrics.k8s.io", version="v1beta1", plural="nodes")
+        self.mock_metrics_api.get_cluster_custom_object.assert_not_called()
+
+    def test_node_without_metrics_is_reported_from_the_join(self):
+        self.mock_v1_instance.list_node.return_value.items = [self.make_node("node-a"), self.make_node("node-new")]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {"items": [self.node_usage("node-a")]}
+
+        result, count, available = k8s_node_metrics.get_node_metrics("dummy/path", "dummy-context")
+
         self.assertTrue(available)
-        self.assertEqual(result[0]["name"], "failing-pod")
-        self.assertIn("error", result[0])
-        self.assertIn("Failed to fetch metrics", result[0]["error"])
+        self.assertEqual(result[1], {"name": "node-new", "error": "No metrics reported for this node"})
 
-    def test_list_pods_failure_in_namespace(self):
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "broken-ns"
-        self.mock_v1_instance.list_namespace.return_value.items = [mock_namespace]
+    def test_millicore_and_decimal_capacity(self):
+        self.mock_v1_instance.list_node.return_value.items = [self.make_node("node-a", cpu="3500m", memory="8Gi")]
+        self.mock_metrics_api.list_cluster_custom_object.return_value = {
+            "items": [self.node_usage("node-a", cpu="700m", memory="2147483648")]}
 
-        self.mock_metrics_api.get_api_resources.return_value = True
-        self.mock_v1_instance.list_namespaced_pod.side_effect = ApiException(reason="Unauthorized")
+        result, count, available = k8s_node_metrics.get_node_metrics("dummy/path", "dummy-context")
 
-        result, count, available = k8s_pod_metrics.get_pod_metrics("dummy/path", "dummy-context")
+        self.assertEqual(result[0]["cpu_cores"], 3.5)
+        self.assertEqual(result[0]["cpu_usage_percentage"], 20.0)
+        self.assertEqual(result[0]["memory_usage_percentage"], 25.0)
+        self.assertEqual(result[0]["memory_mi"], 8192.0)
 
-        self.assertEqual(count, 0)
-        self.assertTrue(available)  # metrics API was available
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 0)
+    def test_metrics_api_not_available(self):
+        self.mock_metrics_api.get_api_resources.side_effect = ApiException(status=404)
+
+        result, count, available = k8s_node_metrics.get_node_metrics("dummy/path", "dummy-context")
+
+        self.assertEqual((result, count, available), ({"error": "Metrics API not available"}, 0, False))
+
+    def test_metrics_listing_failure(self):
+        self.mock_metrics_api.list_cluster_custom_object.side_effect = ApiException(reason="ServiceUnavailable")
+
+        result, count, available = k8s_node_metrics.get_node_metrics("dummy/path", "dummy-context")
+
+        self.assertFalse(available)
+        self.assertIn("ServiceUnavailable", result["error"])
+
+# test cases for the metrics sampler and its ring buffers
+class MetricsSamplerTests(TestCase):
+    NOW = 1_700_000_040
+
+    def test_ring_slot_of_an_older_pass_reads_as_empty(self):
+        ring = metrics_sampler.MetricRing(60, 3, rows=2)
+        ring.add(0, [0], [[100, 10]])
+        ring.add(60, [0, 1], [[200, 20], [50, 5]])
+        # Bucket 3 reuses the slot of bucket 0
+        ring.add(180, [1], [[70, 7]])
+
+        first, means = ring.window(0, 240, 180)
+
+        self.assertEqual(first, 1)
+        self.assertEqual(means[0].tolist(), [200, 20])
+        self.assertTrue(np.isnan(means[1:]).all())
+        self.assertEqual(ring.window(1, 240, 180)[1][2].tolist(), [70, 7])
+
+    def test_coarse_tier_keeps_means(self):
+        store = metrics_sampler.SeriesStore(60, max_series=10)
+        for minute, cpu in enumerate([100, 200, 300]):
+            store.record(self.NOW - 120 + minute * 60, ["web"], [[cpu, 64]])
+
+        hour = store.history(["web"], 3600, now=self.NOW)
+        day = store.history(["web"], 86400, now=self.NOW)
+
+        self.assertEqual(hour["step"], 60)
+        self.assertEqual(hour["series"]["web"]["cpu"][-3:], [100, 200, 300])
+        self.assertIsNone(hour["series"]["web"]["cpu"][0])
+        self.assertEqual(len(day["series"]["web"]["cpu"]), 288)
+        self.assertEqual(day["series"]["web"]["cpu"][-1], 200)
+        self.assertEqual(day["series"]["web"]["memory"][-1], 64)
+
+    def test_rows_grow_are_capped_and_reused(self):
+        store = metrics_sampler.SeriesStore(60, max_series=100)
+        keys = [f"ns/pod-{i}" for i in range(100)]
+        store.record(self.NOW, keys, np.ones((100, 2)))
+        store.record(self.NOW + 60, ["ns/late"] + keys[1:], np.full((100, 2), 5))
+
+        # The full store gives the late pod the row of the pod seen longest ago, without its samples
+        self.assertEqual(len(store.keys), 100)
+        self.assertNotIn("ns/pod-0", store.rows)
+        self.assertEqual(store.rows["ns/late"], 0)
+        self.assertEqual(store.history(["ns/late"], 3600, now=self.NOW + 60)["series"]["ns/late"]["cpu"][-2:], [None, 5])
+
+        # Once the retention has passed the old pods are evicted
+        store.record(self.NOW + store.retention + 120, ["ns/late"], [[5, 5]])
+        self.assertEqual(list(store.rows), ["ns/late"])
+
+    def test_full_store_keeps_accepting_new_series(self):
+        store = metrics_sampler.SeriesStore(60, max_series=10, retention=7 * 86400)
+        # Pods replaced every minute, as in a cluster with heavy churn; the old ones never come back
+        for minute in range(5):
+            keys = [f"ns/pod-{minute}-{i}" for i in range(10)]
+            store.record(self.NOW + minute * 60, keys, np.full((10, 2), minute + 1))
+
+        self.assertEqual(sorted(store.rows), sorted(keys))
+        series = store.history(keys, 3600, now=self.NOW + 240)["series"]
+        self.assertEqual({key: [value for value in values["cpu"] if value is not None] for key, values in series.items()},
+                         {key: [5] for key in keys})
+
+    def test_sample_larger_than_the_store_keeps_its_first_series(self):
+        store = metrics_sampler.SeriesStore(60, max_series=2)
+
+        store.record(self.NOW, ["a", "b", "c"], np.ones((3, 2)))
+
+        self.assertEqual(sorted(store.rows), ["a", "b"])
+
+    def test_memory_per_series_is_bounded(self):
+        store = metrics_sampler.SeriesStore(60, max_series=1024)
+        store.record(self.NOW, [str(i) for i in range(1024)], np.zeros((1024, 2)))
+
+        # An hour of minutes and a day of five-minute means: under 4 KB per row, and few spare rows
+        self.assertLess(store.nbytes() / len(store.keys), 4096)
+        self.assertLessEqual(len(store.keys), 1024 * 5 // 4)
+
+    def test_sample_records_nodes_and_pods(self):
+        sampler = metrics_sampler.MetricsSampler(MagicMock(), interval=60, max_series=10)
+        with patch("dashboard.src.metrics.metrics_sampler.client.CustomObjectsApi") as mock_api:
+            mock_api.return_value.list_cluster_custom_object.side_effect = [
+                {"items": [{"metadata": {"name": "node-1"}, "usage": {"cpu": "500000000n", "memory": "1Gi"}}]},
+                {"items": [{"metadata": {"namespace": "default", "name": "web"},
+                            "containers": [{"usage": {"cpu": "250m", "memory": "128Mi"}},
+                                           {"usage": {"cpu": "50m", "memory": "64Mi"}}]}]},
+            ]
+            sampler.sample(now=self.NOW)
+
+        nodes = sampler.stores["nodes"].history(["node-1"], 3600, now=self.NOW)["series"]
+        pods = sampler.stores["pods"].history(["default/web"], 3600, now=self.NOW)["series"]
+        self.assertEqual((nodes["node-1"]["cpu"][-1], nodes["node-1"]["memory"][-1]), (500, 1024))
+        self.assertEqual((pods["default/web"]["cpu"][-1], pods["default/web"]["memory"][-1]), (300, 192))
+
+    def test_failed_kind_does_not_stop_the_other(self):
+        sampler = metrics_sampler.MetricsSampler(MagicMock(), interval=60, max_series=10)
+        with patch("dashboard.src.metrics.metrics_sampler.client.CustomObjectsApi") as mock_api:
+            mock_api.return_value.list_cluster_custom_object.side_effect = [
+                ApiException(reason="ServiceUnavailable"),
+                {"items": [{"metadata": {"namespace": "default", "name": "web"},
+                            "containers": [{"usage": {"cpu": "1", "memory": "1Mi"}}]}]},
+            ]
+            sampler.sample(now=self.NOW)
+
+        self.assertEqual(sampler.stores["nodes"].rows, {})
+        self.assertIn("default/web", sampler.stores["pods"].rows)
+
+    @override_settings(K8S_METRICS_HISTORY_DIR="")
+    @patch("dashboard.src.metrics.metrics_sampler.configure_k8s")
+    @patch("dashboard.src.metrics.metrics_sampler.MetricsSampler.start")
+    def test_get_sampler_is_shared_per_cluster(self, mock_start, mock_configure):
+        self.addCleanup(metrics_sampler.stop_samplers)
+        mock_configure.return_value = MagicMock()
+
+        first = metrics_sampler.get_sampler("dummy/path", "ctx")
+        self.assertIs(metrics_sampler.get_sampler("dummy/path", "ctx"), first)
+        mock_start.assert_called_once()
+
+        with override_settings(K8S_METRICS_SAMPLER_ENABLED=False):
+            self.assertIsNone(metrics_sampler.get_sampler("dummy/path", "ctx"))
+
+# test cases for the on-disk metrics history
+@override_settings(K8S_METRICS_RAW_RETENTION=3600, K8S_METRICS_5M_RETENTION=86400, K8S_METRICS_1H_RETENTION=7 * 86400)
+class MetricsHistoryTests(TestCase):
+    NOW = 1_700_000_040
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.directory = os.path.join(self.tmpdir.name, "pods")
+
+    def test_tiers_are_downsampled_and_picked_by_window(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=10)
+        for minute, cpu in enumerate([100, 200, 300]):
+            store.record(self.NOW - 120 + minute * 60, ["default/web"], [[cpu, 64]])
+
+        self.assertEqual([tier.span for tier in store.tiers], [3600, 86400, 7 * 86400])
+        hour = store.history(["default/web"], 3600, now=self.NOW)
+        week = store.history(["default/web"], 7 * 86400, now=self.NOW)
+        self.assertEqual(hour["series"]["default/web"]["cpu"][-3:], [100, 200, 300])
+        self.assertEqual((week["step"], len(week["series"]["default/web"]["cpu"])), (3600, 168))
+        self.assertEqual(week["series"]["default/web"]["cpu"][-1], 200)
+
+    def test_history_survives_reopening(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=1000)
+        keys = [f"ns/pod-{i}" for i in range(100)]
+        store.record(self.NOW, keys, np.arange(200).reshape(100, 2))
+        del store
+
+        reopened = metrics_history.HistoryStore(self.directory, 60, max_series=1000)
+        reopened.record(self.NOW + 60, ["ns/pod-99", "ns/new"], [[7, 7], [1, 1]])
+
+        series = reopened.history(["ns/pod-99", "ns/new"], 3600, now=self.NOW + 60)["series"]
+        self.assertEqual(series["ns/pod-99"]["cpu"][-2:], [198, 7])
+        self.assertEqual(series["ns/new"]["cpu"][-2:], [None, 1])
+        self.assertEqual(reopened.rows["ns/new"], 100)
+
+    def test_columns_are_series_major_and_grown_outside_the_lock(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=1000)
+        store.record(self.NOW - 60, ["ns/first"], [[3, 3]])
+        grow = metrics_history.DiskRing.grow
+
+        def grow_unlocked(tier, rows):
+            # Pages reading the history are never held up by the new rows
+            self.assertFalse(store._lock.locked())
+            grow(tier, rows)
+
+        with patch.object(metrics_history.DiskRing, "grow", autospec=True, side_effect=grow_unlocked) as mock_grow:
+            store.record(self.NOW, [f"ns/pod-{i}" for i in range(100)], np.ones((100, 2)))
+        self.assertEqual(mock_grow.call_count, 3)
+
+        raw = store.tiers[0]
+        self.assertEqual(raw.sums.shape, (len(store.keys), raw.slots, 2))
+        self.assertEqual(raw.counts.shape, (len(store.keys), raw.slots))
+        self.assertEqual(store.history(["ns/first"], 3600, now=self.NOW)["series"]["ns/first"]["cpu"][-2:], [3, None])
+
+    def test_partly_grown_columns_are_grown_on_open(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=1000)
+        store.record(self.NOW, ["ns/web"], [[4, 4]])
+        store.flush()
+        # As after a crash between growing the counts and the sums of a tier
+        store.tiers[0]._open(".counts.u16", np.uint16, (), 80)
+        del store
+
+        reopened = metrics_history.HistoryStore(self.directory, 60, max_series=1000)
+
+        self.assertEqual({tier.rows for tier in reopened.tiers}, {80})
+        self.assertEqual(len(reopened.keys), 80)
+        self.assertEqual(reopened.history(["ns/web"], 3600, now=self.NOW)["series"]["ns/web"]["cpu"][-1], 4)
+
+    @override_settings(K8S_METRICS_FLUSH_INTERVAL=300)
+    def test_columns_are_flushed_on_a_timer(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=10)
+        with patch.object(metrics_history.DiskRing, "flush") as mock_flush, \
+             patch("dashboard.src.metrics.metrics_history.time.monotonic", return_value=store._flushed + 60):
+            store.record(self.NOW, ["default/web"], [[5, 5]])
+            mock_flush.assert_not_called()
+
+        with patch.object(metrics_history.DiskRing, "flush") as mock_flush, \
+             patch("dashboard.src.metrics.metrics_history.time.monotonic", return_value=store._flushed + 300):
+            store.record(self.NOW + 60, ["default/web"], [[5, 5]])
+            self.assertEqual(mock_flush.call_count, 3)
+        # The keys are saved as soon as they change, flush or not
+        with open(os.path.join(self.directory, metrics_history.SERIES_FILE)) as f:
+            self.assertIn("default/web", json.load(f))
+
+    def test_unsaved_rows_are_reused_clean_and_stale_tiers_removed(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=10)
+        store.record(self.NOW, ["default/web"], [[5, 5]])
+        # A sample written for a series that was never saved, as after a crash
+        slot = int(self.NOW // 300) % store.tiers[1].slots
+        store.tiers[1].sums[1, slot] = 9
+        store.tiers[1].counts[1, slot] = 1
+        del store
+
+        with override_settings(K8S_METRICS_RAW_RETENTION=1800):
+            reopened = metrics_history.HistoryStore(self.directory, 60, max_series=10)
+        reopened.record(self.NOW, ["default/new"], [[2, 2]])
+
+        self.assertEqual(reopened.rows["default/new"], 1)
+        self.assertEqual(reopened.history(["default/new"], 86400, now=self.NOW)["series"]["default/new"]["cpu"][-1], 2)
+        self.assertEqual(sorted(name for name in os.listdir(self.directory) if name.startswith("raw-")),
+                         ["raw-60s-30.buckets.i64", "raw-60s-30.counts.u16", "raw-60s-30.sums.f32"])
+
+    @override_settings(K8S_METRICS_SERIES_RETENTION=3600)
+    def test_series_give_up_their_rows_after_the_series_retention(self):
+        store = metrics_history.HistoryStore(self.directory, 60, max_series=10)
+        store.record(self.NOW, ["default/deleted"], [[1, 1]])
+
+        store.record(self.NOW + 3660, ["default/web"], [[2, 2]])
+
+        self.assertEqual(store.retention, 3600)
+        self.assertEqual(store.rows, {"default/web": 0})
+        week = store.history(["default/web"], 7 * 86400, now=self.NOW + 3660)["series"]["default/web"]["cpu"]
+        self.assertEqual([value for value in week if value is not None], [2])
+
+    def test_open_history_is_shared_and_locked(self):
+        self.addCleanup(metrics_history.close_histories)
+        stores = metrics_history.open_history(self.tmpdir.name, 60, 10)
+
+        self.assertIs(metrics_history.open_history(self.tmpdir.name), stores)
+        if metrics_history.fcntl is not None:
+            with open(os.path.join(self.tmpdir.name, metrics_history.LOCK_FILE)) as other:
+                with self.assertRaises(OSError):
+                    metrics_history.fcntl.flock(other, metrics_history.fcntl.LOCK_EX | metrics_history.fcntl.LOCK_NB)
+
+    @patch("dashboard.src.metrics.metrics_sampler.configure_k8s")
+    @patch("dashboard.src.metrics.metrics_sampler.MetricsSampler.start")
+    def test_get_sampler_keeps_history_on_disk(self, mock_start, mock_configure):
+        self.addCleanup(metrics_history.close_histories)
+        self.addCleanup(metrics_sampler.stop_samplers)
+        with override_settings(K8S_METRICS_HISTORY_DIR=self.tmpdir.name):
+            sampler = metrics_sampler.get_sampler("dummy/path", "kind-dev")
+
+            self.assertIsInstance(sampler.stores["pods"], metrics_history.HistoryStore)
+            self.assertTrue(os.path.basename(metrics_history.history_directory("dummy/path", "kind-dev")).startswith("kind-dev-"))
+            self.assertEqual(metrics_sampler.history_span(), 7 * 86400)
+
+# test cases for the quantity parser
+class QuantityTests(TestCase):
+    def test_parse_quantity_suffixes_and_exponents(self):
+        cases = [("250m", "", 0.25), ("100000000n", "m", 100.0), ("1500u", "m", 1.5), ("2", "m", 2000.0),
+                 ("1Gi", "Mi", 1024.0), ("128974848", "Mi", 123.0), ("129e6", "", 129e6), ("1.5Ki", "", 1536.0),
+                 ("2E", "", 2e18), ("2E-3", "m", 2.0), ("1k", "", 1000.0), (".5M", "", 500000.0), (4, "m", 4000.0)]
+        for value, unit, expected in cases:
+            with self.subTest(value=value, unit=unit):
+                self.assertEqual(quantity.parse_quantity(value, unit), expected)
+
+    def test_parse_quantity_rejects_malformed_values(self):
+        for value in ("", "Mi", "12Xi", "1.2.3", "abc"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                quantity.parse_quantity(value)
+
+    def test_parse_quantities_returns_array(self):
+        values = quantity.parse_quantities(["100m", "1", "100m", "250m"], unit="m")
+
+        self.assertEqual(values.dtype.name, "float64")
+        self.assertEqual(values.tolist(), [100.0, 1000.0, 100.0, 250.0])
+        self.assertEqual(quantity.parse_quantities([]).tolist(), [])
+
+    def test_sum_by_owner(self):
+        sums = quantity.sum_by([0, 0, 2], ["1Mi", "512Ki", "2Mi"], 3, unit="Mi")
+
+        self.assertEqual(sums.tolist(), [1.5, 0.0, 2.0])
 
 # Test cases for limit ranges
 class LimitRangeFunctionTests(TestCase):
@@ -126,26 +504,23 @@ class LimitRangeFunctionTests(TestCase):
 
     def test_get_limit_ranges_success(self):
         mock_v1 = self.mock_core_v1.return_value
-        mock_ns = MagicMock()
-        mock_ns.metadata.name = "default"
-        mock_v1.list_namespace.return_value.items = [mock_ns]
 
         mock_lr = MagicMock()
         mock_lr.metadata.name = "mylr"
+        mock_lr.metadata.namespace = "default"
         mock_lr.metadata.creation_timestamp.strftime.return_value = "2024-01-01 12:00:00"
-        mock_v1.list_namespaced_limit_range.return_value.items = [mock_lr]
+        mock_v1.list_limit_range_for_all_namespaces.return_value.items = [mock_lr]
 
         result, count = k8s_limit_range.get_limit_ranges("/dummy/path", "dummy-context")
+        mock_v1.list_namespace.assert_not_called()
+        mock_v1.list_limit_range_for_all_namespaces.assert_called_once_with(limit=utils.LIST_PAGE_SIZE, _continue=None)
         self.assertEqual(count, 1)
         self.assertEqual(result[0]["name"], "mylr")
         self.assertEqual(result[0]["namespace"], "default")
 
     def test_get_limit_ranges_error_logging(self):
         mock_v1 = self.mock_core_v1.return_value
-        mock_ns = MagicMock()
-        mock_ns.metadata.name = "default"
-        mock_v1.list_namespace.return_value.items = [mock_ns]
-        mock_v1.list_namespaced_limit_range.side_effect = Exception("API Failure")
+        mock_v1.list_limit_range_for_all_namespaces.side_effect = Exception("API Failure")
 
         _, count = k8s_limit_range.get_limit_ranges("/dummy/path", "dummy-context")
         self.assertEqual(count, 0)
@@ -393,9 +768,7 @@ class NodesTests(TestCase):
         yaml_output = k8s_nodes.get_node_yaml("dummy", "ctx", "node1")
         self.assertIn("name: node1", yaml_output)
 
-    @patch("dashboard.src.cluster_management.k8s_nodes.config.load_incluster_config", side_effect=ConfigException)
-    @patch("dashboard.src.cluster_management.k8s_nodes.config.load_kube_config")
-    def test_get_node_details(self, mock_kube_config, mock_incluster):
+    def test_get_node_details(self):
         mock_api = self.mock_core_v1_api.return_value
         mock_node = MagicMock()
         mock_node.metadata.name = "node1"
@@ -405,7 +778,8 @@ class NodesTests(TestCase):
         mock_node.status.capacity = {"cpu": "2", "memory": "4Gi"}
         mock_api.list_node.return_value.items = [mock_node]
 
-        result = k8s_nodes.get_node_details()
+        result = k8s_nodes.get_node_details("dummy", "ctx")
+        self.mock_core_v1_api.assert_called_with(k8s_nodes.configure_k8s.return_value)
         self.assertEqual(result[0]["name"], "node1")
         self.assertEqual(result[0]["status"], "Ready")
 
@@ -530,7 +904,7 @@ class ResourceQuotaTests(TestCase):
         rq.spec.hard = {"cpu": "2"}
         rq.status.used = {"cpu": "1"}
 
-        self.mock_core_api.return_value.list_namespaced_resource_quota.return_value.items = [rq]
+        self.mock_core_api.return_value.read_namespaced_resource_quota.return_value = rq
 
         result = k8s_resource_quota.get_resourcequota_description("dummy", "ctx", "default", "rq1")
 
@@ -539,7 +913,7 @@ class ResourceQuotaTests(TestCase):
         self.assertEqual(result["resources"][0]["used"], "1")
 
     def test_get_resourcequota_description_not_found(self):
-        self.mock_core_api.return_value.list_namespaced_resource_quota.return_value.items = []
+        self.mock_core_api.return_value.read_namespaced_resource_quota.side_effect = ApiException(status=404, reason="Not Found")
 
         result = k8s_resource_quota.get_resourcequota_description("dummy", "ctx", "default", "missing-rq")
         self.assertIn("error", result)
@@ -606,18 +980,33 @@ class ConfigMapTests(TestCase):
         cm.metadata.namespace = "default"
         cm.data = {"env": "production"}
 
-        self.mock_core_api.return_value.list_namespaced_config_map.return_value.items = [cm]
+        self.mock_core_api.return_value.read_namespaced_config_map.return_value = cm
 
         result = k8s_configmaps.get_configmap_description("dummy", "ctx", "default", "test-cm")
         self.assertEqual(result["name"], "test-cm")
         self.assertEqual(result["data"]["env"], "production")
 
     def test_get_configmap_description_not_found(self):
-        self.mock_core_api.return_value.list_namespaced_config_map.return_value.items = []
+        self.mock_core_api.return_value.read_namespaced_config_map.side_effect = ApiException(status=404, reason="Not Found")
 
         result = k8s_configmaps.get_configmap_description("dummy", "ctx", "default", "missing-cm")
         self.assertIn("error", result)
 
+    def test_configmap_description_and_yaml_reuse_a_read_configmap(self):
+        cm = self.mock_core_api.return_value.read_namespaced_config_map.return_value
+        cm.metadata.name = "test-cm"
+        cm.metadata.namespace = "default"
+        cm.metadata.annotations = {}
+        cm.data = {"env": "production"}
+        self.mock_configure.return_value.sanitize_for_serialization.return_value = {"metadata": {"name": "test-cm"}}
+
+        configmap = k8s_configmaps.read_configmap("dummy", "ctx", "default", "test-cm")
+        result = k8s_configmaps.get_configmap_description("dummy", "ctx", "default", "test-cm", configmap)
+        k8s_configmaps.get_configmap_yaml("dummy", "ctx", "default", "test-cm", False, configmap)
+
+        self.assertEqual(result["data"], {"env": "production"})
+        self.mock_core_api.return_value.read_namespaced_config_map.assert_called_once_with(name="test-cm", namespace="default")
+
     def test_get_configmap_events(self):
         event = MagicMock()
         event.involved_object.name = "my-cm"
@@ -685,14 +1074,14 @@ class SecretsTests(TestCase):
         mock_secret.type = "Opaque"
         mock_secret.data = {"api-key": encoded_value}
 
-        self.mock_core_api.return_value.list_namespaced_secret.return_value.items = [mock_secret]
+        self.mock_core_api.return_value.read_namespaced_secret.return_value = mock_secret
 
         result = k8s_secrets.get_secret_description("dummy", "ctx", "default", "my-secret")
         self.assertEqual(result["name"], "my-secret")
         self.assertEqual(result["data"]["api-key"], "14 bytes")
 
     def test_get_secret_description_not_found(self):
-        self.mock_core_api.return_value.list_namespaced_secret.return_value.items = []
+        self.mock_core_api.return_value.read_namespaced_secret.side_effect = ApiException(status=404, reason="Not Found")
 
         result = k8s_secrets.get_secret_description("dummy", "ctx", "default", "missing-secret")
         self.assertIn("error", result)
@@ -777,6 +1166,292 @@ class EventsTests(TestCase):
         events = k8s_events.get_events("dummy", "ctx", limit=True)
         self.assertEqual(events, [])
 
+    def test_get_object_events_pushes_field_selector(self):
+        v1 = MagicMock()
+        v1.list_namespaced_event.return_value.items = [self.mock_event()]
+
+        events = k8s_events.get_object_events(v1, "mypod", "Pod", namespace="default", uid="abc")
+
+        self.assertEqual(len(events), 1)
+        kwargs = v1.list_namespaced_event.call_args.kwargs
+        self.assertEqual(kwargs["namespace"], "default")
+        self.assertEqual(kwargs["field_selector"],
+                         "involvedObject.name=mypod,involvedObject.kind=Pod,involvedObject.uid=abc")
+        v1.list_event_for_all_namespaces.assert_not_called()
+
+    def test_get_object_events_cluster_scoped(self):
+        v1 = MagicMock()
+        v1.list_event_for_all_namespaces.return_value.items = [self.mock_event(name="admin", kind="ClusterRole")]
+
+        events = k8s_events.get_object_events(v1, "admin", "ClusterRole")
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(v1.list_event_for_all_namespaces.call_args.kwargs["field_selector"],
+                         "involvedObject.name=admin,involvedObject.kind=ClusterRole")
+
+    @override_settings(K8S_OBJECT_EVENTS_LIMIT=2)
+    def test_get_object_events_sorted_and_capped(self):
+        now = datetime.now(tzutc())
+        newest = self.mock_event(message="newest", last_timestamp=now)
+        oldest = self.mock_event(message="oldest", last_timestamp=now - timedelta(hours=2))
+        middle = self.mock_event(message="middle", last_timestamp=now - timedelta(hours=1))
+        other = self.mock_event(name="otherpod")
+        v1 = MagicMock()
+        v1.list_namespaced_event.return_value.items = [newest, other, oldest, middle]
+
+        events = k8s_events.get_object_events(v1, "mypod", "Pod", namespace="default")
+
+        self.assertEqual([event.message for event in events], ["middle", "newest"])
+        for event in events:
+            event.reason = "Pulled"
+        self.assertEqual(k8s_events.format_object_events(events), "Pulled: middle\nPulled: newest")
+
+    def test_get_events_page_filters_and_pages_on_the_server(self):
+        page = self.mock_core_api.return_value.list_namespaced_event.return_value
+        page.items = [self.mock_event(etype="Warning")]
+        page.metadata._continue = "token-3"
+
+        rows, next_token = k8s_events.get_events_page("path", "ctx", namespace="default", event_type="Warning",
+                                                      kind="Pod", limit=50, continue_token="token-2")
+
+        self.assertEqual(next_token, "token-3")
+        self.assertEqual(rows[0]["type"], "Warning")
+        self.assertEqual(rows[0]["last_seen"], "10m")
+        self.mock_core_api.return_value.list_namespaced_event.assert_called_once_with(
+            namespace="default", limit=50, _continue="token-2", field_selector="type=Warning,involvedObject.kind=Pod")
+
+    def test_get_events_page_last_page_has_no_token(self):
+        page = self.mock_core_api.return_value.list_event_for_all_namespaces.return_value
+        page.items = []
+        page.metadata._continue = ""
+
+        rows, next_token = k8s_events.get_events_page("path", "ctx")
+
+        self.assertEqual((rows, next_token), ([], None))
+        self.mock_core_api.return_value.list_event_for_all_namespaces.assert_called_once_with(limit=50)
+
+class EventIndexTests(TestCase):
+    NOW = 1_700_000_000
+
+    def setUp(self):
+        # One-minute buckets over the last hour
+        self.index = k8s_events.EventIndex(bucket_seconds=60, buckets=60)
+        patcher = patch("dashboard.src.events.k8s_events.time.time", return_value=self.NOW)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def mock_event(self, uid, count=1, minutes_ago=0, name="web", reason="BackOff", namespace="default", etype="Warning"):
+        event = MagicMock()
+        event.metadata.uid = uid
+        event.metadata.namespace = namespace
+        event.involved_object.kind = "Pod"
+        event.involved_object.name = name
+        event.reason = reason
+        event.type = etype
+        event.count = count
+        event.last_timestamp = datetime.fromtimestamp(self.NOW - minutes_ago * 60, tzutc())
+        return event
+
+    def test_bucket_ring_reuses_slots_of_expired_buckets(self):
+        ring = k8s_events.BucketRing(3)
+        ring.add(1, 2)
+        ring.add(4, 5)
+        ring.add(1, 7)
+
+        self.assertEqual(ring.count(1), 0)
+        self.assertEqual(ring.count(4), 5)
+        self.assertEqual(ring.total(2, 4), 5)
+
+    def test_repeated_event_only_adds_new_occurrences(self):
+        self.index.add(self.mock_event("a", count=3, minutes_ago=10))
+        self.index.add(self.mock_event("a", count=5, minutes_ago=2))
+
+        self.assertEqual(self.index.top(now=self.NOW),
+                         [{"namespace": "default", "object": "Pod/web", "reason": "BackOff", "count": 5}])
+        counts = [count for _, count in self.index.histogram(now=self.NOW)]
+        self.assertEqual(len(counts), 60)
+        self.assertEqual(counts[-11], 3)
+        self.assertEqual(counts[-3], 2)
+
+    def test_relist_does_not_count_twice(self):
+        events = [self.mock_event("a", count=4, minutes_ago=1)]
+        self.index.replace([events])
+        self.index.replace([events])
+
+        self.assertEqual(self.index.top(now=self.NOW)[0]["count"], 4)
+
+    def test_failed_relist_does_not_count_twice(self):
+        first = [self.mock_event("a", count=4, name="web", minutes_ago=1)]
+        second = [self.mock_event("b", count=2, name="db", minutes_ago=1)]
+        self.index.replace([first, second])
+        def failing_pages():
+            yield first
+            raise ApiException(status=500)
+
+        with self.assertRaises(ApiException):
+            self.index.replace(failing_pages())
+        self.index.replace([first, second])
+
+        self.assertEqual(sorted(row["count"] for row in self.index.top(now=self.NOW)), [2, 4])
+
+    def test_top_ranks_by_type_window_and_namespace(self):
+        self.index.add(self.mock_event("a", count=2, name="web"))
+        self.index.add(self.mock_event("b", count=9, name="db", namespace="data"))
+        self.index.add(self.mock_event("c", count=50, name="api", etype="Normal"))
+        self.index.add(self.mock_event("d", count=30, name="old", minutes_ago=30))
+        self.index.add(self.mock_event("e", count=99, name="gone", minutes_ago=120))
+
+        top = self.index.top("Warning", seconds=600, now=self.NOW)
+        self.assertEqual([row["object"] for row in top], ["Pod/db", "Pod/web"])
+        self.assertEqual([row["object"] for row in self.index.top(limit=1, now=self.NOW)], ["Pod/old"])
+        self.assertEqual([row["object"] for row in self.index.top(namespace="default", now=self.NOW)],
+                         ["Pod/old", "Pod/web"])
+
+    def test_histogram_of_one_namespace(self):
+        self.index.add(self.mock_event("a", count=2, namespace="default"))
+        self.index.add(self.mock_event("b", count=3, namespace="data"))
+
+        history = self.index.histogram(seconds=300, namespace="data", now=self.NOW)
+
+        self.assertEqual([count for _, count in history], [0, 0, 0, 0, 3])
+        self.assertEqual(history[-1][0], datetime.fromtimestamp(self.NOW // 60 * 60, tzutc()))
+
+    def test_informer_feeds_index(self):
+        informer = k8s_events.EventIndexInformer(MagicMock())
+        event = self.mock_event("a", count=1)
+        informer._replace(iter([[event]]))
+        informer._apply("MODIFIED", self.mock_event("a", count=3))
+        informer._apply("DELETED", event)
+
+        self.assertEqual(informer.index.top(now=self.NOW)[0]["count"], 3)
+        self.assertEqual(informer.index._seen, {})
+
+    @override_settings(K8S_EVENT_INDEX_ENABLED=False)
+    @patch("dashboard.src.events.k8s_events.informers.get_informer")
+    def test_get_event_index_disabled(self, mock_get_informer):
+        self.assertIsNone(k8s_events.get_event_index("path", "ctx"))
+        mock_get_informer.assert_not_called()
+
+    @override_settings(K8S_EVENT_INDEX_ENABLED=True)
+    @patch("dashboard.src.events.k8s_events.informers.get_informer")
+    def test_get_event_index_once_listed(self, mock_get_informer):
+        mock_get_informer.return_value.wait_for_sync.return_value = True
+
+        index = k8s_events.get_event_index("path", "ctx")
+
+        self.assertIs(index, mock_get_informer.return_value.index)
+        mock_get_informer.assert_called_once_with("path", "ctx", "events", factory=k8s_events.EventIndexInformer,
+                                                  name=k8s_events.EVENT_INDEX_INFORMER)
+
+    @override_settings(K8S_EVENT_INDEX_ENABLED=True)
+    @patch("dashboard.src.events.k8s_events.informers.get_informer")
+    def test_get_event_index_does_not_wait_for_initial_list(self, mock_get_informer):
+        mock_get_informer.return_value.wait_for_sync.return_value = False
+
+        self.assertIsNone(k8s_events.get_event_index("path", "ctx"))
+        mock_get_informer.return_value.wait_for_sync.assert_called_once_with(0)
+
+class EventStreamTests(TestCase):
+    def mock_event(self, uid, count=1, resource_version="1"):
+        event = MagicMock()
+        event.metadata.uid = uid
+        event.metadata.namespace = "default"
+        event.metadata.resource_version = resource_version
+        event.message = "Back-off restarting failed container"
+        event.involved_object.kind = "Pod"
+        event.involved_object.name = "web"
+        event.source.component = "kubelet"
+        event.source.host = None
+        event.count = count
+        event.last_timestamp = datetime.now(tzutc()) - timedelta(seconds=5)
+        event.type = "Warning"
+        return event
+
+    def frames(self, stream):
+        # Parse the "events" and "error" frames of a finished stream
+        frames = []
+        for chunk in stream:
+            if chunk.startswith("event: events"):
+                frames.append(json.loads(chunk.split("data: ", 1)[1]))
+            elif chunk.startswith("event: error"):
+                frames.append(chunk)
+        return frames
+
+    def test_coalescer_keeps_newest_version_of_each_event(self):
+        coalescer = event_stream.EventCoalescer()
+        coalescer.add("ADDED", self.mock_event("a", count=1))
+        coalescer.add("ADDED", self.mock_event("b"))
+        bumped = self.mock_event("a", count=7)
+        coalescer.add("MODIFIED", bumped)
+
+        taken, dropped = coalescer.take(10)
+
+        self.assertEqual([event.metadata.uid for _, event in taken], ["b", "a"])
+        self.assertEqual(taken[1], ("MODIFIED", bumped))
+        self.assertEqual(dropped, 0)
+        self.assertFalse(coalescer.pending)
+
+    def test_coalescer_limits_rows_and_counts_dropped_events(self):
+        coalescer = event_stream.EventCoalescer(max_pending=2)
+        for uid in ("a", "b", "c"):
+            coalescer.add("ADDED", self.mock_event(uid))
+
+        taken, dropped = coalescer.take(1)
+
+        self.assertEqual([event.metadata.uid for _, event in taken], ["b"])
+        self.assertEqual(dropped, 1)
+        self.assertEqual(list(coalescer.pending), ["c"])
+
+    @patch("dashboard.src.events.event_stream.watch.Watch")
+    def test_live_events_pushes_rows_until_watch_fails(self, mock_watch):
+        changes = [{"type": "ADDED", "object": self.mock_event("a", resource_version="11")},
+                   {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "12"}}},
+                   {"type": "MODIFIED", "object": self.mock_event("a", count=2, resource_version="13")}]
+        mock_watch.return_value.stream.side_effect = [iter(changes), ApiException(status=500, reason="Boom")]
+        list_func = MagicMock()
+
+        frames = self.frames(event_stream.live_events(list_func, {"namespace": "default"}, "10", interval=0, max_rows=10))
+
+        rows = [row for frame in frames[:-1] for row in frame["rows"]]
+        self.assertEqual(rows[-1]["uid"], "a")
+        self.assertEqual(rows[-1]["count"], 2)
+        self.assertEqual(rows[-1]["change"], "MODIFIED")
+        self.assertEqual(rows[-1]["object"], "Pod/web")
+        self.assertEqual(frames[-1], "event: error\ndata: Event watch interrupted\n\n")
+        first, second = mock_watch.return_value.stream.call_args_list
+        self.assertEqual(first.kwargs["resource_version"], "10")
+        self.assertEqual(first.kwargs["namespace"], "default")
+        self.assertTrue(first.kwargs["allow_watch_bookmarks"])
+        # The next watch resumes after the last change seen
+        self.assertEqual(second.kwargs["resource_version"], "13")
+
+    @patch("dashboard.src.events.event_stream.watch.Watch")
+    def test_live_events_resumes_from_now_when_resource_version_expired(self, mock_watch):
+        mock_watch.return_value.stream.side_effect = [ApiException(status=410, reason="Gone"),
+                                                      iter([{"type": "ERROR", "raw_object": {"code": 500}}])]
+        list_func = MagicMock()
+        list_func.return_value.metadata.resource_version = "99"
+
+        frames = self.frames(event_stream.live_events(list_func, {}, "10", interval=0))
+
+        self.assertEqual(frames, ["event: error\ndata: Event watch failed\n\n"])
+        list_func.assert_called_once_with(limit=1)
+        self.assertEqual(mock_watch.return_value.stream.call_args.kwargs["resource_version"], "99")
+
+    @patch("dashboard.src.events.event_stream.live_events")
+    @patch("dashboard.src.events.event_stream.configure_k8s")
+    @patch("dashboard.src.events.event_stream.client.CoreV1Api")
+    def test_stream_events_watches_from_current_resource_version(self, mock_core_api, mock_configure, mock_live):
+        v1 = mock_core_api.return_value
+        v1.list_namespaced_event.return_value.metadata.resource_version = "42"
+
+        stream = event_stream.stream_events("path", "ctx", namespace="dev", event_type="Warning")
+
+        self.assertIs(stream, mock_live.return_value)
+        v1.list_namespaced_event.assert_called_once_with(limit=1, namespace="dev", field_selector="type=Warning")
+        mock_live.assert_called_once_with(v1.list_namespaced_event,
+                                          {"namespace": "dev", "field_selector": "type=Warning"}, "42")
+
 # Test cases for Ingress
 class IngressTests(TestCase):
     def setUp(self):
@@ -855,13 +1530,6 @@ class IngressTests(TestCase):
         self.assertIn("metadata:", yaml_output)
 
     def test_get_ingress_details(self):
-        patcher_cfg = patch("dashboard.src.networking.k8s_ingress.config.load_incluster_config")
-        patcher_fallback = patch("dashboard.src.networking.k8s_ingress.config.load_kube_config")
-        patcher_cfg.start()
-        patcher_fallback.start()
-        self.addCleanup(patcher_cfg.stop)
-        self.addCleanup(patcher_fallback.stop)
-
         rule = MagicMock()
         rule.host = "host.local"
         path = MagicMock()
@@ -876,7 +1544,9 @@ class IngressTests(TestCase):
         ingress.spec.tls = ["tls"]
         self.mock_networking_api.return_value.list_ingress_for_all_namespaces.return_value.items = [ingress]
 
-        result = k8s_ingress.get_ingress_details()
+        result = k8s_ingress.get_ingress_details("dummy", "ctx")
+        self.mock_configure.assert_called_once_with("dummy", "ctx")
+        self.mock_networking_api.assert_called_with(self.mock_configure.return_value)
         self.assertEqual(result[0]["name"], "ingx")
         self.assertEqual(result[0]["tls"], "Yes")
 
@@ -1347,17 +2017,15 @@ class RoleTests(TestCase):
         self.addCleanup(patcher_core.stop)
 
     def test_list_roles(self):
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "dev"
-
         mock_role = MagicMock()
         mock_role.metadata.name = "reader"
+        mock_role.metadata.namespace = "dev"
         mock_role.metadata.creation_timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
-        self.mock_core_api.return_value.list_namespace.return_value.items = [mock_namespace]
-        self.mock_rbac_api.return_value.list_namespaced_role.return_value.items = [mock_role]
+        self.mock_rbac_api.return_value.list_role_for_all_namespaces.return_value.items = [mock_role]
 
         result, count = k8s_role.list_roles("dummy", "ctx")
+        self.mock_core_api.return_value.list_namespace.assert_not_called()
         self.assertEqual(count, 1)
         self.assertEqual(result[0]["namespace"], "dev")
         self.assertEqual(result[0]["name"], "reader")
@@ -1562,18 +2230,16 @@ class ServiceAccountTests(TestCase):
         self.addCleanup(patcher_age.stop)
 
     def test_get_service_accounts(self):
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "dev"
-
         mock_sa = MagicMock()
         mock_sa.metadata.name = "default"
+        mock_sa.metadata.namespace = "dev"
         mock_sa.metadata.creation_timestamp = datetime.now(timezone.utc) - timedelta(days=2)
         mock_sa.secrets = [MagicMock(name="s1"), MagicMock(name="s2")]
 
-        self.mock_core_api.return_value.list_namespace.return_value.items = [mock_namespace]
-        self.mock_core_api.return_value.list_namespaced_service_account.return_value.items = [mock_sa]
+        self.mock_core_api.return_value.list_service_account_for_all_namespaces.return_value.items = [mock_sa]
 
         result, count = k8s_service_accounts.get_service_accounts("dummy", "ctx")
+        self.mock_core_api.return_value.list_namespace.assert_not_called()
 
         self.assertEqual(count, 1)
         self.assertEqual(result[0]["namespace"], "dev")
@@ -1667,11 +2333,9 @@ class EndpointTests(TestCase):
         os.environ.setdefault("INTERNAL_IP", "127.0.0.1")  # Safe loopback IP
         os.environ.setdefault("PORT", "80")
 
-        mock_namespace = MagicMock()
-        mock_namespace.metadata.name = "default"
-
         mock_ep = MagicMock()
         mock_ep.metadata.name = "my-service"
+        mock_ep.metadata.namespace = "default"
         mock_ep.metadata.creation_timestamp = datetime.now(timezone.utc) - timedelta(days=3)
 
         mock_addr = MagicMock()
@@ -1686,10 +2350,10 @@ class EndpointTests(TestCase):
 
         mock_ep.subsets = [mock_subset]
 
-        self.mock_core_api.return_value.list_namespace.return_value.items = [mock_namespace]
-        self.mock_core_api.return_value.list_namespaced_endpoints.return_value.items = [mock_ep]
+        self.mock_core_api.return_value.list_endpoints_for_all_namespaces.return_value.items = [mock_ep]
 
         result = k8s_endpoints.get_endpoints("dummy", "ctx")
+        self.mock_core_api.return_value.list_namespace.assert_not_called()
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["namespace"], "default")
@@ -1897,10 +2561,10 @@ class CronJobTests(TestCase):
         self.addCleanup(patcher_age.stop)
 
     def test_get_cronjob_count(self):
-        with patch("dashboard.src.workloads.k8s_cronjobs.config.load_kube_config"):
-            self.mock_batch_api.return_value.list_cron_job_for_all_namespaces.return_value.items = [MagicMock(), MagicMock()]
-            count = k8s_cronjobs.getCronJobCount()
-            self.assertEqual(count, 2)
+        self.mock_batch_api.return_value.list_cron_job_for_all_namespaces.return_value.items = [MagicMock(), MagicMock()]
+        count = k8s_cronjobs.getCronJobCount("dummy", "ctx")
+        self.assertEqual(count, 2)
+        self.mock_configure_k8s.assert_called_once_with("dummy", "ctx")
 
     def test_get_cronjobs_status(self):
         mock_job1 = MagicMock()
@@ -2154,16 +2818,15 @@ class DeploymentTests(TestCase):
         self.addCleanup(patcher_age.stop)
 
     def test_get_deployments_info(self):
-        now = datetime.now(timezone.utc)
-        mock_dep = MagicMock()
-        mock_dep.metadata.name = "web"
-        mock_dep.metadata.namespace = "default"
-        mock_dep.metadata.creation_timestamp = now - timedelta(days=2)
-        mock_dep.status.ready_replicas = 2
-        mock_dep.spec.replicas = 3
-        mock_dep.spec.template.spec.containers = [MagicMock(image="nginx:1.25")]
+        created = (datetime.now(timezone.utc) - timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        raw_dep = {
+            "metadata": {"name": "web", "namespace": "default", "creationTimestamp": created},
+            "spec": {"replicas": 3, "template": {"spec": {"containers": [{"image": "nginx:1.25"}]}}},
+            "status": {"readyReplicas": 2},
+        }
 
-        self.mock_apps_api.return_value.list_deployment_for_all_namespaces.return_value.items = [mock_dep]
+        self.mock_apps_api.return_value.list_deployment_for_all_namespaces.return_value.data = json.dumps(
+            {"metadata": {}, "items": [raw_dep]}).encode()
 
         result = k8s_deployments.getDeploymentsInfo("dummy", "ctx")
         self.assertEqual(result[0]["name"], "web")
@@ -2399,10 +3062,9 @@ class JobTests(TestCase):
         job.status.completion_time = now
         job.metadata.creation_timestamp = now - timedelta(hours=1)
 
-        with patch("dashboard.src.workloads.k8s_jobs.config.load_incluster_config", side_effect=ConfigException), \
-             patch("dashboard.src.workloads.k8s_jobs.config.load_kube_config"):
-            self.mock_batch_api.return_value.list_job_for_all_namespaces.return_value.items = [job]
-            result = k8s_jobs.get_job_details()
+        self.mock_batch_api.return_value.list_job_for_all_namespaces.return_value.items = [job]
+        result = k8s_jobs.get_job_details("dummy", "ctx")
+        self.mock_batch_api.assert_called_with(self.mock_configure_k8s.return_value)
 
         self.assertEqual(result[0]["name"], "job1")
         self.assertEqual(result[0]["namespace"], "default")
@@ -2453,20 +3115,24 @@ class PodTests(TestCase):
         self.assertEqual(result["Succeeded"], 1)
 
     def test_get_pod_info(self):
-        pod = MagicMock()
-        pod.metadata.namespace = "default"
-        pod.metadata.name = "mypod"
-        pod.spec.node_name = "node1"
-        pod.status.pod_ip = os.getenv("INTERNAL_IP")
-        pod.status.container_statuses = [MagicMock(ready=True, restart_count=1)]
-        pod.metadata.creation_timestamp = datetime.now(timezone.utc) - timedelta(hours=3)
-        pod.status.phase = "Running"
-
-        with patch("dashboard.src.workloads.k8s_pods.getPodStatus", return_value="Running"):
-            self.mock_core_api.return_value.list_pod_for_all_namespaces.return_value.items = [pod]
-            result = k8s_pods.get_pod_info("dummy", "ctx")
-            self.assertEqual(result[0]["name"], "mypod")
-            self.assertEqual(result[0]["status"], "Running")
+        created = (datetime.now(timezone.utc) - timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        raw_pod = {
+            "metadata": {"namespace": "default", "name": "mypod", "creationTimestamp": created},
+            "spec": {"nodeName": "node1"},
+            "status": {
+                "phase": "Running",
+                "podIP": os.getenv("INTERNAL_IP"),
+                "containerStatuses": [{"ready": True, "restartCount": 1, "state": {"running": {"startedAt": created}}}],
+            },
+        }
+
+        self.mock_core_api.return_value.list_pod_for_all_namespaces.return_value.data = json.dumps(
+            {"metadata": {}, "items": [raw_pod]}).encode()
+        result = k8s_pods.get_pod_info("dummy", "ctx")
+        self.assertEqual(result[0]["name"], "mypod")
+        self.assertEqual(result[0]["status"], "Running")
+        self.assertEqual(result[0]["containers"], "1/1")
+        self.assertEqual(result[0]["restarts"], 1)
 
     def test_get_pod_logs(self):
         self.mock_core_api.return_value.read_namespaced_pod_log.return_value = "pod logs"
@@ -2477,6 +3143,7 @@ class PodTests(TestCase):
         pod = MagicMock()
         pod.metadata.annotations = {"foo": "bar"}
         pod.to_dict.return_value = {"metadata": {"name": "mypod"}}
+        self.mock_configure_k8s.return_value.sanitize_for_serialization.return_value = pod.to_dict.return_value
         self.mock_core_api.return_value.read_namespaced_pod.return_value = pod
 
         with patch("dashboard.src.workloads.k8s_pods.filter_annotations", return_value={}):
@@ -2720,4 +3387,965 @@ class ReplicaSetTests(TestCase):
         with patch("dashboard.src.workloads.k8s_replicaset.filter_annotations", return_value={}):
             result = k8s_replicaset.get_yaml_rs("dummy", "ctx", "default", "rs-1")
         self.assertIn("metadata:", result)
-        self.assertIn("name: rs-1", result)
\ No newline at end of file
+        self.assertIn("name: rs-1", result)
+
+
+# test cases for the cached ApiClient registry in utils
+class ConfigureK8sTests(TestCase):
+    def setUp(self):
+        utils._api_clients.clear()
+        self.addCleanup(utils._api_clients.clear)
+        self.mock_new_client = patch("dashboard.src.utils.config.new_client_from_config").start()
+        self.mock_new_client.side_effect = lambda **kwargs: MagicMock()
+        self.addCleanup(patch.stopall)
+
+        kubeconfig = tempfile.NamedTemporaryFile(delete=False, suffix=".yaml")
+        kubeconfig.close()
+        self.path = kubeconfig.name
+        self.addCleanup(os.remove, self.path)
+
+    def test_client_is_reused_for_same_context(self):
+        first = utils.configure_k8s(self.path, "ctx")
+        second = utils.configure_k8s(self.path, "ctx")
+
+        self.assertIs(first, second)
+        self.mock_new_client.assert_called_once_with(config_file=self.path, context="ctx")
+
+    def test_each_context_gets_its_own_client(self):
+        first = utils.configure_k8s(self.path, "ctx-a")
+        second = utils.configure_k8s(self.path, "ctx-b")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.mock_new_client.call_count, 2)
+
+    def test_client_is_rebuilt_when_kubeconfig_changes(self):
+        first = utils.configure_k8s(self.path, "ctx")
+        mtime = os.path.getmtime(self.path)
+        os.utime(self.path, (mtime + 10, mtime + 10))
+
+        second = utils.configure_k8s(self.path, "ctx")
+
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        self.assertEqual(len(utils._api_clients), 1)
+
+    def test_default_configuration_is_not_modified(self):
+        with patch("dashboard.src.utils.client.Configuration.set_default") as mock_set_default:
+            utils.configure_k8s(self.path, "ctx")
+
+        mock_set_default.assert_not_called()
+
+    def test_concurrent_callers_share_one_client(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: utils.configure_k8s(self.path, "ctx"), range(32)))
+
+        self.assertTrue(all(c is clients[0] for c in clients))
+        self.mock_new_client.assert_called_once()
+
+    @patch("dashboard.src.utils.get_cloud_credentials")
+    def test_cloud_client_refreshes_token_per_request(self, mock_credentials):
+        mock_credentials.return_value = {"host": "https://1.2.3.4:443", "ca_cert": "/tmp/ca.crt", "token": "old", "expiry": 0}
+        api_client = utils.configure_k8s(self.path, "gke_project_zone_cluster")
+
+        mock_credentials.return_value = {"host": "https://1.2.3.4:443", "ca_cert": "/tmp/ca.crt", "token": "new", "expiry": 0}
+        header = api_client.configuration.get_api_key_with_prefix("authorization")
+
+        self.assertEqual(header, "Bearer new")
+        self.assertIs(api_client, utils.configure_k8s(self.path, "gke_project_zone_cluster"))
+
+
+class CloudCredentialsTests(TestCase):
+    def setUp(self):
+        utils._cloud_credentials.clear()
+        self.addCleanup(utils._cloud_credentials.clear)
+        self.mock_endpoint = patch("dashboard.src.utils._fetch_eks_endpoint").start()
+        self.mock_endpoint.side_effect = lambda context: {"host": "https://eks", "ca_cert": "/tmp/ca.crt", "token": None, "expiry": 0}
+        self.mock_token = patch("dashboard.src.utils._fetch_eks_token").start()
+        self.addCleanup(patch.stopall)
+        self.context = "arn:aws:eks:us-east-1:123456789012:cluster/demo"
+
+    def test_token_is_reused_until_close_to_expiry(self):
+        now = datetime.now(timezone.utc).timestamp()
+        self.mock_token.return_value = ("token-1", now + 900)
+
+        first = utils.get_cloud_credentials(self.context)
+        second = utils.get_cloud_credentials(self.context)
+
+        self.assertEqual(second["token"], "token-1")
+        self.assertIs(first, second)
+        self.mock_endpoint.assert_called_once_with(self.context)
+        self.mock_token.assert_called_once_with(self.context)
+
+    def test_token_is_refreshed_before_expiry(self):
+        now = datetime.now(timezone.utc).timestamp()
+        self.mock_token.return_value = ("token-1", now + utils.TOKEN_REFRESH_MARGIN - 1)
+        utils.get_cloud_credentials(self.context)
+
+        self.mock_token.return_value = ("token-2", now + 900)
+        credentials = utils.get_cloud_credentials(self.context)
+
+        self.assertEqual(credentials["token"], "token-2")
+        self.assertEqual(self.mock_token.call_count, 2)
+        self.mock_endpoint.assert_called_once()
+
+
+class EksTokenTests(TestCase):
+    @patch("dashboard.src.utils.subprocess.check_output")
+    def test_eks_token_expiry_is_parsed(self, mock_check_output):
+        mock_check_output.return_value = b'{"status": {"token": "k8s-aws-v1.abc", "expirationTimestamp": "2030-01-01T00:00:00Z"}}'
+
+        token, expiry = utils._fetch_eks_token("arn:aws:eks:us-east-1:123456789012:cluster/demo")
+
+        self.assertEqual(token, "k8s-aws-v1.abc")
+        self.assertEqual(expiry, datetime(2030, 1, 1, tzinfo=timezone.utc).timestamp())
+        self.assertIn("demo", mock_check_output.call_args[0][0])
+
+
+# test cases for the informer cache
+def make_k8s_object(name, namespace=None, resource_version="1"):
+    obj = MagicMock()
+    obj.metadata.name = name
+    obj.metadata.namespace = namespace
+    obj.metadata.resource_version = resource_version
+    return obj
+
+class InformerTests(TestCase):
+    def setUp(self):
+        self.mock_api = MagicMock()
+        patch.dict(informers.INFORMER_KINDS, {"pods": (self.mock_api, "list_pod_for_all_namespaces")}).start()
+        self.mock_watch = patch("dashboard.src.informers.watch.Watch").start()
+        self.addCleanup(patch.stopall)
+        self.list_func = self.mock_api.return_value.list_pod_for_all_namespaces
+        self.list_func.return_value.items = [make_k8s_object("a", "ns1"), make_k8s_object("b", "ns2")]
+        self.list_func.return_value.metadata.resource_version = "100"
+        self.informer = informers.Informer(MagicMock(), "pods")
+
+    def test_relist_populates_store_and_resource_version(self):
+        self.informer._relist()
+
+        self.assertTrue(self.informer.wait_for_sync(0))
+        self.assertEqual(self.informer.resource_version, "100")
+        self.assertEqual(len(self.informer.list()), 2)
+        self.assertEqual([p.metadata.name for p in self.informer.list("ns1")], ["a"])
+        self.assertEqual(self.informer.get("b", "ns2").metadata.name, "b")
+
+    @patch("dashboard.src.informers.list_pages")
+    def test_relist_reads_pages_as_they_arrive(self, mock_list_pages):
+        pages = [MagicMock(items=[make_k8s_object("a", "ns1")]), MagicMock(items=[make_k8s_object("b", "ns2")])]
+        for page in pages:
+            page.metadata.resource_version = "200"
+        mock_list_pages.return_value = iter(pages)
+        replaced = []
+        self.informer._replace = lambda listing: replaced.extend(listing)
+
+        self.informer._relist()
+
+        self.assertEqual(replaced, [page.items for page in pages])
+        self.assertEqual(self.informer.resource_version, "200")
+
+    def test_watch_events_update_store(self):
+        self.informer._relist()
+        self.mock_watch.return_value.stream.return_value = [
+            {"type": "ADDED", "object": make_k8s_object("c", "ns1", "101")},
+            {"type": "DELETED", "object": make_k8s_object("b", "ns2", "102")},
+            {"type": "BOOKMARK", "object": {}, "raw_object": {"metadata": {"resourceVersion": "150"}}},
+        ]
+
+        self.informer._watch_once()
+
+        self.assertEqual(sorted(p.metadata.name for p in self.informer.list()), ["a", "c"])
+        self.assertEqual(self.informer.list("ns2"), [])
+        self.assertEqual(self.informer.resource_version, "150")
+        _, kwargs = self.mock_watch.return_value.stream.call_args
+        self.assertEqual(kwargs["resource_version"], "100")
+        self.assertTrue(kwargs["allow_watch_bookmarks"])
+
+    def test_expired_resource_version_triggers_relist(self):
+        def expire_then_stop(*args, **kwargs):
+            if self.list_func.call_count == 1:
+                raise ApiException(status=410)
+            self.informer.stop()
+            return []
+        self.mock_watch.return_value.stream.side_effect = expire_then_stop
+
+        self.informer._run()
+
+        self.assertEqual(self.list_func.call_count, 2)
+
+    @override_settings(K8S_INFORMERS_ENABLED=False)
+    @patch("dashboard.src.informers.get_informer")
+    def test_cached_items_disabled(self, mock_get_informer):
+        self.assertIsNone(informers.cached_items("path", "ctx", "pods"))
+        mock_get_informer.assert_not_called()
+
+    @override_settings(K8S_INFORMERS_ENABLED=True)
+    @patch("dashboard.src.informers.get_informer")
+    def test_cached_items_reads_synced_informer(self, mock_get_informer):
+        mock_get_informer.return_value = self.informer
+        self.informer._relist()
+
+        result = informers.cached_items("path", "ctx", "pods", "ns2")
+
+        self.assertEqual([p.metadata.name for p in result], ["b"])
+
+    def test_secrets_are_stored_without_their_values(self):
+        def make_secret(name, resource_version):
+            return client.V1Secret(data={"password": "c2VjcmV0"}, metadata=client.V1ObjectMeta(
+                name=name, namespace="ns1", resource_version=resource_version,
+                annotations={informers.LAST_APPLIED_ANNOTATION: '{"data": {"password": "c2VjcmV0"}}', "team": "a"}))
+        with patch.dict(informers.INFORMER_KINDS, {"secrets": (self.mock_api, "list_secret_for_all_namespaces")}):
+            informer = informers.Informer(MagicMock(), "secrets")
+        list_func = self.mock_api.return_value.list_secret_for_all_namespaces
+        list_func.return_value.items = [make_secret("listed", "1")]
+        list_func.return_value.metadata.resource_version = "1"
+        informer._relist()
+        self.mock_watch.return_value.stream.return_value = [{"type": "ADDED", "object": make_secret("watched", "2")}]
+        informer._watch_once()
+
+        for secret in informer.list():
+            self.assertEqual(secret.data, {"password": ""})
+            self.assertEqual(secret.metadata.annotations, {"team": "a"})
+
+    @patch("dashboard.src.informers.Informer.start")
+    @patch("dashboard.src.informers.configure_k8s")
+    def test_event_index_is_registered_apart_from_the_events_informer(self, mock_configure, mock_start):
+        self.addCleanup(informers.stop_informers)
+        patch.dict(informers.INFORMER_KINDS, {"events": (self.mock_api, "list_event_for_all_namespaces")}).start()
+
+        events = informers.get_informer("path", "ctx", "events")
+        index = informers.get_informer("path", "ctx", "events", factory=k8s_events.EventIndexInformer,
+                                       name=k8s_events.EVENT_INDEX_INFORMER)
+
+        self.assertIsNot(index, events)
+        self.assertIsInstance(index, k8s_events.EventIndexInformer)
+        self.assertIs(informers.get_informer("path", "ctx", "events"), events)
+
+
+# test cases for paginated list calls
+class ListPagesTests(TestCase):
+    def make_page(self, items, continue_token):
+        page = MagicMock(items=items)
+        page.metadata._continue = continue_token
+        return page
+
+    def test_follows_continue_tokens(self):
+        list_func = MagicMock(side_effect=[self.make_page([1, 2], "token-1"), self.make_page([3], None)])
+
+        result = list(utils.list_items(list_func, page_size=2, label_selector="app=web"))
+
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(list_func.call_args_list, [
+            call(limit=2, _continue=None, label_selector="app=web"),
+            call(limit=2, _continue="token-1", label_selector="app=web"),
+        ])
+
+    def test_pages_are_fetched_lazily(self):
+        list_func = MagicMock(side_effect=[self.make_page([1], "token-1"), self.make_page([2], "")])
+
+        pages = utils.list_pages(list_func)
+        next(pages)
+
+        list_func.assert_called_once()
+        self.assertEqual(len(list(pages)), 1)
+        self.assertEqual(list_func.call_count, 2)
+
+
+    def test_list_raw_decodes_json_pages(self):
+        first = MagicMock(data=json.dumps({"metadata": {"continue": "token-1"}, "items": [{"a": 1}]}).encode())
+        second = MagicMock(data=json.dumps({"metadata": {}, "items": [{"a": 2}]}).encode())
+        list_func = MagicMock(side_effect=[first, second])
+
+        result = list(utils.list_raw(list_func, page_size=1))
+
+        self.assertEqual(result, [{"a": 1}, {"a": 2}])
+        self.assertEqual(list_func.call_args_list[1], call(limit=1, _continue="token-1", _preload_content=False))
+        first.release_conn.assert_called_once()
+
+
+# test cases for the dashboard cluster snapshot
+@patch("dashboard.src.cluster_snapshot.cached_items", return_value=None)
+@patch("dashboard.src.cluster_snapshot.client.CustomObjectsApi")
+@patch("dashboard.src.cluster_snapshot.configure_k8s")
+class ClusterSnapshotTests(TestCase):
+    def setUp(self):
+        self.mock_core_api = MagicMock()
+        self.mock_apps_api = MagicMock()
+        self.mock_batch_api = MagicMock()
+        apis = {"CoreV1Api": self.mock_core_api, "AppsV1Api": self.mock_apps_api, "BatchV1Api": self.mock_batch_api}
+        kinds = {kind: (apis[api_class.__name__], list_all, list_namespaced)
+                 for kind, (api_class, list_all, list_namespaced) in cluster_snapshot.SNAPSHOT_KINDS.items()}
+        patcher = patch.dict(cluster_snapshot.SNAPSHOT_KINDS, kinds)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lists_each_kind_once(self, mock_configure, mock_custom_api, mock_cached_items):
+        self.mock_core_api.return_value.list_node.return_value.items = [MagicMock()]
+        self.mock_core_api.return_value.list_namespaced_pod.return_value.items = [MagicMock(), MagicMock()]
+
+        snapshot = cluster_snapshot.ClusterSnapshot("path", "ctx", "default").fetch()
+
+        self.assertEqual(len(snapshot.get("nodes")), 1)
+        self.assertEqual(len(snapshot.get("pods")), 2)
+        self.assertEqual(snapshot.errors, {})
+        # Node metrics come from the shared node metrics fetch, not the snapshot
+        mock_custom_api.return_value.list_cluster_custom_object.assert_not_called()
+        self.mock_core_api.return_value.list_node.assert_called_once()
+        self.mock_core_api.return_value.list_namespaced_pod.assert_called_once()
+        self.mock_core_api.return_value.list_pod_for_all_namespaces.assert_not_called()
+        for method in ("list_namespaced_deployment", "list_namespaced_daemon_set",
+                       "list_namespaced_replica_set", "list_namespaced_stateful_set"):
+            getattr(self.mock_apps_api.return_value, method).assert_called_once()
+        self.mock_batch_api.return_value.list_namespaced_job.assert_called_once()
+        self.mock_batch_api.return_value.list_namespaced_cron_job.assert_called_once()
+
+    def test_failed_kind_is_recorded(self, mock_configure, mock_custom_api, mock_cached_items):
+        self.mock_batch_api.return_value.list_job_for_all_namespaces.side_effect = ApiException(status=403)
+
+        snapshot = cluster_snapshot.ClusterSnapshot("path", "ctx").fetch()
+
+        self.assertIn("jobs", snapshot.errors)
+        self.assertEqual(snapshot.items["jobs"], [])
+        with self.assertRaises(ApiException):
+            snapshot.get("jobs")
+
+
+# test cases for the stale-while-revalidate view cache
+def list_pods(path, context):
+    return ["pod-a"]
+
+@override_settings(K8S_VIEW_CACHE_TTL=10, K8S_VIEW_CACHE_STALE_TTL=60)
+class ViewCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch("dashboard.src.view_cache._refresh_executor")
+        self.mock_executor = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fetch = MagicMock(wraps=list_pods, __module__=__name__, __qualname__="list_pods")
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.assertEqual(view_cache.cached_result(1, "all", self.fetch, "path", "ctx"), ["pod-a"])
+        self.assertEqual(view_cache.cached_result(1, "all", self.fetch, "path", "ctx"), ["pod-a"])
+
+        self.fetch.assert_called_once_with("path", "ctx")
+        self.mock_executor.submit.assert_not_called()
+
+    def test_entries_are_per_cluster_and_namespace(self):
+        view_cache.cached_result(1, "all", self.fetch, "path", "ctx")
+        view_cache.cached_result(2, "all", self.fetch, "path", "ctx")
+        view_cache.cached_result(1, "default", self.fetch, "path", "ctx")
+
+        self.assertEqual(self.fetch.call_count, 3)
+
+    def test_entries_are_per_arguments(self):
+        view_cache.cached_result(1, "all", self.fetch, "path", "ctx")
+        view_cache.cached_result(1, "all", self.fetch, "other-path", "ctx")
+        view_cache.cached_result(1, "all", self.fetch, "path", "other-ctx")
+
+        self.assertEqual(self.fetch.call_count, 3)
+
+    def test_stale_entry_is_served_while_one_refresh_runs(self):
+        view_cache.cached_result(1, "all", self.fetch, "path", "ctx")
+
+        with patch("dashboard.src.view_cache.time.time", return_value=time.time() + 30):
+            self.assertEqual(view_cache.cached_result(1, "all", self.fetch, "path", "ctx"), ["pod-a"])
+            self.assertEqual(view_cache.cached_result(1, "all", self.fetch, "path", "ctx"), ["pod-a"])
+
+        self.fetch.assert_called_once()
+        self.mock_executor.submit.assert_called_once()
+        # Running the refresh fetches again and releases the refresh lock
+        refresh, *args = self.mock_executor.submit.call_args[0]
+        refresh(*args)
+        self.assertEqual(self.fetch.call_count, 2)
+        self.assertIsNone(cache.get(f"{args[0]}:refreshing"))
+
+    @override_settings(K8S_VIEW_CACHE_TTL=0)
+    def test_zero_ttl_disables_cache(self):
+        view_cache.cached_result(1, "all", self.fetch, "path", "ctx")
+        view_cache.cached_result(1, "all", self.fetch, "path", "ctx")
+
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_entry_version_changes_when_rebuilt(self):
+        version, value = view_cache.cached_entry(1, "all", self.fetch, "path", "ctx")
+        self.assertEqual((view_cache.cached_entry(1, "all", self.fetch, "path", "ctx")), (version, value))
+
+        refresh_time = time.time() + 30
+        with patch("dashboard.src.view_cache.time.time", return_value=refresh_time):
+            view_cache.cached_entry(1, "all", self.fetch, "path", "ctx")
+            refresh, *args = self.mock_executor.submit.call_args[0]
+            refresh(*args)
+
+        self.assertNotEqual(view_cache.cached_entry(1, "all", self.fetch, "path", "ctx")[0], version)
+
+
+# test cases for the cached cluster rows used by every page
+class ClusterCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.kube_config = KubeConfig.objects.create(path="/kube/config", path_type="manual")
+        self.cluster = Cluster.objects.create(cluster_name="dev", context_name="dev-ctx", kube_config=self.kube_config)
+
+    def test_cluster_names_are_cached(self):
+        self.assertEqual(clusters_DB.get_cluster_names(), [{"cluster_name": "dev", "id": self.cluster.id}])
+        with self.assertNumQueries(0):
+            clusters_DB.get_cluster_names()
+
+    def test_cluster_save_and_delete_invalidate_names(self):
+        clusters_DB.get_cluster_names()
+        other = Cluster.objects.create(cluster_name="prod", context_name="prod-ctx", kube_config=self.kube_config)
+        self.assertEqual(len(clusters_DB.get_cluster_names()), 2)
+
+        other.delete()
+        self.assertEqual(len(clusters_DB.get_cluster_names()), 1)
+
+    def test_cluster_is_cached_with_kube_config(self):
+        clusters_DB.get_cluster(self.cluster.id)
+        with self.assertNumQueries(0):
+            cluster = clusters_DB.get_cluster(self.cluster.id)
+            self.assertEqual(cluster.kube_config.path, "/kube/config")
+
+    def test_kube_config_save_invalidates_its_clusters(self):
+        clusters_DB.get_cluster(self.cluster.id)
+        self.kube_config.path = "/kube/other"
+        self.kube_config.save()
+
+        self.assertEqual(clusters_DB.get_cluster(self.cluster.id).kube_config.path, "/kube/other")
+
+    def test_missing_cluster_raises(self):
+        with self.assertRaises(Cluster.DoesNotExist):
+            clusters_DB.get_cluster(self.cluster.id + 999)
+
+
+class NamespaceInformerTests(TestCase):
+    @override_settings(K8S_INFORMERS_ENABLED=False, K8S_NAMESPACE_INFORMER_ENABLED=True)
+    @patch("dashboard.src.informers.get_informer")
+    def test_namespaces_use_informer_when_others_disabled(self, mock_get_informer):
+        mock_get_informer.return_value.wait_for_sync.return_value = True
+        mock_get_informer.return_value.list.return_value = ["ns"]
+
+        self.assertEqual(informers.cached_items("path", "ctx", "namespaces"), ["ns"])
+        self.assertIsNone(informers.cached_items("path", "ctx", "pods"))
+
+    @override_settings(K8S_NAMESPACE_INFORMER_ENABLED=True)
+    @patch("dashboard.src.informers.get_informer", side_effect=ConfigException("no kubeconfig"))
+    def test_unavailable_informer_falls_back(self, mock_get_informer):
+        self.assertIsNone(informers.cached_items("path", "ctx", "namespaces"))
+
+    @patch.dict(informers.INFORMER_KINDS, {"namespaces": (MagicMock(), "list_namespace")})
+    def test_failed_initial_list_does_not_block(self):
+        informer = informers.Informer(MagicMock(), "namespaces")
+        informer._list_func.side_effect = ApiException(status=500)
+        patcher = patch("dashboard.src.informers.RETRY_BACKOFF_SECONDS", 60)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        informer.start()
+        self.addCleanup(informer.stop)
+
+        self.assertFalse(informer.wait_for_sync(5))
+        self.assertTrue(informer._listed_once.is_set())
+
+
+
+class RowIndexTests(TestCase):
+    def setUp(self):
+        self.index = list_api.RowIndex([
+            {"namespace": "default", "name": "api", "status": "Running", "age": "2h", "restarts": 3},
+            {"namespace": "default", "name": "worker", "status": "Failed", "age": "5m", "restarts": None},
+            {"namespace": "prod", "name": "api", "status": "Running", "age": "1d", "restarts": 0},
+        ])
+
+    def test_select_intersects_namespace_and_status(self):
+        self.assertEqual(self.index.select(namespace="default", status="Running"), [0])
+        self.assertEqual(self.index.select(status="Running"), [0, 2])
+        self.assertEqual(self.index.select(namespace="missing"), [])
+
+    def test_select_by_name_and_keys(self):
+        self.assertEqual(self.index.select(name="API"), [0, 2])
+        self.assertEqual(self.index.select(keys={("prod", "api")}), [2])
+
+    def test_sort_orders_ages_by_duration_and_missing_values_last(self):
+        positions = self.index.select()
+        self.assertEqual(self.index.sort(positions, "age"), [1, 0, 2])
+        self.assertEqual(self.index.sort(positions, "restarts"), [2, 0, 1])
+        self.assertEqual(self.index.sort(positions, "age", descending=True), [2, 0, 1])
+        self.assertEqual(self.index.sort(positions, "restarts", descending=True), [0, 2, 1])
+
+    def test_select_several_namespaces(self):
+        self.assertEqual(self.index.select(namespace=["prod", "default"]), [0, 1, 2])
+        self.assertEqual(self.index.select(namespace=["prod"], status="Running"), [2])
+
+    def test_query_results_are_remembered(self):
+        with patch.object(self.index, "select", wraps=self.index.select) as mock_select:
+            first = self.index.query(namespace=["default"], sort="-age")
+            again = self.index.query(namespace=["default"], sort="-age")
+
+        self.assertEqual(first, [0, 1])
+        self.assertIs(again, first)
+        mock_select.assert_called_once()
+
+    @override_settings(K8S_VIEW_CACHE_TTL=60)
+    def test_row_index_is_kept_until_rows_are_refetched(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        fetch = MagicMock(return_value=[{"namespace": "default", "name": "api"}], __module__=__name__, __qualname__="fetch_rows")
+        with patch.dict(list_api.LIST_RESOURCES, {"pods": fetch}):
+            index = list_api.row_index(7, "pods", "path", "ctx")
+            self.assertIs(list_api.row_index(7, "pods", "path", "ctx"), index)
+
+            cache.clear()
+            self.assertIsNot(list_api.row_index(7, "pods", "path", "ctx"), index)
+        self.assertEqual(fetch.call_count, 2)
+
+    @override_settings(K8S_VIEW_CACHE_TTL=0)
+    @patch.dict(list_api._indexes, clear=True)
+    def test_row_index_has_its_own_ttl_without_the_view_cache(self):
+        fetch = MagicMock(return_value=[{"namespace": "default", "name": "api"}], __module__=__name__, __qualname__="fetch_rows")
+        with patch.dict(list_api.LIST_RESOURCES, {"pods": fetch}):
+            index = list_api.row_index(7, "pods", "path", "ctx")
+            self.assertIs(list_api.row_index(7, "pods", "path", "ctx"), index)
+
+            with patch("dashboard.src.list_api.time.monotonic", return_value=time.monotonic() + list_api.INDEX_TTL):
+                self.assertIsNot(list_api.row_index(7, "pods", "path", "ctx"), index)
+        self.assertEqual(fetch.call_count, 2)
+
+    @patch("dashboard.src.list_api.configure_k8s")
+    @patch("dashboard.src.list_api.list_raw")
+    def test_label_selected_keys(self, mock_list_raw, mock_configure_k8s):
+        mock_list_raw.return_value = iter([{"metadata": {"namespace": "default", "name": "api"}}])
+
+        keys = list_api.label_selected_keys("path", "ctx", "pods", "app=api")
+
+        self.assertEqual(keys, {("default", "api")})
+        self.assertEqual(mock_list_raw.call_args.kwargs, {"label_selector": "app=api"})
+
+
+class ListEngineTests(TestCase):
+    def test_project_reads_paths_and_callables_with_one_timestamp(self):
+        now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        objects = [MagicMock(), MagicMock()]
+        for index, obj in enumerate(objects):
+            obj.metadata.name = f"obj-{index}"
+            obj.metadata.creation_timestamp = now - timedelta(hours=index + 1)
+        seen = []
+        columns = list_engine.compile_columns((
+            ("name", "metadata.name"),
+            ("age", lambda obj, now: seen.append(now) or now - obj.metadata.creation_timestamp),
+        ))
+
+        rows = list_engine.project(objects, columns, now)
+
+        self.assertEqual(rows, [{"name": "obj-0", "age": timedelta(hours=1)},
+                                {"name": "obj-1", "age": timedelta(hours=2)}])
+        self.assertEqual(seen, [now, now])
+
+    def test_project_defaults_to_current_time(self):
+        columns = list_engine.compile_columns((("now", lambda obj, now: now),))
+
+        rows = list_engine.project([object()], columns)
+
+        self.assertLess(datetime.now(timezone.utc) - rows[0]["now"], timedelta(seconds=5))
+
+
+class DetailPageTests(TestCase):
+    def test_fetch_detail_reads_object_once(self):
+        obj = MagicMock()
+        read = MagicMock(return_value=obj)
+        describe = MagicMock(return_value={"name": "web"})
+        render_yaml = MagicMock(side_effect=lambda managed_fields, o: f"yaml managed={managed_fields}")
+
+        detail = detail_page.fetch_detail(read, describe, render_yaml)
+
+        read.assert_called_once_with()
+        describe.assert_called_once_with(obj)
+        render_yaml.assert_has_calls([call(True, obj), call(False, obj)])
+        self.assertEqual(detail, {"describe": {"name": "web"}, "yaml": "yaml managed=True",
+                                  "edit": "yaml managed=False"})
+
+    def test_fetch_detail_without_renderer_only_describes(self):
+        detail = detail_page.fetch_detail(MagicMock(), MagicMock(return_value={"name": "web"}))
+
+        self.assertEqual(detail, {"describe": {"name": "web"}})
+
+    def test_fetch_tab_dispatches_yaml_and_side_tabs(self):
+        render_yaml, logs = MagicMock(return_value="kind: Pod"), MagicMock(return_value="log lines")
+        with patch.dict(detail_page.DETAIL_TABS, {"pods": (render_yaml, {"logs": logs})}):
+            self.assertEqual(detail_page.fetch_tab("path", "ctx", "pods", "default", "web", "edit"), "kind: Pod")
+            self.assertEqual(detail_page.fetch_tab("path", "ctx", "pods", "default", "web", "logs"), "log lines")
+            self.assertEqual(detail_page.tab_names("pods"), {"yaml", "edit", "logs"})
+
+        render_yaml.assert_called_once_with("path", "ctx", "default", "web", False)
+        logs.assert_called_once_with("path", "ctx", "default", "web")
+
+    def test_fetch_tab_omits_namespace_for_cluster_scoped_kinds(self):
+        render_yaml = MagicMock(return_value="kind: Node")
+        with patch.dict(detail_page.DETAIL_TABS, {"nodes": (render_yaml, {})}):
+            detail_page.fetch_tab("path", "ctx", "nodes", None, "node-1", "yaml")
+
+        render_yaml.assert_called_once_with("path", "ctx", "node-1", True)
+        self.assertEqual(detail_page.tab_names("unknown"), set())
+
+    def test_config_network_storage_and_rbac_kinds_have_lazy_tabs(self):
+        self.assertEqual(detail_page.tab_names("configmaps"), {"yaml", "edit", "events"})
+        self.assertEqual(detail_page.tab_names("clusterrolebindings"), {"yaml", "edit", "events"})
+        # No events helper for namespaces and PVs: only the YAML is deferred
+        self.assertEqual(detail_page.tab_names("namespaces"), {"yaml", "edit"})
+        self.assertEqual(detail_page.tab_names("persistentvolumes"), {"yaml", "edit"})
+
+    @patch("dashboard.src.workloads.k8s_pods.configure_k8s")
+    @patch("dashboard.src.workloads.k8s_pods.client.CoreV1Api")
+    def test_prefetched_pod_is_not_read_again(self, mock_core_api, mock_configure):
+        mock_configure.return_value.sanitize_for_serialization.return_value = {"metadata": {"name": "web"}}
+        pod = MagicMock()
+
+        k8s_pods.get_pod_yaml("path", "ctx", "default", "web", True, pod)
+        k8s_pods.get_pod_description("path", "ctx", "default", "web", pod)
+
+        mock_core_api.return_value.read_namespaced_pod.assert_not_called()
+        mock_configure.return_value.sanitize_for_serialization.assert_called_once_with(pod)
+
+
+class PodLogsTests(TestCase):
+    def test_log_options_converts_and_validates(self):
+        options = pod_logs.log_options({"container": "app", "tail_lines": "50", "previous": "true", "since_seconds": ""})
+
+        self.assertEqual(options, {"container": "app", "tail_lines": 50, "previous": True})
+        with self.assertRaises(ValueError):
+            pod_logs.log_options({"limit_bytes": "-1"})
+
+    @override_settings(K8S_POD_LOG_TAIL_LINES=1000, K8S_POD_LOG_LIMIT_BYTES=4096)
+    def test_bounded_log_options(self):
+        self.assertEqual(pod_logs.bounded_log_options({}), {"tail_lines": 1000, "limit_bytes": 4096})
+        self.assertEqual(pod_logs.bounded_log_options({"since_seconds": 60, "limit_bytes": 10 ** 9}),
+                         {"since_seconds": 60, "limit_bytes": 4096})
+        self.assertEqual(pod_logs.bounded_log_options({}, follow=True), {"tail_lines": 1000})
+
+    def test_read_pod_log_retries_with_default_container(self):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.side_effect = [ApiException(status=400), "sidecar logs"]
+        pod = v1.read_namespaced_pod.return_value
+        pod.spec.containers = [MagicMock(), MagicMock()]
+        pod.metadata.annotations = {"kubectl.kubernetes.io/default-container": "sidecar"}
+
+        self.assertEqual(pod_logs.read_pod_log(v1, "default", "web", tail_lines=10), "sidecar logs")
+        v1.read_namespaced_pod_log.assert_called_with(name="web", namespace="default", container="sidecar", tail_lines=10)
+
+    def test_read_pod_log_reraises_for_single_container_pods(self):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.side_effect = ApiException(status=400)
+        v1.read_namespaced_pod.return_value.spec.containers = [MagicMock()]
+
+        with self.assertRaises(ApiException):
+            pod_logs.read_pod_log(v1, "default", "web")
+
+    @patch("dashboard.src.pod_logs.MAX_LINE_BYTES", 4)
+    def test_iter_lines_splits_chunks_and_long_lines(self):
+        lines = list(pod_logs.iter_lines([b"one\ntw", b"o\nlonglin", b"e"]))
+
+        self.assertEqual(lines, ["one", "two", "long", "line"])
+
+    @patch("dashboard.src.pod_logs.configure_k8s")
+    @patch("dashboard.src.pod_logs.client.CoreV1Api")
+    def test_stream_pod_log_reads_chunks_and_closes(self, mock_core_api, mock_configure):
+        response = mock_core_api.return_value.read_namespaced_pod_log.return_value
+        response.stream.return_value = iter([b"a\nb\n"])
+
+        lines = pod_logs.stream_pod_log("path", "ctx", "default", "web", bounded=False, tail_lines=5)
+
+        self.assertEqual(list(lines), ["a", "b"])
+        mock_core_api.return_value.read_namespaced_pod_log.assert_called_once_with(
+            name="web", namespace="default", follow=False, _preload_content=False, tail_lines=5)
+        response.close.assert_called_once_with()
+        response.release_conn.assert_called_once_with()
+
+    @staticmethod
+    def _response(*chunks, quiet=False):
+        # A followed log response; a quiet one times out after its chunks
+        def stream(size):
+            yield from chunks
+            if quiet:
+                raise ReadTimeoutError(None, None, "Read timed out.")
+        response = MagicMock()
+        response.stream.side_effect = stream
+        return response
+
+    def test_follow_log_reads_with_a_timeout_and_strips_timestamps(self):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.return_value = self._response(b"t1 a\nt2 b\n")
+
+        lines = pod_logs.follow_log(v1, "default", "web", tail_lines=5)
+
+        self.assertEqual(list(lines), ["a", "b"])
+        v1.read_namespaced_pod_log.assert_called_once_with(
+            name="web", namespace="default", follow=True, timestamps=True, _preload_content=False,
+            _request_timeout=(pod_logs.KEEPALIVE_SECONDS, pod_logs.KEEPALIVE_SECONDS), tail_lines=5)
+
+    def test_quiet_follow_sends_a_keepalive_and_skips_lines_already_emitted(self):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.side_effect = [
+            self._response(b"t1 one\nt2 two\nt2 three\n", quiet=True),
+            self._response(b"t1 one\nt2 two\nt2 three\nt2 four\nt3 five\n")]
+
+        lines = list(pod_logs.follow_log(v1, "default", "web", timestamps=True, tail_lines=10))
+
+        self.assertEqual(lines, ["t1 one", "t2 two", "t2 three", pod_logs.KEEPALIVE, "t2 four", "t3 five"])
+        first, reopened = [call.kwargs for call in v1.read_namespaced_pod_log.call_args_list]
+        self.assertEqual(first["tail_lines"], 10)
+        self.assertNotIn("tail_lines", reopened)
+        self.assertGreaterEqual(reopened["since_seconds"], 1)
+
+    def test_sse_events_reports_a_failed_reopen(self):
+        def lines():
+            yield "first"
+            raise ApiException(status=404, reason="Not Found")
+
+        self.assertEqual(list(pod_logs.sse_events(lines())),
+                         ["data: first\n\n", "event: error\ndata: Log stream interrupted\n\n"])
+
+    def test_sse_events_turns_keepalives_into_comments(self):
+        self.assertEqual(list(pod_logs.sse_events(["first", pod_logs.KEEPALIVE])),
+                         ["data: first\n\n", ": keepalive\n\n", "event: end\ndata: \n\n"])
+
+    def test_sse_events(self):
+        self.assertEqual(list(pod_logs.sse_events(["first\r", "second"])),
+                         ["data: first\n\n", "data: second\n\n", "event: end\ndata: \n\n"])
+
+
+class WorkloadLogsTests(TestCase):
+    @staticmethod
+    def _lines(*lines):
+        # A real generator, like stream_pod_log returns, so the reader can close it
+        yield from lines
+
+    def test_selector_string(self):
+        selector = MagicMock(match_labels={"app": "web"}, match_expressions=[
+            MagicMock(key="tier", operator="In", values=["a", "b"]),
+            MagicMock(key="canary", operator="DoesNotExist", values=None)])
+
+        self.assertEqual(workload_logs.selector_string(selector), "app=web,tier in (a,b),!canary")
+
+    def test_timestamp_key_pads_fractions(self):
+        self.assertLess(workload_logs.timestamp_key("2024-01-01T00:00:00Z"),
+                        workload_logs.timestamp_key("2024-01-01T00:00:00.1Z"))
+        self.assertLess(workload_logs.timestamp_key("2024-01-01T00:00:00.09Z"),
+                        workload_logs.timestamp_key("2024-01-01T00:00:00.1Z"))
+
+    @patch("dashboard.src.workload_logs.list_items")
+    @patch("dashboard.src.workload_logs.client.CoreV1Api")
+    @patch("dashboard.src.workload_logs.configure_k8s")
+    def test_workload_pods_uses_the_workload_selector(self, mock_configure, mock_core_api, mock_list_items):
+        apps_api = MagicMock()
+        apps_api.return_value.read_namespaced_deployment.return_value.spec.selector = MagicMock(
+            match_labels={"app": "web"}, match_expressions=None)
+        mock_list_items.return_value = [MagicMock(**{"metadata.name": "web-b"}), MagicMock(**{"metadata.name": "web-a"})]
+
+        with patch.dict(workload_logs.WORKLOAD_KINDS, {"deployments": (apps_api, "read_namespaced_deployment")}):
+            pods = workload_logs.workload_pods("path", "ctx", "deployments", "default", "web")
+
+        self.assertEqual(pods, ["web-a", "web-b"])
+        mock_list_items.assert_called_once_with(mock_core_api.return_value.list_namespaced_pod,
+                                                namespace="default", label_selector="app=web")
+
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_merge_interleaves_by_timestamp(self, mock_stream):
+        logs = {"a": self._lines("2024-01-01T00:00:01Z a1", "2024-01-01T00:00:03Z a2"),
+                "b": self._lines("2024-01-01T00:00:02Z b1", "2024-01-01T00:00:04Z b2")}
+        mock_stream.side_effect = lambda path, context, namespace, pod, **kwargs: logs[pod]
+
+        merged = list(workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b"], timestamps=True))
+
+        self.assertEqual([message for _, _, message in merged], ["a1", "b1", "a2", "b2"])
+        self.assertEqual(mock_stream.call_args.kwargs, {"follow": False, "timestamps": True,
+                                                        "read_timeout": workload_logs.FOLLOW_READ_TIMEOUT})
+
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_merge_reports_unavailable_pods(self, mock_stream):
+        def stream(path, context, namespace, pod, **kwargs):
+            if pod == "b":
+                raise ApiException(status=400, reason="container is waiting")
+            return self._lines("2024-01-01T00:00:01Z a1")
+        mock_stream.side_effect = stream
+
+        merged = list(workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b"]))
+
+        self.assertEqual(merged, [("", "b", "[log unavailable: container is waiting]"),
+                                  ("2024-01-01T00:00:01Z", "a", "a1")])
+
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_follow_emits_every_line(self, mock_stream):
+        mock_stream.side_effect = lambda path, context, namespace, pod, **kwargs: self._lines(f"t {pod}1", f"t {pod}2")
+
+        merged = list(workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b", "c"], follow=True))
+
+        self.assertEqual(sorted(message for _, _, message in merged), ["a1", "a2", "b1", "b2", "c1", "c2"])
+
+    @staticmethod
+    def _quiet(*lines):
+        # A followed log that goes quiet: its reads time out after its lines
+        yield from lines
+        while True:
+            time.sleep(0.01)
+            yield pod_logs.KEEPALIVE
+
+    @patch("dashboard.src.workload_logs._readers", threading.BoundedSemaphore(2))
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_followed_readers_stop_after_the_consumer_closes(self, mock_stream):
+        mock_stream.side_effect = lambda path, context, namespace, pod, **kwargs: self._quiet(f"t1 {pod}1")
+
+        merged = workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b"], follow=True)
+        next(merged)
+        merged.close()
+
+        for thread in threading.enumerate():
+            if thread.name in ("pod-log-a", "pod-log-b"):
+                thread.join(timeout=5)
+                self.assertFalse(thread.is_alive())
+        # Both reader slots were given back
+        self.assertTrue(workload_logs._readers.acquire(blocking=False))
+        self.assertTrue(workload_logs._readers.acquire(blocking=False))
+        self.assertEqual(mock_stream.call_args.kwargs["read_timeout"], workload_logs.FOLLOW_READ_TIMEOUT)
+
+    @patch("dashboard.src.workload_logs.KEEPALIVE_SECONDS", 0.01)
+    @patch("dashboard.src.workload_logs._readers", threading.BoundedSemaphore(2))
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_quiet_follow_sends_keepalives_and_stops_on_disconnect(self, mock_stream):
+        mock_stream.side_effect = lambda path, context, namespace, pod, **kwargs: self._quiet()
+
+        events = pod_logs.sse_events(workload_logs.format_lines(
+            workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b"], follow=True)))
+        self.assertEqual(next(events), ": keepalive\n\n")
+        # The viewer has gone: the server closes the stream when the keepalive write fails
+        events.close()
+
+        for thread in threading.enumerate():
+            if thread.name in ("pod-log-a", "pod-log-b"):
+                thread.join(timeout=5)
+                self.assertFalse(thread.is_alive())
+        self.assertTrue(workload_logs._readers.acquire(blocking=False))
+        self.assertTrue(workload_logs._readers.acquire(blocking=False))
+
+    @patch("dashboard.src.workload_logs.READER_WAIT", 0.2)
+    @patch("dashboard.src.workload_logs._readers", threading.BoundedSemaphore(1))
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_reader_wait_is_shared_by_all_pods(self, mock_stream):
+        workload_logs._readers.acquire()
+        started = time.monotonic()
+
+        merged = list(workload_logs.merge_pod_logs("path", "ctx", "default", ["a", "b", "c", "d"]))
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(len(merged), 4)
+        mock_stream.assert_not_called()
+
+    @patch("dashboard.src.workload_logs.READER_WAIT", 0)
+    @patch("dashboard.src.workload_logs._readers", threading.BoundedSemaphore(1))
+    @patch("dashboard.src.workload_logs.stream_pod_log")
+    def test_pods_beyond_the_reader_limit_are_skipped(self, mock_stream):
+        workload_logs._readers.acquire()
+
+        merged = list(workload_logs.merge_pod_logs("path", "ctx", "default", ["a"]))
+
+        self.assertEqual(merged, [("", "a", "[log skipped: too many logs are being read]")])
+        mock_stream.assert_not_called()
+
+    @override_settings(K8S_POD_LOG_TAIL_LINES=2)
+    @patch("dashboard.src.workload_logs.merge_pod_logs")
+    @patch("dashboard.src.workload_logs.workload_pods", return_value=["a", "b"])
+    def test_get_workload_logs_keeps_the_merged_tail(self, mock_pods, mock_merge):
+        mock_merge.return_value = iter([("t1", "a", "one"), ("t2", "b", "two"), ("t3", "a", "three")])
+
+        logs = workload_logs.get_workload_logs("path", "ctx", "default", "web", resource="jobs")
+
+        self.assertEqual(logs, "[b] two\n[a] three")
+        mock_pods.assert_called_once_with("path", "ctx", "jobs", "default", "web")
+
+
+class LogSearchTests(TestCase):
+    def test_grep_lines_returns_matches_with_context(self):
+        lines = ["start", "ok", "ERROR one", "retry", "ok", "ok", "ERROR two"]
+
+        matches = list(log_search.grep_lines(lines, re.compile("ERROR"), context=1))
+
+        self.assertEqual(matches, [
+            {"line_number": 3, "line": "ERROR one", "before": ["ok"], "after": ["retry"]},
+            {"line_number": 7, "line": "ERROR two", "before": ["ok"], "after": []},
+        ])
+
+    def test_grep_lines_stops_reading_at_the_match_cap(self):
+        lines = iter(["ERROR 1", "after 1", "ERROR 2", "never read"])
+
+        matches = list(log_search.grep_lines(lines, re.compile("ERROR"), context=1, max_matches=1))
+
+        self.assertEqual([match["line"] for match in matches], ["ERROR 1"])
+        self.assertEqual(list(lines), ["ERROR 2", "never read"])
+
+    def test_grep_lines_stops_at_the_deadline(self):
+        lines = iter(["ERROR 1", "ERROR 2", "ERROR past the deadline", "never read"])
+
+        with patch("dashboard.src.log_search.time.monotonic", side_effect=[0, 0, 5]):
+            matches = list(log_search.grep_lines(lines, re.compile("ERROR"), deadline=5))
+
+        self.assertEqual([match["line"] for match in matches], ["ERROR 1", "ERROR 2"])
+        self.assertEqual(list(lines), ["never read"])
+
+    def test_compile_pattern_is_literal_unless_regex_is_set(self):
+        literal, is_literal = log_search.compile_pattern("a.c[")
+        self.assertTrue(is_literal)
+        self.assertTrue(literal.search("x a.c[ y"))
+        self.assertIsNone(literal.search("abc["))
+
+        regex, is_literal = log_search.compile_pattern("a.c", regex=True, ignore_case=True)
+        self.assertFalse(is_literal)
+        self.assertTrue(regex.search("ABC"))
+
+        # A regex that does not compile is searched for as written
+        fallback, is_literal = log_search.compile_pattern("(unclosed", regex=True)
+        self.assertTrue(is_literal)
+        self.assertTrue(fallback.search("call(unclosed"))
+
+        with self.assertRaises(ValueError):
+            log_search.compile_pattern("x" * (log_search.MAX_PATTERN_LENGTH + 1))
+
+    @override_settings(K8S_LOG_SEARCH_LIMIT_BYTES=1024)
+    @patch("dashboard.src.log_search.stream_pod_log")
+    def test_search_pod_streams_the_window_and_closes(self, mock_stream):
+        lines = MagicMock()
+        lines.__iter__.return_value = iter(["boom", "fine"])
+        mock_stream.return_value = lines
+
+        result = log_search.search_pod("path", "ctx", "default", "web", re.compile("boom"), 600, 0, 5, container="app")
+
+        self.assertEqual(result, {"pod": "web", "truncated": False,
+                                  "matches": [{"line_number": 1, "line": "boom", "before": [], "after": []}]})
+        mock_stream.assert_called_once_with("path", "ctx", "default", "web", bounded=False, since_seconds=600,
+                                            limit_bytes=1024, container="app")
+        lines.close.assert_called_once_with()
+
+    @patch("dashboard.src.log_search.stream_pod_log")
+    def test_search_logs_keeps_pods_with_matches_or_errors(self, mock_stream):
+        def stream(path, context, namespace, pod, **kwargs):
+            if pod == "c":
+                raise ApiException(status=400, reason="container is waiting")
+            return (line for line in (["boom"] if pod == "a" else ["fine"]))
+        mock_stream.side_effect = stream
+
+        results = log_search.search_logs("path", "ctx", "default", ["a", "b", "c"], re.compile("boom"), 600, 0, 1)
+
+        self.assertEqual([result["pod"] for result in results], ["a", "c"])
+        self.assertTrue(results[0]["truncated"])
+        self.assertEqual(results[1]["error"], "container is waiting")
+
+    @patch("dashboard.src.log_search.list_items")
+    @patch("dashboard.src.log_search.client.CoreV1Api")
+    @patch("dashboard.src.log_search.configure_k8s")
+    def test_namespace_pods_skips_pending_pods(self, mock_configure, mock_core_api, mock_list_items):
+        mock_list_items.return_value = [MagicMock(**{"metadata.name": "web", "status.phase": "Running"}),
+                                        MagicMock(**{"metadata.name": "new", "status.phase": "Pending"})]
+
+        self.assertEqual(log_search.namespace_pods("path", "ctx", "default", "app=web"), ["web"])
+        mock_list_items.assert_called_once_with(mock_core_api.return_value.list_namespaced_pod,
+                                                namespace="default", label_selector="app=web")
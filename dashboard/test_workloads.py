@@ -1,7 +1,9 @@
 import io
+import json
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, mock_open
 from django.http import HttpResponse
+from django.test.utils import override_settings
 from dashboard.src.generate_pdf import generate_pdf
 from .src.workloads.k8s_cronjobs import (
     getCronJobCount, getCronJobsStatus, getCronJobsList,
@@ -34,21 +36,7 @@ from dashboard.src.workloads.k8s_statefulset import (
     getStatefulsetCount, getStatefulsetStatus, getStatefulsetList,
     get_statefulset_description, get_sts_events, get_yaml_sts
 )
-from dashboard.src.dashData import (
-    fetch_dashboard_data,
-    fetch_nodes_status,
-    fetch_nodes,
-    fetch_pods_status,
-    fetch_pods,
-    fetch_deployments,
-    fetch_daemonsets,
-    fetch_replicasets,
-    fetch_statefulsets,
-    fetch_jobs,
-    fetch_cronjobs,
-    fetch_metrics,
-    fetch_events,
-)
+from dashboard.src.dashData import fetch_dashboard_data, fetch_event_trends, fetch_metrics
 from dashboard.src.k8s_cluster_metric import get_metrics
 from datetime import datetime, timezone, timedelta
 import os
@@ -58,11 +46,12 @@ from kubernetes.client.exceptions import ApiException
 
 class TestCronJobFunctions(TestCase):
 
-    @patch('dashboard.src.workloads.k8s_cronjobs.config.load_kube_config')
+    @patch('dashboard.src.workloads.k8s_cronjobs.configure_k8s')
     @patch('dashboard.src.workloads.k8s_cronjobs.client.BatchV1Api')
-    def test_get_cronjob_count(self, mock_batch_api, mock_config):
+    def test_get_cronjob_count(self, mock_batch_api, mock_configure):
         mock_batch_api.return_value.list_cron_job_for_all_namespaces.return_value.items = [1, 2, 3]
-        count = getCronJobCount()
+        count = getCronJobCount('p', 'c')
+        mock_batch_api.assert_called_once_with(mock_configure.return_value)
         self.assertEqual(count, 3)
 
     @patch('dashboard.src.workloads.k8s_cronjobs.configure_k8s')
@@ -266,15 +255,15 @@ class TestDeploymentFunctions(TestCase):
     @patch('dashboard.src.workloads.k8s_deployments.client.AppsV1Api')
     @patch('dashboard.src.workloads.k8s_deployments.calculateAge', return_value='1d')
     def test_get_deployments_info(self, mock_age, mock_apps_api, mock_configure):
-        deployment = MagicMock()
-        deployment.metadata.namespace = 'default'
-        deployment.metadata.name = 'test-deploy'
-        deployment.status.ready_replicas = 2
-        deployment.spec.replicas = 3
-        deployment.spec.template.spec.containers = [MagicMock(image='nginx:latest')]
-        deployment.metadata.creation_timestamp = datetime.now(timezone.utc)
+        deployment = {
+            'metadata': {'namespace': 'default', 'name': 'test-deploy',
+                         'creationTimestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')},
+            'spec': {'replicas': 3, 'template': {'spec': {'containers': [{'image': 'nginx:latest'}]}}},
+            'status': {'readyReplicas': 2},
+        }
 
-        mock_apps_api.return_value.list_deployment_for_all_namespaces.return_value.items = [deployment]
+        mock_apps_api.return_value.list_deployment_for_all_namespaces.return_value.data = json.dumps(
+            {'metadata': {}, 'items': [deployment]}).encode()
         result = getDeploymentsInfo('path', 'context')
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['name'], 'test-deploy')
@@ -360,10 +349,9 @@ class TestDeploymentFunctions(TestCase):
         self.assertIn('metadata:', result)
         self.assertEqual(yaml.safe_load(result)['metadata']['name'], 'mydeploy')
 
-    @patch('dashboard.src.workloads.k8s_deployments.config.load_incluster_config')
-    @patch('dashboard.src.workloads.k8s_deployments.config.load_kube_config')
+    @patch('dashboard.src.workloads.k8s_deployments.configure_k8s')
     @patch('dashboard.src.workloads.k8s_deployments.client.AppsV1Api')
-    def test_get_deployment_details(self, mock_api, mock_kube_config, mock_incluster_config):
+    def test_get_deployment_details(self, mock_api, mock_configure):
         deployment = MagicMock()
         deployment.metadata.name = 'mydeploy'
         deployment.metadata.namespace = 'default'
@@ -373,7 +361,8 @@ class TestDeploymentFunctions(TestCase):
         deployment.metadata.creation_timestamp = datetime.now(timezone.utc)
 
         mock_api.return_value.list_deployment_for_all_namespaces.return_value.items = [deployment]
-        result = get_deployment_details()
+        result = get_deployment_details('p', 'c')
+        mock_api.assert_called_once_with(mock_configure.return_value)
         self.assertEqual(result[0]['name'], 'mydeploy')
         
 class TestK8sJobs(TestCase):
@@ -493,9 +482,9 @@ class TestK8sJobs(TestCase):
         self.assertIn('metadata:', result)
         self.assertEqual(yaml.safe_load(result)['metadata']['name'], 'job1')
 
-    @patch('dashboard.src.workloads.k8s_jobs.config.load_kube_config')
+    @patch('dashboard.src.workloads.k8s_jobs.configure_k8s')
     @patch('dashboard.src.workloads.k8s_jobs.client.BatchV1Api')
-    def test_get_job_details(self, mock_batch_api, mock_load_config):
+    def test_get_job_details(self, mock_batch_api, mock_configure):
         job = MagicMock()
         job.metadata.name = 'job1'
         job.metadata.namespace = 'default'
@@ -506,7 +495,7 @@ class TestK8sJobs(TestCase):
 
         mock_batch_api.return_value.list_job_for_all_namespaces.return_value.items = [job]
 
-        result = get_job_details()
+        result = get_job_details('p', 'c')
         self.assertEqual(result[0]['name'], 'job1')
         self.assertEqual(result[0]['namespace'], 'default')
         
@@ -560,17 +549,15 @@ class TestK8sPods(TestCase):
         # Use env var for pod_ip with safe fallback
         os.environ.setdefault("TEST_POD_IP", "127.0.0.1")
 
-        pod = MagicMock()
-        pod.metadata.name = 'pod1'
-        pod.metadata.namespace = 'default'
-        pod.metadata.creation_timestamp = datetime.now(timezone.utc) - timedelta(days=1)
-        pod.spec.node_name = 'node1'
-        pod.status.pod_ip = os.getenv("TEST_POD_IP")
-        pod.status.container_statuses = []
-        pod.spec.containers = []
-        pod.status.phase = "Running"
+        pod = {
+            'metadata': {'name': 'pod1', 'namespace': 'default',
+                         'creationTimestamp': (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')},
+            'spec': {'nodeName': 'node1', 'containers': []},
+            'status': {'podIP': os.getenv("TEST_POD_IP"), 'containerStatuses': [], 'phase': "Running"},
+        }
 
-        mock_core_api.return_value.list_pod_for_all_namespaces.return_value.items = [pod]
+        mock_core_api.return_value.list_pod_for_all_namespaces.return_value.data = json.dumps(
+            {'metadata': {}, 'items': [pod]}).encode()
 
         result = get_pod_info('p', 'c')
         self.assertEqual(result[0]['name'], 'pod1')
@@ -630,6 +617,7 @@ class TestK8sPods(TestCase):
     def test_get_pod_events(self, mock_core_api, mock_configure):
         event = MagicMock()
         event.involved_object.name = 'pod1'
+        event.involved_object.kind = 'Pod'
         event.reason = 'Scheduled'
         event.message = 'Pod scheduled on node'
 
@@ -645,6 +633,7 @@ class TestK8sPods(TestCase):
         pod = MagicMock()
         pod.metadata.annotations = {}
         pod.to_dict.return_value = {'metadata': {'name': 'pod1'}}
+        mock_configure.return_value.sanitize_for_serialization.return_value = pod.to_dict.return_value
 
         mock_core_api.return_value.read_namespaced_pod.return_value = pod
 
@@ -652,9 +641,9 @@ class TestK8sPods(TestCase):
         self.assertIn('metadata:', result)
         self.assertEqual(yaml.safe_load(result)['metadata']['name'], 'pod1')
 
-    @patch('dashboard.src.workloads.k8s_pods.config.load_kube_config')
+    @patch('dashboard.src.workloads.k8s_pods.configure_k8s')
     @patch('dashboard.src.workloads.k8s_pods.client.CoreV1Api')
-    def test_get_pod_details(self, mock_core_api, mock_load_config):
+    def test_get_pod_details(self, mock_core_api, mock_configure):
         pod = MagicMock()
         pod.metadata.name = 'pod1'
         pod.metadata.namespace = 'default'
@@ -665,7 +654,8 @@ class TestK8sPods(TestCase):
 
         mock_core_api.return_value.list_pod_for_all_namespaces.return_value.items = [pod]
 
-        result = get_pod_details()
+        result = get_pod_details('p', 'c')
+        mock_core_api.assert_called_once_with(mock_configure.return_value)
         self.assertEqual(result[0]['name'], 'pod1')
         self.assertEqual(result[0]['status'], 'Running')
 
@@ -867,35 +857,39 @@ class TestStatefulSetFunctions(TestCase):
         
         
 class TestDashboardDataFetch(TestCase):
-    @patch("dashboard.src.dashData.fetch_nodes_status")
-    @patch("dashboard.src.dashData.fetch_nodes")
-    @patch("dashboard.src.dashData.fetch_pods_status")
-    @patch("dashboard.src.dashData.fetch_pods")
-    @patch("dashboard.src.dashData.fetch_deployments")
-    @patch("dashboard.src.dashData.fetch_daemonsets")
-    @patch("dashboard.src.dashData.fetch_replicasets")
-    @patch("dashboard.src.dashData.fetch_statefulsets")
-    @patch("dashboard.src.dashData.fetch_jobs")
-    @patch("dashboard.src.dashData.fetch_cronjobs")
-    @patch("dashboard.src.dashData.fetch_metrics")
+    @override_settings(K8S_VIEW_CACHE_TTL=0)
+    @patch("dashboard.src.dashData.k8s_node_metrics.get_node_metrics", return_value=({"error": "Not Found"}, 0, False))
     @patch("dashboard.src.dashData.fetch_events")
-    def test_fetch_dashboard_data(self, mock_events, mock_metrics, mock_cronjobs, mock_jobs,
-                                  mock_statefulsets, mock_replicasets, mock_daemonsets,
-                                  mock_deployments, mock_pods, mock_pods_status, mock_nodes,
-                                  mock_nodes_status):
-
-        # Set return values for each mock
-        mock_nodes_status.return_value = (1, 1, 2)
-        mock_nodes.return_value = ["node-a", "node-b"]
-        mock_pods_status.return_value = {"Running": 2, "Pending": 1}
-        mock_pods.return_value = (["pod-a", "pod-b"], 2)
-        mock_deployments.return_value = {"Running": 1, "Pending": 0, "Count": 1}
-        mock_daemonsets.return_value = {"Running": 1, "Pending": 0, "Count": 1}
-        mock_replicasets.return_value = {"Running": 1, "Pending": 0, "Count": 1}
-        mock_statefulsets.return_value = {"Running": 1, "Pending": 0, "Count": 1}
-        mock_jobs.return_value = {"Completed": 1, "Failed": 0, "Count": 1}
-        mock_cronjobs.return_value = {"Count": 1, "Active": 0}
-        mock_metrics.return_value = {"cpu": "ok"}
+    @patch("dashboard.src.dashData.ClusterSnapshot")
+    def test_fetch_dashboard_data(self, mock_snapshot_cls, mock_events, mock_node_metrics):
+        def make_node(name, ready):
+            node = MagicMock()
+            node.metadata.name = name
+            node.status.conditions = [MagicMock(type="Ready", status="True" if ready else "False")]
+            node.status.capacity = {"cpu": "4", "memory": "8388608Ki"}
+            return node
+
+        running_pod = MagicMock()
+        running_pod.status.phase = "Running"
+        running_pod.status.container_statuses = [MagicMock()]
+        pending_pod = MagicMock()
+        pending_pod.status.phase = "Pending"
+
+        ready_deployment = MagicMock()
+        ready_deployment.status.replicas = ready_deployment.status.ready_replicas = ready_deployment.status.available_replicas = 1
+
+        snapshot = mock_snapshot_cls.return_value.fetch.return_value
+        snapshot.items = {
+            "nodes": [make_node("node-a", True), make_node("node-b", False)],
+            "pods": [running_pod, pending_pod],
+            "deployments": [ready_deployment],
+            "daemonsets": [],
+            "replicasets": [],
+            "statefulsets": [],
+            "jobs": [],
+        }
+        snapshot.errors = {"cronjobs": Exception("forbidden")}
+        snapshot.get.side_effect = lambda kind: snapshot.items[kind]
         mock_events.return_value = "Mocked event log"
 
         result = fetch_dashboard_data(
@@ -910,13 +904,44 @@ class TestDashboardDataFetch(TestCase):
             warning_message="Test Warning"
         )
 
-        # Basic validations
+        mock_snapshot_cls.assert_called_once_with("dummy-path", "dummy-context", "default")
         self.assertEqual(result["ready_nodes"], 1)
+        self.assertEqual(result["not_ready_nodes"], 1)
+        self.assertEqual(result["node_list"], (["node-a", "node-b"], 2))
         self.assertEqual(result["pod_count"], 2)
+        self.assertEqual(result["status_count"]["Pending"], 1)
+        self.assertEqual(result["deployments_status"], {"Running": 1, "Pending": 0, "Count": 1})
+        self.assertEqual(result["cronjob_status"], [])
         self.assertEqual(result["warning"], "Test Warning")
-        self.assertEqual(result["metrics"], {"cpu": "ok"})
+        self.assertEqual(result["metrics"], {"error": "Failed to fetch endpoint details: Not Found"})
         self.assertEqual(result["events"], "Mocked event log")
         self.assertIn("replicaset_status", result)
+        mock_node_metrics.assert_called_once_with("dummy-path", "dummy-context")
+
+    def test_fetch_metrics_sums_node_rows(self):
+        rows = [{"name": "node-a", "cpu_cores": 2, "cpu_usage_nano": 500000000,
+                 "memory_usage_bytes": 512 * 1024 ** 2, "memory_capacity_bytes": 1024 ** 3},
+                {"name": "node-b", "error": "No metrics reported for this node"}]
+
+        self.assertEqual(fetch_metrics((rows, 2, True)),
+                         {"cpu_usage": 25.0, "memory_usage": 50.0, "cpu_total": 2, "memory_total": 1.0})
+
+    @patch("dashboard.src.dashData.k8s_events.get_event_index")
+    def test_fetch_event_trends_reads_event_index(self, mock_get_index):
+        index = mock_get_index.return_value
+        index.histogram.return_value = [(datetime(2024, 1, 1, 9, 59), 1), (datetime(2024, 1, 1, 10, 0), 4)]
+        index.top.return_value = [{"namespace": "default", "object": "Pod/web", "reason": "BackOff", "count": 5}]
+
+        history, top = fetch_event_trends("dummy-path", "dummy-context", "default")
+
+        self.assertEqual(history, {"labels": ["09:59", "10:00"], "counts": [1, 4]})
+        self.assertEqual(top, index.top.return_value)
+        index.histogram.assert_called_once_with("Warning", namespace="default")
+        index.top.assert_called_once_with("Warning", namespace="default")
+
+    @patch("dashboard.src.dashData.k8s_events.get_event_index", return_value=None)
+    def test_fetch_event_trends_without_index(self, mock_get_index):
+        self.assertEqual(fetch_event_trends("dummy-path", "dummy-context", "all"), (None, None))
         
         
 class TestGeneratePDF(TestCase):
@@ -11,7 +11,9 @@ from dashboard.views import dashboard, pods, nodes, replicasets, deployments, po
                                 secret_info, role_info, pv_info, storageclass_info, role_binding_info, \
                                 clusterrole_info, cluster_role_binding_info, service_accountInfo, \
                                 pod_metrics, node_metrics, pdb, pdb_info, np, np_info, ingress, \
-                                ingress_info, execute_command, generate_reports, kube_bench_report, cluster_hotspot, k8sgpt_view
+                                ingress_info, execute_command, generate_reports, kube_bench_report, cluster_hotspot, k8sgpt_view, \
+                                resource_list_api, detail_tab, pod_logs_stream, workload_logs_stream, pod_log_search, events_stream, \
+                                metrics_history
 
 urlpatterns = [
     # Dashboard
@@ -40,6 +42,9 @@ urlpatterns = [
     path('<int:cluster_id>/cronjobs', cronjobs, name="cronjobs"),
     
     path('<int:cluster_id>/pods/<str:namespace>/<str:pod_name>/', pod_info, name='pod_info'),
+    path('<int:cluster_id>/pods/<str:namespace>/<str:pod_name>/logs/', pod_logs_stream, name='pod_logs_stream'),
+    path('<int:cluster_id>/workloads/<str:resource>/<str:namespace>/<str:name>/logs/', workload_logs_stream, name='workload_logs_stream'),
+    path('<int:cluster_id>/logs/search/', pod_log_search, name='pod_log_search'),
     path('<int:cluster_id>/replicasets/<str:namespace>/<str:rs_name>/', rs_info, name='rs_info'),
     path('<int:cluster_id>/deployments/<str:namespace>/<str:deploy_name>/', deploy_info, name='deploy_info'),
     path('<int:cluster_id>/statefulsets/<str:namespace>/<str:sts_name>/', sts_info, name='sts_info'),
@@ -50,6 +55,7 @@ urlpatterns = [
     
     # Events
     path('<int:cluster_id>/events', events, name='events'),
+    path('<int:cluster_id>/events/stream/', events_stream, name='events_stream'),
     path('events/', events, name='events'),
     
     # ConfigMap & Secrets
@@ -115,5 +121,13 @@ urlpatterns = [
     # Pod Metrics
     path('<int:cluster_id>/pod_metrics', pod_metrics, name="pod_metrics"),
     path('<int:cluster_id>/node_metrics', node_metrics, name="node_metrics"),
+    path('<int:cluster_id>/metrics/history/<str:kind>/', metrics_history, name="metrics_history"),
+
+    # List API
+    path('<int:cluster_id>/api/<str:resource>/', resource_list_api, name="resource_list_api"),
+
+    # Detail page tabs
+    path('<int:cluster_id>/tabs/<str:resource>/<str:namespace>/<str:name>/<str:tab>/', detail_tab, name="detail_tab"),
+    path('<int:cluster_id>/tabs/<str:resource>/<str:name>/<str:tab>/', detail_tab, name="cluster_detail_tab"),
     
 ]
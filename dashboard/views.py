@@ -1,23 +1,26 @@
 import subprocess, os
+from functools import partial
+from urllib.parse import urlencode
 
 from django.shortcuts import render
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
+from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseServerError, HttpResponse, FileResponse
+from django.http import HttpResponseServerError, HttpResponse, FileResponse, StreamingHttpResponse
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import redirect
+from django.conf import settings
 
 from .src.cluster_management import k8s_namespaces, k8s_nodes, k8s_limit_range, k8s_resource_quota, k8s_pdb
 from .src.services import k8s_endpoints, k8s_services
-from .src.events import k8s_events
+from .src.events import k8s_events, event_stream
 from .src.networking import k8s_np, k8s_ingress
 from .src.config_secrets import k8s_configmaps, k8s_secrets
 from .src.workloads import k8s_cronjobs, k8s_daemonset, k8s_deployments, k8s_jobs, k8s_pods, k8s_replicaset, k8s_statefulset
 from .src.persistent_volume import k8s_pv, k8s_pvc, k8s_storage_class
 from .src.rbac import k8s_role, k8s_cluster_role_bindings, k8s_cluster_roles, k8s_rolebindings, k8s_service_accounts
-from .src.metrics import k8s_pod_metrics, k8s_node_metrics
-from .src import dashData, clusters_DB, k8sgpt
+from .src.metrics import k8s_pod_metrics, k8s_node_metrics, metrics_sampler
+from .src import dashData, clusters_DB, k8sgpt, list_api, detail_page, pod_logs, workload_logs, log_search
 from .src.cluster_hotspot import get_cluster_hotspot
 
 from main.models import Cluster
@@ -36,11 +39,12 @@ from django.template.loader import get_template
 from .src.generate_pdf import generate_pdf
 from .src import kube_bench
 from .src.utils import validate_and_patch_resource
+from .src.view_cache import cached_result
 ###### Utilities ######
 
 def get_utils_data(request):
     cluster_id = request.GET.get('cluster_id')
-    current_cluster = Cluster.objects.get(id = cluster_id)
+    current_cluster = clusters_DB.get_cluster(cluster_id)
     
     path = current_cluster.kube_config.path
     registered_clusters = clusters_DB.get_cluster_names()
@@ -68,25 +72,26 @@ def dashboard(request, cluster_id):
 
 def pods(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    pods, pc = k8s_pods.getpods(path, context_name)
-    pod_info_list = k8s_pods.get_pod_info(path, current_cluster.context_name)
-    status_count = k8s_pods.getPodsStatus(path, current_cluster.context_name)
+    pods, pc = cached_result(cluster_id, "all", k8s_pods.getpods, path, context_name)
+    pod_info_list = cached_result(cluster_id, "all", k8s_pods.get_pod_info, path, current_cluster.context_name)
+    status_count = cached_result(cluster_id, "all", k8s_pods.getPodsStatus, path, current_cluster.context_name)
+    # Only the first page is rendered; the table pages through resource_list_api from there
     return render(request, 'dashboard/workloads/pods.html', { "pods": pods, "pc": pc,
                                                    "cluster_id": cluster_id,
-                                                   "pod_info_list": pod_info_list, "status_count": status_count,
+                                                   "pod_info_list": pod_info_list[:list_api.DEFAULT_PAGE_SIZE],
+                                                   "pod_rows": len(pod_info_list), "page_size": list_api.DEFAULT_PAGE_SIZE,
+                                                   "status_count": status_count,
                                                    "registered_clusters": registered_clusters, "namespaces": namespaces, 'current_cluster': current_cluster})
 
 
 def pod_info(request, cluster_id, namespace, pod_name):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    pod_info = {
-        "describe": k8s_pods.get_pod_description(path, context_name, namespace, pod_name),
-        "logs": k8s_pods.get_pod_logs(path, context_name, namespace, pod_name),
-        "events": k8s_pods.get_pod_events(path, context_name, namespace, pod_name) or "< None >",
-        "yaml": k8s_pods.get_pod_yaml(path, context_name, namespace, pod_name, managed_fields=True),
-        "edit": k8s_pods.get_pod_yaml(path, context_name, namespace, pod_name, managed_fields=False),
-    }
+    read = partial(k8s_pods.read_pod, path, context_name, namespace, pod_name)
+    render_yaml = partial(k8s_pods.get_pod_yaml, path, context_name, namespace, pod_name)
+    pod_info = detail_page.fetch_detail(
+        read, partial(k8s_pods.get_pod_description, path, context_name, namespace, pod_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -100,33 +105,31 @@ def pod_info(request, cluster_id, namespace, pod_name):
             pod_info["changes"] = ret["changes"]
             pod_info["message"] = ret["message"]
             
-        new_yaml = k8s_pods.get_pod_yaml(path, context_name, namespace, pod_name, managed_fields=True)
-        new_edit = k8s_pods.get_pod_yaml(path, context_name, namespace, pod_name, managed_fields=False)
-        pod_info["yaml"] = new_yaml
-        pod_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        pod_info["yaml"], pod_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/pod_info.html', {"pod_info": pod_info, "cluster_id": cluster_id,
+    return render(request, 'dashboard/workloads/pod_info.html', {"pod_info": pod_info, "cluster_id": cluster_id, "namespace": namespace,
                                                         "pod_name": pod_name,
                                                         "registered_clusters": registered_clusters, 'current_cluster': current_cluster})
 
 
 def replicasets(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    rs_status = k8s_replicaset.getReplicasetStatus(path, context_name)
-    replicaset_info_list = k8s_replicaset.getReplicaSetsInfo(path, context_name)
-    return render(request, 'dashboard/workloads/replicasets.html', {"cluster_id": cluster_id, "replicaset_info_list": replicaset_info_list,
+    rs_status = cached_result(cluster_id, "all", k8s_replicaset.getReplicasetStatus, path, context_name)
+    replicaset_info_list = cached_result(cluster_id, "all", k8s_replicaset.getReplicaSetsInfo, path, context_name)
+    return render(request, 'dashboard/workloads/replicasets.html', {"cluster_id": cluster_id, "replicaset_info_list": replicaset_info_list[:list_api.DEFAULT_PAGE_SIZE],
+                                                          "replicaset_rows": len(replicaset_info_list), "page_size": list_api.DEFAULT_PAGE_SIZE,
                                                           "rs_status": rs_status,
                                                           "registered_clusters": registered_clusters, "namespaces": namespaces, 'current_cluster': current_cluster})
 
 
 def rs_info(request, cluster_id, namespace, rs_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    rs_info = {
-        "describe": k8s_replicaset.get_replicaset_description(path, context_name, namespace, rs_name),
-        "events": k8s_replicaset.get_replicaset_events(path, context_name, namespace, rs_name),
-        "yaml": k8s_replicaset.get_yaml_rs(path, context_name, namespace, rs_name, managed_fields=True),
-        "edit": k8s_replicaset.get_yaml_rs(path, context_name, namespace, rs_name, managed_fields=False),
-    }
+    read = partial(k8s_replicaset.read_replicaset, path, context_name, namespace, rs_name)
+    render_yaml = partial(k8s_replicaset.get_yaml_rs, path, context_name, namespace, rs_name)
+    rs_info = detail_page.fetch_detail(
+        read, partial(k8s_replicaset.get_replicaset_description, path, context_name, namespace, rs_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -140,31 +143,29 @@ def rs_info(request, cluster_id, namespace, rs_name):
             rs_info["changes"] = ret["changes"]
             rs_info["message"] = ret["message"]
             
-        new_yaml = k8s_replicaset.get_yaml_rs(path, context_name, namespace, rs_name, managed_fields=True)
-        new_edit = k8s_replicaset.get_yaml_rs(path, context_name, namespace, rs_name, managed_fields=False)
-        rs_info["yaml"] = new_yaml
-        rs_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        rs_info["yaml"], rs_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/rs_info.html', {"rs_info": rs_info, "cluster_id": cluster_id, "rs_name": rs_name, 
+    return render(request, 'dashboard/workloads/rs_info.html', {"rs_info": rs_info, "cluster_id": cluster_id, "namespace": namespace, "rs_name": rs_name, 
                                                                 "registered_clusters": registered_clusters, 'current_cluster': current_cluster})
 
 
 def deployments(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    dep_status = k8s_deployments.getDeploymentsStatus(path, context_name)
-    deployment_info_list = k8s_deployments.getDeploymentsInfo(path, context_name)
-    return render(request, 'dashboard/workloads/deployment.html', {"cluster_id": cluster_id, "dep_status": dep_status, "deployment_info_list": deployment_info_list,
+    dep_status = cached_result(cluster_id, "all", k8s_deployments.getDeploymentsStatus, path, context_name)
+    deployment_info_list = cached_result(cluster_id, "all", k8s_deployments.getDeploymentsInfo, path, context_name)
+    return render(request, 'dashboard/workloads/deployment.html', {"cluster_id": cluster_id, "dep_status": dep_status, "deployment_info_list": deployment_info_list[:list_api.DEFAULT_PAGE_SIZE],
+                                                                "deployment_rows": len(deployment_info_list), "page_size": list_api.DEFAULT_PAGE_SIZE,
                                                                 "registered_clusters": registered_clusters, "namespaces": namespaces, 'current_cluster': current_cluster})
 
 
 def deploy_info(request, cluster_id, namespace, deploy_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    deploy_info = {
-        "describe": k8s_deployments.get_deployment_description(path, context_name, namespace, deploy_name),
-        "events": k8s_deployments.get_deploy_events(path, context_name, namespace, deploy_name),
-        "yaml": k8s_deployments.get_yaml_deploy(path, context_name, namespace, deploy_name, managed_fields=True),
-        "edit": k8s_deployments.get_yaml_deploy(path, context_name, namespace, deploy_name, managed_fields=False),
-    }
+    read = partial(k8s_deployments.read_deployment, path, context_name, namespace, deploy_name)
+    render_yaml = partial(k8s_deployments.get_yaml_deploy, path, context_name, namespace, deploy_name)
+    deploy_info = detail_page.fetch_detail(
+        read, partial(k8s_deployments.get_deployment_description, path, context_name, namespace, deploy_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -178,33 +179,31 @@ def deploy_info(request, cluster_id, namespace, deploy_name):
             deploy_info["changes"] = ret["changes"]
             deploy_info["message"] = ret["message"]
             
-        new_yaml = k8s_deployments.get_yaml_deploy(path, context_name, namespace, deploy_name, managed_fields=True)
-        new_edit = k8s_deployments.get_yaml_deploy(path, context_name, namespace, deploy_name, managed_fields=False)
-        deploy_info["yaml"] = new_yaml
-        deploy_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        deploy_info["yaml"], deploy_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/deploy_info.html', {"deploy_info": deploy_info, "cluster_id": cluster_id, "deploy_name": deploy_name, 
+    return render(request, 'dashboard/workloads/deploy_info.html', {"deploy_info": deploy_info, "cluster_id": cluster_id, "namespace": namespace, "deploy_name": deploy_name, 
                                                                     "registered_clusters": registered_clusters, 'current_cluster': current_cluster})
 
 
 def statefulsets(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    statefulsets_status = k8s_statefulset.getStatefulsetStatus(path, context_name)
-    statefulsets_list = k8s_statefulset.getStatefulsetList(path, context_name)
+    statefulsets_status = cached_result(cluster_id, "all", k8s_statefulset.getStatefulsetStatus, path, context_name)
+    statefulsets_list = cached_result(cluster_id, "all", k8s_statefulset.getStatefulsetList, path, context_name)
 
     return render(request, 'dashboard/workloads/statefulsets.html', {'cluster_id': cluster_id,
-                                                                     'statefulsets_list': statefulsets_list, 'statefulsets_status': statefulsets_status,
+                                                                     'statefulsets_list': statefulsets_list[:list_api.DEFAULT_PAGE_SIZE], 'statefulsets_status': statefulsets_status,
+                                                                     'statefulset_rows': len(statefulsets_list), 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                      'registered_clusters': registered_clusters,'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def sts_info(request, cluster_id, namespace, sts_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    sts_info = {
-        "describe": k8s_statefulset.get_statefulset_description(path, context_name, namespace, sts_name),
-        "events": k8s_statefulset.get_sts_events(path, context_name, namespace, sts_name),
-        "yaml": k8s_statefulset.get_yaml_sts(path, context_name, namespace, sts_name, managed_fields = True),
-        "edit": k8s_statefulset.get_yaml_sts(path, context_name, namespace, sts_name, managed_fields = False)
-    }
+    read = partial(k8s_statefulset.read_statefulset, path, context_name, namespace, sts_name)
+    render_yaml = partial(k8s_statefulset.get_yaml_sts, path, context_name, namespace, sts_name)
+    sts_info = detail_page.fetch_detail(
+        read, partial(k8s_statefulset.get_statefulset_description, path, context_name, namespace, sts_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -218,33 +217,31 @@ def sts_info(request, cluster_id, namespace, sts_name):
             sts_info["changes"] = ret["changes"]
             sts_info["message"] = ret["message"]
             
-        new_yaml = k8s_statefulset.get_yaml_sts(path, context_name, namespace, sts_name, managed_fields=True)
-        new_edit = k8s_statefulset.get_yaml_sts(path, context_name, namespace, sts_name, managed_fields=False)
-        sts_info["yaml"] = new_yaml
-        sts_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        sts_info["yaml"], sts_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
     
-    return render(request, 'dashboard/workloads/sts_info.html', {"sts_info": sts_info,"cluster_id": cluster_id,
+    return render(request, 'dashboard/workloads/sts_info.html', {"sts_info": sts_info,"cluster_id": cluster_id, "namespace": namespace,
                                                                  "sts_name": sts_name, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
 
 
 def daemonset(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    daemonset_status = k8s_daemonset.getDaemonsetStatus(path, context_name)
-    daemonset_list = k8s_daemonset.getDaemonsetList(path, context_name)
+    daemonset_status = cached_result(cluster_id, "all", k8s_daemonset.getDaemonsetStatus, path, context_name)
+    daemonset_list = cached_result(cluster_id, "all", k8s_daemonset.getDaemonsetList, path, context_name)
     
     return render(request, 'dashboard/workloads/daemonset.html',{'cluster_id': cluster_id,
-                                                                 'daemonset_status': daemonset_status, 'daemonset_list': daemonset_list,
+                                                                 'daemonset_status': daemonset_status, 'daemonset_list': daemonset_list[:list_api.DEFAULT_PAGE_SIZE],
+                                                                 'daemonset_rows': len(daemonset_list), 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                  'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def daemonset_info(request, cluster_id, namespace, daemonset_name):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    ds_info = {
-        "describe": k8s_daemonset.get_daemonset_description(path, context_name, namespace, daemonset_name),
-        "events": k8s_daemonset.get_daemonset_events(path, context_name, namespace, daemonset_name),
-        "yaml": k8s_daemonset.get_daemonset_yaml(path, context_name, namespace, daemonset_name, managed_fields = True),
-        "edit": k8s_daemonset.get_daemonset_yaml(path, context_name, namespace, daemonset_name, managed_fields = False)
-    }
+    read = partial(k8s_daemonset.read_daemonset, path, context_name, namespace, daemonset_name)
+    render_yaml = partial(k8s_daemonset.get_daemonset_yaml, path, context_name, namespace, daemonset_name)
+    ds_info = detail_page.fetch_detail(
+        read, partial(k8s_daemonset.get_daemonset_description, path, context_name, namespace, daemonset_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -258,32 +255,30 @@ def daemonset_info(request, cluster_id, namespace, daemonset_name):
             ds_info["changes"] = ret["changes"]
             ds_info["message"] = ret["message"]
             
-        new_yaml = k8s_daemonset.get_daemonset_yaml(path, context_name, namespace, daemonset_name, managed_fields=True)
-        new_edit = k8s_daemonset.get_daemonset_yaml(path, context_name, namespace, daemonset_name, managed_fields=False)
-        ds_info["yaml"] = new_yaml
-        ds_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        ds_info["yaml"], ds_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/daemonset_info.html', {"daemonset_info": ds_info, "cluster_id": cluster_id,
+    return render(request, 'dashboard/workloads/daemonset_info.html', {"daemonset_info": ds_info, "cluster_id": cluster_id, "namespace": namespace,
                                                                        "daemonset_name": daemonset_name, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
 
 
 def jobs(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    jobs_status = k8s_jobs.getJobsStatus(path, context_name)
-    jobs_list = k8s_jobs.getJobsList(path, context_name)
+    jobs_status = cached_result(cluster_id, "all", k8s_jobs.getJobsStatus, path, context_name)
+    jobs_list = cached_result(cluster_id, "all", k8s_jobs.getJobsList, path, context_name)
 
     return render(request, 'dashboard/workloads/jobs.html',{'cluster_id': cluster_id, 'jobs_status': jobs_status,
-                                                            'jobs_list': jobs_list, 'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
+                                                            'jobs_list': jobs_list[:list_api.DEFAULT_PAGE_SIZE], 'job_rows': len(jobs_list), 'page_size': list_api.DEFAULT_PAGE_SIZE,
+                                                            'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def jobs_info(request, cluster_id, namespace, job_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    job_info = {
-        "describe": k8s_jobs.get_job_description(path, context_name, namespace, job_name),
-        "events": k8s_jobs.get_job_events(path, context_name, namespace, job_name),
-        "yaml": k8s_jobs.get_yaml_job(path, context_name, namespace, job_name, managed_fields=True),
-        "edit": k8s_jobs.get_yaml_job(path, context_name, namespace, job_name, managed_fields=False)
-    }
+    read = partial(k8s_jobs.read_job, path, context_name, namespace, job_name)
+    render_yaml = partial(k8s_jobs.get_yaml_job, path, context_name, namespace, job_name)
+    job_info = detail_page.fetch_detail(
+        read, partial(k8s_jobs.get_job_description, path, context_name, namespace, job_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -297,33 +292,31 @@ def jobs_info(request, cluster_id, namespace, job_name):
             job_info["changes"] = ret["changes"]
             job_info["message"] = ret["message"]
             
-        new_yaml = k8s_jobs.get_yaml_job(path, context_name, namespace, job_name, managed_fields=True)
-        new_edit = k8s_jobs.get_yaml_job(path, context_name, namespace, job_name, managed_fields=False)
-        job_info["yaml"] = new_yaml
-        job_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        job_info["yaml"], job_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/job_info.html', { "job_info": job_info, "cluster_id": cluster_id,
+    return render(request, 'dashboard/workloads/job_info.html', { "job_info": job_info, "cluster_id": cluster_id, "namespace": namespace,
                                                                  "job_name": job_name, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
 
 
 def cronjobs(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    cronjobs_status = k8s_cronjobs.getCronJobsStatus(path, context_name)
-    cronjobs_list = k8s_cronjobs.getCronJobsList(path, context_name)
+    cronjobs_status = cached_result(cluster_id, "all", k8s_cronjobs.getCronJobsStatus, path, context_name)
+    cronjobs_list = cached_result(cluster_id, "all", k8s_cronjobs.getCronJobsList, path, context_name)
 
     return render(request, 'dashboard/workloads/cronjobs.html', {'cluster_id': cluster_id,
                                                                  'registered_clusters': registered_clusters, 'cronjobs_status': cronjobs_status,
-                                                                 'cronjobs_list': cronjobs_list, 'namespaces': namespaces, 'current_cluster': current_cluster})
+                                                                 'cronjobs_list': cronjobs_list[:list_api.DEFAULT_PAGE_SIZE], 'cronjob_rows': len(cronjobs_list),
+                                                                 'page_size': list_api.DEFAULT_PAGE_SIZE, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 def cronjob_info(request, cluster_id, namespace, cronjob_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    cronjob_info = {
-        "describe": k8s_cronjobs.get_cronjob_description(path, context_name, namespace, cronjob_name),
-        "events": k8s_cronjobs.get_cronjob_events(path, context_name, namespace, cronjob_name),
-        "yaml": k8s_cronjobs.get_yaml_cronjob(path, context_name, namespace, cronjob_name, managed_fields=True),
-        "edit": k8s_cronjobs.get_yaml_cronjob(path, context_name, namespace, cronjob_name, managed_fields=False)
-    }
+    read = partial(k8s_cronjobs.read_cronjob, path, context_name, namespace, cronjob_name)
+    render_yaml = partial(k8s_cronjobs.get_yaml_cronjob, path, context_name, namespace, cronjob_name)
+    cronjob_info = detail_page.fetch_detail(
+        read, partial(k8s_cronjobs.get_cronjob_description, path, context_name, namespace, cronjob_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -337,12 +330,10 @@ def cronjob_info(request, cluster_id, namespace, cronjob_name):
             cronjob_info["changes"] = ret["changes"]
             cronjob_info["message"] = ret["message"]
             
-        new_yaml = k8s_cronjobs.get_yaml_cronjob(path, context_name, namespace, cronjob_name, managed_fields=True)
-        new_edit = k8s_cronjobs.get_yaml_cronjob(path, context_name, namespace, cronjob_name, managed_fields=False)
-        cronjob_info["yaml"] = new_yaml
-        cronjob_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        cronjob_info["yaml"], cronjob_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/workloads/cronjob_info.html', {"cronjob_info": cronjob_info, "cluster_id": cluster_id,
+    return render(request, 'dashboard/workloads/cronjob_info.html', {"cronjob_info": cronjob_info, "cluster_id": cluster_id, "namespace": namespace,
                                                                      "cronjob_name": cronjob_name, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
 
 ############ CLUSTER MANAGEMENT SECTION ############
@@ -353,20 +344,20 @@ def namespace(request, cluster_id):
     path = current_cluster.kube_config.path
 
     registered_clusters = clusters_DB.get_cluster_names()
-    namespaces = k8s_namespaces.namespaces_data(path, current_cluster.context_name)
+    namespaces = cached_result(cluster_id, "all", k8s_namespaces.namespaces_data, path, current_cluster.context_name)
     namespaces_count = len(namespaces)
 
     return render(request, 'dashboard/cluster_management/namespace.html',{'cluster_id': cluster_id,
-                                                                          'registered_clusters': registered_clusters, 'namespaces': namespaces, 'namespaces_count': namespaces_count, 'current_cluster': current_cluster})
+                                                                          'registered_clusters': registered_clusters, 'namespaces': namespaces[:list_api.DEFAULT_PAGE_SIZE], 'namespaces_count': namespaces_count,
+                                                                          'namespace_rows': namespaces_count, 'page_size': list_api.DEFAULT_PAGE_SIZE, 'current_cluster': current_cluster})
 
 
 def ns_info(request, cluster_id, namespace):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    ns_info = {
-        "describe": k8s_namespaces.get_namespace_description(path, context_name, namespace),
-        "yaml": k8s_namespaces.get_namespace_yaml(path, context_name, namespace, managed_fields=True),
-        "edit": k8s_namespaces.get_namespace_yaml(path, context_name, namespace, managed_fields=False),
-    }
+    read = partial(k8s_namespaces.read_namespace, path, context_name, namespace)
+    render_yaml = partial(k8s_namespaces.get_namespace_yaml, path, context_name, namespace)
+    ns_info = detail_page.fetch_detail(read, partial(k8s_namespaces.get_namespace_description, path, context_name, namespace),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -380,10 +371,8 @@ def ns_info(request, cluster_id, namespace):
             ns_info["changes"] = ret["changes"]
             ns_info["message"] = ret["message"]
             
-        new_yaml = k8s_namespaces.get_namespace_yaml(path, context_name, namespace, managed_fields=True)
-        new_edit = k8s_namespaces.get_namespace_yaml(path, context_name, namespace, managed_fields=False)
-        ns_info["yaml"] = new_yaml
-        ns_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        ns_info["yaml"], ns_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/cluster_management/ns_info.html', {"ns_info": ns_info, "cluster_id": cluster_id,
                                                                          "namespace": namespace, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
@@ -392,21 +381,22 @@ def ns_info(request, cluster_id, namespace):
 def nodes(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    nodes = k8s_nodes.get_nodes_info(path, context_name)
-    ready_nodes, not_ready_nodes, total_nodes = k8s_nodes.get_nodes_status(path, context_name)
+    nodes = cached_result(cluster_id, "all", k8s_nodes.get_nodes_info, path, context_name)
+    ready_nodes, not_ready_nodes, total_nodes = cached_result(cluster_id, "all", k8s_nodes.get_nodes_status, path, context_name)
     
-    return render(request, 'dashboard/cluster_management/nodes.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'nodes': nodes, 
+    return render(request, 'dashboard/cluster_management/nodes.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'nodes': nodes[:list_api.DEFAULT_PAGE_SIZE],
+                                                                       'node_rows': len(nodes), 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                        'ready_nodes': ready_nodes, 'not_ready_nodes': not_ready_nodes, 'total_nodes': total_nodes, 'current_cluster': current_cluster})
 
 
 def node_info(request, cluster_id, node_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    node_info = {
-        "describe": k8s_nodes.get_node_description(path, context_name, node_name),
-        "yaml": k8s_nodes.get_node_yaml(path, context_name, node_name, managed_fields=True),
-        "edit": k8s_nodes.get_node_yaml(path, context_name, node_name, managed_fields=False)
-    }
+    read = partial(k8s_nodes.read_node, path, context_name, node_name)
+    render_yaml = partial(k8s_nodes.get_node_yaml, path, context_name, node_name)
+    node_info = detail_page.fetch_detail(
+        read, partial(k8s_nodes.get_node_description, path, context_name, node_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -420,10 +410,8 @@ def node_info(request, cluster_id, node_name):
             node_info["changes"] = ret["changes"]
             node_info["message"] = ret["message"]
             
-        new_yaml = k8s_nodes.get_node_yaml(path, context_name, node_name, managed_fields=True)
-        new_edit = k8s_nodes.get_node_yaml(path, context_name, node_name, managed_fields=False)
-        node_info["yaml"] = new_yaml
-        node_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        node_info["yaml"], node_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/cluster_management/node_info.html', {"node_info": node_info, "cluster_id": cluster_id, "node_name": node_name, 
                                                                            'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
@@ -432,7 +420,7 @@ def node_info(request, cluster_id, node_name):
 def limitrange(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    limitranges, total_limitranges = k8s_limit_range.get_limit_ranges(path, context_name)
+    limitranges, total_limitranges = cached_result(cluster_id, "all", k8s_limit_range.get_limit_ranges, path, context_name)
 
     return render(request, 'dashboard/cluster_management/limitrange.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'limitranges': limitranges, 
                                                                             'total_limitranges': total_limitranges, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -441,12 +429,10 @@ def limitrange(request, cluster_id):
 def limitrange_info(request, cluster_id, namespace, limitrange_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    limitrange_info = {
-        "describe": k8s_limit_range.get_limit_range_description(path, context_name, namespace, limitrange_name),
-        "events": k8s_limit_range.get_limitrange_events(path, context_name, namespace, limitrange_name),
-        "yaml": k8s_limit_range.get_limitrange_yaml(path, context_name, namespace, limitrange_name, managed_fields=True),
-        "edit": k8s_limit_range.get_limitrange_yaml(path, context_name, namespace, limitrange_name, managed_fields=False)
-    }
+    read = partial(k8s_limit_range.read_limit_range, path, context_name, namespace, limitrange_name)
+    render_yaml = partial(k8s_limit_range.get_limitrange_yaml, path, context_name, namespace, limitrange_name)
+    limitrange_info = detail_page.fetch_detail(read, partial(k8s_limit_range.get_limit_range_description, path, context_name, namespace, limitrange_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -460,19 +446,17 @@ def limitrange_info(request, cluster_id, namespace, limitrange_name):
             limitrange_info["changes"] = ret["changes"]
             limitrange_info["message"] = ret["message"]
             
-        new_yaml = k8s_limit_range.get_limitrange_yaml(path, context_name, namespace, limitrange_name, managed_fields=True)
-        new_edit = k8s_limit_range.get_limitrange_yaml(path, context_name, namespace, limitrange_name, managed_fields=False)
-        limitrange_info["yaml"] = new_yaml
-        limitrange_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        limitrange_info["yaml"], limitrange_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/cluster_management/limitrange_info.html', {"limitrange_info": limitrange_info, "cluster_id": cluster_id, "limitrange_name": limitrange_name, 
-                                                                                 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                                 'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 def resourcequotas(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    resourcequotas, total_quotas = k8s_resource_quota.get_resource_quotas(path, context_name)
+    resourcequotas, total_quotas = cached_result(cluster_id, "all", k8s_resource_quota.get_resource_quotas, path, context_name)
 
     return render(request, 'dashboard/cluster_management/resourcequotas.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'resourcequotas': resourcequotas, 
                                                                                 'total_quotas': total_quotas, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -481,12 +465,10 @@ def resourcequotas(request, cluster_id):
 def resourcequota_info(request, cluster_id, namespace, resourcequota_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    resourcequota_info = {
-        "describe": k8s_resource_quota.get_resourcequota_description(path, context_name, namespace, resourcequota_name),
-        "events": k8s_resource_quota.get_resourcequota_events(path, context_name, namespace, resourcequota_name),
-        "yaml": k8s_resource_quota.get_resourcequota_yaml(path, context_name, namespace, resourcequota_name, managed_fields=True),
-        "edit": k8s_resource_quota.get_resourcequota_yaml(path, context_name, namespace, resourcequota_name, managed_fields=False)
-    }
+    read = partial(k8s_resource_quota.read_resource_quota, path, context_name, namespace, resourcequota_name)
+    render_yaml = partial(k8s_resource_quota.get_resourcequota_yaml, path, context_name, namespace, resourcequota_name)
+    resourcequota_info = detail_page.fetch_detail(read, partial(k8s_resource_quota.get_resourcequota_description, path, context_name, namespace, resourcequota_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -500,19 +482,17 @@ def resourcequota_info(request, cluster_id, namespace, resourcequota_name):
             resourcequota_info["changes"] = ret["changes"]
             resourcequota_info["message"] = ret["message"]
             
-        new_yaml = k8s_resource_quota.get_resourcequota_yaml(path, context_name, namespace, resourcequota_name, managed_fields=True)
-        new_edit = k8s_resource_quota.get_resourcequota_yaml(path, context_name, namespace, resourcequota_name, managed_fields=False)
-        resourcequota_info["yaml"] = new_yaml
-        resourcequota_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        resourcequota_info["yaml"], resourcequota_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/cluster_management/resourcequota_info.html', {"resourcequota_info": resourcequota_info, "cluster_id": cluster_id, "resourcequota_name": resourcequota_name, 
-                                                                                    'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                                    'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 def pdb(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    pdbs, pdbs_count = k8s_pdb.get_pdb(path, context_name)
+    pdbs, pdbs_count = cached_result(cluster_id, "all", k8s_pdb.get_pdb, path, context_name)
 
     return render(request, 'dashboard/cluster_management/pdb.html', {"cluster_id": cluster_id, "registered_clusters": registered_clusters, "pdbs": pdbs, 
                                                                      "namespaces": namespaces, "pdbs_count": pdbs_count, 'current_cluster': current_cluster})
@@ -521,12 +501,10 @@ def pdb(request, cluster_id):
 def pdb_info(request, cluster_id, namespace, pdb_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    pdb_info = {
-        "describe": k8s_pdb.get_pdb_description(path, context_name, namespace, pdb_name),
-        "events": k8s_pdb.get_pdb_events(path, context_name, namespace, pdb_name),
-        "yaml": k8s_pdb.get_pdb_yaml(path, context_name, namespace, pdb_name, managed_fields=True),
-        "edit": k8s_pdb.get_pdb_yaml(path, context_name, namespace, pdb_name, managed_fields=False),
-    }
+    read = partial(k8s_pdb.read_pdb, path, context_name, namespace, pdb_name)
+    render_yaml = partial(k8s_pdb.get_pdb_yaml, path, context_name, namespace, pdb_name)
+    pdb_info = detail_page.fetch_detail(read, partial(k8s_pdb.get_pdb_description, path, context_name, namespace, pdb_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -540,32 +518,29 @@ def pdb_info(request, cluster_id, namespace, pdb_name):
             pdb_info["changes"] = ret["changes"]
             pdb_info["message"] = ret["message"]
             
-        new_yaml = k8s_pdb.get_pdb_yaml(path, context_name, namespace, pdb_name, managed_fields=True)
-        new_edit = k8s_pdb.get_pdb_yaml(path, context_name, namespace, pdb_name, managed_fields=False)
-        pdb_info["yaml"] = new_yaml
-        pdb_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        pdb_info["yaml"], pdb_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/cluster_management/pdb_info.html', {"pdb_info": pdb_info, "cluster_id": cluster_id, 
-                                                                          "registered_clusters": registered_clusters, 'current_cluster': current_cluster})
+                                                                          "registered_clusters": registered_clusters, 'namespace': namespace, 'pdb_name': pdb_name, 'current_cluster': current_cluster})
 
 
 ############ CONFIGMAPS & SECRETS SECTION ############
 
 def configmaps(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    configmaps, total_count = k8s_configmaps.get_configmaps(path, context_name)
-    return render(request, 'dashboard/config_secrets/configmaps.html', {"configmaps": configmaps, 'total_count':total_count, "cluster_id": cluster_id, 
+    configmaps, total_count = cached_result(cluster_id, "all", k8s_configmaps.get_configmaps, path, context_name)
+    return render(request, 'dashboard/config_secrets/configmaps.html', {"configmaps": configmaps[:list_api.DEFAULT_PAGE_SIZE], 'total_count':total_count, "cluster_id": cluster_id,
+                                                                        'configmap_rows': len(configmaps), 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                         'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def configmap_info(request, cluster_id, namespace, configmap_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    configmap_info = {
-        "describe": k8s_configmaps.get_configmap_description(path, context_name, namespace, configmap_name),
-        "events": k8s_configmaps.get_configmap_events(path, context_name, namespace, configmap_name),
-        "yaml": k8s_configmaps.get_configmap_yaml(path, context_name, namespace, configmap_name, managed_fields=True),
-        "edit": k8s_configmaps.get_configmap_yaml(path, context_name, namespace, configmap_name, managed_fields=False),
-    }
+    read = partial(k8s_configmaps.read_configmap, path, context_name, namespace, configmap_name)
+    render_yaml = partial(k8s_configmaps.get_configmap_yaml, path, context_name, namespace, configmap_name)
+    configmap_info = detail_page.fetch_detail(read, partial(k8s_configmaps.get_configmap_description, path, context_name, namespace, configmap_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -579,32 +554,28 @@ def configmap_info(request, cluster_id, namespace, configmap_name):
             configmap_info["changes"] = ret["changes"]
             configmap_info["message"] = ret["message"]
             
-        new_yaml = k8s_configmaps.get_configmap_yaml(path, context_name, namespace, configmap_name, managed_fields=True)
-        new_edit = k8s_configmaps.get_configmap_yaml(path, context_name, namespace, configmap_name, managed_fields=False)
-        configmap_info["yaml"] = new_yaml
-        configmap_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        configmap_info["yaml"], configmap_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/config_secrets/configmap_info.html', {"configmap_info": configmap_info, "cluster_id": cluster_id, "configmap_name": configmap_name, 
-                                                                            'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                            'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 def secrets(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    namespaces = k8s_namespaces.get_namespace(path, context_name)
-    secrets, total_secrets = k8s_secrets.list_secrets(path, context_name)
-    return render(request, 'dashboard/config_secrets/secrets.html', {"secrets": secrets, "total_secrets": total_secrets, "cluster_id": cluster_id, 
+    secrets, total_secrets = cached_result(cluster_id, "all", k8s_secrets.list_secrets, path, context_name)
+    return render(request, 'dashboard/config_secrets/secrets.html', {"secrets": secrets[:list_api.DEFAULT_PAGE_SIZE], "total_secrets": total_secrets, "cluster_id": cluster_id,
+                                                                     'secret_rows': len(secrets), 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                      'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def secret_info(request, cluster_id, namespace, secret_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    secret_info = {
-        "describe": k8s_secrets.get_secret_description(path, context_name, namespace, secret_name),
-        "events": k8s_secrets.get_secret_events(path, context_name, namespace, secret_name),
-        "yaml": k8s_secrets.get_secret_yaml(path, context_name, namespace, secret_name, managed_fields=True),
-        "edit": k8s_secrets.get_secret_yaml(path, context_name, namespace, secret_name, managed_fields=False),
-    }
+    read = partial(k8s_secrets.read_secret, path, context_name, namespace, secret_name)
+    render_yaml = partial(k8s_secrets.get_secret_yaml, path, context_name, namespace, secret_name)
+    secret_info = detail_page.fetch_detail(read, partial(k8s_secrets.get_secret_description, path, context_name, namespace, secret_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -618,13 +589,11 @@ def secret_info(request, cluster_id, namespace, secret_name):
             secret_info["changes"] = ret["changes"]
             secret_info["message"] = ret["message"]
             
-        new_yaml = k8s_secrets.get_secret_yaml(path, context_name, namespace, secret_name, managed_fields=True)
-        new_edit = k8s_secrets.get_secret_yaml(path, context_name, namespace, secret_name, managed_fields=False)
-        secret_info["yaml"] = new_yaml
-        secret_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        secret_info["yaml"], secret_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/config_secrets/secret_info.html', {"secret_info": secret_info, "cluster_id": cluster_id, "secret_name": secret_name, 
-                                                                         'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                         'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 ############ SERVICES SECTION ############
@@ -632,20 +601,19 @@ def secret_info(request, cluster_id, namespace, secret_name):
 def services(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    services = k8s_services.list_kubernetes_services(path, context_name)
+    services = cached_result(cluster_id, "all", k8s_services.list_kubernetes_services, path, context_name)
     total_services = len(services)
-    return render(request, 'dashboard/services/services.html', {"services": services,"total_services": total_services, "cluster_id": cluster_id, 
+    return render(request, 'dashboard/services/services.html', {"services": services[:list_api.DEFAULT_PAGE_SIZE],"total_services": total_services, "cluster_id": cluster_id,
+                                                                'service_rows': total_services, 'page_size': list_api.DEFAULT_PAGE_SIZE,
                                                                 'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
 
 
 def service_info(request, cluster_id, namespace, service_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
-    service_info = {
-        "describe": k8s_services.get_service_description(path, context_name, namespace, service_name),
-        "events": k8s_services.get_service_events(path, context_name, namespace, service_name),
-        "yaml": k8s_services.get_service_yaml(path, context_name, namespace, service_name, managed_fields=True),
-        "edit": k8s_services.get_service_yaml(path, context_name, namespace, service_name, managed_fields=False),
-    }
+    read = partial(k8s_services.read_service, path, context_name, namespace, service_name)
+    render_yaml = partial(k8s_services.get_service_yaml, path, context_name, namespace, service_name)
+    service_info = detail_page.fetch_detail(read, partial(k8s_services.get_service_description, path, context_name, namespace, service_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -659,20 +627,18 @@ def service_info(request, cluster_id, namespace, service_name):
             service_info["changes"] = ret["changes"]
             service_info["message"] = ret["message"]
             
-        new_yaml = k8s_services.get_service_yaml(path, context_name, namespace, service_name, managed_fields=True)
-        new_edit = k8s_services.get_service_yaml(path, context_name, namespace, service_name, managed_fields=False)
-        service_info["yaml"] = new_yaml
-        service_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        service_info["yaml"], service_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
 
     return render(request, 'dashboard/services/service_info.html', {"service_info": service_info, "cluster_id": cluster_id, "service_name": service_name, 
-                                                                    'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                    'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 def endpoints(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
     
-    endpoints = k8s_endpoints.get_endpoints(path, context_name)
+    endpoints = cached_result(cluster_id, "all", k8s_endpoints.get_endpoints, path, context_name)
     total_endpoints = len(endpoints)
     return render(request, 'dashboard/services/endpoints.html', {"endpoints": endpoints,"total_endpoints":total_endpoints, "cluster_id": cluster_id, 'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster}) 
 
@@ -680,12 +646,10 @@ def endpoints(request, cluster_id):
 def endpoint_info(request, cluster_id, namespace, endpoint_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    endpoint_info = {
-        "describe": k8s_endpoints.get_endpoint_description(path, context_name, namespace, endpoint_name),
-        "events": k8s_endpoints.get_endpoint_events(path, context_name, namespace, endpoint_name),
-        "yaml": k8s_endpoints.get_endpoint_yaml(path, context_name, namespace, endpoint_name, managed_fields=True),
-        "edit": k8s_endpoints.get_endpoint_yaml(path, context_name, namespace, endpoint_name, managed_fields=False)
-    }
+    read = partial(k8s_endpoints.read_endpoint, path, context_name, namespace, endpoint_name)
+    render_yaml = partial(k8s_endpoints.get_endpoint_yaml, path, context_name, namespace, endpoint_name)
+    endpoint_info = detail_page.fetch_detail(read, partial(k8s_endpoints.get_endpoint_description, path, context_name, namespace, endpoint_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -699,13 +663,11 @@ def endpoint_info(request, cluster_id, namespace, endpoint_name):
             endpoint_info["changes"] = ret["changes"]
             endpoint_info["message"] = ret["message"]
             
-        new_yaml = k8s_endpoints.get_endpoint_yaml(path, context_name, namespace, endpoint_name, managed_fields=True)
-        new_edit = k8s_endpoints.get_endpoint_yaml(path, context_name, namespace, endpoint_name, managed_fields=False)
-        endpoint_info["yaml"] = new_yaml
-        endpoint_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        endpoint_info["yaml"], endpoint_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/services/endpoint_info.html', {"endpoint_info": endpoint_info, "cluster_id": cluster_id, "endpoint_name": endpoint_name, 
-                                                                     'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                     'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 ############ PERSISTENT STORAGE SECTION ############
@@ -713,7 +675,7 @@ def endpoint_info(request, cluster_id, namespace, endpoint_name):
 def persistentvolume(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    pvs, total_pvs = k8s_pv.list_persistent_volumes(path, context_name)
+    pvs, total_pvs = cached_result(cluster_id, "all", k8s_pv.list_persistent_volumes, path, context_name)
 
     return render(request, 'dashboard/persistent_storage/persistentvolume.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                                   'pvs': pvs, 'total_pvs': total_pvs, 'current_cluster': current_cluster})
@@ -722,11 +684,10 @@ def persistentvolume(request, cluster_id):
 def pv_info(request, cluster_id, pv_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    pv_info = {
-        "describe": k8s_pv.get_pv_description(path, context_name, pv_name),
-        "yaml": k8s_pv.get_pv_yaml(path, context_name, pv_name, managed_fields=True),
-        "edit": k8s_pv.get_pv_yaml(path, context_name, pv_name, managed_fields=False),
-    }
+    read = partial(k8s_pv.read_pv, path, context_name, pv_name)
+    render_yaml = partial(k8s_pv.get_pv_yaml, path, context_name, pv_name)
+    pv_info = detail_page.fetch_detail(read, partial(k8s_pv.get_pv_description, path, context_name, pv_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -740,10 +701,8 @@ def pv_info(request, cluster_id, pv_name):
             pv_info["changes"] = ret["changes"]
             pv_info["message"] = ret["message"]
             
-        new_yaml = k8s_pv.get_pv_yaml(path, context_name, pv_name, managed_fields=True)
-        new_edit = k8s_pv.get_pv_yaml(path, context_name, pv_name, managed_fields=False)
-        pv_info["yaml"] = new_yaml
-        pv_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        pv_info["yaml"], pv_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/persistent_storage/pv_info.html', {"pv_info": pv_info, "cluster_id": cluster_id, "pv_name": pv_name, 
                                                                          'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
@@ -752,7 +711,7 @@ def pv_info(request, cluster_id, pv_name):
 def persistentvolumeclaim(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    pvc, total_pvc = k8s_pvc.list_pvc(path, context_name)
+    pvc, total_pvc = cached_result(cluster_id, "all", k8s_pvc.list_pvc, path, context_name)
 
     return render(request, 'dashboard/persistent_storage/persistentvolumeclaim.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'pvc': pvc, 
                                                                                        'total_pvc': total_pvc, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -761,12 +720,10 @@ def persistentvolumeclaim(request, cluster_id):
 def pvc_info(request, cluster_id, namespace, pvc_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    pvc_info = {
-        "describe": k8s_pvc.get_pvc_description(path, context_name, namespace, pvc_name),
-        "events": k8s_pvc.get_pvc_events(path, context_name, namespace, pvc_name),
-        "yaml": k8s_pvc.get_pvc_yaml(path, context_name, namespace, pvc_name, managed_fields=True),
-        "edit": k8s_pvc.get_pvc_yaml(path, context_name, namespace, pvc_name, managed_fields=False)
-    }
+    read = partial(k8s_pvc.read_pvc, path, context_name, namespace, pvc_name)
+    render_yaml = partial(k8s_pvc.get_pvc_yaml, path, context_name, namespace, pvc_name)
+    pvc_info = detail_page.fetch_detail(read, partial(k8s_pvc.get_pvc_description, path, context_name, namespace, pvc_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -780,19 +737,17 @@ def pvc_info(request, cluster_id, namespace, pvc_name):
             pvc_info["changes"] = ret["changes"]
             pvc_info["message"] = ret["message"]
             
-        new_yaml = k8s_pvc.get_pvc_yaml(path, context_name, namespace, pvc_name, managed_fields=True)
-        new_edit = k8s_pvc.get_pvc_yaml(path, context_name, namespace, pvc_name, managed_fields=False)
-        pvc_info["yaml"] = new_yaml
-        pvc_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        pvc_info["yaml"], pvc_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/persistent_storage/pvc_info.html', {"pvc_info": pvc_info, "cluster_id": cluster_id, "pvc_name": pvc_name, 
-                                                                          'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                          'registered_clusters': registered_clusters, 'namespace': namespace, 'current_cluster': current_cluster})
 
 
 def storageclass(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    sc, total_sc = k8s_storage_class.list_storage_classes(path, context_name)
+    sc, total_sc = cached_result(cluster_id, "all", k8s_storage_class.list_storage_classes, path, context_name)
 
     return render(request, 'dashboard/persistent_storage/storageclass.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                               'sc': sc, 'total_sc': total_sc, 'current_cluster': current_cluster})
@@ -800,12 +755,10 @@ def storageclass(request, cluster_id):
 def storageclass_info(request, cluster_id, sc_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    sc_info = {
-        "describe": k8s_storage_class.get_storage_class_description(path, context_name, sc_name),
-        "events": k8s_storage_class.get_storage_class_events(path, context_name, sc_name),
-        "yaml": k8s_storage_class.get_sc_yaml(path, context_name, sc_name, managed_fields=True),
-        "edit": k8s_storage_class.get_sc_yaml(path, context_name, sc_name, managed_fields=False)
-    }    
+    read = partial(k8s_storage_class.read_storage_class, path, context_name, sc_name)
+    render_yaml = partial(k8s_storage_class.get_sc_yaml, path, context_name, sc_name)
+    sc_info = detail_page.fetch_detail(read, partial(k8s_storage_class.get_storage_class_description, path, context_name, sc_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -819,19 +772,17 @@ def storageclass_info(request, cluster_id, sc_name):
             sc_info["changes"] = ret["changes"]
             sc_info["message"] = ret["message"]
             
-        new_yaml = k8s_storage_class.get_sc_yaml(path, context_name, sc_name, managed_fields=True)
-        new_edit = k8s_storage_class.get_sc_yaml(path, context_name, sc_name, managed_fields=False)
-        sc_info["yaml"] = new_yaml
-        sc_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        sc_info["yaml"], sc_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/persistent_storage/storageclass_info.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'sc_info': sc_info, 'current_cluster': current_cluster})
+    return render(request, 'dashboard/persistent_storage/storageclass_info.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'sc_info': sc_info, 'sc_name': sc_name, 'current_cluster': current_cluster})
 
 ############ NETWORKING SECTION ############
 
 def np(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    nps, nps_count = k8s_np.get_np(path, current_cluster.context_name)
+    nps, nps_count = cached_result(cluster_id, "all", k8s_np.get_np, path, current_cluster.context_name)
 
     return render(request, 'dashboard/networking/np.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                             'nps': nps, 'nps_count': nps_count, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -840,12 +791,10 @@ def np(request, cluster_id):
 def np_info(request, cluster_id, namespace, np_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    np_info = {
-        "describe": k8s_np.get_np_description(path, current_cluster.context_name, namespace, np_name),
-        "events": k8s_np.get_np_events(path, current_cluster.context_name, namespace, np_name),
-        "yaml": k8s_np.get_np_yaml(path, current_cluster.context_name, namespace, np_name, managed_fields=True),
-        "edit": k8s_np.get_np_yaml(path, current_cluster.context_name, namespace, np_name, managed_fields=False)
-    }    
+    read = partial(k8s_np.read_np, path, current_cluster.context_name, namespace, np_name)
+    render_yaml = partial(k8s_np.get_np_yaml, path, current_cluster.context_name, namespace, np_name)
+    np_info = detail_page.fetch_detail(read, partial(k8s_np.get_np_description, path, current_cluster.context_name, namespace, np_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -859,19 +808,17 @@ def np_info(request, cluster_id, namespace, np_name):
             np_info["changes"] = ret["changes"]
             np_info["message"] = ret["message"]
             
-        new_yaml = k8s_np.get_np_yaml(path, context_name, namespace, np_name, managed_fields=True)
-        new_edit = k8s_np.get_np_yaml(path, context_name, namespace, np_name, managed_fields=False)
-        np_info["yaml"] = new_yaml
-        np_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        np_info["yaml"], np_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/networking/np_info.html', {'cluster_id': cluster_id, 
-                                                                 'registered_clusters': registered_clusters, 'np_info': np_info, 'current_cluster': current_cluster})
+                                                                 'registered_clusters': registered_clusters, 'np_info': np_info, 'namespace': namespace, 'np_name': np_name, 'current_cluster': current_cluster})
 
 
 def ingress(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    ingress, ingress_count = k8s_ingress.get_ingress(path, current_cluster.context_name)
+    ingress, ingress_count = cached_result(cluster_id, "all", k8s_ingress.get_ingress, path, current_cluster.context_name)
 
     return render(request, 'dashboard/networking/ingress.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                  'ingress': ingress, 'ingress_count': ingress_count, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -879,12 +826,10 @@ def ingress(request, cluster_id):
 def ingress_info(request, cluster_id, namespace, ingress_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    ingress_info = {
-        "describe": k8s_ingress.get_ingress_description(path, current_cluster.context_name, namespace, ingress_name),
-        "events": k8s_ingress.get_ingress_events(path, current_cluster.context_name, namespace, ingress_name),
-        "yaml": k8s_ingress.get_ingress_yaml(path, current_cluster.context_name, namespace, ingress_name, managed_fields=True),
-        "edit": k8s_ingress.get_ingress_yaml(path, current_cluster.context_name, namespace, ingress_name, managed_fields=False)
-    }
+    read = partial(k8s_ingress.read_ingress, path, current_cluster.context_name, namespace, ingress_name)
+    render_yaml = partial(k8s_ingress.get_ingress_yaml, path, current_cluster.context_name, namespace, ingress_name)
+    ingress_info = detail_page.fetch_detail(read, partial(k8s_ingress.get_ingress_description, path, current_cluster.context_name, namespace, ingress_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -898,19 +843,17 @@ def ingress_info(request, cluster_id, namespace, ingress_name):
             ingress_info["changes"] = ret["changes"]
             ingress_info["message"] = ret["message"]
             
-        new_yaml = k8s_ingress.get_ingress_yaml(path, context_name, namespace, ingress_name, managed_fields=True)
-        new_edit = k8s_ingress.get_ingress_yaml(path, context_name, namespace, ingress_name, managed_fields=False)
-        ingress_info["yaml"] = new_yaml
-        ingress_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        ingress_info["yaml"], ingress_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/networking/ingress_info.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'ingress_info': ingress_info, 'current_cluster': current_cluster})
+    return render(request, 'dashboard/networking/ingress_info.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'ingress_info': ingress_info, 'namespace': namespace, 'ingress_name': ingress_name, 'current_cluster': current_cluster})
 
 
 ############ RBAC SECTION ############
 
 def role(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    role, total_role = k8s_role.list_roles(path, current_cluster.context_name)
+    role, total_role = cached_result(cluster_id, "all", k8s_role.list_roles, path, current_cluster.context_name)
 
     return render(request, 'dashboard/RBAC/role.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                         'role': role, 'total_role': total_role, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -919,12 +862,10 @@ def role(request, cluster_id):
 def role_info(request, cluster_id, namespace, role_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    role_info = {
-        "describe": k8s_role.get_role_description(path, context_name, namespace, role_name),
-        "events": k8s_role.get_role_events(path, context_name, namespace, role_name),
-        "yaml": k8s_role.get_role_yaml(path, context_name, namespace, role_name, managed_fields=True),
-        "edit": k8s_role.get_role_yaml(path, context_name, namespace, role_name, managed_fields=False)
-    }
+    read = partial(k8s_role.read_role, path, context_name, namespace, role_name)
+    render_yaml = partial(k8s_role.get_role_yaml, path, context_name, namespace, role_name)
+    role_info = detail_page.fetch_detail(read, partial(k8s_role.get_role_description, path, context_name, namespace, role_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -938,18 +879,16 @@ def role_info(request, cluster_id, namespace, role_name):
             role_info["changes"] = ret["changes"]
             role_info["message"] = ret["message"]
             
-        new_yaml = k8s_role.get_role_yaml(path, context_name, namespace, role_name, managed_fields=True)
-        new_edit = k8s_role.get_role_yaml(path, context_name, namespace, role_name, managed_fields=False)
-        role_info["yaml"] = new_yaml
-        role_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        role_info["yaml"], role_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
-    return render(request, 'dashboard/RBAC/role_info.html', {"role_info": role_info, "cluster_id": cluster_id, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+    return render(request, 'dashboard/RBAC/role_info.html', {"role_info": role_info, "cluster_id": cluster_id, 'registered_clusters': registered_clusters, 'namespace': namespace, 'role_name': role_name, 'current_cluster': current_cluster})
 
 
 def rolebinding(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    rolebinding, total_rolebinding = k8s_rolebindings.list_rolebindings(path, context_name)
+    rolebinding, total_rolebinding = cached_result(cluster_id, "all", k8s_rolebindings.list_rolebindings, path, context_name)
 
     return render(request, 'dashboard/RBAC/rolebinding.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                'rolebinding': rolebinding, 'total_rolebinding': total_rolebinding, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -958,12 +897,10 @@ def rolebinding(request, cluster_id):
 def role_binding_info(request, cluster_id, namespace, role_binding_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    role_binding_info = {
-        "describe": k8s_rolebindings.get_role_binding_description(path, context_name, namespace, role_binding_name),
-        "events": k8s_rolebindings.get_role_binding_events(path, context_name, namespace, role_binding_name),
-        "yaml": k8s_rolebindings.get_role_binding_yaml(path, context_name, namespace, role_binding_name, managed_fields=True),
-        "edit": k8s_rolebindings.get_role_binding_yaml(path, context_name, namespace, role_binding_name, managed_fields=False)
-    }
+    read = partial(k8s_rolebindings.read_role_binding, path, context_name, namespace, role_binding_name)
+    render_yaml = partial(k8s_rolebindings.get_role_binding_yaml, path, context_name, namespace, role_binding_name)
+    role_binding_info = detail_page.fetch_detail(read, partial(k8s_rolebindings.get_role_binding_description, path, context_name, namespace, role_binding_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -977,19 +914,17 @@ def role_binding_info(request, cluster_id, namespace, role_binding_name):
             role_binding_info["changes"] = ret["changes"]
             role_binding_info["message"] = ret["message"]
             
-        new_yaml = k8s_rolebindings.get_role_binding_yaml(path, context_name, namespace, role_binding_name, managed_fields=True)
-        new_edit = k8s_rolebindings.get_role_binding_yaml(path, context_name, namespace, role_binding_name, managed_fields=False)
-        role_binding_info["yaml"] = new_yaml
-        role_binding_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        role_binding_info["yaml"], role_binding_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/RBAC/rolebinding_info.html', {"role_binding_info": role_binding_info, "cluster_id": cluster_id, 
-                                                                    'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                    'registered_clusters': registered_clusters, 'namespace': namespace, 'role_binding_name': role_binding_name, 'current_cluster': current_cluster})
 
 
 def clusterrole(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    clusterrole, total_clusterrole = k8s_cluster_roles.get_cluster_role(path, context_name)
+    clusterrole, total_clusterrole = cached_result(cluster_id, "all", k8s_cluster_roles.get_cluster_role, path, context_name)
 
     return render(request, 'dashboard/RBAC/clusterrole.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                'clusterrole': clusterrole, 'total_clusterrole': total_clusterrole, 'current_cluster': current_cluster})
@@ -998,12 +933,10 @@ def clusterrole(request, cluster_id):
 def clusterrole_info(request, cluster_id, cluster_role_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    cluster_role_info = {
-        "describe": k8s_cluster_roles.get_cluster_role_description(path, context_name, cluster_role_name),
-        "events": k8s_cluster_roles.get_cluster_role_events(path, context_name, cluster_role_name),
-        "yaml": k8s_cluster_roles.get_cluster_role_yaml(path, context_name, cluster_role_name, managed_fields=True),
-        "edit": k8s_cluster_roles.get_cluster_role_yaml(path, context_name, cluster_role_name, managed_fields=False)
-    }
+    read = partial(k8s_cluster_roles.read_cluster_role, path, context_name, cluster_role_name)
+    render_yaml = partial(k8s_cluster_roles.get_cluster_role_yaml, path, context_name, cluster_role_name)
+    cluster_role_info = detail_page.fetch_detail(read, partial(k8s_cluster_roles.get_cluster_role_description, path, context_name, cluster_role_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -1017,19 +950,17 @@ def clusterrole_info(request, cluster_id, cluster_role_name):
             cluster_role_info["changes"] = ret["changes"]
             cluster_role_info["message"] = ret["message"]
             
-        new_yaml = k8s_cluster_roles.get_cluster_role_yaml(path, context_name, cluster_role_name, managed_fields=True)
-        new_edit = k8s_cluster_roles.get_cluster_role_yaml(path, context_name, cluster_role_name, managed_fields=False)
-        cluster_role_info["yaml"] = new_yaml
-        cluster_role_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        cluster_role_info["yaml"], cluster_role_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/RBAC/clusterrole_info.html', {"cluster_role_info": cluster_role_info, "cluster_id": cluster_id, 
-                                                                    'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                    'registered_clusters': registered_clusters, 'cluster_role_name': cluster_role_name, 'current_cluster': current_cluster})
 
 
 def clusterrolebinding(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    clusterrolebinding, total_clusterrolebinding = k8s_cluster_role_bindings.get_cluster_role_bindings(path, context_name)
+    clusterrolebinding, total_clusterrolebinding = cached_result(cluster_id, "all", k8s_cluster_role_bindings.get_cluster_role_bindings, path, context_name)
 
     return render(request, 'dashboard/RBAC/clusterrolebinding.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 'clusterrolebinding': clusterrolebinding, 
                                                                       'total_clusterrolebinding': total_clusterrolebinding, 'current_cluster': current_cluster})
@@ -1038,12 +969,10 @@ def clusterrolebinding(request, cluster_id):
 def cluster_role_binding_info(request, cluster_id, cluster_role_binding_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    cluster_role_binding_info = {
-        "describe": k8s_cluster_role_bindings.get_cluster_role_binding_description(path, context_name, cluster_role_binding_name),
-        "events": k8s_cluster_role_bindings.get_cluster_role_binding_events(path, context_name, cluster_role_binding_name),
-        "yaml": k8s_cluster_role_bindings.get_cluster_role_binding_yaml(path, context_name, cluster_role_binding_name, managed_fields=True),
-        "edit": k8s_cluster_role_bindings.get_cluster_role_binding_yaml(path, context_name, cluster_role_binding_name, managed_fields=False)
-    }
+    read = partial(k8s_cluster_role_bindings.read_cluster_role_binding, path, context_name, cluster_role_binding_name)
+    render_yaml = partial(k8s_cluster_role_bindings.get_cluster_role_binding_yaml, path, context_name, cluster_role_binding_name)
+    cluster_role_binding_info = detail_page.fetch_detail(read, partial(k8s_cluster_role_bindings.get_cluster_role_binding_description, path, context_name, cluster_role_binding_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -1057,19 +986,17 @@ def cluster_role_binding_info(request, cluster_id, cluster_role_binding_name):
             cluster_role_binding_info["changes"] = ret["changes"]
             cluster_role_binding_info["message"] = ret["message"]
             
-        new_yaml = k8s_cluster_role_bindings.get_cluster_role_binding_yaml(path, context_name, cluster_role_binding_name, managed_fields=True)
-        new_edit = k8s_cluster_role_bindings.get_cluster_role_binding_yaml(path, context_name, cluster_role_binding_name, managed_fields=False)
-        cluster_role_binding_info["yaml"] = new_yaml
-        cluster_role_binding_info["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        cluster_role_binding_info["yaml"], cluster_role_binding_info["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/RBAC/clusterrolebinding_info.html', {"cluster_role_binding_info": cluster_role_binding_info, 
-                                                                           "cluster_id": cluster_id, 'registered_clusters': registered_clusters, 'current_cluster': current_cluster})
+                                                                           "cluster_id": cluster_id, 'registered_clusters': registered_clusters, 'cluster_role_binding_name': cluster_role_binding_name, 'current_cluster': current_cluster})
 
 
 def service_account(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    service_account, total_service_account = k8s_service_accounts.get_service_accounts(path, context_name)
+    service_account, total_service_account = cached_result(cluster_id, "all", k8s_service_accounts.get_service_accounts, path, context_name)
 
     return render(request, 'dashboard/RBAC/service_account.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
                                                                   'service_account': service_account, 'total_service_account': total_service_account, 'namespaces': namespaces, 'current_cluster': current_cluster})
@@ -1078,12 +1005,10 @@ def service_account(request, cluster_id):
 def service_accountInfo(request, cluster_id, namespace, sa_name):
     cluster_id, current_cluster, path, registered_clusters, _, context_name = get_utils_data(request)
 
-    service_accountInfo = {
-        "describe": k8s_service_accounts.get_sa_description(path, context_name, namespace, sa_name),
-        "events": k8s_service_accounts.get_sa_events(path, context_name, namespace, sa_name),
-        "yaml": k8s_service_accounts.get_sa_yaml(path, context_name, namespace, sa_name, managed_fields=True),
-        "edit": k8s_service_accounts.get_sa_yaml(path, context_name, namespace, sa_name, managed_fields=False)
-    }
+    read = partial(k8s_service_accounts.read_service_account, path, context_name, namespace, sa_name)
+    render_yaml = partial(k8s_service_accounts.get_sa_yaml, path, context_name, namespace, sa_name)
+    service_accountInfo = detail_page.fetch_detail(read, partial(k8s_service_accounts.get_sa_description, path, context_name, namespace, sa_name),
+        render_yaml if request.method == 'POST' else None)
 
     if request.method == 'POST':
         yaml = request.POST.get('yaml')
@@ -1097,21 +1022,29 @@ def service_accountInfo(request, cluster_id, namespace, sa_name):
             serviceAccountInfo["changes"] = ret["changes"]
             serviceAccountInfo["message"] = ret["message"]
             
-        new_yaml = k8s_service_accounts.get_sa_yaml(path, context_name, namespace, sa_name, managed_fields=True)
-        new_edit = k8s_service_accounts.get_sa_yaml(path, context_name, namespace, sa_name, managed_fields=False)
-        serviceAccountInfo["yaml"] = new_yaml
-        serviceAccountInfo["edit"] = new_edit
+        # Render the patched object; read it again only if the patch failed
+        serviceAccountInfo["yaml"], serviceAccountInfo["edit"] = detail_page.render_yamls(render_yaml, ret.get("object") or read())
 
     return render(request, 'dashboard/RBAC/serviceAccountInfo.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters, 
-                                                                      'serviceAccountInfo': serviceAccountInfo, 'current_cluster': current_cluster})
+                                                                      'serviceAccountInfo': serviceAccountInfo, 'namespace': namespace, 'sa_name': sa_name, 'current_cluster': current_cluster})
 
 
 ############ METRICS SECTION ############
 
+# Trend windows of the metrics pages, in seconds
+METRICS_HISTORY_WINDOWS = {'1h': 3600, '24h': 24 * 3600, '7d': 7 * 24 * 3600, '30d': 30 * 24 * 3600}
+# Series returned per request; the pages ask for the rows on screen
+METRICS_HISTORY_MAX_KEYS = 200
+
+def history_windows():
+    # The trend windows the metrics history keeps, for the metrics pages' buttons
+    return [name for name, seconds in METRICS_HISTORY_WINDOWS.items() if seconds <= metrics_sampler.history_span()]
+
+
 def pod_metrics(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
-    result = k8s_pod_metrics.get_pod_metrics(path, context_name)
+    result = cached_result(cluster_id, "all", k8s_pod_metrics.get_pod_metrics, path, context_name)
     
     # Check if result is a tuple with 3 elements (indicating new format)
     if isinstance(result, tuple) and len(result) == 3:
@@ -1128,13 +1061,14 @@ def pod_metrics(request, cluster_id):
 
     return render(request, 'dashboard/metrics/pod_metrics.html', {'all_pod_metrics': all_pod_metrics if metrics_available else [], 'total_pods': total_pods, 
                                                                   'metrics_available': metrics_available, 'error_message': error_message, 'cluster_id': cluster_id, 
-                                                                  'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
+                                                                  'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster,
+                                                                  'history_windows': history_windows()})
 
 
 def node_metrics(request, cluster_id):
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
     
-    result = k8s_node_metrics.get_node_metrics(path, context_name)
+    result = cached_result(cluster_id, "all", k8s_node_metrics.get_node_metrics, path, context_name)
     
     # Check if result is a tuple with 3 elements (indicating new format)
     if isinstance(result, tuple) and len(result) == 3:
@@ -1151,31 +1085,114 @@ def node_metrics(request, cluster_id):
     
     return render(request, 'dashboard/metrics/node_metrics.html', {'node_metrics': node_metrics if metrics_available else [], 'total_nodes': total_nodes, 'metrics_available': metrics_available, 
                                                                    'error_message': error_message, 'cluster_id': cluster_id, 
-                                                                   'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster})
+                                                                   'registered_clusters': registered_clusters, 'namespaces': namespaces, 'current_cluster': current_cluster,
+                                                                   'history_windows': history_windows()})
+
+
+@login_required
+def metrics_history(request, cluster_id, kind):
+    """
+    CPU and memory history of some pods or nodes, from the cluster's metrics sampler.
+
+    kind is "pods" or "nodes"; keys is a comma-separated list of node names
+    or namespace/name pod keys, and window one of METRICS_HISTORY_WINDOWS
+    (windows longer than the history kept return what there is). Returns the
+    sampler's {"start", "step", "series"}, starting the sampler on first use.
+    """
+    window = METRICS_HISTORY_WINDOWS.get(request.GET.get('window', '1h'))
+    if kind not in ('pods', 'nodes') or window is None:
+        return JsonResponse({'error': 'Unknown metrics kind or window'}, status=400)
+    keys = [key for key in request.GET.get('keys', '').split(',') if key][:METRICS_HISTORY_MAX_KEYS]
+
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    sampler = metrics_sampler.get_sampler(current_cluster.kube_config.path, current_cluster.context_name)
+    if sampler is None:
+        return JsonResponse({'error': 'Metrics history is not available'}, status=503)
+    return JsonResponse(sampler.history(kind, keys, window))
 
 
 ############ EVENTS SECTION ############
 
 
+EVENTS_PAGE_SIZE = 50
+
 def events(request=None, cluster_id = None):
+    """
+    One page of the cluster's events, cut and filtered by the API server.
+
+    Query parameters: page, namespace, type (Normal or Warning) and kind
+    (of the involved object). The continue tokens of the pages visited so
+    far are kept in the session, so next and previous links do not list
+    the events before the page shown.
+    """
     cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
-    
-    events = k8s_events.get_events(path, context_name, False)
-    if not isinstance(events, list):
-        events = []
-    # Paginate events
-    paginator = Paginator(events, 50)  
-    page_number = request.GET.get('page')  
+
+    event_type = request.GET.get('type')
+    filters = {"namespace": request.GET.get('namespace') or "all",
+               "event_type": event_type if event_type in k8s_events.EVENT_TYPES else None,
+               "kind": request.GET.get('kind') or None}
+    # tokens[n] opens page n + 1; tokens are only valid for the filters they were issued for
+    session_key = f"event_pages_{cluster_id}"
+    saved = request.session.get(session_key)
+    tokens = saved["tokens"] if saved and saved["filters"] == filters else [None]
     try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
+        number = int(request.GET.get('page', 1))
+    except ValueError:
+        number = 1
+    # Only pages reached through next links have a token
+    number = min(max(number, 1), len(tokens))
 
-    return render(request, 'dashboard/events.html', {'cluster_id': cluster_id, 'events': page_obj,
+    token_expired = False
+    try:
+        rows, next_token = k8s_events.get_events_page(path, context_name, limit=EVENTS_PAGE_SIZE,
+                                                      continue_token=tokens[number - 1], **filters)
+    except client.exceptions.ApiException as e:
+        if e.status != 410:
+            logger.error(f"Kubernetes API Exception: {e}")
+            rows, next_token = [], None
+        else:
+            # The token outlived the API server's compaction window; start over
+            token_expired = True
+            tokens, number = [None], 1
+            rows, next_token = k8s_events.get_events_page(path, context_name, limit=EVENTS_PAGE_SIZE, **filters)
+    tokens = tokens[:number] + ([next_token] if next_token else [])
+    request.session[session_key] = {"filters": filters, "tokens": tokens}
+
+    page_obj = {"number": number, "has_previous": number > 1, "has_next": next_token is not None,
+                "previous_page_number": number - 1, "next_page_number": number + 1}
+    filter_query = urlencode({key: value for key, value in request.GET.items() if key in ('namespace', 'type', 'kind') and value})
+    return render(request, 'dashboard/events.html', {'cluster_id': cluster_id, 'events': rows,
                                                      'registered_clusters': registered_clusters,
-                                                     'namespaces': namespaces, 'page_obj': page_obj, 'current_cluster': current_cluster})
+                                                     'namespaces': namespaces, 'page_obj': page_obj, 'current_cluster': current_cluster,
+                                                     'event_types': k8s_events.EVENT_TYPES, 'filters': filters,
+                                                     'filter_query': filter_query, 'token_expired': token_expired})
+
+
+@login_required
+def events_stream(request, cluster_id):
+    """
+    Push the cluster's new and updated events as server-sent events.
+
+    Takes the events page's namespace, type and kind filters. Each "events"
+    event carries {"rows": [...], "dropped": n}: rows are formatted like the
+    events table, plus the event's uid and its change (ADDED, MODIFIED or
+    DELETED), so the page can update rows in place instead of reloading.
+    """
+    event_type = request.GET.get('type')
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    try:
+        stream = event_stream.stream_events(current_cluster.kube_config.path, current_cluster.context_name,
+                                            namespace=request.GET.get('namespace') or "all",
+                                            event_type=event_type if event_type in k8s_events.EVENT_TYPES else None,
+                                            kind=request.GET.get('kind') or None)
+    except client.exceptions.ApiException as e:
+        return JsonResponse({'error': e.reason}, status=e.status or 500)
+
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Keep proxies such as nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
 
 current_working_directory = os.path.expanduser('~')
@@ -1245,41 +1262,35 @@ def execute_command(request):
     
 ################### Download report Function #############################    
 
-def get_cluster_name():
+def get_cluster_name(path, context_name):
     try:
-        contexts, current_context = config.list_kube_config_contexts()
-        if current_context:
-            return current_context['context']['cluster']
+        contexts, _ = config.list_kube_config_contexts(config_file=path)
+        for context in contexts:
+            if context['name'] == context_name:
+                return context['context']['cluster']
     except ConfigException:
         return "in-cluster"
     return "unknown"
 
 def generate_reports(request):
     try:
-        # Load kube config
-        try:
-            config.load_incluster_config()
-        except ConfigException:
-            config.load_kube_config()
+        cluster_id, current_cluster, path, registered_clusters, namespaces, context_name = get_utils_data(request)
 
         # Fetch all resources
-        pods = get_pod_details()
+        pods = get_pod_details(path, context_name)
         pod_counts = len(pods)
-        nodes = get_node_details()
+        nodes = get_node_details(path, context_name)
         node_counts = len(nodes)
-        namespaces = get_namespace_details()
+        namespaces = get_namespace_details(path, context_name)
         namespace_count = len(namespaces)
-        deployments = get_deployment_details()
+        deployments = get_deployment_details(path, context_name)
         deployment_counts = len(deployments)
-        services = get_service_details()
-        endpoints = get_endpoint_details()
-        ingresses = get_ingress_details()
-        cluster_name = get_cluster_name()
+        services = get_service_details(path, context_name)
+        endpoints = get_endpoint_details(path, context_name)
+        ingresses = get_ingress_details(path, context_name)
+        cluster_name = get_cluster_name(path, context_name)
 
         # Cluster Overview
-        v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
-
         total_nodes = len(nodes)
         ready_nodes = sum(1 for node in nodes if node['status'] == 'Ready')
 
@@ -1419,3 +1430,178 @@ def k8sgpt_view(request, cluster_id):
         return render(request, 'dashboard/k8sgpt.html', {'cluster_id': cluster_id, 'registered_clusters': registered_clusters,
                                                          'namespaces': namespaces, 'current_cluster': current_cluster,'output': output,
                                                          'selected_namespace': selected_namespace, 'explain': explain, 'filter_list': filter_list, 'filters':filters_to_pass })
+
+############ LIST API ############
+
+@login_required
+def resource_list_api(request, cluster_id, resource):
+    """
+    One page of a resource list as JSON, for virtualized tables.
+
+    Query parameters: page, page_size, sort (a row field, "-" prefix for
+    descending), namespace (comma-separated), name (substring), status and
+    label_selector. Rows come from the same cached fetch as the HTML list
+    page, indexed once per fetch.
+    """
+    fetch = list_api.LIST_RESOURCES.get(resource)
+    if fetch is None:
+        return JsonResponse({'error': f"Unknown resource: {resource}"}, status=404)
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    path, context_name = current_cluster.kube_config.path, current_cluster.context_name
+
+    index = list_api.row_index(cluster_id, resource, path, context_name)
+    # Several namespaces are comma-separated
+    namespace = [value for value in request.GET.get('namespace', '').split(',') if value] or None
+    filters = {'namespace': namespace, 'status': request.GET.get('status'), 'name': request.GET.get('name')}
+    sort = request.GET.get('sort')
+    label_selector = request.GET.get('label_selector')
+    if label_selector:
+        try:
+            keys = list_api.label_selected_keys(path, context_name, resource, label_selector)
+        except client.exceptions.ApiException as e:
+            return JsonResponse({'error': f"Invalid label selector: {e.reason}"}, status=400)
+        positions = index.select(keys=keys, **filters)
+        if sort:
+            positions = index.sort(positions, sort.lstrip('-'), descending=sort.startswith('-'))
+    else:
+        positions = index.query(sort=sort, **filters)
+
+    try:
+        page_size = min(max(int(request.GET.get('page_size', list_api.DEFAULT_PAGE_SIZE)), 1), list_api.MAX_PAGE_SIZE)
+    except ValueError:
+        page_size = list_api.DEFAULT_PAGE_SIZE
+    page_obj = Paginator(positions, page_size).get_page(request.GET.get('page'))
+
+    return JsonResponse({'resource': resource, 'total': len(index.rows), 'count': len(positions),
+                         'page': page_obj.number, 'page_size': page_size, 'num_pages': page_obj.paginator.num_pages,
+                         'rows': index.page(page_obj.object_list)})
+
+
+@login_required
+def detail_tab(request, cluster_id, resource, name, tab, namespace=None):
+    """
+    One tab of a resource's detail page as JSON, fetched when the tab is opened.
+
+    The page itself only renders the describe tab; logs, events, yaml and
+    edit are loaded from here on demand. Cluster-scoped kinds omit the namespace.
+    """
+    if tab not in detail_page.tab_names(resource):
+        return JsonResponse({'error': f"Unknown tab: {resource}/{tab}"}, status=404)
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    try:
+        content = detail_page.fetch_tab(current_cluster.kube_config.path, current_cluster.context_name,
+                                        resource, namespace, name, tab)
+    except client.exceptions.ApiException as e:
+        return JsonResponse({'error': e.reason}, status=e.status or 500)
+    return JsonResponse({'content': content})
+
+############ POD LOGS ############
+
+@login_required
+def pod_logs_stream(request, cluster_id, namespace, pod_name):
+    """
+    Stream a pod's log without loading it into memory.
+
+    Query parameters: container, tail_lines, since_seconds, limit_bytes,
+    previous and timestamps. The log is sent as plain text, or with
+    follow=true as server-sent events that push new lines as they arrive.
+    """
+    try:
+        options = pod_logs.log_options(request.GET)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    follow = pod_logs.parse_bool(request.GET.get('follow', ''))
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    try:
+        lines = pod_logs.stream_pod_log(current_cluster.kube_config.path, current_cluster.context_name,
+                                        namespace, pod_name, follow=follow, **options)
+    except client.exceptions.ApiException as e:
+        return JsonResponse({'error': e.reason}, status=e.status or 500)
+
+    if follow:
+        response = StreamingHttpResponse(pod_logs.sse_events(lines), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Keep proxies such as nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    return StreamingHttpResponse((f"{line}\n" for line in lines), content_type='text/plain; charset=utf-8')
+
+
+@login_required
+def workload_logs_stream(request, cluster_id, resource, namespace, name):
+    """
+    Stream the merged logs of all pods of a deployment, replicaset, statefulset, daemonset or job.
+
+    Takes the same query parameters as pod_logs_stream; each line is
+    prefixed with its pod. Finite logs are interleaved by timestamp.
+    """
+    if resource not in workload_logs.WORKLOAD_KINDS:
+        return JsonResponse({'error': f"Unknown workload: {resource}"}, status=404)
+    try:
+        options = pod_logs.log_options(request.GET)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    follow = pod_logs.parse_bool(request.GET.get('follow', ''))
+    timestamps = options.pop('timestamps', False)
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    path, context_name = current_cluster.kube_config.path, current_cluster.context_name
+    try:
+        pod_names = workload_logs.workload_pods(path, context_name, resource, namespace, name)
+    except client.exceptions.ApiException as e:
+        return JsonResponse({'error': e.reason}, status=e.status or 500)
+
+    lines = workload_logs.format_lines(
+        workload_logs.merge_pod_logs(path, context_name, namespace, pod_names, follow=follow, **options), timestamps)
+    if follow:
+        response = StreamingHttpResponse(pod_logs.sse_events(lines), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    return StreamingHttpResponse((f"{line}\n" for line in lines), content_type='text/plain; charset=utf-8')
+
+
+@login_required
+def pod_log_search(request, cluster_id):
+    """
+    Search pod logs server-side and return only the matching lines, with context.
+
+    Query parameters: namespace, pattern (matched literally, or as a
+    regular expression with regex=true), and optionally resource and name
+    to search one workload's pods, label_selector, since_seconds, context,
+    max_matches (per pod), container and ignore_case.
+    """
+    namespace, pattern = request.GET.get('namespace'), request.GET.get('pattern')
+    if not namespace or not pattern:
+        return JsonResponse({'error': "namespace and pattern are required"}, status=400)
+    resource, name = request.GET.get('resource'), request.GET.get('name')
+    if resource and resource not in workload_logs.WORKLOAD_KINDS:
+        return JsonResponse({'error': f"Unknown workload: {resource}"}, status=404)
+    if resource and not name:
+        return JsonResponse({'error': "name is required with resource"}, status=400)
+    try:
+        regex, literal = log_search.compile_pattern(pattern, pod_logs.parse_bool(request.GET.get('regex', '')),
+                                                    pod_logs.parse_bool(request.GET.get('ignore_case', '')))
+        since_seconds = pod_logs.positive_int(request.GET.get('since_seconds') or settings.K8S_LOG_SEARCH_WINDOW)
+        context_lines = min(max(int(request.GET.get('context', log_search.DEFAULT_CONTEXT_LINES)), 0),
+                            log_search.MAX_CONTEXT_LINES)
+        max_matches = min(pod_logs.positive_int(request.GET.get('max_matches', log_search.DEFAULT_MAX_MATCHES)),
+                          log_search.MAX_MATCHES)
+    except ValueError as e:
+        return JsonResponse({'error': f"Invalid search: {e}"}, status=400)
+    options = {'container': request.GET['container']} if request.GET.get('container') else {}
+
+    current_cluster = clusters_DB.get_cluster(cluster_id)
+    path, context_name = current_cluster.kube_config.path, current_cluster.context_name
+    try:
+        if resource:
+            pod_names = workload_logs.workload_pods(path, context_name, resource, namespace, name)
+        else:
+            pod_names = log_search.namespace_pods(path, context_name, namespace, request.GET.get('label_selector'))
+    except client.exceptions.ApiException as e:
+        return JsonResponse({'error': e.reason}, status=e.status or 500)
+
+    results = log_search.search_logs(path, context_name, namespace, pod_names, regex, since_seconds,
+                                      context_lines, max_matches, **options)
+    return JsonResponse({'pattern': pattern, 'literal': literal, 'since_seconds': since_seconds,
+                         'pods_searched': min(len(pod_names), settings.K8S_LOG_AGGREGATION_MAX_PODS),
+                         'results': results})
@@ -89,6 +89,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# In-process memory by default; set DJANGO_CACHE_DIR to share cached page data between worker processes
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache' if os.getenv('DJANGO_CACHE_DIR')
+                   else 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': os.getenv('DJANGO_CACHE_DIR', 'kubebuddy'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -139,4 +152,64 @@ LOGOUT_REDIRECT_URL = 'login'
 
 
 # Prevent logs printing in terminal
-LOGGING_CONFIG = None
\ No newline at end of file
+LOGGING_CONFIG = None
+
+# Serve list pages from a background list+watch cache per cluster (dashboard/src/informers.py)
+K8S_INFORMERS_ENABLED = os.getenv('K8S_INFORMERS_ENABLED', 'False').lower() == 'true'
+# Seconds a request waits for an informer's initial list before falling back to a live list call
+K8S_INFORMER_SYNC_TIMEOUT = 10
+# Keep the namespace dropdown on a watch instead of listing namespaces on every page
+K8S_NAMESPACE_INFORMER_ENABLED = os.getenv('K8S_NAMESPACE_INFORMER_ENABLED', 'True').lower() == 'true'
+
+# Stale-while-revalidate cache for dashboard and list page data (dashboard/src/view_cache.py).
+# Data is fresh for K8S_VIEW_CACHE_TTL seconds and then served stale for up to
+# K8S_VIEW_CACHE_STALE_TTL more seconds while it refreshes in the background.
+# Set K8S_VIEW_CACHE_TTL=0 to opt out and query the API server on every request.
+K8S_VIEW_CACHE_TTL = int(os.getenv('K8S_VIEW_CACHE_TTL', '10'))
+K8S_VIEW_CACHE_STALE_TTL = int(os.getenv('K8S_VIEW_CACHE_STALE_TTL', '300'))
+
+# Newest events shown on an object's detail page (0 shows all of them)
+K8S_OBJECT_EVENTS_LIMIT = int(os.getenv('K8S_OBJECT_EVENTS_LIMIT', '100'))
+
+# Pod logs (dashboard/src/pod_logs.py): lines read when no tail or since window is given,
+# and the byte cap of a log that is not followed. 0 disables either bound.
+K8S_POD_LOG_TAIL_LINES = int(os.getenv('K8S_POD_LOG_TAIL_LINES', '1000'))
+K8S_POD_LOG_LIMIT_BYTES = int(os.getenv('K8S_POD_LOG_LIMIT_BYTES', str(1024 * 1024)))
+# Pods whose logs a workload's merged log view reads at once, one reader thread each
+K8S_LOG_AGGREGATION_MAX_PODS = int(os.getenv('K8S_LOG_AGGREGATION_MAX_PODS', '50'))
+# Reader threads all merged log views may run at once in this process
+K8S_LOG_READERS_MAX = int(os.getenv('K8S_LOG_READERS_MAX', '200'))
+# Log search (dashboard/src/log_search.py): pods searched at once, bytes read per pod,
+# the time window searched when the request gives none, and seconds spent searching
+# one pod's log (0 disables the timeout)
+K8S_LOG_SEARCH_WORKERS = int(os.getenv('K8S_LOG_SEARCH_WORKERS', '8'))
+K8S_LOG_SEARCH_LIMIT_BYTES = int(os.getenv('K8S_LOG_SEARCH_LIMIT_BYTES', str(64 * 1024 * 1024)))
+K8S_LOG_SEARCH_WINDOW = int(os.getenv('K8S_LOG_SEARCH_WINDOW', '3600'))
+K8S_LOG_SEARCH_TIMEOUT = float(os.getenv('K8S_LOG_SEARCH_TIMEOUT', '10'))
+# Live events (dashboard/src/events/event_stream.py): seconds between pushes to a viewer,
+# and rows per push; changes to one event in between are sent once
+K8S_EVENT_STREAM_INTERVAL = float(os.getenv('K8S_EVENT_STREAM_INTERVAL', '1'))
+K8S_EVENT_STREAM_MAX_ROWS = int(os.getenv('K8S_EVENT_STREAM_MAX_ROWS', '50'))
+# Event index (dashboard/src/events/k8s_events.py): warning counts kept from a watch of all events
+# in K8S_EVENT_INDEX_BUCKETS buckets of K8S_EVENT_INDEX_BUCKET_SECONDS, i.e. the last hour by default.
+# Off by default: the watch lists every event of the cluster once
+K8S_EVENT_INDEX_ENABLED = os.getenv('K8S_EVENT_INDEX_ENABLED', 'False').lower() == 'true'
+K8S_EVENT_INDEX_BUCKET_SECONDS = int(os.getenv('K8S_EVENT_INDEX_BUCKET_SECONDS', '60'))
+K8S_EVENT_INDEX_BUCKETS = int(os.getenv('K8S_EVENT_INDEX_BUCKETS', '60'))
+# Metrics sampler (dashboard/src/metrics/metrics_sampler.py): seconds between polls of node and pod
+# metrics, and series kept per cluster and kind; the sparklines of the metrics pages read its history
+K8S_METRICS_SAMPLER_ENABLED = os.getenv('K8S_METRICS_SAMPLER_ENABLED', 'True').lower() == 'true'
+K8S_METRICS_SAMPLE_INTERVAL = int(os.getenv('K8S_METRICS_SAMPLE_INTERVAL', '60'))
+K8S_METRICS_MAX_SERIES = int(os.getenv('K8S_METRICS_MAX_SERIES', '20000'))
+# Metrics history on disk (dashboard/src/metrics/metrics_history.py): memory-mapped column files per cluster
+# under K8S_METRICS_HISTORY_DIR (empty keeps the last day in memory only), and the seconds kept of raw samples
+# and of five-minute and hourly means
+K8S_METRICS_HISTORY_DIR = os.getenv('K8S_METRICS_HISTORY_DIR', str(BASE_DIR / 'metrics_history'))
+K8S_METRICS_RAW_RETENTION = int(os.getenv('K8S_METRICS_RAW_RETENTION', str(6 * 3600)))
+K8S_METRICS_5M_RETENTION = int(os.getenv('K8S_METRICS_5M_RETENTION', str(7 * 24 * 3600)))
+K8S_METRICS_1H_RETENTION = int(os.getenv('K8S_METRICS_1H_RETENTION', str(30 * 24 * 3600)))
+# Seconds a pod or node that stopped reporting keeps its history; a full history also makes room
+# by dropping the series seen longest ago
+K8S_METRICS_SERIES_RETENTION = int(os.getenv('K8S_METRICS_SERIES_RETENTION', str(K8S_METRICS_5M_RETENTION)))
+# Seconds between flushes of the history files to disk; a machine crash loses at most this much
+K8S_METRICS_FLUSH_INTERVAL = int(os.getenv('K8S_METRICS_FLUSH_INTERVAL', '300'))
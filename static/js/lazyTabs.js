@@ -0,0 +1,29 @@
+// Detail-page tabs carrying a data-tab-url are fetched the first time they are shown
+function showTabContent(pane, content) {
+    const editor = pane.querySelector("#editor");
+    if (editor) {
+        ace.edit(editor).setValue(content, -1);
+    } else {
+        pane.querySelector("pre").textContent = content || "<none>";
+    }
+}
+
+window.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll('[data-bs-toggle="tab"]').forEach(function (link) {
+        link.addEventListener("shown.bs.tab", function () {
+            const pane = document.querySelector(link.getAttribute("href"));
+            if (!pane || !pane.dataset.tabUrl || pane.dataset.loaded) {
+                return;
+            }
+            pane.dataset.loaded = "true";
+            fetch(pane.dataset.tabUrl)
+                .then(response => response.json())
+                .then(data => showTabContent(pane, data.error ? "Error: " + data.error : data.content))
+                .catch(err => {
+                    // Retry the next time the tab is opened
+                    delete pane.dataset.loaded;
+                    showTabContent(pane, "Error: " + err);
+                });
+        });
+    });
+});
@@ -0,0 +1,143 @@
+// Pages, searches and sorts a list table through the JSON list API, so only one page of rows is in the DOM
+window.addEventListener("DOMContentLoaded", function () {
+    const table = document.querySelector("table[data-list-url]");
+    if (!table) {
+        return;
+    }
+    const url = table.dataset.listUrl;
+    const body = table.querySelector("tbody");
+    const headers = table.querySelectorAll("thead th");
+    const template = document.getElementById("listRowTemplate");
+    const pager = document.getElementById("listPager");
+    const status = document.getElementById("listPagerStatus");
+    const searchInput = document.getElementById("tableSearchInput");
+    const state = {page: 1, numPages: Math.max(1, Math.ceil(table.dataset.total / table.dataset.pageSize)),
+                   count: Number(table.dataset.total), sort: "", name: "", namespaces: []};
+    let request = 0;
+
+    function fill(text, row) {
+        return text.replace(/\{(\w+)\}/g, function (_, field) {
+            return encodeURIComponent(row[field] === null || row[field] === undefined ? "" : row[field]);
+        });
+    }
+
+    // Lists (e.g. images) are joined and mappings (e.g. labels) shown as key=value pairs
+    function formatValue(value) {
+        if (value === null || value === undefined) {
+            return "";
+        }
+        if (Array.isArray(value)) {
+            return value.map(formatValue).join(", ");
+        }
+        if (typeof value === "object") {
+            return Object.entries(value).map(function (entry) { return entry[0] + "=" + entry[1]; }).join(", ");
+        }
+        return String(value);
+    }
+
+    function renderRow(row) {
+        const tr = template.content.firstElementChild.cloneNode(true);
+        tr.querySelectorAll("[data-field]").forEach(function (element) {
+            const value = row[element.dataset.field];
+            element.textContent = formatValue(value);
+            if (element.dataset.classes) {
+                element.className = JSON.parse(element.dataset.classes)[value] || element.dataset.defaultClass || "";
+            }
+        });
+        tr.querySelectorAll("[data-href]").forEach(function (element) {
+            element.setAttribute("href", fill(element.dataset.href, row));
+        });
+        // Follow the columns hidden with the column selector
+        Array.from(tr.children).forEach(function (td, index) {
+            if (headers[index]) {
+                td.style.display = headers[index].style.display;
+            }
+        });
+        return tr;
+    }
+
+    function showStatus() {
+        status.textContent = "Page " + state.page + " of " + state.numPages + " (" + state.count + " rows)";
+        pager.querySelector('[data-page="previous"]').disabled = state.page <= 1;
+        pager.querySelector('[data-page="next"]').disabled = state.page >= state.numPages;
+    }
+
+    function load() {
+        const query = new URLSearchParams({page: state.page, page_size: table.dataset.pageSize});
+        if (state.sort) {
+            query.set("sort", state.sort);
+        }
+        if (state.name) {
+            query.set("name", state.name);
+        }
+        if (state.namespaces.length) {
+            query.set("namespace", state.namespaces.join(","));
+        }
+        // Only the answer to the latest request is shown
+        const current = ++request;
+        fetch(url + "?" + query.toString(), {credentials: "same-origin"})
+            .then(function (response) { return response.ok ? response.json() : null; })
+            .then(function (result) {
+                if (!result || current !== request) {
+                    return;
+                }
+                body.replaceChildren.apply(body, result.rows.map(renderRow));
+                state.page = result.page;
+                state.numPages = result.num_pages;
+                state.count = result.count;
+                showStatus();
+            })
+            .catch(function () {
+                status.textContent = "Failed to load rows";
+            });
+    }
+
+    pager.querySelectorAll("[data-page]").forEach(function (button) {
+        button.addEventListener("click", function () {
+            state.page += button.dataset.page === "next" ? 1 : -1;
+            load();
+        });
+    });
+
+    let searchTimer = null;
+    if (searchInput) {
+        searchInput.addEventListener("keyup", function () {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(function () {
+                state.name = searchInput.value.trim();
+                state.page = 1;
+                load();
+            }, 300);
+        });
+    }
+
+    table.querySelectorAll("th.sortable[data-field]").forEach(function (header) {
+        header.innerHTML += ' <i class="bi bi-arrow-down sort-indicator"></i>';
+        header.style.cursor = "pointer";
+        header.addEventListener("click", function () {
+            const descending = state.sort === header.dataset.field;
+            state.sort = (descending ? "-" : "") + header.dataset.field;
+            state.page = 1;
+            const indicator = header.querySelector(".sort-indicator");
+            indicator.classList.toggle("bi-arrow-up", !descending);
+            indicator.classList.toggle("bi-arrow-down", descending);
+            load();
+        });
+    });
+
+    // Called by namespaceFilter.js instead of hiding rows on the page
+    window.listPager = {
+        filterNamespaces: function (selected) {
+            state.namespaces = selected.includes("All Namespaces") ? [] : selected;
+            state.page = 1;
+            load();
+        }
+    };
+
+    const saved = JSON.parse(sessionStorage.getItem("selectedNamespaces_" + window.location.pathname)) || ["All Namespaces"];
+    if (saved.includes("All Namespaces")) {
+        showStatus();
+    } else {
+        window.listPager.filterNamespaces(saved);
+    }
+});
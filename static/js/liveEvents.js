@@ -0,0 +1,106 @@
+// Keeps an events table current with the rows pushed by the events stream, instead of reloading the page
+window.addEventListener("DOMContentLoaded", function () {
+    const button = document.getElementById("liveEvents");
+    if (!button) {
+        return;
+    }
+    const table = document.getElementById("eventsTable");
+    const body = table.querySelector("tbody");
+    const headers = table.querySelectorAll("thead th");
+    const empty = document.getElementById("noEvents");
+    const status = document.getElementById("liveEventsStatus");
+    // Rows kept on screen while live, so a long session does not grow the page
+    const MAX_ROWS = 200;
+    const FIELDS = ["namespace", "message", "object", "source", "count", "last_seen", "type"];
+    let source = null;
+    let dropped = 0;
+
+    function messageCell(message) {
+        const span = document.createElement("span");
+        span.className = "message-truncate";
+        span.dataset.full = message;
+        span.textContent = message.length > 100 ? message.slice(0, 99) + "…" : message;
+        span.addEventListener("click", function () {
+            this.textContent = this.textContent.length > 100 ? message.slice(0, 100) + "..." : message;
+        });
+        return span;
+    }
+
+    function renderRow(row) {
+        const tr = document.createElement("tr");
+        tr.dataset.uid = row.uid;
+        FIELDS.forEach(function (field, index) {
+            const td = document.createElement("td");
+            const value = row[field] === null || row[field] === undefined ? "" : String(row[field]);
+            if (field === "message") {
+                td.appendChild(messageCell(value));
+            } else if (field === "type") {
+                const span = document.createElement("span");
+                if (value === "Warning") {
+                    span.className = "warning-event";
+                }
+                span.textContent = value;
+                td.appendChild(span);
+            } else {
+                td.textContent = value;
+            }
+            // Follow the columns hidden with the column selector
+            if (headers[index]) {
+                td.style.display = headers[index].style.display;
+            }
+            tr.appendChild(td);
+        });
+        return tr;
+    }
+
+    function applyRows(data) {
+        data.rows.forEach(function (row) {
+            const existing = body.querySelector(`tr[data-uid="${CSS.escape(row.uid || "")}"]`);
+            if (existing) {
+                existing.remove();
+            }
+            // The newest change goes on top; a repeated event moves up with its new count
+            if (row.change !== "DELETED") {
+                body.insertBefore(renderRow(row), body.firstChild);
+            }
+        });
+        while (body.rows.length > MAX_ROWS) {
+            body.deleteRow(-1);
+        }
+        if (body.rows.length) {
+            table.classList.remove("d-none");
+            if (empty) {
+                empty.classList.add("d-none");
+            }
+        }
+        dropped += data.dropped;
+        if (dropped) {
+            status.textContent = `${dropped} events skipped while busy`;
+        }
+    }
+
+    function stopLive(message) {
+        if (source) {
+            source.close();
+            source = null;
+        }
+        button.textContent = "Live";
+        status.textContent = message || "";
+    }
+
+    button.addEventListener("click", function () {
+        if (source) {
+            stopLive();
+            return;
+        }
+        dropped = 0;
+        source = new EventSource(button.dataset.streamUrl);
+        button.textContent = "Stop live";
+        status.textContent = "Live";
+        source.addEventListener("events", event => applyRows(JSON.parse(event.data)));
+        // Sent by the server when the watch fails, and by the browser when it cannot connect
+        source.addEventListener("error", function (event) {
+            stopLive(event.data ? "Error: " + event.data : "Live updates stopped");
+        });
+    });
+});
@@ -0,0 +1,139 @@
+// Draws a CPU and memory sparkline in the Trend cell of each metrics row, from the metrics sampler's history
+window.addEventListener("DOMContentLoaded", function () {
+    const trend = document.getElementById("metricsTrend");
+    if (!trend) {
+        return;
+    }
+    const url = trend.dataset.historyUrl;
+    const buttons = trend.querySelectorAll("button[data-window]");
+    // Keys per request; the view caps them too
+    const BATCH = 100;
+    const WIDTH = 120;
+    const HEIGHT = 24;
+    const COLORS = {cpu: "#0d6efd", memory: "#fd7e14"};
+    let windowName = "1h";
+    let pending = new Set();
+    let loaded = new Set();
+    let timer = null;
+
+    function points(values) {
+        const present = values.filter(function (value) { return value !== null; });
+        if (present.length < 2) {
+            return null;
+        }
+        const max = Math.max.apply(null, present);
+        const min = Math.min.apply(null, present);
+        const range = max - min || 1;
+        const step = WIDTH / (values.length - 1);
+        const result = [];
+        values.forEach(function (value, index) {
+            if (value !== null) {
+                result.push((index * step).toFixed(1) + "," + (HEIGHT - 2 - (value - min) / range * (HEIGHT - 4)).toFixed(1));
+            }
+        });
+        return result.join(" ");
+    }
+
+    function change(values) {
+        const present = values.filter(function (value) { return value !== null; });
+        if (present.length < 2) {
+            return "";
+        }
+        const first = present[0];
+        const last = present[present.length - 1];
+        return first ? " (" + (last >= first ? "+" : "") + Math.round((last - first) / first * 100) + "% over " + windowName + ")" : "";
+    }
+
+    function draw(cell, series) {
+        cell.textContent = "";
+        if (!series) {
+            cell.textContent = "-";
+            return;
+        }
+        const svg = document.createElementNS("http://www.w3.org/2000/svg", "svg");
+        svg.setAttribute("width", WIDTH);
+        svg.setAttribute("height", HEIGHT);
+        let drawn = false;
+        ["cpu", "memory"].forEach(function (name) {
+            const line = points(series[name]);
+            if (line) {
+                const polyline = document.createElementNS("http://www.w3.org/2000/svg", "polyline");
+                polyline.setAttribute("points", line);
+                polyline.setAttribute("fill", "none");
+                polyline.setAttribute("stroke", COLORS[name]);
+                polyline.setAttribute("stroke-width", "1.5");
+                svg.appendChild(polyline);
+                drawn = true;
+            }
+        });
+        if (!drawn) {
+            cell.textContent = "collecting…";
+            return;
+        }
+        const latest = function (values) {
+            const present = values.filter(function (value) { return value !== null; });
+            return present[present.length - 1];
+        };
+        const title = document.createElementNS("http://www.w3.org/2000/svg", "title");
+        title.textContent = "CPU " + latest(series.cpu) + " m" + change(series.cpu) +
+            "\nMemory " + latest(series.memory) + " Mi" + change(series.memory);
+        svg.appendChild(title);
+        cell.appendChild(svg);
+    }
+
+    function fetchPending() {
+        timer = null;
+        const keys = Array.from(pending);
+        pending = new Set();
+        for (let start = 0; start < keys.length; start += BATCH) {
+            const batch = keys.slice(start, start + BATCH);
+            const query = new URLSearchParams({keys: batch.join(","), window: windowName});
+            fetch(url + "?" + query.toString(), {credentials: "same-origin"})
+                .then(function (response) { return response.ok ? response.json() : null; })
+                .then(function (history) {
+                    batch.forEach(function (key) {
+                        const row = document.querySelector('tr[data-series="' + CSS.escape(key) + '"]');
+                        if (row) {
+                            draw(row.querySelector(".metrics-trend"), history ? history.series[key] : null);
+                        }
+                    });
+                })
+                .catch(function () {});
+        }
+    }
+
+    function request(key) {
+        if (loaded.has(key)) {
+            return;
+        }
+        loaded.add(key);
+        pending.add(key);
+        // Rows scrolled into view together are fetched in one request
+        if (!timer) {
+            timer = setTimeout(fetchPending, 100);
+        }
+    }
+
+    // Only rows on screen are fetched, so a page of thousands of pods asks for a few dozen series
+    const observer = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+                request(entry.target.dataset.series);
+            }
+        });
+    });
+    const rows = document.querySelectorAll("tr[data-series]");
+    rows.forEach(function (row) { observer.observe(row); });
+
+    buttons.forEach(function (button) {
+        button.addEventListener("click", function () {
+            buttons.forEach(function (other) { other.classList.toggle("active", other === button); });
+            windowName = button.dataset.window;
+            loaded = new Set();
+            rows.forEach(function (row) {
+                observer.unobserve(row);
+                observer.observe(row);
+            });
+        });
+    });
+});
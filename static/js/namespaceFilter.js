@@ -58,6 +58,11 @@ function updateDropdownText(selectedNamespaces) {
 }
 
 function filterTable(selectedNamespaces) {
+    // Paged tables are filtered by the list API
+    if (window.listPager) {
+        window.listPager.filterNamespaces(selectedNamespaces);
+        return;
+    }
     let tableRows = document.querySelectorAll("tbody tr");
 
     tableRows.forEach(row => {
@@ -0,0 +1,65 @@
+// Reloads or follows the log shown in the logs tab (a pod, or all pods of a workload) with the chosen options
+window.addEventListener("DOMContentLoaded", function () {
+    const pane = document.getElementById("logs");
+    const output = pane.querySelector("pre");
+    const scroller = output.parentElement;
+    const followButton = document.getElementById("followLogs");
+    // Lines kept on screen while following, so a long-running stream does not grow the page
+    const MAX_LINES = 5000;
+    let source = null;
+
+    function logUrl(params) {
+        pane.querySelectorAll("[data-log-option]").forEach(function (input) {
+            const value = input.type === "checkbox" ? (input.checked ? "true" : "") : input.value;
+            if (value) {
+                params.set(input.name, value);
+            }
+        });
+        return pane.dataset.streamUrl + "?" + params;
+    }
+
+    function appendLine(line) {
+        output.appendChild(document.createTextNode(line + "\n"));
+        while (output.childNodes.length > MAX_LINES) {
+            output.removeChild(output.firstChild);
+        }
+        scroller.scrollTop = scroller.scrollHeight;
+    }
+
+    function stopFollowing() {
+        if (source) {
+            source.close();
+            source = null;
+        }
+        followButton.textContent = "Follow";
+    }
+
+    document.getElementById("loadLogs").addEventListener("click", function () {
+        stopFollowing();
+        // The tab's own lazy load is superseded by this one
+        pane.dataset.loaded = "true";
+        output.textContent = "Loading...";
+        fetch(logUrl(new URLSearchParams()))
+            .then(response => response.ok ? response.text() : response.json().then(data => "Error: " + data.error))
+            .then(text => { output.textContent = text || "<none>"; })
+            .catch(err => { output.textContent = "Error: " + err; });
+    });
+
+    followButton.addEventListener("click", function () {
+        if (source) {
+            stopFollowing();
+            return;
+        }
+        pane.dataset.loaded = "true";
+        output.textContent = "";
+        source = new EventSource(logUrl(new URLSearchParams({follow: "true"})));
+        followButton.textContent = "Stop";
+        source.onmessage = event => appendLine(event.data);
+        source.addEventListener("end", stopFollowing);
+        // Sent by the server when the stream breaks, and by the browser when it cannot connect
+        source.addEventListener("error", function (event) {
+            appendLine(event.data ? "Error: " + event.data : "Log stream closed");
+            stopFollowing();
+        });
+    });
+});
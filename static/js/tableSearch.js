@@ -1,4 +1,8 @@
 document.addEventListener("DOMContentLoaded", function () {
+    // Tables paged by listPager.js search and sort through the list API instead
+    if (document.querySelector("table[data-list-url]")) {
+        return;
+    }
     // searching table
     const searchInput = document.getElementById("tableSearchInput");
     